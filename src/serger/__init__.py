@@ -15,172 +15,540 @@ Highlights:
     - get_metadata()      → Retrieve version / commit info
 """
 
-from .actions import get_metadata, watch_for_changes
-from .build import (
-    collect_included_files,
-    expand_include_pattern,
-    find_package_root,
-    resolve_order_paths,
-    run_build,
-)
-from .cli import HintingArgumentParser, main
-from .config import (
-    DRYRUN_KEYS,
-    DRYRUN_MSG,
-    FIELD_EXAMPLES,
-    ROOT_ONLY_KEYS,
-    ROOT_ONLY_MSG,
-    CommentsMode,
-    DocstringMode,
-    DocstringModeLocation,
-    DocstringModeSimple,
-    ExternalImportMode,
-    IncludeConfig,
-    IncludeResolved,
-    InternalImportMode,
-    MainMode,
-    MetaBuildConfigResolved,
-    ModuleActionAffects,
-    ModuleActionCleanup,
-    ModuleActionFull,
-    ModuleActionMode,
-    ModuleActions,
-    ModuleActionScope,
-    ModuleActionSimple,
-    ModuleActionType,
-    ModuleMode,
-    OriginType,
-    PathResolved,
-    PostCategoryConfig,
-    PostCategoryConfigResolved,
-    PostProcessingConfig,
-    PostProcessingConfigResolved,
-    PyprojectMetadata,
-    RootConfig,
-    RootConfigResolved,
-    SchemaErrorAggregator,
-    ShimSetting,
-    StitchMode,
-    ToolConfig,
-    ToolConfigResolved,
-    ValidationSummary,
-    can_run_configless,
-    extract_pyproject_metadata,
-    find_config,
-    load_and_validate_config,
-    load_config,
-    parse_config,
-    resolve_build_config,
-    resolve_config,
-    resolve_post_processing,
-    validate_config,
-)
-from .constants import (
-    BUILD_TIMESTAMP_PLACEHOLDER,
-    BUILD_TOOL_FIND_MAX_LINES,
-    DEFAULT_CATEGORIES,
-    DEFAULT_CATEGORY_ORDER,
-    DEFAULT_COMMENTS_MODE,
-    DEFAULT_DISABLE_BUILD_TIMESTAMP,
-    DEFAULT_DOCSTRING_MODE,
-    DEFAULT_DRY_RUN,
-    DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP,
-    DEFAULT_ENV_LOG_LEVEL,
-    DEFAULT_ENV_RESPECT_GITIGNORE,
-    DEFAULT_ENV_WATCH_INTERVAL,
-    DEFAULT_EXTERNAL_IMPORTS,
-    DEFAULT_INTERNAL_IMPORTS,
-    DEFAULT_LICENSE_FALLBACK,
-    DEFAULT_LOG_LEVEL,
-    DEFAULT_MAIN_MODE,
-    DEFAULT_MAIN_NAME,
-    DEFAULT_MODULE_MODE,
-    DEFAULT_OUT_DIR,
-    DEFAULT_RESPECT_GITIGNORE,
-    DEFAULT_SHIM,
-    DEFAULT_SOURCE_BASES,
-    DEFAULT_STITCH_MODE,
-    DEFAULT_STRICT_CONFIG,
-    DEFAULT_USE_PYPROJECT_METADATA,
-    DEFAULT_WATCH_INTERVAL,
-    RUNTIME_MODES,
-)
-from .logs import AppLogger, getAppLogger
-from .main_config import (
-    FunctionCollision,
-    MainBlock,
-    detect_collisions,
-    detect_function_parameters,
-    detect_main_blocks,
-    find_main_function,
-    generate_auto_renames,
-    parse_main_name,
-    rename_function_in_source,
-    select_main_block,
-)
-from .meta import (
-    DESCRIPTION,
-    PROGRAM_CONFIG,
-    PROGRAM_DISPLAY,
-    PROGRAM_ENV,
-    PROGRAM_PACKAGE,
-    PROGRAM_SCRIPT,
-    Metadata,
-)
-from .module_actions import (
-    apply_cleanup_behavior,
-    apply_module_actions,
-    apply_single_action,
-    check_shim_stitching_mismatches,
-    extract_module_name_from_source_path,
-    generate_actions_from_mode,
-    get_deleted_modules_from_actions,
-    separate_actions_by_affects,
-    set_mode_generated_action_defaults,
-    validate_action_dest,
-    validate_action_source_exists,
-    validate_module_actions,
-    validate_no_circular_moves,
-    validate_no_conflicting_operations,
-    validate_rename_action,
-)
-from .selftest import run_selftest
-from .stitch import (
-    ModuleSymbols,
-    compute_module_order,
-    detect_name_collisions,
-    extract_commit,
-    extract_version,
-    force_mtime_advance,
-    is_serger_build,
-    process_comments,
-    process_docstrings,
-    split_imports,
-    stitch_modules,
-    strip_redundant_blocks,
-    suggest_order_mismatch,
-    verify_all_modules_listed,
-    verify_no_broken_imports,
-)
-from .utils import (
-    derive_module_name,
-    discover_installed_packages_roots,
-    is_excluded,
-    make_includeresolved,
-    make_pathresolved,
-    shorten_path_for_display,
-    shorten_paths_for_display,
-    validate_required_keys,
-)
-from .verify_script import (
-    build_tool_command,
-    execute_post_processing,
-    find_tool_executable,
-    post_stitch_processing,
-    verify_compiles,
-    verify_compiles_string,
-    verify_executes,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .actions import get_metadata, watch_for_changes
+    from .build import (
+        BuildResult,
+        collect_included_files,
+        expand_include_pattern,
+        find_package_root,
+        resolve_order_paths,
+        run_build,
+        run_builds,
+    )
+    from .build_async import run_build_async, stitch_modules_async
+    from .bytecode_cache import BYTECODE_CACHE_MARKER, wrap_with_bytecode_cache
+    from .cli import HintingArgumentParser, main, run_cli
+    from .config import (
+        CONFIG_CACHE_VERSION,
+        DRYRUN_KEYS,
+        DRYRUN_MSG,
+        FIELD_EXAMPLES,
+        ROOT_ONLY_KEYS,
+        ROOT_ONLY_MSG,
+        CommentsMode,
+        DocstringMode,
+        DocstringModeLocation,
+        DocstringModeSimple,
+        ExternalImportMode,
+        IncludeConfig,
+        IncludeResolved,
+        InternalImportMode,
+        MainMode,
+        MetaBuildConfigResolved,
+        ModuleActionAffects,
+        ModuleActionCleanup,
+        ModuleActionFull,
+        ModuleActionMode,
+        ModuleActions,
+        ModuleActionScope,
+        ModuleActionSimple,
+        ModuleActionType,
+        ModuleLoading,
+        ModuleMode,
+        OriginType,
+        OutFormat,
+        PathResolved,
+        PostCategoryConfig,
+        PostCategoryConfigResolved,
+        PostProcessingConfig,
+        PostProcessingConfigResolved,
+        PyprojectMetadata,
+        RootConfig,
+        RootConfigResolved,
+        SchemaErrorAggregator,
+        ShimAttrsMode,
+        ShimSetting,
+        StitchMode,
+        ToolConfig,
+        ToolConfigResolved,
+        ValidationSummary,
+        can_run_configless,
+        expand_build_configs,
+        extract_pyproject_metadata,
+        find_config,
+        get_config_cache_dir,
+        is_config_cache_enabled,
+        load_and_validate_config,
+        load_cached_config,
+        load_config,
+        make_config_cache_key,
+        parse_config,
+        record_config_dependency,
+        recording_config_dependencies,
+        resolve_build_config,
+        resolve_config,
+        resolve_post_processing,
+        resolved_config_directories,
+        store_cached_config,
+        validate_config,
+    )
+    from .constants import (
+        BUILD_TIMESTAMP_PLACEHOLDER,
+        BUILD_TOOL_FIND_MAX_LINES,
+        DEFAULT_BYTECODE_CACHE,
+        DEFAULT_CATEGORIES,
+        DEFAULT_CATEGORY_ORDER,
+        DEFAULT_COMMENTS_MODE,
+        DEFAULT_CONFIG_CACHE,
+        DEFAULT_DISABLE_BUILD_TIMESTAMP,
+        DEFAULT_DOCSTRING_MODE,
+        DEFAULT_DRY_RUN,
+        DEFAULT_ENV_CONFIG_CACHE,
+        DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP,
+        DEFAULT_ENV_LOG_LEVEL,
+        DEFAULT_ENV_RESPECT_GITIGNORE,
+        DEFAULT_ENV_SERVE_SOCKET,
+        DEFAULT_ENV_WATCH_INTERVAL,
+        DEFAULT_EXTERNAL_IMPORTS,
+        DEFAULT_INTERNAL_IMPORTS,
+        DEFAULT_LEAN_MODE,
+        DEFAULT_LICENSE_FALLBACK,
+        DEFAULT_LOG_LEVEL,
+        DEFAULT_MAIN_MODE,
+        DEFAULT_MAIN_NAME,
+        DEFAULT_MEMORY_BUDGET_MB,
+        DEFAULT_MODULE_LOADING,
+        DEFAULT_MODULE_MODE,
+        DEFAULT_OPTIMIZE_IMPORTS,
+        DEFAULT_OUT_DIR,
+        DEFAULT_OUT_FORMAT,
+        DEFAULT_RESPECT_GITIGNORE,
+        DEFAULT_SCHEDULER_WORKERS,
+        DEFAULT_SERVE_ACCEPT_TIMEOUT,
+        DEFAULT_SERVE_IDLE_TIMEOUT,
+        DEFAULT_SERVE_SOCKET_NAME,
+        DEFAULT_SHIM,
+        DEFAULT_SHIM_ATTRS,
+        DEFAULT_SOURCE_BASES,
+        DEFAULT_STARTUP_PROFILING,
+        DEFAULT_STITCH_MODE,
+        DEFAULT_STRICT_CONFIG,
+        DEFAULT_TREE_SHAKE,
+        DEFAULT_USE_PYPROJECT_METADATA,
+        DEFAULT_WATCH_INTERVAL,
+        DEFAULT_ZIPAPP_PYTHON,
+        RUNTIME_MODES,
+        SIDE_EFFECT_IMPORT_MODULES,
+    )
+    from .daemon import (
+        BuildServer,
+        ServeReply,
+        get_serve_socket_path,
+        is_serve_supported,
+        request_build,
+        serve,
+    )
+    from .import_optimizer import OptimizedImports, optimize_hoisted_imports
+    from .lean_mode import apply_lean_mode
+    from .logs import AppLogger, getAppLogger
+    from .main_config import (
+        FunctionCollision,
+        MainBlock,
+        detect_collisions,
+        detect_function_parameters,
+        detect_main_blocks,
+        find_main_function,
+        generate_auto_renames,
+        parse_main_name,
+        rename_function_in_source,
+        select_main_block,
+    )
+    from .meta import (
+        DESCRIPTION,
+        PROGRAM_CONFIG,
+        PROGRAM_DISPLAY,
+        PROGRAM_ENV,
+        PROGRAM_PACKAGE,
+        PROGRAM_SCRIPT,
+        Metadata,
+    )
+    from .module_actions import (
+        ModuleActionPlan,
+        ModulePattern,
+        apply_cleanup_behavior,
+        apply_module_actions,
+        apply_single_action,
+        check_shim_stitching_mismatches,
+        compile_module_actions,
+        compile_module_pattern,
+        expand_module_action_patterns,
+        extract_module_name_from_source_path,
+        generate_actions_from_mode,
+        get_deleted_modules_from_actions,
+        is_module_pattern,
+        separate_actions_by_affects,
+        set_mode_generated_action_defaults,
+        validate_action_dest,
+        validate_action_pattern,
+        validate_action_source_exists,
+        validate_module_actions,
+        validate_no_circular_moves,
+        validate_no_conflicting_operations,
+        validate_rename_action,
+    )
+    from .scheduler import BuildScheduler, TaskTiming, using_stage_check
+    from .selftest import run_selftest
+    from .startup_profile import (
+        PROFILE_REPORT,
+        STARTUP_PROFILE_ENV,
+        make_profile_prelude,
+        make_profile_probe,
+    )
+    from .stitch import (
+        ModuleCache,
+        ModuleSymbols,
+        compute_module_order,
+        detect_name_collisions,
+        extract_commit,
+        extract_version,
+        find_eager_import_cycles,
+        force_mtime_advance,
+        is_serger_build,
+        process_comments,
+        process_docstrings,
+        read_git_head,
+        split_imports,
+        stitch_modules,
+        strip_redundant_blocks,
+        suggest_order_mismatch,
+        using_module_cache,
+        verify_all_modules_listed,
+        verify_no_broken_imports,
+    )
+    from .timings import (
+        CacheStats,
+        SizeSample,
+        Span,
+        SpanRecorder,
+        current_recorder,
+        format_memory_table,
+        format_timings_table,
+        memory_accounting,
+        memory_accounting_enabled,
+        memory_to_dict,
+        record_cache,
+        record_size,
+        recording,
+        span,
+        timed,
+        timings_to_chrome_trace,
+        timings_to_dict,
+    )
+    from .tree_shake import TreeShakeResult, tree_shake_script
+    from .utils import (
+        INSTALLED_ROOTS_CACHE_VERSION,
+        SubprocessRunner,
+        derive_module_name,
+        discover_installed_packages_roots,
+        get_installed_packages_roots,
+        get_user_cache_dir,
+        is_excluded,
+        make_includeresolved,
+        make_pathresolved,
+        run_subprocess,
+        shorten_path_for_display,
+        shorten_paths_for_display,
+        using_subprocess_runner,
+        validate_required_keys,
+    )
+    from .verify_script import (
+        ToolLookupCache,
+        build_tool_command,
+        caching_tool_lookups,
+        discover_tool_executables,
+        execute_post_processing,
+        find_tool_executable,
+        post_stitch_processing,
+        using_tool_executables,
+        verify_compiles,
+        verify_compiles_string,
+        verify_executes,
+    )
+    from .zipapp_output import ZIPAPP_SHEBANG, build_zipapp, compile_pyc
+
+
+# Submodule -> public names it defines. Nothing is imported until a name is
+# first accessed (PEP 562), so `serger --version` does not load the stitcher.
+_LAZY_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "actions": ("get_metadata", "watch_for_changes"),
+    "build": (
+        "BuildResult",
+        "collect_included_files",
+        "expand_include_pattern",
+        "find_package_root",
+        "resolve_order_paths",
+        "run_build",
+        "run_builds",
+    ),
+    "build_async": ("run_build_async", "stitch_modules_async"),
+    "bytecode_cache": ("BYTECODE_CACHE_MARKER", "wrap_with_bytecode_cache"),
+    "cli": ("HintingArgumentParser", "main", "run_cli"),
+    "config": (
+        "CONFIG_CACHE_VERSION",
+        "DRYRUN_KEYS",
+        "DRYRUN_MSG",
+        "FIELD_EXAMPLES",
+        "ROOT_ONLY_KEYS",
+        "ROOT_ONLY_MSG",
+        "CommentsMode",
+        "DocstringMode",
+        "DocstringModeLocation",
+        "DocstringModeSimple",
+        "ExternalImportMode",
+        "IncludeConfig",
+        "IncludeResolved",
+        "InternalImportMode",
+        "MainMode",
+        "MetaBuildConfigResolved",
+        "ModuleActionAffects",
+        "ModuleActionCleanup",
+        "ModuleActionFull",
+        "ModuleActionMode",
+        "ModuleActions",
+        "ModuleActionScope",
+        "ModuleActionSimple",
+        "ModuleActionType",
+        "ModuleLoading",
+        "ModuleMode",
+        "OriginType",
+        "OutFormat",
+        "PathResolved",
+        "PostCategoryConfig",
+        "PostCategoryConfigResolved",
+        "PostProcessingConfig",
+        "PostProcessingConfigResolved",
+        "PyprojectMetadata",
+        "RootConfig",
+        "RootConfigResolved",
+        "SchemaErrorAggregator",
+        "ShimAttrsMode",
+        "ShimSetting",
+        "StitchMode",
+        "ToolConfig",
+        "ToolConfigResolved",
+        "ValidationSummary",
+        "can_run_configless",
+        "expand_build_configs",
+        "extract_pyproject_metadata",
+        "find_config",
+        "get_config_cache_dir",
+        "is_config_cache_enabled",
+        "load_and_validate_config",
+        "load_cached_config",
+        "load_config",
+        "make_config_cache_key",
+        "parse_config",
+        "record_config_dependency",
+        "recording_config_dependencies",
+        "resolve_build_config",
+        "resolve_config",
+        "resolve_post_processing",
+        "resolved_config_directories",
+        "store_cached_config",
+        "validate_config",
+    ),
+    "constants": (
+        "BUILD_TIMESTAMP_PLACEHOLDER",
+        "BUILD_TOOL_FIND_MAX_LINES",
+        "DEFAULT_BYTECODE_CACHE",
+        "DEFAULT_CATEGORIES",
+        "DEFAULT_CATEGORY_ORDER",
+        "DEFAULT_COMMENTS_MODE",
+        "DEFAULT_CONFIG_CACHE",
+        "DEFAULT_DISABLE_BUILD_TIMESTAMP",
+        "DEFAULT_DOCSTRING_MODE",
+        "DEFAULT_DRY_RUN",
+        "DEFAULT_ENV_CONFIG_CACHE",
+        "DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP",
+        "DEFAULT_ENV_LOG_LEVEL",
+        "DEFAULT_ENV_RESPECT_GITIGNORE",
+        "DEFAULT_ENV_SERVE_SOCKET",
+        "DEFAULT_ENV_WATCH_INTERVAL",
+        "DEFAULT_EXTERNAL_IMPORTS",
+        "DEFAULT_INTERNAL_IMPORTS",
+        "DEFAULT_LEAN_MODE",
+        "DEFAULT_LICENSE_FALLBACK",
+        "DEFAULT_LOG_LEVEL",
+        "DEFAULT_MAIN_MODE",
+        "DEFAULT_MAIN_NAME",
+        "DEFAULT_MEMORY_BUDGET_MB",
+        "DEFAULT_MODULE_LOADING",
+        "DEFAULT_MODULE_MODE",
+        "DEFAULT_OPTIMIZE_IMPORTS",
+        "DEFAULT_OUT_DIR",
+        "DEFAULT_OUT_FORMAT",
+        "DEFAULT_RESPECT_GITIGNORE",
+        "DEFAULT_SCHEDULER_WORKERS",
+        "DEFAULT_SERVE_ACCEPT_TIMEOUT",
+        "DEFAULT_SERVE_IDLE_TIMEOUT",
+        "DEFAULT_SERVE_SOCKET_NAME",
+        "DEFAULT_SHIM",
+        "DEFAULT_SHIM_ATTRS",
+        "DEFAULT_SOURCE_BASES",
+        "DEFAULT_STARTUP_PROFILING",
+        "DEFAULT_STITCH_MODE",
+        "DEFAULT_STRICT_CONFIG",
+        "DEFAULT_TREE_SHAKE",
+        "DEFAULT_USE_PYPROJECT_METADATA",
+        "DEFAULT_WATCH_INTERVAL",
+        "DEFAULT_ZIPAPP_PYTHON",
+        "RUNTIME_MODES",
+        "SIDE_EFFECT_IMPORT_MODULES",
+    ),
+    "daemon": (
+        "BuildServer",
+        "ServeReply",
+        "get_serve_socket_path",
+        "is_serve_supported",
+        "request_build",
+        "serve",
+    ),
+    "import_optimizer": ("OptimizedImports", "optimize_hoisted_imports"),
+    "lean_mode": ("apply_lean_mode",),
+    "logs": ("AppLogger", "getAppLogger"),
+    "main_config": (
+        "FunctionCollision",
+        "MainBlock",
+        "detect_collisions",
+        "detect_function_parameters",
+        "detect_main_blocks",
+        "find_main_function",
+        "generate_auto_renames",
+        "parse_main_name",
+        "rename_function_in_source",
+        "select_main_block",
+    ),
+    "meta": (
+        "DESCRIPTION",
+        "PROGRAM_CONFIG",
+        "PROGRAM_DISPLAY",
+        "PROGRAM_ENV",
+        "PROGRAM_PACKAGE",
+        "PROGRAM_SCRIPT",
+        "Metadata",
+    ),
+    "module_actions": (
+        "ModuleActionPlan",
+        "ModulePattern",
+        "apply_cleanup_behavior",
+        "apply_module_actions",
+        "apply_single_action",
+        "check_shim_stitching_mismatches",
+        "compile_module_actions",
+        "compile_module_pattern",
+        "expand_module_action_patterns",
+        "extract_module_name_from_source_path",
+        "generate_actions_from_mode",
+        "get_deleted_modules_from_actions",
+        "is_module_pattern",
+        "separate_actions_by_affects",
+        "set_mode_generated_action_defaults",
+        "validate_action_dest",
+        "validate_action_pattern",
+        "validate_action_source_exists",
+        "validate_module_actions",
+        "validate_no_circular_moves",
+        "validate_no_conflicting_operations",
+        "validate_rename_action",
+    ),
+    "scheduler": ("BuildScheduler", "TaskTiming", "using_stage_check"),
+    "selftest": ("run_selftest",),
+    "startup_profile": (
+        "PROFILE_REPORT",
+        "STARTUP_PROFILE_ENV",
+        "make_profile_prelude",
+        "make_profile_probe",
+    ),
+    "stitch": (
+        "ModuleCache",
+        "ModuleSymbols",
+        "compute_module_order",
+        "detect_name_collisions",
+        "extract_commit",
+        "extract_version",
+        "find_eager_import_cycles",
+        "force_mtime_advance",
+        "is_serger_build",
+        "process_comments",
+        "process_docstrings",
+        "read_git_head",
+        "split_imports",
+        "stitch_modules",
+        "strip_redundant_blocks",
+        "suggest_order_mismatch",
+        "using_module_cache",
+        "verify_all_modules_listed",
+        "verify_no_broken_imports",
+    ),
+    "timings": (
+        "CacheStats",
+        "SizeSample",
+        "Span",
+        "SpanRecorder",
+        "current_recorder",
+        "format_memory_table",
+        "format_timings_table",
+        "memory_accounting",
+        "memory_accounting_enabled",
+        "memory_to_dict",
+        "record_cache",
+        "record_size",
+        "recording",
+        "span",
+        "timed",
+        "timings_to_chrome_trace",
+        "timings_to_dict",
+    ),
+    "tree_shake": ("TreeShakeResult", "tree_shake_script"),
+    "utils": (
+        "INSTALLED_ROOTS_CACHE_VERSION",
+        "SubprocessRunner",
+        "derive_module_name",
+        "discover_installed_packages_roots",
+        "get_installed_packages_roots",
+        "get_user_cache_dir",
+        "is_excluded",
+        "make_includeresolved",
+        "make_pathresolved",
+        "run_subprocess",
+        "shorten_path_for_display",
+        "shorten_paths_for_display",
+        "using_subprocess_runner",
+        "validate_required_keys",
+    ),
+    "verify_script": (
+        "ToolLookupCache",
+        "build_tool_command",
+        "caching_tool_lookups",
+        "discover_tool_executables",
+        "execute_post_processing",
+        "find_tool_executable",
+        "post_stitch_processing",
+        "using_tool_executables",
+        "verify_compiles",
+        "verify_compiles_string",
+        "verify_executes",
+    ),
+    "zipapp_output": ("ZIPAPP_SHEBANG", "build_zipapp", "compile_pyc"),
+}
+_LAZY_EXPORTS: dict[str, str] = {
+    name: module for module, names in _LAZY_SUBMODULE_EXPORTS.items() for name in names
+}
 
 
 __all__ = [  # noqa: RUF022
@@ -188,19 +556,29 @@ __all__ = [  # noqa: RUF022
     "get_metadata",
     "watch_for_changes",
     # build
+    "BuildResult",
     "collect_included_files",
     "expand_include_pattern",
     "find_package_root",
     "resolve_order_paths",
     "run_build",
+    "run_builds",
+    # build_async
+    "run_build_async",
+    "stitch_modules_async",
+    # bytecode_cache
+    "BYTECODE_CACHE_MARKER",
+    "wrap_with_bytecode_cache",
     # cli
     "HintingArgumentParser",
     "main",
+    "run_cli",
     # config
     "CommentsMode",
     "DocstringMode",
     "DocstringModeLocation",
     "DocstringModeSimple",
+    "CONFIG_CACHE_VERSION",
     "DRYRUN_KEYS",
     "DRYRUN_MSG",
     "ExternalImportMode",
@@ -218,8 +596,10 @@ __all__ = [  # noqa: RUF022
     "ModuleActionSimple",
     "ModuleActionType",
     "ModuleActions",
+    "ModuleLoading",
     "ModuleMode",
     "OriginType",
+    "OutFormat",
     "PathResolved",
     "PostCategoryConfig",
     "PostCategoryConfigResolved",
@@ -231,12 +611,14 @@ __all__ = [  # noqa: RUF022
     "RootConfig",
     "RootConfigResolved",
     "SchemaErrorAggregator",
+    "ShimAttrsMode",
     "ShimSetting",
     "StitchMode",
     "ToolConfig",
     "ToolConfigResolved",
     "ValidationSummary",
     "can_run_configless",
+    "expand_build_configs",
     "extract_pyproject_metadata",
     "find_config",
     "load_and_validate_config",
@@ -245,36 +627,74 @@ __all__ = [  # noqa: RUF022
     "resolve_build_config",
     "resolve_config",
     "resolve_post_processing",
+    "get_config_cache_dir",
+    "is_config_cache_enabled",
+    "load_cached_config",
+    "make_config_cache_key",
+    "record_config_dependency",
+    "recording_config_dependencies",
+    "resolved_config_directories",
+    "store_cached_config",
     "validate_config",
     # constants
     "BUILD_TIMESTAMP_PLACEHOLDER",
     "BUILD_TOOL_FIND_MAX_LINES",
+    "DEFAULT_BYTECODE_CACHE",
     "DEFAULT_CATEGORIES",
+    "DEFAULT_CONFIG_CACHE",
     "DEFAULT_CATEGORY_ORDER",
     "DEFAULT_COMMENTS_MODE",
     "DEFAULT_DISABLE_BUILD_TIMESTAMP",
     "DEFAULT_DOCSTRING_MODE",
     "DEFAULT_DRY_RUN",
+    "DEFAULT_ENV_CONFIG_CACHE",
     "DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP",
     "DEFAULT_ENV_LOG_LEVEL",
     "DEFAULT_ENV_RESPECT_GITIGNORE",
+    "DEFAULT_ENV_SERVE_SOCKET",
     "DEFAULT_ENV_WATCH_INTERVAL",
     "DEFAULT_EXTERNAL_IMPORTS",
     "DEFAULT_INTERNAL_IMPORTS",
+    "DEFAULT_LEAN_MODE",
     "DEFAULT_LICENSE_FALLBACK",
     "DEFAULT_LOG_LEVEL",
     "DEFAULT_MAIN_MODE",
     "DEFAULT_MAIN_NAME",
+    "DEFAULT_MEMORY_BUDGET_MB",
+    "DEFAULT_MODULE_LOADING",
     "DEFAULT_MODULE_MODE",
+    "DEFAULT_OPTIMIZE_IMPORTS",
     "DEFAULT_OUT_DIR",
+    "DEFAULT_OUT_FORMAT",
     "DEFAULT_RESPECT_GITIGNORE",
+    "DEFAULT_SCHEDULER_WORKERS",
+    "DEFAULT_SERVE_ACCEPT_TIMEOUT",
+    "DEFAULT_SERVE_IDLE_TIMEOUT",
+    "DEFAULT_SERVE_SOCKET_NAME",
     "DEFAULT_SHIM",
+    "DEFAULT_SHIM_ATTRS",
     "DEFAULT_SOURCE_BASES",
+    "DEFAULT_STARTUP_PROFILING",
     "DEFAULT_STITCH_MODE",
     "DEFAULT_STRICT_CONFIG",
+    "DEFAULT_TREE_SHAKE",
     "DEFAULT_USE_PYPROJECT_METADATA",
     "DEFAULT_WATCH_INTERVAL",
+    "DEFAULT_ZIPAPP_PYTHON",
     "RUNTIME_MODES",
+    "SIDE_EFFECT_IMPORT_MODULES",
+    # daemon
+    "BuildServer",
+    "ServeReply",
+    "get_serve_socket_path",
+    "is_serve_supported",
+    "request_build",
+    "serve",
+    # import_optimizer
+    "OptimizedImports",
+    "optimize_hoisted_imports",
+    # lean_mode
+    "apply_lean_mode",
     # logs
     "AppLogger",
     "getAppLogger",
@@ -298,54 +718,128 @@ __all__ = [  # noqa: RUF022
     "PROGRAM_PACKAGE",
     "PROGRAM_SCRIPT",
     # module_actions
+    "ModuleActionPlan",
+    "ModulePattern",
     "apply_cleanup_behavior",
     "apply_module_actions",
     "apply_single_action",
     "check_shim_stitching_mismatches",
+    "compile_module_actions",
+    "compile_module_pattern",
+    "expand_module_action_patterns",
     "extract_module_name_from_source_path",
     "generate_actions_from_mode",
     "get_deleted_modules_from_actions",
+    "is_module_pattern",
     "separate_actions_by_affects",
     "set_mode_generated_action_defaults",
     "validate_action_dest",
+    "validate_action_pattern",
     "validate_action_source_exists",
     "validate_module_actions",
     "validate_no_circular_moves",
     "validate_no_conflicting_operations",
     "validate_rename_action",
+    # scheduler
+    "BuildScheduler",
+    "TaskTiming",
+    "using_stage_check",
     # selftest
     "run_selftest",
+    # startup_profile
+    "PROFILE_REPORT",
+    "STARTUP_PROFILE_ENV",
+    "make_profile_prelude",
+    "make_profile_probe",
     # stitch
+    "ModuleCache",
     "ModuleSymbols",
     "compute_module_order",
     "detect_name_collisions",
     "extract_commit",
     "extract_version",
+    "find_eager_import_cycles",
     "force_mtime_advance",
     "is_serger_build",
     "process_comments",
     "process_docstrings",
+    "read_git_head",
     "split_imports",
     "stitch_modules",
     "strip_redundant_blocks",
     "suggest_order_mismatch",
+    "using_module_cache",
     "verify_all_modules_listed",
     "verify_no_broken_imports",
+    # timings
+    "CacheStats",
+    "SizeSample",
+    "Span",
+    "SpanRecorder",
+    "current_recorder",
+    "format_memory_table",
+    "format_timings_table",
+    "memory_accounting",
+    "memory_accounting_enabled",
+    "memory_to_dict",
+    "record_cache",
+    "record_size",
+    "recording",
+    "span",
+    "timed",
+    "timings_to_chrome_trace",
+    "timings_to_dict",
+    # tree_shake
+    "TreeShakeResult",
+    "tree_shake_script",
     # utils
+    "INSTALLED_ROOTS_CACHE_VERSION",
+    "SubprocessRunner",
     "derive_module_name",
     "discover_installed_packages_roots",
+    "get_installed_packages_roots",
+    "get_user_cache_dir",
     "is_excluded",
     "make_includeresolved",
     "make_pathresolved",
+    "run_subprocess",
     "shorten_path_for_display",
     "shorten_paths_for_display",
+    "using_subprocess_runner",
     "validate_required_keys",
     # verify_script
+    "ToolLookupCache",
     "build_tool_command",
+    "caching_tool_lookups",
+    "discover_tool_executables",
     "execute_post_processing",
     "find_tool_executable",
     "post_stitch_processing",
+    "using_tool_executables",
     "verify_compiles",
     "verify_compiles_string",
     "verify_executes",
+    # zipapp_output
+    "ZIPAPP_SHEBANG",
+    "build_zipapp",
+    "compile_pyc",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule that defines `name` on first access (PEP 562)."""
+    # Stitched builds define every name eagerly; this hook only serves the
+    # package, so it must never import anything from a stitched script
+    if name in _LAZY_SUBMODULE_EXPORTS and not globals().get("__STITCHED__"):
+        return import_module(f".{name}", __name__)
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None or globals().get("__STITCHED__"):
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
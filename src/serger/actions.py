@@ -5,23 +5,28 @@ import time
 from collections.abc import Callable
 from contextlib import suppress
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from apathetic_utils import load_toml
-
-from .build import collect_included_files
-from .config import RootConfigResolved
 from .constants import DEFAULT_WATCH_INTERVAL
 from .logs import getAppLogger
 from .meta import Metadata
-from .utils.utils_validation import validate_required_keys
+from .timings import span
+
+
+# get_metadata() backs `serger --version`; the builder, serger.utils and
+# apathetic_utils are imported where they are used so it does not load them.
+if TYPE_CHECKING:
+    from .config import RootConfigResolved
 
 
-def _collect_included_files(resolved: RootConfigResolved) -> list[Path]:
+def _collect_included_files(resolved: "RootConfigResolved") -> list[Path]:
     """Collect all include globs into a unique list of files.
 
     Uses collect_included_files() from build.py for consistency.
     Watch mode respects excludes from config.
     """
+    from .build import collect_included_files  # noqa: PLC0415
+
     # include and exclude are optional, but if present they need validation
     # Validation happens inside collect_included_files
     includes = resolved.get("include", [])
@@ -35,7 +40,7 @@ def _collect_included_files(resolved: RootConfigResolved) -> list[Path]:
 
 def watch_for_changes(
     rebuild_func: Callable[[], None],
-    resolved: RootConfigResolved,
+    resolved: "RootConfigResolved",
     interval: float = DEFAULT_WATCH_INTERVAL,
 ) -> None:
     """Poll file modification times and rebuild when changes are detected.
@@ -46,6 +51,8 @@ def watch_for_changes(
     - Polling interval defaults to 1 second (tune 0.5–2.0 for balance).
     Stops on KeyboardInterrupt.
     """
+    from .utils.utils_validation import validate_required_keys  # noqa: PLC0415
+
     logger = getAppLogger()
     logger.info(
         "👀 Watching for changes (interval=%.2fs)... Press Ctrl+C to stop.", interval
@@ -114,7 +121,7 @@ def _get_metadata_from_header(script_path: Path) -> tuple[str, str]:
     logger.trace("reading commit from header: %s", script_path)
 
     with suppress(Exception):
-        text = script_path.read_text(encoding="utf-8")
+        text = _read_script_text(script_path)
 
         # --- Prefer Python constants if defined ---
         const_version = re.search(r"__version__\s*=\s*['\"]([^'\"]+)['\"]", text)
@@ -135,19 +142,37 @@ def _get_metadata_from_header(script_path: Path) -> tuple[str, str]:
     return version, commit
 
 
+def _read_script_text(script_path: Path) -> str:
+    """Read the stitched script's source through its loader.
+
+    A zipapp runs `x.pyz/__main__.py`, which is not a file on disk; the
+    zipimport loader that loaded it can still read it.
+    """
+    get_data = getattr(globals().get("__loader__"), "get_data", None)
+    if get_data is not None:
+        with suppress(OSError):
+            data: bytes = get_data(str(script_path))
+            return data.decode("utf-8")
+    return script_path.read_text(encoding="utf-8")
+
+
 def get_metadata() -> Metadata:
     """Return (version, commit) tuple for this tool.
 
-    - Stitched script → parse from header
+    - Stitched script → the header's __version__/__commit__ constants
+      (parsed from the script text if missing)
     - Source package → read pyproject.toml + git
     """
     script_path = Path(__file__)
     logger = getAppLogger()
     logger.trace("get_metadata ran from: %s", Path(__file__).resolve())
 
-    # --- Heuristic: stitched script lives outside `src/` ---
-    if globals().get("__STITCHED__", False):
-        version, commit = _get_metadata_from_header(script_path)
+    # --- Stitched script (any stitch_mode: exec modules lack __STITCHED__) ---
+    if globals().get("__STITCH_SOURCE__"):
+        version = globals().get("__version__")
+        commit = globals().get("__commit__")
+        if not (isinstance(version, str) and isinstance(commit, str)):
+            version, commit = _get_metadata_from_header(script_path)
         logger.trace(f"got stitched version {version} with commit {commit}")
         return Metadata(version, commit)
 
@@ -162,6 +187,8 @@ def get_metadata() -> Metadata:
     pyproject = root / "pyproject.toml"
     if pyproject.exists():
         logger.trace(f"trying to read metadata from {pyproject}")
+        from apathetic_utils import load_toml  # noqa: PLC0415
+
         data = load_toml(pyproject, required=False)
         if data:
             project = data.get("project", {})
@@ -172,13 +199,14 @@ def get_metadata() -> Metadata:
     # Try git for commit
     with suppress(Exception):
         logger.trace("trying to get commit from git")
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
-            cwd=root,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        with span("git rev-parse", category="subprocess"):
+            result = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+                cwd=root,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
         commit = result.stdout.strip()
 
     logger.trace(f"got package version {version} with commit {commit}")
@@ -1,6 +1,14 @@
 # src/serger/build.py
 
 
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import cast
@@ -12,16 +20,43 @@ from apathetic_utils import (
 )
 
 from .config import IncludeResolved, PathResolved, RootConfigResolved
-from .constants import BUILD_TIMESTAMP_PLACEHOLDER, DEFAULT_DRY_RUN
-from .logs import getAppLogger
+from .constants import (
+    BUILD_TIMESTAMP_PLACEHOLDER,
+    DEFAULT_BYTECODE_CACHE,
+    DEFAULT_DRY_RUN,
+    DEFAULT_LEAN_MODE,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_MODULE_LOADING,
+    DEFAULT_OPTIMIZE_IMPORTS,
+    DEFAULT_OUT_FORMAT,
+    DEFAULT_SHIM_ATTRS,
+    DEFAULT_STARTUP_PROFILING,
+    DEFAULT_TREE_SHAKE,
+    DEFAULT_ZIPAPP_PYTHON,
+)
+from .logs import Lazy, getAppLogger
+from .scheduler import BuildScheduler
 from .stitch import (
     compute_module_order,
     extract_commit,
     is_serger_build,
     stitch_modules,
 )
-from .utils import shorten_path_for_display
+from .timings import (
+    CacheStats,
+    CriticalPath,
+    SizeSample,
+    Span,
+    current_recorder,
+    memory_accounting,
+    memory_accounting_enabled,
+    recording,
+    span,
+    timed,
+)
+from .utils import get_installed_packages_roots, shorten_path_for_display
 from .utils.utils_validation import validate_required_keys
+from .verify_script import discover_tool_executables, using_tool_executables
 
 
 # --------------------------------------------------------------------------- #
@@ -29,7 +64,7 @@ from .utils.utils_validation import validate_required_keys
 # --------------------------------------------------------------------------- #
 
 
-def expand_include_pattern(include: IncludeResolved) -> list[Path]:
+def expand_include_pattern(include: IncludeResolved) -> list[Path]:  # noqa: PLR0912
     """Expand a single include pattern to a list of matching Python files.
 
     Args:
@@ -46,26 +81,26 @@ def expand_include_pattern(include: IncludeResolved) -> list[Path]:
 
     if src_pattern.endswith("/") and not has_glob_chars(src_pattern):
         logger.trace(
-            f"[MATCH] Treating as trailing-slash directory include → {src_pattern!r}",
+            "[MATCH] Treating as trailing-slash directory include → %r", src_pattern
         )
         root_dir = root / src_pattern.rstrip("/")
         if root_dir.exists():
             all_files = [p for p in root_dir.rglob("*") if p.is_file()]
             matches = [p for p in all_files if p.suffix == ".py"]
         else:
-            logger.trace(f"[MATCH] root_dir does not exist: {root_dir}")
+            logger.trace("[MATCH] root_dir does not exist: %s", root_dir)
 
     elif src_pattern.endswith("/**"):
-        logger.trace(f"[MATCH] Treating as recursive include → {src_pattern!r}")
+        logger.trace("[MATCH] Treating as recursive include → %r", src_pattern)
         root_dir = root / src_pattern.removesuffix("/**")
         if root_dir.exists():
             all_files = [p for p in root_dir.rglob("*") if p.is_file()]
             matches = [p for p in all_files if p.suffix == ".py"]
         else:
-            logger.trace(f"[MATCH] root_dir does not exist: {root_dir}")
+            logger.trace("[MATCH] root_dir does not exist: %s", root_dir)
 
     elif has_glob_chars(src_pattern):
-        logger.trace(f"[MATCH] Using glob() for pattern {src_pattern!r}")
+        logger.trace("[MATCH] Using glob() for pattern %r", src_pattern)
         # Make pattern relative to root if it's absolute
         pattern_path = Path(src_pattern)
         if pattern_path.is_absolute():
@@ -77,10 +112,10 @@ def expand_include_pattern(include: IncludeResolved) -> list[Path]:
                 src_pattern = pattern_path.name
         all_matches = list(root.glob(src_pattern))
         matches = [p for p in all_matches if p.is_file() and p.suffix == ".py"]
-        logger.trace(f"[MATCH] glob found {len(matches)} .py file(s)")
+        logger.trace("[MATCH] glob found %d .py file(s)", len(matches))
 
     else:
-        logger.trace(f"[MATCH] Treating as literal include {root / src_pattern}")
+        logger.trace("[MATCH] Treating as literal include %s", root / src_pattern)
         candidate = root / src_pattern
         if candidate.is_file() and candidate.suffix == ".py":
             matches = [candidate]
@@ -88,12 +123,14 @@ def expand_include_pattern(include: IncludeResolved) -> list[Path]:
     # Resolve all paths to absolute
     resolved_matches = [p.resolve() for p in matches]
 
-    for i, m in enumerate(resolved_matches):
-        logger.trace(f"[MATCH]   {i + 1:02d}. {m}")
+    if logger.isTraceEnabled():
+        for i, m in enumerate(resolved_matches, start=1):
+            logger.trace("[MATCH]   %02d. %s", i, m)
 
     return resolved_matches
 
 
+@timed()
 def collect_included_files(
     includes: list[IncludeResolved],
     excludes: list[PathResolved],
@@ -124,7 +161,7 @@ def collect_included_files(
             file_to_include[match] = inc  # Store the include for dest access
 
     logger.trace(
-        f"[COLLECT] Found {len(all_files)} file(s) from {len(includes)} include(s)",
+        "[COLLECT] Found %d file(s) from %d include(s)", len(all_files), len(includes)
     )
 
     # Apply excludes - each exclude has its own root!
@@ -136,18 +173,17 @@ def collect_included_files(
             exclude_root = Path(exc["root"]).resolve()
             exclude_patterns = [str(exc["path"])]
             if is_excluded_raw(file_path, exclude_patterns, exclude_root):
-                exc_display = shorten_path_for_display(exc)
                 logger.trace(
                     "[COLLECT] Excluded %s by pattern %s",
                     file_path,
-                    exc_display,
+                    Lazy(shorten_path_for_display, exc),
                 )
                 is_excluded = True
                 break
         if not is_excluded:
             filtered.append(file_path)
 
-    logger.trace(f"[COLLECT] After excludes: {len(filtered)} file(s)")
+    logger.trace("[COLLECT] After excludes: %d file(s)", len(filtered))
 
     return sorted(filtered), file_to_include
 
@@ -278,6 +314,7 @@ def _handle_literal_file_path(
     return True
 
 
+@timed()
 def resolve_order_paths(
     order: list[str],
     included_files: list[Path],
@@ -435,6 +472,7 @@ def _extract_build_metadata(
     project_root: Path,
     git_root: Path | None = None,
     disable_timestamp: bool = False,
+    commit: str | None = None,
 ) -> tuple[str, str, str]:
     """Extract version, commit, and build date for embedding.
 
@@ -443,6 +481,7 @@ def _extract_build_metadata(
         project_root: Project root path (for finding pyproject.toml)
         git_root: Git repository root path (for finding .git, defaults to project_root)
         disable_timestamp: If True, use placeholder instead of real timestamp
+        commit: Already-extracted commit hash (skips extraction when given)
 
     Returns:
         Tuple of (version, commit, build_date)
@@ -463,8 +502,9 @@ def _extract_build_metadata(
         git_root,
         commit_path,
     )
-    commit = extract_commit(commit_path)
-    logger.trace("_extract_build_metadata: extracted commit=%s", commit)
+    if commit is None:
+        commit = extract_commit(commit_path)
+    logger.trace("_extract_build_metadata: commit=%s", commit)
 
     if disable_timestamp:
         build_date = BUILD_TIMESTAMP_PLACEHOLDER
@@ -480,14 +520,316 @@ def _extract_build_metadata(
     return version, commit, build_date
 
 
-def run_build(  # noqa: C901, PLR0915, PLR0912
+@dataclass
+class BuildResult:
+    """What one run_build() call did.
+
+    Attributes:
+        out_path: File written (None for validate/dry-run and empty builds)
+        files: Source files collected (after exclusions once resolved)
+        bytes_in: Total size of those source files
+        bytes_out: Size of the written output (0 when nothing was written)
+        elapsed: Wall-clock seconds of the build
+        spans: Spans recorded during the build (see serger.timings)
+        caches: Cache lookups made during the build, by cache name
+        sizes: Data structure sizes measured during the build (only while
+            accounting memory, see serger.timings.memory_accounting)
+        critical_path: Main-thread stages and waits of the build
+    """
+
+    out_path: Path | None = None
+    files: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    elapsed: float = 0.0
+    spans: list[Span] = field(default_factory=list[Span])
+    caches: dict[str, CacheStats] = field(default_factory=dict[str, CacheStats])
+    sizes: list[SizeSample] = field(default_factory=list[SizeSample])
+    critical_path: CriticalPath | None = None
+
+    @property
+    def memory_peak(self) -> int | None:
+        """Peak bytes the build allocated (None unless accounting memory)."""
+        build_span = next(
+            (s for s in reversed(self.spans) if s.name == "run_build"), None
+        )
+        return build_span.mem_growth if build_span is not None else None
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-friendly dict (span times relative to the first span)."""
+        origin = min((s.start for s in self.spans), default=0.0)
+        return {
+            "out_path": str(self.out_path) if self.out_path else None,
+            "files": self.files,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "spans": [s.to_dict(origin) for s in self.spans],
+            "caches": {name: c.to_dict() for name, c in sorted(self.caches.items())},
+            "memory_peak_bytes": self.memory_peak,
+            "critical_path": (
+                self.critical_path.to_dict() if self.critical_path else None
+            ),
+        }
+
+
+def run_build(
     build_cfg: RootConfigResolved,
-) -> None:
+) -> BuildResult:
     """Execute a single build task using a fully resolved config.
 
     Serger handles module stitching builds (combining Python modules into
     a single executable script). File copying is the responsibility of
     pocket-build, not serger.
+
+    Independent I/O-bound steps (git metadata, tool discovery) run on a
+    small thread pool while files are collected and analyzed. The build's
+    critical path is kept in the result and the recorder (see `--timings`).
+
+    Spans go to the active recorder (e.g. the CLI's `--timings` one) or, if
+    there is none, to a recorder private to this build. With
+    `memory_budget_mb` set, the build's peak memory is checked afterwards;
+    the output has already been written by then and is left in place.
+
+    Returns:
+        BuildResult with file counts, sizes, spans and cache counters
+
+    Raises:
+        RuntimeError: If the build's peak memory exceeded memory_budget_mb
+    """
+    budget_mb = _memory_budget_mb(build_cfg)
+    result = BuildResult()
+    with _watch_peak_rss() as peak_rss, recording(current_recorder()) as recorder:
+        first_span = len(recorder.spans)
+        first_size = len(recorder.sizes)
+        caches = recorder.cache_snapshot()
+        start = time.perf_counter()
+        scheduler = BuildScheduler()
+        try:
+            with span("run_build"):
+                _run_build(build_cfg, scheduler, result)
+        finally:
+            scheduler.close()
+        scheduler.report()
+        result.critical_path = CriticalPath(
+            _build_label(build_cfg),
+            scheduler.elapsed,
+            tuple(scheduler.critical_path()),
+        )
+        recorder.add_critical_path(result.critical_path)
+        result.elapsed = time.perf_counter() - start
+        result.spans = recorder.spans[first_span:]
+        result.caches = recorder.caches_since(caches)
+        result.sizes = recorder.sizes[first_size:]
+    if budget_mb is not None:
+        _check_memory_budget(result, budget_mb, peak_rss)
+    return result
+
+
+def _memory_budget_mb(build_cfg: RootConfigResolved) -> float | None:
+    """Return the validated memory_budget_mb setting (None when unset)."""
+    budget = build_cfg.get("memory_budget_mb", DEFAULT_MEMORY_BUDGET_MB)
+    if budget is None:
+        return None
+    if isinstance(budget, bool) or not isinstance(budget, (int, float)):
+        msg = "Config 'memory_budget_mb' must be a number of megabytes or null"
+        raise TypeError(msg)
+    if budget <= 0:
+        msg = f"Config 'memory_budget_mb' must be positive, got {budget}"
+        raise ValueError(msg)
+    return float(budget)
+
+
+def _max_rss_bytes() -> int | None:
+    """Return this process's peak resident set size (None where unsupported)."""
+    try:
+        import resource  # noqa: PLC0415 (Unix only)
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class _PeakRss:
+    """The process's peak RSS around one build (see _watch_peak_rss())."""
+
+    before: int | None = None
+    after: int | None = None
+    alone: bool = False
+
+
+class _RunningBuilds:
+    """Counts run_build() calls in progress in this process (any thread)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._running = 0
+        self._started = 0
+
+    def enter(self) -> int:
+        """Register a build; return the token to pass to leave()."""
+        with self._lock:
+            self._running += 1
+            self._started += 1
+            return self._started if self._running == 1 else -1
+
+    def leave(self, token: int) -> bool:
+        """Unregister a build; return whether no other build overlapped it."""
+        with self._lock:
+            self._running -= 1
+            return token == self._started
+
+
+_running_builds = _RunningBuilds()
+
+
+@contextmanager
+def _watch_peak_rss() -> Iterator[_PeakRss]:
+    """Read the process's peak RSS before and after a build.
+
+    ru_maxrss is the peak over the process's whole lifetime, and --watch,
+    --serve, run_builds() workers and async callers run many builds in one
+    process. The value is this build's only if it rose during the build
+    and no other build ran at the same time.
+    """
+    peak = _PeakRss(before=_max_rss_bytes())
+    token = _running_builds.enter()
+    try:
+        yield peak
+    finally:
+        peak.alone = _running_builds.leave(token)
+        peak.after = _max_rss_bytes()
+
+
+def _build_peak_rss(peak_rss: _PeakRss, budget: float) -> int | None:
+    """Return the build's own peak RSS, or None when it can't be told apart.
+
+    The process's peak bounds every build in it from above, so a peak within
+    budget is always returned (the build fits). Over budget, it is only the
+    build's own if it rose during the build and no other build overlapped.
+    """
+    logger = getAppLogger()
+    before, after = peak_rss.before, peak_rss.after
+    if after is None:
+        logger.debug("memory_budget_mb not checked: no peak RSS here")
+        return None
+    if after <= budget:
+        return after  # no build in this process went over
+    if not peak_rss.alone:
+        reason = "other builds ran in this process at the same time"
+    elif before is None or after > before:
+        return after
+    else:
+        reason = (
+            f"this process already peaked at {after / 1048576:.1f} MB before this build"
+        )
+    logger.warning(
+        "memory_budget_mb not checked: %s, so its peak RSS is not this build's."
+        " Run with --memory-report to check the traced peak.",
+        reason,
+    )
+    return None
+
+
+def _check_memory_budget(
+    result: BuildResult, budget_mb: float, peak_rss: _PeakRss
+) -> None:
+    """Raise if the build's peak memory went over budget.
+
+    Uses the build's traced peak while accounting memory (`--memory-report`),
+    which is precise but slow to collect; otherwise the process's peak RSS,
+    which is free and is what runs out on a small CI runner, when it can be
+    attributed to this build (see _build_peak_rss()). The output is already
+    written and is left in place.
+    """
+    budget = budget_mb * 1024 * 1024
+    peak, measure = result.memory_peak, "traced"
+    if peak is None:
+        peak, measure = _build_peak_rss(peak_rss, budget), "peak RSS"
+    if peak is None or peak <= budget:
+        return
+    largest: dict[str, int] = {}
+    for sample in result.sizes:
+        largest[sample.name] = max(largest.get(sample.name, 0), sample.size)
+    top = sorted(largest.items(), key=lambda item: -item[1])[:3]
+    details = ", ".join(f"{name} {size / 1048576:.1f} MB" for name, size in top)
+    xmsg = (
+        f"Build peaked at {peak / 1048576:.1f} MB ({measure}), over its "
+        f"memory_budget_mb of "
+        f"{budget_mb:g} MB"
+        + (f" (largest: {details})" if details else "")
+        + ". Run with --memory-report to see memory per phase."
+        + (
+            f" The output was still written to {result.out_path}."
+            if result.out_path
+            else ""
+        )
+    )
+    raise RuntimeError(xmsg)
+
+
+def _out_file_suffix(build_cfg: RootConfigResolved) -> str:
+    """Return the output file extension for the build's out_format."""
+    out_format = build_cfg.get("out_format", DEFAULT_OUT_FORMAT)
+    return ".pyz" if out_format == "zipapp" else ".py"
+
+
+def _resolve_out_path(build_cfg: RootConfigResolved, *, stitching: bool) -> Path:
+    """Return the file a build writes.
+
+    `out` is a directory if it is one, or if it does not exist and has no
+    .py extension (.pyz for zipapps); a stitch build then writes
+    `<package>.py` (or `.pyz`) inside it.
+    """
+    out_entry = build_cfg["out"]
+    out_path = (out_entry["root"] / out_entry["path"]).resolve()
+    out_suffix = _out_file_suffix(build_cfg)
+    # Use the resolved path string to check the extension (handles absolute
+    # paths correctly)
+    is_directory = out_path.is_dir() or (
+        not out_path.exists() and not str(out_path).endswith(out_suffix)
+    )
+    package = build_cfg.get("package")
+    if is_directory and stitching and package:
+        out_path = out_path / f"{package}{out_suffix}"
+    return out_path
+
+
+def _check_output_path(out_path: Path, max_lines: int | None) -> bool:
+    """Return whether out_path is a serger build (or absent); raise otherwise.
+
+    Safety check: don't overwrite files that aren't serger builds.
+    """
+    is_serger_build_result = not out_path.exists() or is_serger_build(
+        out_path, max_lines=max_lines
+    )
+    if out_path.exists() and not is_serger_build_result:
+        xmsg = (
+            f"Refusing to overwrite {out_path} because it does not appear "
+            "to be a serger-generated build. If you want to overwrite this "
+            "file, please delete it first or rename it."
+        )
+        raise RuntimeError(xmsg)
+    return is_serger_build_result
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _run_build(  # noqa: C901, PLR0915, PLR0912
+    build_cfg: RootConfigResolved,
+    scheduler: BuildScheduler,
+    result: BuildResult,
+) -> None:
+    """Body of run_build(); stages and background tasks go through scheduler.
+
+    Counts and sizes are filled into `result` as they become known.
     """
     validate_required_keys(
         build_cfg,
@@ -506,6 +848,15 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
     dry_run = build_cfg.get("dry_run", DEFAULT_DRY_RUN)
     validate = build_cfg.get("validate", False)
 
+    # Start I/O-bound work in the background while files are collected.
+    # Use config_root (project root) for git; it is resolved for git lookups.
+    git_root = build_cfg["__meta__"]["config_root"].resolve()
+    scheduler.submit("git", extract_commit, git_root)
+    if not (dry_run or validate):
+        scheduler.submit(
+            "tools", discover_tool_executables, build_cfg["post_processing"]
+        )
+
     # Extract stitching fields from config
     package = build_cfg.get("package")
     order = build_cfg.get("order")
@@ -521,7 +872,10 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
         includes,
         excludes,
     )
+    scheduler.begin_stage("collect")
     included_files, file_to_include = collect_included_files(includes, excludes)
+    result.files = len(included_files)
+    scheduler.begin_stage("analyze")
     logger.trace(
         "🔍 [DEBUG] Collected %d files: %s",
         len(included_files),
@@ -556,18 +910,8 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
 
     # Determine output file path
     validate_required_keys(out_entry, {"path", "root"}, "build_cfg['out']")
-    out_path = (out_entry["root"] / out_entry["path"]).resolve()
-    # Check if it's a directory (exists and is dir) or should be treated as one
-    # If path doesn't exist and has no .py extension, treat as directory
-    # Use the resolved path string to check for .py extension
-    # (handles absolute paths correctly)
-    out_path_str = str(out_path)
-    is_directory = out_path.is_dir() or (
-        not out_path.exists() and not out_path_str.endswith(".py")
-    )
     # Only use package for output path if we have included files (stitch build)
-    if is_directory and included_files and package:
-        out_path = out_path / f"{package}.py"
+    out_path = _resolve_out_path(build_cfg, stitching=bool(included_files))
 
     # --- Validate-config exit point ---
     # Exit after file collection but before expensive stitching work
@@ -609,19 +953,10 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
         raise ValueError(xmsg)
 
     # Safety check: Don't overwrite files that aren't serger builds
-    # (fail fast before doing expensive work)
+    # (fail fast before doing expensive work; it only reads a few lines)
     # Compute once and pass down to avoid recomputation
     max_lines = build_cfg.get("build_tool_find_max_lines")
-    is_serger_build_result = not out_path.exists() or is_serger_build(
-        out_path, max_lines=max_lines
-    )
-    if out_path.exists() and not is_serger_build_result:
-        xmsg = (
-            f"Refusing to overwrite {out_path} because it does not appear "
-            "to be a serger-generated build. If you want to overwrite this "
-            "file, please delete it first or rename it."
-        )
-        raise RuntimeError(xmsg)
+    is_serger_build_result = _check_output_path(out_path, max_lines)
 
     # Get config root for resolving order paths and validating module_actions
     validate_required_keys(
@@ -707,6 +1042,8 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
     if not final_files:
         xmsg = "No files remaining after exclusions"
         raise ValueError(xmsg)
+    result.files = len(final_files)
+    result.bytes_in = sum(_file_size(f) for f in final_files)
 
     # Warn about files outside project directory
     cwd = Path.cwd().resolve()
@@ -717,6 +1054,7 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
     # Convert to Path objects for comparison
     source_base_paths = [Path(base).resolve() for base in source_bases]
     installed_base_paths = [Path(base).resolve() for base in installed_bases]
+    installed_bases_checked = False
     for file_path in final_files:
         file_path_resolved = file_path.resolve()
         # Check if file is inside source_bases or installed_bases
@@ -738,6 +1076,22 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
             and not is_in_source_bases
             and not is_in_installed_bases
         )
+        # Installed bases are discovered lazily during resolution; consult them
+        # now only if this file would otherwise be warned about
+        if (
+            should_warn
+            and build_cfg.get("auto_discover_installed_packages")
+            and not installed_bases_checked
+        ):
+            installed_bases_checked = True
+            installed_base_paths.extend(
+                Path(base).resolve()
+                for base in get_installed_packages_roots(Path(config_root))
+            )
+            should_warn = not any(
+                file_path_resolved.is_relative_to(base_path)
+                for base_path in installed_base_paths
+            )
         if should_warn:
             logger.warning(
                 "Including file outside project directory: %s "
@@ -865,6 +1219,8 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
     stitch_mode = build_cfg["stitch_mode"]
     module_mode = build_cfg["module_mode"]
     shim = build_cfg.get("shim", "all")
+    shim_attrs = build_cfg.get("shim_attrs", DEFAULT_SHIM_ATTRS)
+    module_loading = build_cfg.get("module_loading", DEFAULT_MODULE_LOADING)
     comments_mode = build_cfg["comments_mode"]
     docstring_mode = build_cfg["docstring_mode"]
     # module_actions already validated and normalized above
@@ -881,6 +1237,18 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
         "stitch_mode": stitch_mode,
         "module_mode": module_mode,
         "shim": shim,
+        "shim_attrs": shim_attrs,
+        "module_loading": module_loading,
+        "bytecode_cache": build_cfg.get("bytecode_cache", DEFAULT_BYTECODE_CACHE),
+        "tree_shake": build_cfg.get("tree_shake", DEFAULT_TREE_SHAKE),
+        "tree_shake_keep": build_cfg.get("tree_shake_keep", []),
+        "startup_profiling": build_cfg.get(
+            "startup_profiling", DEFAULT_STARTUP_PROFILING
+        ),
+        "out_format": build_cfg.get("out_format", DEFAULT_OUT_FORMAT),
+        "zipapp_python": build_cfg.get("zipapp_python", DEFAULT_ZIPAPP_PYTHON),
+        "lean_mode": build_cfg.get("lean_mode", DEFAULT_LEAN_MODE),
+        "optimize_imports": build_cfg.get("optimize_imports", DEFAULT_OPTIMIZE_IMPORTS),
         "module_actions": module_actions,
         "comments_mode": comments_mode,
         "docstring_mode": docstring_mode,
@@ -897,14 +1265,13 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
     # Extract metadata for embedding
     # Use config_root for finding pyproject.toml (project root) and for git
     config_root = build_cfg["__meta__"]["config_root"]
-    # Resolve to absolute path for git operations
-    git_root = config_root.resolve()
     disable_timestamp = build_cfg.get("disable_build_timestamp", False)
     version, commit, build_date = _extract_build_metadata(
         build_cfg=build_cfg,
         project_root=config_root,
         git_root=git_root,  # Use resolved project root for git operations
         disable_timestamp=disable_timestamp,
+        commit=scheduler.result("git"),
     )
 
     # Create parent directory if needed (skip in dry-run)
@@ -944,21 +1311,190 @@ def run_build(  # noqa: C901, PLR0915, PLR0912
     )
     logger.info("🧵 Stitching %s → %s", package, out_display)
 
+    scheduler.begin_stage("stitch")
     try:
-        stitch_modules(
-            config=stitch_config,
-            file_paths=included_files,
-            package_root=package_root,
-            file_to_include=file_to_include,
-            out_path=out_path,
-            license_text=license_text,
-            version=version,
-            commit=commit,
-            build_date=build_date,
-            post_processing=post_processing,
-            is_serger_build=is_serger_build_result,
-        )
+        with using_tool_executables(scheduler.result("tools")):
+            stitch_modules(
+                config=stitch_config,
+                file_paths=included_files,
+                package_root=package_root,
+                file_to_include=file_to_include,
+                out_path=out_path,
+                license_text=license_text,
+                version=version,
+                commit=commit,
+                build_date=build_date,
+                post_processing=post_processing,
+                is_serger_build=is_serger_build_result,
+            )
+        result.out_path = out_path
+        result.bytes_out = _file_size(out_path)
         logger.brief("✅ Stitch completed → %s\n", out_display)
     except RuntimeError as e:
         xmsg = f"Stitch build failed: {e}"
         raise RuntimeError(xmsg) from e
+
+
+# --------------------------------------------------------------------------- #
+# Multi-build orchestration
+# --------------------------------------------------------------------------- #
+
+
+# Failures a build reports with a message of its own; others are shown
+# with their type
+_EXPECTED_BUILD_ERRORS = (FileNotFoundError, ValueError, TypeError, RuntimeError)
+
+
+@dataclass(frozen=True)
+class _BuildOutcome:
+    """Result of one build in a multi-build run (picklable across processes)."""
+
+    index: int
+    label: str
+    elapsed: float
+    error: str | None = None
+    result: BuildResult | None = None
+
+
+def _planned_out_path(build_cfg: RootConfigResolved) -> Path:
+    """Output path of a build, assuming it stitches (see _resolve_out_path)."""
+    return _resolve_out_path(build_cfg, stitching=True)
+
+
+def _build_label(build_cfg: RootConfigResolved) -> str:
+    meta = build_cfg["__meta__"]
+    out_display = shorten_path_for_display(
+        _planned_out_path(build_cfg),
+        cwd=meta.get("cli_root"),
+        config_dir=meta.get("config_root"),
+    )
+    return f"{build_cfg.get('package') or '(no package)'} → {out_display}"
+
+
+def _run_build_worker(
+    index: int,
+    build_cfg: RootConfigResolved,
+    *,
+    memory: bool = False,
+) -> _BuildOutcome:
+    """Run one build, capturing its failure instead of raising.
+
+    Any exception fails only this build, so the other builds and the
+    summary still go through. Top-level so it can be pickled into a process
+    pool. `memory` carries the parent's memory accounting over to the
+    worker process.
+    """
+    label = _build_label(build_cfg)
+    start = time.perf_counter()
+    try:
+        with memory_accounting() if memory else nullcontext():
+            result = run_build(build_cfg)
+    except Exception as e:  # noqa: BLE001
+        getAppLogger().debug("Build %s failed", label, exc_info=True)
+        error = str(e) if isinstance(e, _EXPECTED_BUILD_ERRORS) else repr(e)
+        return _BuildOutcome(index, label, time.perf_counter() - start, error)
+    return _BuildOutcome(index, label, time.perf_counter() - start, result=result)
+
+
+def _merge_worker_timings(outcomes: list[_BuildOutcome]) -> None:
+    """Add spans recorded in worker processes to this process's recorder."""
+    recorder = current_recorder()
+    if recorder is None:
+        return
+    for outcome in outcomes:
+        if outcome.result is not None:
+            result = outcome.result
+            recorder.merge(
+                result.spans,
+                result.caches,
+                result.sizes,
+                [result.critical_path] if result.critical_path else None,
+            )
+
+
+def run_builds(
+    builds: list[RootConfigResolved],
+    *,
+    max_workers: int | None = None,
+) -> list[BuildResult]:
+    """Execute several resolved builds and report them in one summary.
+
+    Builds are independent, so when there is more than one they run
+    concurrently in a process pool (one interpreter per build, which sidesteps
+    the GIL for the AST-heavy stitching work). A single build runs in-process.
+    All builds run to completion even if one fails.
+
+    Args:
+        builds: Fully resolved build configs (e.g. from expand_build_configs)
+        max_workers: Upper bound on worker processes
+            (default: number of CPUs, capped at the number of builds)
+
+    Returns:
+        One BuildResult per build, in declaration order. Spans of builds run
+        in worker processes are also added to the active recorder.
+
+    Raises:
+        ValueError: If two builds would write the same output file
+        RuntimeError: If any build failed (raised after all builds finish)
+    """
+    logger = getAppLogger()
+    if not builds:
+        return []
+
+    # Fail fast: concurrent builds must never race on the same output file
+    seen_outputs: dict[Path, int] = {}
+    for i, build_cfg in enumerate(builds, start=1):
+        out_path = _planned_out_path(build_cfg)
+        if out_path in seen_outputs:
+            xmsg = (
+                f"Builds #{seen_outputs[out_path]} and #{i} both write to "
+                f"{out_path}. Give each build its own 'out'."
+            )
+            raise ValueError(xmsg)
+        seen_outputs[out_path] = i
+
+    if len(builds) == 1:
+        return [run_build(builds[0])]
+
+    workers = min(len(builds), max_workers or os.cpu_count() or 1)
+    logger.info("🚀 Running %d builds (%d worker(s))...", len(builds), workers)
+    start = time.perf_counter()
+    outcomes: list[_BuildOutcome] = []
+    if workers == 1:
+        outcomes = [_run_build_worker(i, cfg) for i, cfg in enumerate(builds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_build_worker, i, cfg, memory=memory_accounting_enabled()
+                )
+                for i, cfg in enumerate(builds)
+            ]
+            outcomes = [f.result() for f in as_completed(futures)]
+        _merge_worker_timings(outcomes)
+    elapsed = time.perf_counter() - start
+
+    # --- Summary (declaration order, not completion order) ---
+    failed = [o for o in outcomes if o.error is not None]
+    lines: list[str] = []
+    for outcome in sorted(outcomes, key=lambda o: o.index):
+        if outcome.error is None:
+            lines.append(f"  ✅ {outcome.label} ({outcome.elapsed:.2f}s)")
+        else:
+            lines.append(f"  ❌ {outcome.label}: {outcome.error}")
+    logger.info(
+        "📦 %d/%d builds succeeded in %.2fs\n%s",
+        len(outcomes) - len(failed),
+        len(outcomes),
+        elapsed,
+        "\n".join(lines),
+    )
+
+    if failed:
+        xmsg = f"{len(failed)} of {len(outcomes)} builds failed"
+        raise RuntimeError(xmsg)
+    return [
+        o.result
+        for o in sorted(outcomes, key=lambda o: o.index)
+        if o.result is not None
+    ]
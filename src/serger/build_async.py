@@ -0,0 +1,194 @@
+# src/serger/build_async.py
+"""asyncio API for running builds from an event loop.
+
+run_build_async() and stitch_modules_async() run the blocking build on a
+worker thread, so the loop stays responsive, and run the build's
+subprocesses (git, post-processing tools, verification, zipapp_python) on
+the loop with asyncio.create_subprocess_exec(). Many builds can be awaited
+at once, e.g. with asyncio.gather().
+
+Cancelling the awaiting task kills the subprocess the build is waiting on
+and stops the build at its next subprocess call or stage boundary. The
+CancelledError is raised once the build thread has stopped, so a cancelled
+build never writes output afterwards.
+"""
+
+import asyncio
+import contextvars
+import locale
+import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import CancelledError as FutureCancelledError, Executor, Future
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .build import BuildResult, run_build
+from .scheduler import using_stage_check
+from .stitch import stitch_modules
+from .utils.utils_subprocess import using_subprocess_runner
+
+
+if TYPE_CHECKING:
+    from .config import RootConfigResolved
+
+
+_T = TypeVar("_T")
+
+
+def _decode_output(data: bytes | None) -> str | None:
+    """Decode captured output as subprocess.run(text=True) does."""
+    if data is None:
+        return None
+    text = data.decode(locale.getpreferredencoding(False))
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+async def _run_process(
+    args: list[str],
+    *,
+    cwd: str | Path | None = None,
+    input: str | bytes | None = None,  # noqa: A002
+    capture_output: bool = False,
+    text: bool = False,
+    check: bool = False,
+    timeout: float | None = None,
+) -> "subprocess.CompletedProcess[Any]":
+    """subprocess.run() on the event loop (the arguments build code uses)."""
+    if isinstance(input, str):
+        input = input.encode(locale.getpreferredencoding(False))  # noqa: A001
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=pipe,
+        stderr=pipe,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(input), timeout)
+    except BaseException as e:
+        # timed out or cancelled: don't leave the process running
+        with suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        if isinstance(e, asyncio.TimeoutError):
+            raise subprocess.TimeoutExpired(args, timeout or 0) from None
+        raise
+    returncode = process.returncode if process.returncode is not None else -1
+    out: Any = _decode_output(stdout) if text else stdout
+    err: Any = _decode_output(stderr) if text else stderr
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args, out, err)
+    return subprocess.CompletedProcess(args, returncode, out, err)
+
+
+class _LoopSubprocessRunner:
+    """SubprocessRunner for a build thread: runs each command on the loop.
+
+    cancel() (called on the loop) cancels the command being waited on and
+    makes every later command and stage boundary raise CancelledError.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._running: set[Future[Any]] = set()
+
+    def __call__(
+        self, args: list[str], **kwargs: Any
+    ) -> "subprocess.CompletedProcess[Any]":
+        self.raise_if_cancelled()
+        future = asyncio.run_coroutine_threadsafe(
+            _run_process(args, **kwargs), self._loop
+        )
+        with self._lock:
+            self._running.add(future)
+        if self._cancelled.is_set():  # cancelled before it was registered
+            future.cancel()
+        try:
+            return future.result()
+        except FutureCancelledError as e:
+            # asyncio's CancelledError is a BaseException, so the build's
+            # `except Exception` handlers let it through
+            raise asyncio.CancelledError from e
+        finally:
+            with self._lock:
+                self._running.discard(future)
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise asyncio.CancelledError
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        with self._lock:
+            for future in self._running:
+                future.cancel()
+
+
+async def _run_in_build_thread(func: Callable[[], _T], executor: Executor | None) -> _T:
+    """Run `func` on `executor` with its subprocesses on the running loop."""
+    loop = asyncio.get_running_loop()
+    runner = _LoopSubprocessRunner(loop)
+
+    def call() -> _T:
+        with (
+            using_subprocess_runner(runner),
+            using_stage_check(runner.raise_if_cancelled),
+        ):
+            return func()
+
+    # each build gets its own copy of the caller's context (e.g. recording())
+    context = contextvars.copy_context()
+    future = loop.run_in_executor(executor, context.run, call)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        runner.cancel()
+        # report the cancellation only once the build thread has stopped
+        with suppress(Exception, asyncio.CancelledError):
+            await future
+        raise
+
+
+async def run_build_async(
+    build_cfg: "RootConfigResolved",
+    *,
+    executor: Executor | None = None,
+) -> BuildResult:
+    """Run run_build() without blocking the event loop.
+
+    Args:
+        build_cfg: Resolved build configuration (as for run_build())
+        executor: Thread pool to run the build on (default: the loop's
+            default executor). Process pools are not supported.
+
+    Returns:
+        The BuildResult from run_build()
+
+    Raises:
+        asyncio.CancelledError: If the awaiting task was cancelled
+    """
+    return await _run_in_build_thread(partial(run_build, build_cfg), executor)
+
+
+async def stitch_modules_async(
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Run stitch_modules() without blocking the event loop.
+
+    Args:
+        executor: Thread pool to run the stitch on (default: the loop's
+            default executor). Process pools are not supported.
+        **kwargs: Keyword arguments for stitch_modules()
+
+    Raises:
+        asyncio.CancelledError: If the awaiting task was cancelled
+    """
+    await _run_in_build_thread(partial(stitch_modules, **kwargs), executor)
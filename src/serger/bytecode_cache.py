@@ -0,0 +1,108 @@
+# src/serger/bytecode_cache.py
+"""Self-caching loader stub for stitched scripts.
+
+Python never writes bytecode for the script it runs as `__main__`, so a
+large stitched file is tokenized, parsed and compiled on every invocation.
+With `bytecode_cache` enabled, the stitched program is stored as comment
+lines behind a small loader. The tokenizer skips comments cheaply; the
+loader compiles the program once per (build, interpreter) and later runs
+unmarshal the cached code object instead.
+"""
+
+import hashlib
+
+from .meta import PROGRAM_PACKAGE
+
+
+# Separates the loader from the commented-out program
+BYTECODE_CACHE_MARKER = "# --- serger: cached program below ---"
+
+# Loader placed at the top of the output. Filled via str.format():
+# {digest} identifies the program text, {marker} is BYTECODE_CACHE_MARKER,
+# {program} names the build tool (header line and cache directory).
+_LOADER_TEMPLATE = """\
+#!/usr/bin/env python3
+# Build Tool: {program} (bytecode-cached loader)
+# The program is stored below as comment lines. This loader compiles it once
+# per interpreter and caches the code object (under $XDG_CACHE_HOME/{program},
+# or next to this file), so later runs skip parsing and compiling it.
+
+
+def _serger_cached_code(digest: str) -> object:
+    import marshal
+    import os
+    import sys
+    from importlib.util import MAGIC_NUMBER
+
+    path = os.path.abspath(__file__)
+    tag = f"{{digest}}-{{MAGIC_NUMBER.hex()}}-o{{sys.flags.optimize}}"
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    name = os.path.basename(path)
+    candidates = [
+        os.path.join(cache_home, "{program}", "bytecode", f"{{name}}.{{tag}}.bin"),
+        os.path.join(os.path.dirname(path), "__pycache__", f"{{name}}.{{tag}}.bin"),
+    ]
+    for cache_path in candidates:
+        try:
+            with open(cache_path, "rb") as f:
+                return marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            continue
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().split("\\n")
+    start = lines.index("{marker}") + 1
+    # Leading newlines keep line numbers in tracebacks pointing into this file
+    source = "\\n" * start + "\\n".join(line[1:] for line in lines[start:])
+    code = compile(source, path, "exec", dont_inherit=True)
+    if not sys.dont_write_bytecode:
+        data = marshal.dumps(code)
+        for cache_path in candidates:
+            tmp_path = f"{{cache_path}}.{{os.getpid()}}.tmp"
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_path)
+                break
+            except OSError:
+                continue
+    return code
+
+
+_serger_code = _serger_cached_code("{digest}")
+del _serger_cached_code
+exec(_serger_code)
+
+{marker}
+"""
+
+
+def wrap_with_bytecode_cache(script_text: str) -> str:
+    """Turn a stitched script into a self-caching loader plus its program.
+
+    The program text is kept verbatim as comment lines (each prefixed with
+    `#`), so the output stays readable and diffable. Its SHA-256 digest keys
+    the cache, so a rebuilt script never picks up stale bytecode.
+
+    Args:
+        script_text: The complete stitched script
+
+    Returns:
+        The loader script with the program appended
+
+    Raises:
+        ValueError: If the script contains carriage returns (Python would end
+            the comment there and run the rest of the line)
+    """
+    if "\r" in script_text:
+        xmsg = "Cannot comment out a script that contains carriage returns"
+        raise ValueError(xmsg)
+    digest = hashlib.sha256(script_text.encode("utf-8")).hexdigest()[:32]
+    loader = _LOADER_TEMPLATE.format(
+        digest=digest, marker=BYTECODE_CACHE_MARKER, program=PROGRAM_PACKAGE
+    )
+    program = "\n".join(f"#{line}" for line in script_text.split("\n"))
+    return f"{loader}{program}\n"
@@ -1,30 +1,42 @@
 # src/serger/cli.py
 
 import argparse
+import json
 import platform
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from difflib import get_close_matches
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from apathetic_logging import LEVEL_ORDER, safeLog, setRootLevel
-from apathetic_utils import cast_hint, get_sys_version_info
+from apathetic_logging import LEVEL_ORDER, TRACE_LEVEL, safeLog, setRootLevel
 
-from .actions import get_metadata, watch_for_changes
-from .build import run_build
-from .config import (
-    RootConfig,
-    RootConfigResolved,
-    load_and_validate_config,
-    resolve_config,
-)
 from .constants import (
     DEFAULT_DRY_RUN,
     DEFAULT_WATCH_INTERVAL,
 )
-from .logs import getAppLogger
+from .logs import configureLogQueue, flushLogs, getAppLogger
 from .meta import DESCRIPTION, PROGRAM_DISPLAY, PROGRAM_PACKAGE, PROGRAM_SCRIPT
-from .selftest import run_selftest
+from .timings import (
+    format_memory_table,
+    format_timings_table,
+    memory_accounting,
+    memory_to_dict,
+    record_cache,
+    recording,
+    span,
+    timings_to_chrome_trace,
+    timings_to_dict,
+)
+
+
+# The stitcher, config loader and apathetic_utils are imported inside the
+# functions that need them, so `--help` and `--version` stay fast.
+if TYPE_CHECKING:
+    from .build import BuildResult
+    from .config import RootConfig, RootConfigResolved
 
 
 # --------------------------------------------------------------------------- #
@@ -148,6 +160,22 @@ def _setup_parser() -> argparse.ArgumentParser:  # noqa: PLR0915
         ),
     )
 
+    # serve (build server)
+    #   invalidates: all
+    #   not valid with: version, selftest, help
+    commands.add_argument(
+        "--serve",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="SOCKET",
+        help=(
+            "Run a build server on a Unix socket; later serger runs hand their "
+            "builds to it and reuse its warm caches. "
+            "(default socket: $SERGER_SERVE_SOCKET or the user cache dir)"
+        ),
+    )
+
     # selftest
     #   invalidates: all
     #   not valid with: version, help
@@ -267,6 +295,33 @@ def _setup_parser() -> argparse.ArgumentParser:  # noqa: PLR0915
     # --- Build options ---
     build_opts = parser.add_argument_group("Build & Watch options")
 
+    # config cache
+    config_cache = build_opts.add_mutually_exclusive_group()
+    config_cache.add_argument(
+        "--config-cache",
+        dest="config_cache",
+        action="store_true",
+        help=(
+            "Reuse the resolved config from a previous run when the config, "
+            "pyproject.toml, license files, env and args are unchanged."
+        ),
+    )
+    config_cache.add_argument(
+        "--no-config-cache",
+        dest="config_cache",
+        action="store_false",
+        help="Always resolve the config from scratch (default).",
+    )
+    config_cache.set_defaults(config_cache=None)
+
+    # build server
+    build_opts.add_argument(
+        "--no-server",
+        dest="no_server",
+        action="store_true",
+        help="Build in this process even if a --serve server is running.",
+    )
+
     # dry-run
     build_opts.add_argument(
         "--dry-run",
@@ -330,6 +385,33 @@ def _setup_parser() -> argparse.ArgumentParser:  # noqa: PLR0915
         help="Disable build timestamps for deterministic builds (uses placeholder).",
     )
 
+    # timings
+    build_opts.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print how long config resolution and each build phase took.",
+    )
+    build_opts.add_argument(
+        "--timings-json",
+        metavar="PATH",
+        default=None,
+        help="Write phase timings, file counts, sizes and cache hits as JSON.",
+    )
+    build_opts.add_argument(
+        "--trace-out",
+        metavar="PATH",
+        default=None,
+        help="Write every build span as Chrome trace-event JSON (for Perfetto).",
+    )
+    build_opts.add_argument(
+        "--memory-report",
+        action="store_true",
+        help=(
+            "Trace memory with tracemalloc; print peak and retained memory per "
+            "phase and the largest data structures (slows the build)."
+        ),
+    )
+
     # --- Universal flags ---
     uni = parser.add_argument_group("Universal flags")
 
@@ -448,10 +530,13 @@ class _LoadedConfig:
     """Container for loaded and resolved configuration data."""
 
     config_path: Path | None
-    root_cfg: RootConfig
-    resolved: RootConfigResolved
+    root_cfg: "RootConfig"
+    resolved: "RootConfigResolved"
     config_dir: Path
     cwd: Path
+    # One (build config, resolved) pair per build; the first pair is
+    # root_cfg/resolved. Holds more than one entry only for a 'builds' list.
+    builds: "list[tuple[RootConfig, RootConfigResolved]]"
 
 
 def _initialize_logger(args: argparse.Namespace) -> None:
@@ -460,6 +545,7 @@ def _initialize_logger(args: argparse.Namespace) -> None:
     log_level = logger.determineLogLevel(args=args)
     setRootLevel(log_level)
     logger.enable_color = getattr(args, "enable_color", logger.determineColorEnabled())
+    _sync_log_queue()
     logger.trace("[BOOT] log-level initialized: %s", logger.levelName)
 
     logger.debug(
@@ -470,9 +556,14 @@ def _initialize_logger(args: argparse.Namespace) -> None:
     )
 
 
+def _sync_log_queue() -> None:
+    """Queue log output at trace level so builds don't wait on stderr."""
+    configureLogQueue(enabled=getAppLogger().getEffectiveLevel() == TRACE_LEVEL)
+
+
 def _validate_includes(
-    root_cfg: RootConfig,
-    resolved: RootConfigResolved,
+    root_cfg: "RootConfig",
+    resolved: "RootConfigResolved",
     args: argparse.Namespace,
 ) -> bool:
     """
@@ -528,8 +619,8 @@ def _validate_includes(
 
 
 def _validate_package(  # noqa: PLR0912
-    root_cfg: RootConfig,
-    resolved: RootConfigResolved,
+    root_cfg: "RootConfig",
+    resolved: "RootConfigResolved",
     _args: argparse.Namespace,
 ) -> bool:
     """
@@ -666,24 +757,30 @@ def _handle_early_exits(args: argparse.Namespace) -> int | None:
 
     Returns exit code if we should exit early, None otherwise.
     """
+    from .actions import get_metadata  # noqa: PLC0415
+
     logger = getAppLogger()
 
     # --- Version flag ---
     if getattr(args, "version", None):
         meta = get_metadata()
-        stitched = " [stitched]" if globals().get("__STITCHED__", False) else ""
+        stitched = " [stitched]" if globals().get("__STITCH_SOURCE__") else ""
         logger.info(
             "%s %s (%s)%s", PROGRAM_DISPLAY, meta.version, meta.commit, stitched
         )
         return 0
 
     # --- Python version check ---
+    from apathetic_utils import get_sys_version_info  # noqa: PLC0415
+
     if get_sys_version_info() < (3, 10):
         logger.error("%s requires Python 3.10 or newer.", PROGRAM_DISPLAY)
         return 1
 
     # --- Self-test mode ---
     if getattr(args, "selftest", None):
+        from .selftest import run_selftest  # noqa: PLC0415
+
         return 0 if run_selftest() else 1
 
     return None
@@ -692,7 +789,57 @@ def _handle_early_exits(args: argparse.Namespace) -> int | None:
 def _load_and_resolve_config(
     args: argparse.Namespace,
 ) -> _LoadedConfig:
-    """Load config and resolve final configuration."""
+    """Load config and resolve final configuration.
+
+    With the config cache enabled, a previous result is reused when none of
+    its inputs changed, skipping loading and resolution entirely.
+    """
+    from .config import (  # noqa: PLC0415
+        is_config_cache_enabled,
+        load_cached_config,
+        make_config_cache_key,
+        recording_config_dependencies,
+        resolved_config_directories,
+        store_cached_config,
+    )
+
+    logger = getAppLogger()
+
+    if not is_config_cache_enabled(args):
+        return _load_and_resolve_config_uncached(args)
+
+    cache_key = make_config_cache_key(args, Path.cwd().resolve())
+    cached = load_cached_config(cache_key)
+    record_cache("config", hit=isinstance(cached, _LoadedConfig))
+    if isinstance(cached, _LoadedConfig):
+        # Resolution normally syncs the runtime log level; do it here instead
+        setRootLevel(cached.resolved["log_level"])
+        logger.debug("⚡ Using cached resolved config")
+        return cached
+
+    with recording_config_dependencies() as dependencies:
+        loaded = _load_and_resolve_config_uncached(args)
+    if loaded.config_path is not None:
+        dependencies.add(loaded.config_path.resolve())
+    for _build_cfg, resolved in loaded.builds:
+        dependencies |= resolved_config_directories(resolved)
+    store_cached_config(cache_key, loaded, dependencies)
+    return loaded
+
+
+def _load_and_resolve_config_uncached(
+    args: argparse.Namespace,
+) -> _LoadedConfig:
+    """Find, load, validate and resolve the config (no caching)."""
+    from apathetic_utils import cast_hint  # noqa: PLC0415
+
+    from .config import (  # noqa: PLC0415
+        RootConfig,
+        expand_build_configs,
+        load_and_validate_config,
+        resolve_config,
+    )
+
     logger = getAppLogger()
 
     # --- Load configuration ---
@@ -715,30 +862,53 @@ def _load_and_resolve_config(
         logger.info("No config file found — using CLI-only mode.")
         root_cfg = cast_hint(RootConfig, {})
 
-    # --- Resolve config with args and defaults ---
-    resolved = resolve_config(root_cfg, args, config_dir, cwd)
+    # --- Resolve config with args and defaults (once per build) ---
+    builds = [
+        (build_cfg, resolve_config(build_cfg, args, config_dir, cwd))
+        for build_cfg in expand_build_configs(root_cfg)
+    ]
+    first_cfg, first_resolved = builds[0]
 
     return _LoadedConfig(
         config_path=config_path,
-        root_cfg=root_cfg,
-        resolved=resolved,
+        root_cfg=first_cfg,
+        resolved=first_resolved,
         config_dir=config_dir,
         cwd=cwd,
+        builds=builds,
     )
 
 
 def _execute_build(
-    resolved: RootConfigResolved,
+    resolved: "RootConfigResolved",
     args: argparse.Namespace,
     argv: list[str] | None,
-) -> None:
-    """Execute build either in watch mode or one-time mode."""
+    extra_builds: "list[RootConfigResolved] | None" = None,
+) -> "list[BuildResult]":
+    """Execute build either in watch mode or one-time mode.
+
+    extra_builds holds the remaining builds of a multi-build config; when
+    present, all builds run together via run_builds().
+
+    Returns the results of one-time builds (watch mode returns none).
+    """
+    from .actions import watch_for_changes  # noqa: PLC0415
+    from .build import run_build, run_builds  # noqa: PLC0415
+
     watch_enabled = getattr(args, "watch", None) is not None or (
         "--watch" in (argv or [])
     )
 
-    resolved["dry_run"] = getattr(args, "dry_run", DEFAULT_DRY_RUN)
-    resolved["validate"] = getattr(args, "validate", False)
+    all_builds = [resolved, *(extra_builds or [])]
+    for build_cfg in all_builds:
+        build_cfg["dry_run"] = getattr(args, "dry_run", DEFAULT_DRY_RUN)
+        build_cfg["validate"] = getattr(args, "validate", False)
+
+    if len(all_builds) > 1:
+        if watch_enabled:
+            xmsg = "--watch is not supported with a multi-build 'builds' config."
+            raise ValueError(xmsg)
+        return run_builds(all_builds)
 
     if watch_enabled:
         watch_interval = resolved["watch_interval"]
@@ -747,8 +917,74 @@ def _execute_build(
             resolved,
             interval=watch_interval,
         )
-    else:
-        run_build(resolved)
+        return []
+    return [run_build(resolved)]
+
+
+def _forward_to_server(args: argparse.Namespace, argv: list[str]) -> int | None:
+    """Hand this invocation to a running `--serve` server, if there is one.
+
+    Returns the served build's exit code, or None to build in this process.
+    """
+    from .daemon import request_build  # noqa: PLC0415
+
+    runs_locally = (
+        getattr(args, "no_server", False)
+        or getattr(args, "serve", None) is not None
+        or getattr(args, "watch", None) is not None
+        or getattr(args, "version", False)
+        or getattr(args, "selftest", False)
+    )
+    if runs_locally:
+        return None
+    reply = request_build(argv)
+    if reply is None:
+        return None
+    getAppLogger().trace("[SERVE] build served, exit code %d", reply.exit_code)
+    return reply.exit_code
+
+
+@contextmanager
+def _timings_report(args: argparse.Namespace) -> Iterator["list[BuildResult]"]:
+    """Record spans for the timing flags and report them after the block.
+
+    Yields a list for the caller to fill with build results; the report is
+    written even if the block fails, covering whatever ran.
+    """
+    json_path = getattr(args, "timings_json", None)
+    trace_path = getattr(args, "trace_out", None)
+    memory = getattr(args, "memory_report", False)
+    if not (getattr(args, "timings", False) or json_path or trace_path or memory):
+        yield []
+        return
+
+    results: list[BuildResult] = []
+    with memory_accounting() if memory else nullcontext(), recording() as recorder:
+        try:
+            yield results
+        finally:
+            flushLogs()  # reports go after any queued trace output
+            if getattr(args, "timings", False):
+                sys.stderr.write(format_timings_table(recorder) + "\n")
+            if memory:
+                sys.stderr.write(format_memory_table(recorder) + "\n")
+            if json_path:
+                report = {
+                    **timings_to_dict(recorder),
+                    **({"memory": memory_to_dict(recorder)} if memory else {}),
+                    "builds": [result.to_dict() for result in results],
+                }
+                _write_report(json_path, json.dumps(report, indent=2), "Timings")
+            if trace_path:
+                trace = json.dumps(timings_to_chrome_trace(recorder))
+                _write_report(trace_path, trace, "Trace")
+
+
+def _write_report(path_str: str, text: str, what: str) -> None:
+    path = Path(path_str)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text + "\n", encoding="utf-8")
+    getAppLogger().detail("⏱️  %s written to %s", what, path)
 
 
 # --------------------------------------------------------------------------- #
@@ -756,8 +992,26 @@ def _execute_build(
 # --------------------------------------------------------------------------- #
 
 
-def main(argv: list[str] | None = None) -> int:  # noqa: PLR0911, PLR0912
+def main(argv: list[str] | None = None) -> int:
+    exit_code, _results = run_cli(argv, forward=True)
+    return exit_code
+
+
+def run_cli(  # noqa: C901, PLR0911, PLR0912
+    argv: list[str] | None = None,
+    *,
+    forward: bool = False,
+) -> "tuple[int, list[BuildResult]]":
+    """Run the CLI in this process.
+
+    With forward=True, the invocation is handed to a running `--serve`
+    server instead when there is one (see serger.daemon).
+
+    Returns:
+        Tuple of (exit code, results of the builds that ran here)
+    """
     logger = getAppLogger()  # init (use env + defaults)
+    results: list[BuildResult] = []
 
     try:
         parser = _setup_parser()
@@ -766,41 +1020,68 @@ def main(argv: list[str] | None = None) -> int:  # noqa: PLR0911, PLR0912
         # --- Early runtime init (use CLI + env + defaults) ---
         _initialize_logger(args)
 
+        # --- Thin client: let a running server build (warm caches) ---
+        # Checked before the early exits, which load apathetic_utils
+        if forward:
+            served = _forward_to_server(
+                args, sys.argv[1:] if argv is None else list(argv)
+            )
+            if served is not None:
+                return served, results
+
         # --- Handle early exits (version, selftest, etc.) ---
         # These exit immediately, so we don't need to check incompatibilities with them
         early_exit_code = _handle_early_exits(args)
         if early_exit_code is not None:
-            return early_exit_code
-
-        # --- Load and resolve configuration ---
-        config = _load_and_resolve_config(args)
-
-        # --- Validate includes ---
-        if not _validate_includes(config.root_cfg, config.resolved, args):
-            return 1
-
-        # --- Validate package ---
-        if not _validate_package(config.root_cfg, config.resolved, args):
-            return 1
-
-        # --- Validate-config notice ---
-        if getattr(args, "validate", None):
-            logger.info("🔍 Validating configuration...")
-
-        # --- Dry-run notice ---
-        if getattr(args, "dry_run", None):
-            logger.info("🧪 Dry-run mode: no files will be written or deleted.\n")
-
-        # --- Config summary ---
-        if config.config_path:
-            logger.detail("🔧 Using config: %s", config.config_path.name)
-        else:
-            logger.detail("🔧 Running in CLI-only mode (no config file).")
-        logger.detail("📁 Config root: %s", config.config_dir)
-        logger.detail("📂 Invoked from: %s", config.cwd)
-
-        # --- Execute build ---
-        _execute_build(config.resolved, args, argv)
+            return early_exit_code, results
+
+        # --- Build server (--serve) ---
+        if getattr(args, "serve", None) is not None:
+            from .daemon import serve  # noqa: PLC0415
+
+            socket_path = Path(args.serve) if args.serve else None
+            return serve(run_cli, socket_path), results
+
+        # --- Record timings and memory (--timings, --trace-out, ...) ---
+        with _timings_report(args) as build_results:
+            # --- Load and resolve configuration ---
+            with span("config"):
+                config = _load_and_resolve_config(args)
+            _sync_log_queue()  # the config may set log_level
+
+            # --- Validate includes and package (every build) ---
+            for build_cfg, resolved in config.builds:
+                if not _validate_includes(build_cfg, resolved, args):
+                    return 1, results
+                if not _validate_package(build_cfg, resolved, args):
+                    return 1, results
+
+            # --- Validate-config notice ---
+            if getattr(args, "validate", None):
+                logger.info("🔍 Validating configuration...")
+
+            # --- Dry-run notice ---
+            if getattr(args, "dry_run", None):
+                logger.info("🧪 Dry-run mode: no files will be written or deleted.\n")
+
+            # --- Config summary ---
+            if config.config_path:
+                logger.detail("🔧 Using config: %s", config.config_path.name)
+            else:
+                logger.detail("🔧 Running in CLI-only mode (no config file).")
+            logger.detail("📁 Config root: %s", config.config_dir)
+            logger.detail("📂 Invoked from: %s", config.cwd)
+
+            # --- Execute build ---
+            results.extend(
+                _execute_build(
+                    config.resolved,
+                    args,
+                    argv,
+                    extra_builds=[resolved for _cfg, resolved in config.builds[1:]],
+                )
+            )
+            build_results.extend(results)
 
     except (FileNotFoundError, ValueError, TypeError, RuntimeError) as e:
         # controlled termination
@@ -810,7 +1091,7 @@ def main(argv: list[str] | None = None) -> int:  # noqa: PLR0911, PLR0912
                 logger.errorIfNotDebug(str(e))
             except Exception:  # noqa: BLE001
                 safeLog(f"[FATAL] Logging failed while reporting: {e}")
-        return getattr(e, "code", 1)
+        return getattr(e, "code", 1), results
 
     except Exception as e:  # noqa: BLE001
         # unexpected internal error
@@ -819,7 +1100,10 @@ def main(argv: list[str] | None = None) -> int:  # noqa: PLR0911, PLR0912
         except Exception:  # noqa: BLE001
             safeLog(f"[FATAL] Logging failed while reporting: {e}")
 
-        return getattr(e, "code", 1)
+        return getattr(e, "code", 1), results
 
     else:
-        return 0
+        return 0, results
+
+    finally:
+        flushLogs()
@@ -5,6 +5,17 @@
 This module provides configuration loading, parsing, validation, and resolution.
 """
 
+from .config_cache import (
+    CONFIG_CACHE_VERSION,
+    get_config_cache_dir,
+    is_config_cache_enabled,
+    load_cached_config,
+    make_config_cache_key,
+    record_config_dependency,
+    recording_config_dependencies,
+    resolved_config_directories,
+    store_cached_config,
+)
 from .config_loader import (
     can_run_configless,
     find_config,
@@ -14,6 +25,7 @@ from .config_loader import (
 )
 from .config_resolve import (
     PyprojectMetadata,
+    expand_build_configs,
     extract_pyproject_metadata,
     resolve_build_config,
     resolve_config,
@@ -38,8 +50,10 @@ from .config_types import (
     ModuleActionScope,
     ModuleActionSimple,
     ModuleActionType,
+    ModuleLoading,
     ModuleMode,
     OriginType,
+    OutFormat,
     PathResolved,
     PostCategoryConfig,
     PostCategoryConfigResolved,
@@ -47,6 +61,7 @@ from .config_types import (
     PostProcessingConfigResolved,
     RootConfig,
     RootConfigResolved,
+    ShimAttrsMode,
     ShimSetting,
     StitchMode,
     ToolConfig,
@@ -65,6 +80,16 @@ from .config_validate import (
 
 
 __all__ = [  # noqa: RUF022
+    # config_cache
+    "CONFIG_CACHE_VERSION",
+    "get_config_cache_dir",
+    "is_config_cache_enabled",
+    "load_cached_config",
+    "make_config_cache_key",
+    "record_config_dependency",
+    "recording_config_dependencies",
+    "resolved_config_directories",
+    "store_cached_config",
     # config_loader
     "can_run_configless",
     "find_config",
@@ -73,6 +98,7 @@ __all__ = [  # noqa: RUF022
     "parse_config",
     # config_resolve
     "PyprojectMetadata",
+    "expand_build_configs",
     "extract_pyproject_metadata",
     "resolve_build_config",
     "resolve_config",
@@ -96,8 +122,10 @@ __all__ = [  # noqa: RUF022
     "ModuleActionSimple",
     "ModuleActionType",
     "ModuleActions",
+    "ModuleLoading",
     "ModuleMode",
     "OriginType",
+    "OutFormat",
     "PathResolved",
     "PostCategoryConfig",
     "PostCategoryConfigResolved",
@@ -105,6 +133,7 @@ __all__ = [  # noqa: RUF022
     "PostProcessingConfigResolved",
     "RootConfig",
     "RootConfigResolved",
+    "ShimAttrsMode",
     "ShimSetting",
     "StitchMode",
     "ToolConfig",
@@ -0,0 +1,274 @@
+# src/serger/config/config_cache.py
+
+"""On-disk cache for fully resolved configurations.
+
+Resolving a config re-executes `.py` configs, re-parses JSONC, re-reads
+pyproject.toml and license files, and re-infers packages from the source tree.
+When none of the inputs changed, the previous result can be reused as-is.
+
+An entry is keyed by everything resolution reads that is not a file (CLI args,
+relevant environment variables, interpreter, working directory, serger itself)
+and validated against stamps of the files and directories it depends on.
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from apathetic_utils import has_glob_chars
+
+from serger.constants import (
+    DEFAULT_CONFIG_CACHE,
+    DEFAULT_ENV_CONFIG_CACHE,
+    DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP,
+    DEFAULT_ENV_LOG_LEVEL,
+    DEFAULT_ENV_RESPECT_GITIGNORE,
+    DEFAULT_ENV_WATCH_INTERVAL,
+)
+from serger.logs import getAppLogger
+from serger.meta import PROGRAM_ENV
+from serger.utils.utils_paths import get_user_cache_dir
+
+from .config_types import RootConfigResolved
+
+
+# Bump when the cached payload shape changes
+CONFIG_CACHE_VERSION = 1
+
+# Unprefixed env vars that influence resolution (prefixed ones are always keyed)
+_KEYED_ENV_VARS = {
+    DEFAULT_ENV_LOG_LEVEL,
+    DEFAULT_ENV_RESPECT_GITIGNORE,
+    DEFAULT_ENV_WATCH_INTERVAL,
+    DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP,
+    # installed-package discovery depends on the active environment
+    "VIRTUAL_ENV",
+    "CONDA_PREFIX",
+    "PYTHONPATH",
+}
+
+# CLI args applied after resolution (never part of the resolved config)
+_UNKEYED_ARGS = {"dry_run", "validate", "config_cache"}
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+_recorded_deps: ContextVar[set[Path] | None] = ContextVar(
+    "serger_config_deps", default=None
+)
+
+
+@dataclass(frozen=True)
+class _Stamp:
+    """Fingerprint of one dependency (file, directory, or missing path)."""
+
+    path: str
+    kind: str  # "file" | "dir" | "missing"
+    mtime_ns: int = 0
+    size: int = 0
+    digest: str = ""
+
+
+# --------------------------------------------------------------------------- #
+# dependency recording
+# --------------------------------------------------------------------------- #
+
+
+def record_config_dependency(path: Path) -> None:
+    """Note that config resolution read (or looked for) `path`.
+
+    No-op unless called inside recording_config_dependencies().
+    """
+    deps = _recorded_deps.get()
+    if deps is not None:
+        deps.add(path.resolve())
+
+
+@contextmanager
+def recording_config_dependencies() -> Iterator[set[Path]]:
+    """Collect every path passed to record_config_dependency() in this block."""
+    deps: set[Path] = set()
+    token = _recorded_deps.set(deps)
+    try:
+        yield deps
+    finally:
+        _recorded_deps.reset(token)
+
+
+def resolved_config_directories(resolved: RootConfigResolved) -> set[Path]:
+    """Directories whose listings feed resolution (package inference, globs).
+
+    Their mtimes change when entries are added or removed, which is what
+    invalidates inferred packages and include expansion.
+    """
+    meta = resolved["__meta__"]
+    dirs: set[Path] = {meta["config_root"], meta["cli_root"]}
+    for base in resolved.get("source_bases", []):
+        dirs.add(meta["config_root"] / base)
+    for include in resolved.get("include", []):
+        literal_parts: list[str] = []
+        for part in Path(include["path"]).parts:
+            if has_glob_chars(part):
+                break
+            literal_parts.append(part)
+        literal = include["root"].joinpath(*literal_parts)
+        dirs.add(literal if literal.is_dir() else literal.parent)
+    return {d.resolve() for d in dirs if d.is_dir()}
+
+
+# --------------------------------------------------------------------------- #
+# keys and stamps
+# --------------------------------------------------------------------------- #
+
+
+def is_config_cache_enabled(args: argparse.Namespace) -> bool:
+    """Whether to use the config cache (CLI flag > env var > default)."""
+    cli_value = getattr(args, "config_cache", None)
+    if cli_value is not None:
+        return bool(cli_value)
+    env_value = os.getenv(f"{PROGRAM_ENV}_{DEFAULT_ENV_CONFIG_CACHE}")
+    if env_value is not None:
+        return env_value.strip().lower() in _TRUE_VALUES
+    return DEFAULT_CONFIG_CACHE
+
+
+def get_config_cache_dir() -> Path:
+    """Return the cache directory ($XDG_CACHE_HOME/serger/config)."""
+    return get_user_cache_dir() / "config"
+
+
+def _tool_fingerprint() -> list[tuple[str, int, int]]:
+    """Stamp serger's own sources so upgrading serger invalidates the cache."""
+    here = Path(__file__).resolve()
+    # Stitched (any stitch_mode): everything lives in one file.
+    # Package: stamp sibling modules.
+    if globals().get("__STITCH_SOURCE__"):
+        files = [here]
+    else:
+        files = sorted(here.parent.parent.glob("**/*.py"))
+    stamps: list[tuple[str, int, int]] = []
+    for file_path in files:
+        st = file_path.stat()
+        stamps.append((str(file_path), st.st_mtime_ns, st.st_size))
+    return stamps
+
+
+def make_config_cache_key(args: argparse.Namespace, cwd: Path) -> str:
+    """Build the cache key from the non-file inputs of config resolution."""
+    env_prefix = f"{PROGRAM_ENV}_"
+    env = sorted(
+        (k, v)
+        for k, v in os.environ.items()
+        if k.startswith(env_prefix) or k in _KEYED_ENV_VARS
+    )
+    cli_args = sorted(
+        (k, repr(v)) for k, v in vars(args).items() if k not in _UNKEYED_ARGS
+    )
+    parts = (
+        CONFIG_CACHE_VERSION,
+        sys.executable,
+        sys.version,
+        str(cwd),
+        cli_args,
+        env,
+        _tool_fingerprint(),
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _make_stamp(path: Path) -> _Stamp:
+    try:
+        st = path.stat()
+    except OSError:
+        return _Stamp(str(path), "missing")
+    if path.is_dir():
+        return _Stamp(str(path), "dir", st.st_mtime_ns)
+    return _Stamp(str(path), "file", st.st_mtime_ns, st.st_size, _file_digest(path))
+
+
+def _stamp_is_current(stamp: _Stamp) -> bool:
+    path = Path(stamp.path)
+    try:
+        st = path.stat()
+    except OSError:
+        return stamp.kind == "missing"
+    if stamp.kind == "missing":
+        return False
+    if stamp.kind == "dir":
+        return path.is_dir() and st.st_mtime_ns == stamp.mtime_ns
+    if st.st_size != stamp.size:
+        return False
+    # mtime match is the fast path; a touched-but-identical file still hits
+    return st.st_mtime_ns == stamp.mtime_ns or _file_digest(path) == stamp.digest
+
+
+# --------------------------------------------------------------------------- #
+# load / store
+# --------------------------------------------------------------------------- #
+
+
+def load_cached_config(key: str, cache_dir: Path | None = None) -> Any | None:
+    """Return the cached payload for `key`, or None on a miss or stale entry."""
+    logger = getAppLogger()
+    cache_file = (cache_dir or get_config_cache_dir()) / f"{key}.pickle"
+    try:
+        with cache_file.open("rb") as f:
+            entry = pickle.load(f)  # noqa: S301 - private per-user cache
+    except FileNotFoundError:
+        logger.trace("[config_cache] miss: %s", key[:12])
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.trace("[config_cache] unreadable entry %s: %s", key[:12], e)
+        return None
+
+    if not isinstance(entry, dict) or entry.get("version") != CONFIG_CACHE_VERSION:
+        return None
+    stamps: list[_Stamp] = entry.get("stamps", [])
+    for stamp in stamps:
+        if not _stamp_is_current(stamp):
+            logger.trace("[config_cache] stale (%s changed)", stamp.path)
+            return None
+    logger.trace("[config_cache] hit: %s (%d deps)", key[:12], len(stamps))
+    return entry.get("payload")
+
+
+def store_cached_config(
+    key: str,
+    payload: Any,
+    dependencies: set[Path],
+    cache_dir: Path | None = None,
+) -> None:
+    """Write `payload` to the cache, stamped with its dependencies.
+
+    Failures are logged and ignored: the cache is an optimization only.
+    """
+    logger = getAppLogger()
+    target_dir = cache_dir or get_config_cache_dir()
+    entry = {
+        "version": CONFIG_CACHE_VERSION,
+        "stamps": [_make_stamp(p) for p in sorted(dependencies)],
+        "payload": payload,
+    }
+    try:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        # Atomic replace so concurrent invocations never read a partial entry
+        fd, tmp_name = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp_name).replace(target_dir / f"{key}.pickle")
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.trace("[config_cache] could not store entry: %s", e)
+        return
+    logger.trace("[config_cache] stored %s (%d deps)", key[:12], len(entry["stamps"]))
@@ -19,6 +19,7 @@ from serger.logs import getAppLogger
 from serger.meta import (
     PROGRAM_CONFIG,
 )
+from serger.timings import timed
 
 from .config_types import (
     RootConfig,
@@ -259,7 +260,7 @@ def parse_config(
         raise TypeError(xmsg)
 
     # --- Flat config: all fields at root level ---
-    # Note: build/builds keys will be rejected as unknown keys by validation
+    # Note: a 'builds' list is kept as-is; entries are validated separately
     return _parse_case_flat_config(raw_config)
 
 
@@ -316,6 +317,7 @@ def _validation_summary(
         logger.warning("\nWarnings (non-fatal):\n  • %s", msg_summary)
 
 
+@timed()
 def load_and_validate_config(
     args: argparse.Namespace,
 ) -> tuple[Path, RootConfig, ValidationSummary] | None:
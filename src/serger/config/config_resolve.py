@@ -3,6 +3,7 @@
 
 import argparse
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -12,6 +13,7 @@ from apathetic_utils import cast_hint, has_glob_chars, literal_to_set, load_toml
 
 from serger.constants import (
     BUILD_TOOL_FIND_MAX_LINES,
+    DEFAULT_BYTECODE_CACHE,
     DEFAULT_CATEGORIES,
     DEFAULT_CATEGORY_ORDER,
     DEFAULT_COMMENTS_MODE,
@@ -22,30 +24,45 @@ from serger.constants import (
     DEFAULT_ENV_WATCH_INTERVAL,
     DEFAULT_EXTERNAL_IMPORTS,
     DEFAULT_INTERNAL_IMPORTS,
+    DEFAULT_LEAN_MODE,
     DEFAULT_LICENSE_FALLBACK,
     DEFAULT_MAIN_MODE,
     DEFAULT_MAIN_NAME,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_MODULE_LOADING,
     DEFAULT_MODULE_MODE,
+    DEFAULT_OPTIMIZE_IMPORTS,
     DEFAULT_OUT_DIR,
+    DEFAULT_OUT_FORMAT,
     DEFAULT_RESPECT_GITIGNORE,
     DEFAULT_SHIM,
+    DEFAULT_SHIM_ATTRS,
     DEFAULT_SOURCE_BASES,
+    DEFAULT_STARTUP_PROFILING,
     DEFAULT_STITCH_MODE,
     DEFAULT_STRICT_CONFIG,
+    DEFAULT_TREE_SHAKE,
     DEFAULT_USE_PYPROJECT_METADATA,
     DEFAULT_WATCH_INTERVAL,
+    DEFAULT_ZIPAPP_PYTHON,
 )
 from serger.logs import getAppLogger
 from serger.meta import PROGRAM_ENV
-from serger.module_actions import extract_module_name_from_source_path
+from serger.module_actions import (
+    extract_module_name_from_source_path,
+    is_module_pattern,
+    validate_action_pattern,
+)
+from serger.timings import timed
 from serger.utils import (
-    discover_installed_packages_roots,
+    get_installed_packages_roots,
     make_includeresolved,
     make_pathresolved,
     shorten_paths_for_display,
 )
 from serger.utils.utils_validation import validate_required_keys
 
+from .config_cache import record_config_dependency
 from .config_types import (
     IncludeResolved,
     MainMode,
@@ -57,17 +74,25 @@ from .config_types import (
     ModuleActions,
     ModuleActionScope,
     ModuleActionType,
+    ModuleLoading,
     OriginType,
+    OutFormat,
     PathResolved,
     PostCategoryConfigResolved,
     PostProcessingConfig,
     PostProcessingConfigResolved,
     RootConfig,
     RootConfigResolved,
+    ShimAttrsMode,
     ShimSetting,
     ToolConfig,
     ToolConfigResolved,
 )
+from .config_validate import ROOT_ONLY_KEYS
+
+
+# installed_bases as a list, or a callable that discovers them on first use
+InstalledBasesSource = list[str] | Callable[[], list[str]]
 
 
 # --------------------------------------------------------------------------- #
@@ -205,10 +230,11 @@ def _read_license_files(matched_files: set[Path]) -> list[str]:
     logger = getAppLogger()
     text_parts: list[str] = []
     for file_path in sorted(matched_files):
+        record_config_dependency(file_path)
         try:
             content = file_path.read_text(encoding="utf-8")
             text_parts.append(content)
-        except (OSError, UnicodeDecodeError) as e:  # noqa: PERF203
+        except (OSError, UnicodeDecodeError) as e:
             # PERF203: try/except in loop is intentional - we need to handle
             # errors per file and continue processing other files
             logger.warning(
@@ -538,6 +564,7 @@ def extract_pyproject_metadata(
     Raises:
         RuntimeError: If required=True and TOML parsing is unavailable
     """
+    record_config_dependency(pyproject_path)
     if not pyproject_path.exists():
         return PyprojectMetadata()
 
@@ -738,6 +765,16 @@ def validate_and_normalize_module_actions(  # noqa: C901, PLR0912, PLR0915
                 msg = "module_actions dict keys (source) must be non-empty strings"
                 raise ValueError(msg)
 
+            # Glob/capture sources: check the pattern and dest captures
+            pattern_action: ModuleActionFull = {"source": key}
+            if value is not None:
+                pattern_action["dest"] = value
+            try:
+                validate_action_pattern(pattern_action)
+            except ValueError as e:
+                msg = f"module_actions[{key!r}]: {e}"
+                raise ValueError(msg) from e
+
             # Build normalized action with defaults
             # Dict format: {"old": "new"} -> move, {"old": None} -> delete
             if value is not None:
@@ -792,6 +829,13 @@ def validate_and_normalize_module_actions(  # noqa: C901, PLR0912, PLR0915
                 msg = f"module_actions[{idx}]['source'] must be a non-empty string"
                 raise ValueError(msg)
 
+            if "source_path" in action and is_module_pattern(source_val):
+                msg = (
+                    f"module_actions[{idx}]: 'source_path' requires a plain "
+                    f"'source', got pattern {source_val!r}"
+                )
+                raise ValueError(msg)
+
             # Validate and normalize action type
             action_val = action.get("action", "move")
             # Normalize "none" to "delete" (alias)
@@ -957,6 +1001,16 @@ def validate_and_normalize_module_actions(  # noqa: C901, PLR0912, PLR0915
                     )
                     raise ValueError(msg)
 
+            # Glob/capture sources: check the pattern and dest captures
+            pattern_action = {"source": source_val}
+            if dest_val is not None:
+                pattern_action["dest"] = dest_val
+            try:
+                validate_action_pattern(pattern_action)
+            except ValueError as e:
+                msg = f"module_actions[{idx}]: {e}"
+                raise ValueError(msg) from e
+
             # Build normalized action with all defaults applied (per Q1/Q2)
             normalized_action: ModuleActionFull = {
                 "source": source_val,
@@ -1155,6 +1209,7 @@ def _apply_pyproject_metadata(
 def _load_gitignore_patterns(path: Path) -> list[str]:
     """Read .gitignore and return non-comment patterns."""
     patterns: list[str] = []
+    record_config_dependency(path)
     if path.exists():
         for line in path.read_text(encoding="utf-8").splitlines():
             clean_line = line.strip()
@@ -1445,7 +1500,7 @@ def _parse_include_with_dest(
 def _try_resolve_path_in_bases(
     raw: Path | str,
     source_bases: list[str] | None = None,
-    installed_bases: list[str] | None = None,
+    installed_bases: InstalledBasesSource | None = None,
 ) -> tuple[Path, Path | str] | None:
     """Try to resolve a relative path in source_bases or installed_bases.
 
@@ -1460,7 +1515,8 @@ def _try_resolve_path_in_bases(
         raw: Relative path to resolve
         source_bases: Optional list of source base directories (absolute paths)
         installed_bases: Optional list of installed base directories
-            (absolute paths)
+            (absolute paths), or a callable returning them; it is only
+            called when the path is not found in source_bases
 
     Returns:
         Tuple of (root, rel) if path found in bases, None otherwise
@@ -1500,7 +1556,9 @@ def _try_resolve_path_in_bases(
                 )
                 return base_path, raw_str
 
-    # Try installed_bases as fallback
+    # Try installed_bases as fallback (discovering them only now if lazy)
+    if callable(installed_bases):
+        installed_bases = installed_bases()
     if installed_bases:
         for base_str in installed_bases:
             base_path = Path(base_str).resolve()
@@ -1520,7 +1578,7 @@ def _normalize_path_with_root(
     context_root: Path | str,
     *,
     source_bases: list[str] | None = None,
-    installed_bases: list[str] | None = None,
+    installed_bases: InstalledBasesSource | None = None,
 ) -> tuple[Path, Path | str]:
     """Normalize a user-provided path (from CLI or config).
 
@@ -1537,8 +1595,8 @@ def _normalize_path_with_root(
         context_root: Default context root (config_dir or cwd)
         source_bases: Optional list of source base directories
             (for fallback lookup)
-        installed_bases: Optional list of installed base directories
-            (for fallback lookup)
+        installed_bases: Optional list of installed base directories, or a
+            callable returning them on first use (for fallback lookup)
     """
     logger = getAppLogger()
     raw_path = Path(raw)
@@ -1811,6 +1869,7 @@ def _has_main_function(module_path: Path) -> bool:
         return False
 
     for file_path in files_to_check:
+        record_config_dependency(file_path)
         try:
             content = file_path.read_text(encoding="utf-8")
             tree = ast.parse(content, filename=str(file_path))
@@ -1832,7 +1891,7 @@ def _has_main_function(module_path: Path) -> bool:
                         and test.comparators[0].value == "__main__"
                     ):
                         return True
-        except (SyntaxError, UnicodeDecodeError, OSError):  # noqa: PERF203
+        except (SyntaxError, UnicodeDecodeError, OSError):
             # Skip files that can't be parsed
             continue
 
@@ -2059,6 +2118,40 @@ def _find_common_path_prefix(paths: list[str], config_dir: Path) -> str | None:
         return str(common_path)
 
 
+def _lazy_installed_bases(
+    resolved_cfg: dict[str, Any],
+    *,
+    cwd: Path,
+    config_dir: Path,
+) -> Callable[[], list[str]]:
+    """Return a callable that auto-discovers installed bases on first call.
+
+    Discovery scans the environment (and Poetry's config), so it only runs
+    once an include actually needs the installed-bases fallback. The result
+    is also stored in resolved_cfg["installed_bases"].
+    """
+    logger = getAppLogger()
+    discovered: list[str] | None = None
+
+    def _discover() -> list[str]:
+        nonlocal discovered
+        if discovered is None:
+            discovered = get_installed_packages_roots(config_dir)
+            resolved_cfg["installed_bases"] = discovered
+            if discovered:
+                logger.debug(
+                    "[INSTALLED_BASES] Auto-discovered %d installed package root(s):"
+                    " %s",
+                    len(discovered),
+                    shorten_paths_for_display(
+                        discovered, cwd=cwd, config_dir=config_dir
+                    ),
+                )
+        return discovered
+
+    return _discover
+
+
 def _resolve_includes(  # noqa: PLR0912
     resolved_cfg: dict[str, Any],
     *,
@@ -2066,7 +2159,7 @@ def _resolve_includes(  # noqa: PLR0912
     config_dir: Path,
     cwd: Path,
     source_bases: list[str] | None = None,
-    installed_bases: list[str] | None = None,
+    installed_bases: InstalledBasesSource | None = None,
 ) -> list[IncludeResolved]:
     logger = getAppLogger()
     logger.trace(
@@ -2302,6 +2395,7 @@ def resolve_build_config(  # noqa: C901, PLR0912, PLR0915
     # ------------------------------
     # Convert str to list[str] if needed, then resolve relative paths to absolute
     # Priority: user-specified > auto-discovery > empty list
+    installed_bases_source: InstalledBasesSource | None = None
     if "installed_bases" in resolved_cfg:
         installed_bases = resolved_cfg["installed_bases"]
         config_installed_bases = (
@@ -2313,18 +2407,14 @@ def resolve_build_config(  # noqa: C901, PLR0912, PLR0915
             base_path = (config_dir / base).resolve()
             resolved_installed_bases.append(str(base_path))
         resolved_cfg["installed_bases"] = resolved_installed_bases
-    # Not specified - use auto-discovery if enabled
+        installed_bases_source = resolved_installed_bases
+    # Not specified - use auto-discovery if enabled. Discovery is deferred
+    # until an include actually falls back to installed bases.
     elif resolved_cfg["auto_discover_installed_packages"]:
-        discovered_bases = discover_installed_packages_roots()
-        resolved_cfg["installed_bases"] = discovered_bases
-        if discovered_bases:
-            logger.debug(
-                "[INSTALLED_BASES] Auto-discovered %d installed package root(s): %s",
-                len(discovered_bases),
-                shorten_paths_for_display(
-                    discovered_bases, cwd=cwd, config_dir=config_dir
-                ),
-            )
+        resolved_cfg["installed_bases"] = []
+        installed_bases_source = _lazy_installed_bases(
+            resolved_cfg, cwd=cwd, config_dir=config_dir
+        )
     else:
         # Auto-discovery disabled and not specified - use empty list
         resolved_cfg["installed_bases"] = []
@@ -2349,7 +2439,7 @@ def resolve_build_config(  # noqa: C901, PLR0912, PLR0915
         config_dir=config_dir,
         cwd=cwd,
         source_bases=resolved_source_bases,
-        installed_bases=resolved_cfg.get("installed_bases"),
+        installed_bases=installed_bases_source,
     )
     logger.trace(
         f"[resolve_build_config] Resolved {len(resolved_cfg['include'])} include(s)"
@@ -2433,6 +2523,102 @@ def resolve_build_config(  # noqa: C901, PLR0912, PLR0915
     else:
         resolved_cfg["shim"] = DEFAULT_SHIM
 
+    # ------------------------------
+    # Shim attributes
+    # ------------------------------
+    valid_shim_attrs = literal_to_set(ShimAttrsMode)
+    if "shim_attrs" in resolved_cfg:
+        shim_attrs_val = resolved_cfg["shim_attrs"]
+        # Validate value
+        if shim_attrs_val not in valid_shim_attrs:
+            valid_str = ", ".join(repr(v) for v in sorted(valid_shim_attrs))
+            msg = (
+                f"Invalid shim_attrs value: {shim_attrs_val!r}. "
+                f"Must be one of: {valid_str}"
+            )
+            raise ValueError(msg)
+    else:
+        resolved_cfg["shim_attrs"] = DEFAULT_SHIM_ATTRS
+
+    # ------------------------------
+    # Module loading
+    # ------------------------------
+    valid_module_loading = literal_to_set(ModuleLoading)
+    if "module_loading" in resolved_cfg:
+        module_loading_val = resolved_cfg["module_loading"]
+        # Validate value
+        if module_loading_val not in valid_module_loading:
+            valid_str = ", ".join(repr(v) for v in sorted(valid_module_loading))
+            msg = (
+                f"Invalid module_loading value: {module_loading_val!r}. "
+                f"Must be one of: {valid_str}"
+            )
+            raise ValueError(msg)
+    else:
+        resolved_cfg["module_loading"] = DEFAULT_MODULE_LOADING
+
+    # ------------------------------
+    # Bytecode cache
+    # ------------------------------
+    if "bytecode_cache" not in resolved_cfg:
+        resolved_cfg["bytecode_cache"] = DEFAULT_BYTECODE_CACHE
+
+    # ------------------------------
+    # Tree shaking
+    # ------------------------------
+    if "tree_shake" not in resolved_cfg:
+        resolved_cfg["tree_shake"] = DEFAULT_TREE_SHAKE
+    tree_shake_keep_val: object = resolved_cfg.get("tree_shake_keep", [])
+    if not isinstance(tree_shake_keep_val, list) or not all(
+        isinstance(name, str) for name in cast("list[object]", tree_shake_keep_val)
+    ):
+        msg = "tree_shake_keep must be a list of strings"
+        raise TypeError(msg)
+    resolved_cfg["tree_shake_keep"] = list(cast("list[str]", tree_shake_keep_val))
+
+    # ------------------------------
+    # Startup profiling
+    # ------------------------------
+    if "startup_profiling" not in resolved_cfg:
+        resolved_cfg["startup_profiling"] = DEFAULT_STARTUP_PROFILING
+
+    # ------------------------------
+    # Output format
+    # ------------------------------
+    valid_out_formats = literal_to_set(OutFormat)
+    if "out_format" in resolved_cfg:
+        out_format_val = resolved_cfg["out_format"]
+        # Validate value
+        if out_format_val not in valid_out_formats:
+            valid_str = ", ".join(repr(v) for v in sorted(valid_out_formats))
+            msg = (
+                f"Invalid out_format value: {out_format_val!r}. "
+                f"Must be one of: {valid_str}"
+            )
+            raise ValueError(msg)
+    else:
+        resolved_cfg["out_format"] = DEFAULT_OUT_FORMAT
+    if "zipapp_python" not in resolved_cfg:
+        resolved_cfg["zipapp_python"] = DEFAULT_ZIPAPP_PYTHON
+
+    # ------------------------------
+    # Lean mode
+    # ------------------------------
+    if "lean_mode" not in resolved_cfg:
+        resolved_cfg["lean_mode"] = DEFAULT_LEAN_MODE
+
+    # ------------------------------
+    # Memory budget
+    # ------------------------------
+    if "memory_budget_mb" not in resolved_cfg:
+        resolved_cfg["memory_budget_mb"] = DEFAULT_MEMORY_BUDGET_MB
+
+    # ------------------------------
+    # Hoisted import optimization
+    # ------------------------------
+    if "optimize_imports" not in resolved_cfg:
+        resolved_cfg["optimize_imports"] = DEFAULT_OPTIMIZE_IMPORTS
+
     # ------------------------------
     # Module actions
     # ------------------------------
@@ -2870,6 +3056,36 @@ def resolve_build_config(  # noqa: C901, PLR0912, PLR0915
 # --------------------------------------------------------------------------- #
 
 
+def expand_build_configs(root_input: RootConfig) -> list[RootConfig]:
+    """Expand a root config into one flat config per build.
+
+    Without a ``builds`` list the root config is the only build. Otherwise each
+    entry is shallow-merged over the root settings (entry keys win), so shared
+    options such as ``source_bases`` or ``post_processing`` only need to be
+    written once. Root-only keys are dropped from entries (validation warns).
+
+    Args:
+        root_input: Validated root configuration
+
+    Returns:
+        List of flat build configs, in declaration order
+    """
+    logger = getAppLogger()
+    builds = root_input.get("builds")
+    root_cfg = {k: v for k, v in root_input.items() if k != "builds"}
+    if not builds:
+        return [cast_hint(RootConfig, root_cfg)]
+
+    logger.trace(f"[expand_build_configs] Expanding {len(builds)} build(s)")
+    expanded: list[RootConfig] = []
+    for build_cfg in builds:
+        merged = dict(root_cfg)
+        merged.update({k: v for k, v in build_cfg.items() if k not in ROOT_ONLY_KEYS})
+        expanded.append(cast_hint(RootConfig, merged))
+    return expanded
+
+
+@timed()
 def resolve_config(
     root_input: RootConfig,
     args: argparse.Namespace,
@@ -2,7 +2,7 @@
 
 
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
@@ -11,12 +11,15 @@ OriginType = Literal["cli", "config", "plugin", "default", "code", "gitignore",
 
 
 InternalImportMode = Literal["force_strip", "strip", "keep", "assign"]
-ExternalImportMode = Literal["force_top", "top", "keep", "force_strip", "strip"]
+ExternalImportMode = Literal["force_top", "top", "keep", "force_strip", "strip", "lazy"]
 StitchMode = Literal["raw", "class", "exec"]
 ModuleMode = Literal[
     "none", "multi", "force", "force_flat", "unify", "unify_preserve", "flat"
 ]
 ShimSetting = Literal["all", "public", "none"]
+ShimAttrsMode = Literal["copy", "lazy"]
+ModuleLoading = Literal["eager", "lazy"]
+OutFormat = Literal["script", "zipapp"]
 MainMode = Literal["none", "auto"]
 # Module actions configuration types
 ModuleActionType = Literal["move", "copy", "delete", "rename", "none"]
@@ -36,6 +39,9 @@ class ModuleActionFull(TypedDict, total=False):
     scope: NotRequired[ModuleActionScope]
     affects: NotRequired[ModuleActionAffects]  # default: "shims"
     cleanup: NotRequired[ModuleActionCleanup]  # default: "auto"
+    # internal: source matches only itself and its submodules (set on the
+    # concrete actions a pattern expands to)
+    exact: NotRequired[bool]
 
 
 # Simple format: dict[str, str | None]
@@ -129,6 +135,10 @@ class RootConfig(TypedDict, total=False):
     watch_interval: float
     post_processing: PostProcessingConfig  # Post-processing configuration
 
+    # Multi-build: each entry is a partial config that inherits every root-level
+    # setting (shallow merge, entry keys win). Root-only keys are ignored per build.
+    builds: NotRequired[list[dict[str, Any]]]
+
     # Pyproject.toml integration
     use_pyproject_metadata: bool  # Whether to pull metadata from pyproject.toml
     pyproject_path: str  # Path to pyproject.toml (overrides root default)
@@ -155,7 +165,7 @@ class RootConfig(TypedDict, total=False):
     # Stitching mode: how to combine modules into a single file
     # - "raw": Concatenate all files together (default)
     # - "class": Namespace files within classes (not yet implemented)
-    # - "exec": Namespace files within module shims using exec() (not yet implemented)
+    # - "exec": Run each module in its own module object from precompiled code
     stitch_mode: StitchMode
     # Module mode: how to generate import shims for stitched runtime
     # - "none": No shims generated
@@ -172,6 +182,14 @@ class RootConfig(TypedDict, total=False):
     #   (future: based on _ prefix or __all__)
     # - "none": Don't generate shims at all
     shim: ShimSetting
+    # Shim attributes: how package shims expose the stitched globals
+    # - "copy": Copy every global onto each package module at startup (default)
+    # - "lazy": Forward attribute lookups to the stitched globals (PEP 562)
+    shim_attrs: ShimAttrsMode
+    # Module loading (stitch_mode "exec" only): when stitched modules execute
+    # - "eager": Import every module at startup, in order (default)
+    # - "lazy": Execute a module only when it is first imported
+    module_loading: ModuleLoading
     # Module actions: custom module transformations (move, copy, delete)
     # - dict[str, str | None]: Simple format mapping source -> dest
     # - list[ModuleActionFull]: Full format with detailed options
@@ -219,6 +237,41 @@ class RootConfig(TypedDict, total=False):
     # - False: Use real timestamps (default)
     # - True: Use placeholder for deterministic builds
     disable_build_timestamp: NotRequired[bool]
+    # Bytecode cache: prepend a loader that caches the compiled program
+    # - False: Write the stitched script as-is (default)
+    # - True: Store the program as comments behind a self-caching loader
+    bytecode_cache: NotRequired[bool]
+    # Tree shaking (stitch_mode "raw" only): drop unreachable definitions
+    # - False: Keep every top-level definition (default)
+    # - True: Remove functions, classes, constants and imports nothing reaches
+    tree_shake: NotRequired[bool]
+    # Top-level names tree shaking always keeps (public API)
+    tree_shake_keep: NotRequired[list[str]]
+    # Startup profiling: embed timing probes, reported when SERGER_PROFILE=1
+    # - False: No probes (default)
+    # - True: Time the hoisted imports, each module section and shim setup
+    startup_profiling: NotRequired[bool]
+    # Output format: what gets written to `out`
+    # - "script": A single executable .py file (default)
+    # - "zipapp": An executable .pyz archive with precompiled bytecode
+    out_format: NotRequired[OutFormat]
+    # Interpreter the zipapp bytecode is compiled for
+    # - None: The interpreter running serger (default)
+    # - str: Interpreter command or path (e.g. "python3.12")
+    zipapp_python: NotRequired[str | None]
+    # Lean mode: strip code only type checkers need
+    # - False: Keep annotations and TYPE_CHECKING blocks (default)
+    # - True: Drop annotations, TYPE_CHECKING blocks and unused typing imports
+    lean_mode: NotRequired[bool]
+    # Memory budget: fail the build if its traced peak memory exceeds it
+    # - None: No limit (default)
+    # - int | float: Megabytes; checked against the build's traced peak with
+    #   --memory-report, else against the process's peak RSS
+    memory_budget_mb: NotRequired[int | float | None]
+    # Hoisted import optimization
+    # - False: Hoist imports as written, deduped by exact text (default)
+    # - True: Merge same-module imports, drop unused ones and sort them
+    optimize_imports: NotRequired[bool]
     # Max lines to check when detecting serger builds
     # - int: Override the default line limit for checking "# Build Tool: serger"
     #   (default: 200)
@@ -265,6 +318,8 @@ class RootConfigResolved(TypedDict):
     stitch_mode: StitchMode  # How to combine modules into a single file
     module_mode: ModuleMode  # How to generate import shims for stitched runtime
     shim: ShimSetting  # Controls shim generation and which modules get shims
+    shim_attrs: ShimAttrsMode  # How package shims expose stitched globals
+    module_loading: ModuleLoading  # When exec-mode modules execute
     # Module transformations (normalized to list format, always present)
     module_actions: list[ModuleActionFull]
     comments_mode: CommentsMode  # How to handle comments in stitched output
@@ -285,6 +340,23 @@ class RootConfigResolved(TypedDict):
     main_name: str | None
     # Build timestamp control (always present, resolved with defaults)
     disable_build_timestamp: bool
+    # Bytecode-cached output (always present, resolved with defaults)
+    bytecode_cache: bool
+    # Tree shaking (always present, resolved with defaults)
+    tree_shake: bool
+    tree_shake_keep: list[str]
+    # Startup profiling probes (always present, resolved with defaults)
+    startup_profiling: bool
+    # Output format (always present, resolved with defaults)
+    out_format: OutFormat
+    # Zipapp bytecode interpreter (always present, resolved with defaults)
+    zipapp_python: str | None
+    # Lean mode (always present, resolved with defaults)
+    lean_mode: bool
+    # Memory budget in MB (always present, resolved with defaults)
+    memory_budget_mb: int | float | None
+    # Hoisted import optimization (always present, resolved with defaults)
+    optimize_imports: bool
     # Max lines to check when detecting serger builds
     # (always present, resolved with defaults)
     build_tool_find_max_lines: int
@@ -11,7 +11,7 @@ from apathetic_schema import (
     flush_schema_aggregators,
     warn_keys_once,
 )
-from apathetic_utils import schema_from_typeddict
+from apathetic_utils import cast_hint, schema_from_typeddict
 
 from serger.constants import DEFAULT_STRICT_CONFIG
 from serger.logs import getAppLogger
@@ -134,21 +134,87 @@ def _validate_builds(
     summary: ValidationSummary,  # modified
     agg: SchemaErrorAggregator,  # modified
 ) -> ValidationSummary | None:
-    """Validate that 'builds' key is not present (multi-build not supported)."""
+    """Validate the optional 'builds' list.
+
+    Each entry is a partial configuration that inherits every root-level
+    setting, so entries are checked against the same schema as the root.
+    Root-only keys (e.g. watch_interval) are reported and ignored per build.
+    """
     logger = getAppLogger()
-    logger.trace("[validate_builds] Checking for unsupported 'builds' key")
+    logger.trace("[validate_builds] Checking 'builds' entries")
+
+    if "builds" not in parsed_cfg:
+        return None
 
-    if "builds" in parsed_cfg:
+    builds: Any = parsed_cfg["builds"]
+    if not isinstance(builds, list) or not builds:
         collect_msg(
-            "The 'builds' key is not supported. "
-            "Please use a single flat configuration object with all options "
-            "at the root level.",
+            "The 'builds' key must be a non-empty list of build objects. "
+            "Remove it to use a single flat configuration.",
             strict=True,
             summary=summary,
             is_error=True,
         )
         return _set_valid_and_return(summary=summary, agg=agg)
 
+    root_schema = schema_from_typeddict(RootConfig)
+    for i, build_cfg in enumerate(cast_hint(list[Any], builds), start=1):
+        context = f"in build #{i}"
+        if not isinstance(build_cfg, dict):
+            collect_msg(
+                f"Build #{i} must be an object, got {type(build_cfg).__name__}.",
+                strict=True,
+                summary=summary,
+                is_error=True,
+            )
+            continue
+        build_dict = cast_hint(dict[str, Any], build_cfg)
+
+        if "builds" in build_dict:
+            collect_msg(
+                f"Nested 'builds' {context} are not supported.",
+                strict=True,
+                summary=summary,
+                is_error=True,
+            )
+
+        prewarn_build: set[str] = set()
+        _ok, found = warn_keys_once(
+            "dry-run",
+            DRYRUN_KEYS,
+            build_dict,
+            context,
+            DRYRUN_MSG,
+            strict_config=summary.strict,
+            summary=summary,
+            agg=agg,
+        )
+        prewarn_build |= found
+        root_only_found = sorted(k for k in build_dict if k.lower() in ROOT_ONLY_KEYS)
+        _ok, found = warn_keys_once(
+            ", ".join(root_only_found) or "root-only",
+            ROOT_ONLY_KEYS,
+            build_dict,
+            context,
+            ROOT_ONLY_MSG,
+            strict_config=summary.strict,
+            summary=summary,
+            agg=agg,
+        )
+        prewarn_build |= found
+
+        check_schema_conformance(
+            build_dict,
+            root_schema,
+            context,
+            strict_config=summary.strict,
+            summary=summary,
+            prewarn=prewarn_build,
+            ignore_keys={"builds"},
+            base_path=f"root.builds[{i - 1}]",
+            field_examples=FIELD_EXAMPLES,
+        )
+
     return None
 
 
@@ -15,11 +15,18 @@ DEFAULT_ENV_LOG_LEVEL: str = "LOG_LEVEL"
 DEFAULT_ENV_RESPECT_GITIGNORE: str = "RESPECT_GITIGNORE"
 DEFAULT_ENV_WATCH_INTERVAL: str = "WATCH_INTERVAL"
 DEFAULT_ENV_DISABLE_BUILD_TIMESTAMP: str = "DISABLE_BUILD_TIMESTAMP"
+DEFAULT_ENV_CONFIG_CACHE: str = "CONFIG_CACHE"  # only read with the SERGER_ prefix
+DEFAULT_ENV_SERVE_SOCKET: str = "SERVE_SOCKET"  # only read with the SERGER_ prefix
 
 # --- program defaults ---
 DEFAULT_LOG_LEVEL: str = "info"
 DEFAULT_WATCH_INTERVAL: float = 1.0  # seconds
 DEFAULT_RESPECT_GITIGNORE: bool = True
+DEFAULT_CONFIG_CACHE: bool = False  # reuse resolved configs across invocations
+DEFAULT_SCHEDULER_WORKERS: int = 4  # threads for overlapped I/O-bound build steps
+DEFAULT_SERVE_SOCKET_NAME: str = "serve.sock"  # --serve socket in the user cache dir
+DEFAULT_SERVE_ACCEPT_TIMEOUT: float = 5.0  # seconds to wait for the server to start
+DEFAULT_SERVE_IDLE_TIMEOUT: float = 300.0  # seconds without output from a served build
 
 # --- config defaults ---
 DEFAULT_STRICT_CONFIG: bool = True
@@ -48,19 +55,29 @@ DEFAULT_INTERNAL_IMPORTS: dict[str, str] = {
 }
 
 # EXTERNAL_IMPORTS:
-#   - All modes use "top" - External imports (e.g., "import os", "from pathlib
-#     import Path") must be available at module level for all stitching modes.
-#     Hoisting them to the top ensures they're accessible throughout the stitched
-#     file, whether code is concatenated (raw), wrapped in classes (class), or
-#     executed in separate namespaces (exec).
+#   - "raw" / "class": "top" - External imports (e.g., "import os", "from pathlib
+#     import Path") are hoisted so they're accessible throughout the stitched
+#     file, whether code is concatenated (raw) or wrapped in classes (class).
+#   - "exec": "keep" - Exec mode runs each module in its own namespace, so a
+#     hoisted import would not be visible to the module that needs it.
 DEFAULT_EXTERNAL_IMPORTS: dict[str, str] = {
     "raw": "top",
     "class": "top",
-    "exec": "top",
+    "exec": "keep",
 }
 DEFAULT_STITCH_MODE: str = "raw"  # Raw concatenation (default stitching mode)
 DEFAULT_MODULE_MODE: str = "multi"  # Generate shims for all detected packages
 DEFAULT_SHIM: str = "all"  # Generate shims for all modules (default shim setting)
+DEFAULT_SHIM_ATTRS: str = "copy"  # Copy stitched globals onto package shims
+DEFAULT_MODULE_LOADING: str = "eager"  # Import exec-mode modules at startup
+DEFAULT_BYTECODE_CACHE: bool = False  # Write plain scripts (no caching loader)
+DEFAULT_TREE_SHAKE: bool = False  # Keep every top-level definition
+DEFAULT_STARTUP_PROFILING: bool = False  # No timing probes in stitched output
+DEFAULT_OUT_FORMAT: str = "script"  # Write a plain .py script (not a zipapp)
+DEFAULT_LEAN_MODE: bool = False  # Keep annotations and TYPE_CHECKING blocks
+DEFAULT_MEMORY_BUDGET_MB: float | None = None  # No memory limit for builds
+DEFAULT_OPTIMIZE_IMPORTS: bool = False  # Hoist imports as written (exact dedup)
+DEFAULT_ZIPAPP_PYTHON: str | None = None  # Compile zipapp bytecode in-process
 DEFAULT_COMMENTS_MODE: str = "keep"  # Keep all comments (default comments mode)
 DEFAULT_DOCSTRING_MODE: str = "keep"  # Keep all docstrings (default docstring mode)
 DEFAULT_SOURCE_BASES: list[str] = [
@@ -81,6 +98,10 @@ DEFAULT_LICENSE_FALLBACK: str = (
 # Lines to read when checking for "# Build Tool: serger" comment
 BUILD_TOOL_FIND_MAX_LINES: int = 200
 
+# --- stitched output defaults ---
+# Modules imported for their side effects only (kept even when unreferenced)
+SIDE_EFFECT_IMPORT_MODULES: frozenset[str] = frozenset({"readline", "rlcompleter"})
+
 # --- post-processing defaults ---
 DEFAULT_CATEGORY_ORDER: list[str] = ["static_checker", "formatter", "import_sorter"]
 
@@ -0,0 +1,502 @@
+# src/serger/daemon.py
+"""Long-lived build server (`serger --serve`) and the client that forwards to it.
+
+Every `serger` run pays for interpreter startup, imports, config resolution
+and module processing. The server is one process that stays up and runs
+builds sent to it over a Unix socket, keeping warm between them:
+
+- imported modules and the installed-package roots cache
+- resolved configs (the config cache is on by default for served builds)
+- processed module bodies (see stitch.ModuleCache)
+- tool executables found on PATH (see verify_script.caching_tool_lookups)
+
+When a server is listening, the `serger` CLI forwards its arguments, working
+directory and environment to it instead of building itself. The server
+builds with its own code and installed packages, so it only takes builds
+from clients running the same serger version and Python interpreter; other
+clients are refused and build locally.
+
+The socket is created owner-only in a directory no one else can write to,
+and each side checks the other's uid where the platform reports it
+(SO_PEERCRED), so a client never sends its environment to another user's
+server. A client that gets no answer in time builds locally.
+
+Protocol: one build per connection, as JSON lines. The client sends
+`{"argv": [...], "cwd": "...", "env": {...}, "tty": bool, "version": "...",
+"executable": "...", "prefix": "..."}`. A server that cannot run the build
+answers `{"refused": "reason"}`. Otherwise it answers `{"accepted": true}` and
+streams
+`{"stream": "stdout" | "stderr", "text": "..."}` frames while the build runs
+and ends with `{"exit_code": int, "results": [...]}`, where results are
+BuildResult.to_dict() of each build.
+"""
+
+import importlib.metadata
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, TextIO
+
+from apathetic_logging import TRACE_LEVEL, setRootLevel
+
+from .constants import (
+    DEFAULT_ENV_CONFIG_CACHE,
+    DEFAULT_ENV_SERVE_SOCKET,
+    DEFAULT_SERVE_ACCEPT_TIMEOUT,
+    DEFAULT_SERVE_IDLE_TIMEOUT,
+    DEFAULT_SERVE_SOCKET_NAME,
+)
+from .logs import configureLogQueue, flushLogs, getAppLogger
+from .meta import PROGRAM_ENV, PROGRAM_PACKAGE
+
+
+# The stitcher is imported when the server starts, so a client that finds
+# no server has only loaded this module.
+if TYPE_CHECKING:
+    from .build import BuildResult
+    from .verify_script import ToolLookupCache
+
+# Runs one CLI invocation in this process (cli.run_cli)
+RunFunc = Callable[[list[str]], tuple[int, list["BuildResult"]]]
+
+
+@dataclass
+class ServeReply:
+    """Outcome of a build run by the server.
+
+    Attributes:
+        exit_code: Exit code of the served CLI invocation
+        results: BuildResult.to_dict() of each build it ran
+    """
+
+    exit_code: int
+    results: list[dict[str, Any]] = field(default_factory=list[dict[str, Any]])
+
+
+def is_serve_supported() -> bool:
+    """Whether this platform has Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_serve_socket_path() -> Path:
+    """Return the server socket path ($SERGER_SERVE_SOCKET or the cache dir)."""
+    env_value = os.getenv(f"{PROGRAM_ENV}_{DEFAULT_ENV_SERVE_SOCKET}")
+    if env_value:
+        return Path(env_value)
+    from .utils.utils_paths import get_user_cache_dir  # noqa: PLC0415
+
+    return get_user_cache_dir() / DEFAULT_SERVE_SOCKET_NAME
+
+
+def _program_version() -> str:
+    """Return this serger's version (without running git, unlike --version)."""
+    stitched_version = globals().get("__version__")  # set in the stitched script
+    if isinstance(stitched_version, str):
+        return stitched_version
+    with suppress(importlib.metadata.PackageNotFoundError):
+        return importlib.metadata.version(PROGRAM_PACKAGE)
+    return "unknown"
+
+
+def _runtime_identity() -> dict[str, str]:
+    """Return what a client and server must share: serger and interpreter."""
+    return {
+        "version": _program_version(),
+        "executable": sys.executable,
+        "prefix": sys.prefix,
+    }
+
+
+def _send_frame(wfile: IO[bytes], frame: dict[str, Any]) -> None:
+    wfile.write(json.dumps(frame).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Connect to a server on `socket_path` (None if nothing is listening)."""
+    if not socket_path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _peer_uid(sock: socket.socket) -> int | None:
+    """Return the uid of the process on the other end of `sock`.
+
+    None where the platform does not report it (no SO_PEERCRED); the
+    owner-only socket mode still keeps other users out there.
+    """
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return None
+    creds = struct.calcsize("3i")  # pid, uid, gid
+    try:
+        _pid, uid, _gid = struct.unpack(
+            "3i", sock.getsockopt(socket.SOL_SOCKET, peercred, creds)
+        )
+    except OSError:
+        return None
+    return uid
+
+
+# --------------------------------------------------------------------------- #
+# server
+# --------------------------------------------------------------------------- #
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that sends everything written to it to the client."""
+
+    def __init__(self, wfile: IO[bytes], stream: str, *, tty: bool) -> None:
+        super().__init__()
+        self._wfile = wfile
+        self._stream = stream
+        self._tty = tty
+        self._connected = True
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, text: str) -> int:
+        if text and self._connected:
+            try:
+                _send_frame(self._wfile, {"stream": self._stream, "text": text})
+            except OSError:
+                # client went away; finish the build without its output
+                self._connected = False
+        return len(text)
+
+
+@contextmanager
+def _client_process_state(
+    cwd: Path, env: dict[str, str], stdout: TextIO, stderr: TextIO
+) -> Iterator[None]:
+    """Run the block with the client's working directory, env and streams.
+
+    The server's own log level and color setting are restored afterwards
+    (the served CLI run sets them from the client's args and env).
+    """
+    logger = getAppLogger()
+    saved_level = logger.getEffectiveLevel()
+    saved_color = logger.enable_color
+    saved_cwd = Path.cwd()
+    saved_env = dict(os.environ)
+    saved_streams = (sys.stdout, sys.stderr)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        yield
+    finally:
+        flushLogs()  # queued trace output still belongs to the client
+        sys.stdout, sys.stderr = saved_streams
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+        setRootLevel(saved_level)
+        logger.enable_color = saved_color
+        configureLogQueue(enabled=saved_level == TRACE_LEVEL)
+
+
+class _BuildRequestHandler(socketserver.StreamRequestHandler):
+    server: "BuildServer"
+
+    def handle(self) -> None:
+        uid = _peer_uid(self.request)
+        if uid not in (None, os.getuid()):
+            getAppLogger().warning("🛰️  Refused a connection from uid %s", uid)
+            return
+        line = self.rfile.readline()
+        if not line.strip():
+            return  # a liveness probe (see _claim_socket_path)
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+        if not isinstance(request, dict):
+            with suppress(OSError):
+                _send_frame(self.wfile, {"stream": "stderr", "text": "Bad request\n"})
+                _send_frame(self.wfile, {"exit_code": 2, "results": []})
+            return
+        self.server.run_request(request, self.wfile)
+
+
+class BuildServer(socketserver.UnixStreamServer):
+    """Unix-socket server that runs CLI builds in this (warm) process.
+
+    Builds run one at a time, each with the client's working directory,
+    environment and argv, and with the server's caches active. Requests
+    from a different serger version or interpreter (see `identity`) are
+    refused so the client builds locally.
+
+    Usage:
+        with BuildServer(path, run_cli) as server:
+            server.serve_forever()
+    """
+
+    def __init__(self, socket_path: Path, run_func: RunFunc) -> None:
+        from .stitch import ModuleCache  # noqa: PLC0415
+
+        self.socket_path = socket_path
+        self.run_func = run_func
+        self.module_cache = ModuleCache()
+        self.tool_lookups: ToolLookupCache = {}
+        self.identity = _runtime_identity()
+        self.builds_served = 0
+        _claim_socket_path(socket_path)
+        super().__init__(str(socket_path), _BuildRequestHandler)
+
+    def server_bind(self) -> None:
+        # create the socket file owner-only (connecting needs write access)
+        previous = os.umask(0o077)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+    def run_request(self, request: dict[str, Any], wfile: IO[bytes]) -> None:
+        """Run one client request, streaming its output back on `wfile`."""
+        from .stitch import using_module_cache  # noqa: PLC0415
+        from .verify_script import caching_tool_lookups  # noqa: PLC0415
+
+        mismatches = [
+            f"{key} {request.get(key)!r}, server has {value!r}"
+            for key, value in self.identity.items()
+            if request.get(key) != value
+        ]
+        if mismatches:
+            reason = "; ".join(mismatches)
+            getAppLogger().detail("🛰️  Refused a build: %s", reason)
+            with suppress(OSError):
+                _send_frame(wfile, {"refused": reason})
+            return
+        try:
+            _send_frame(wfile, {"accepted": True})
+        except OSError:
+            return  # the client gave up waiting and builds locally
+
+        argv = [str(arg) for arg in request.get("argv", [])]
+        cwd = Path(request.get("cwd") or Path.cwd())
+        env = {str(k): str(v) for k, v in (request.get("env") or os.environ).items()}
+        # served builds reuse resolved configs unless the client opted out
+        env.setdefault(f"{PROGRAM_ENV}_{DEFAULT_ENV_CONFIG_CACHE}", "1")
+        tty = bool(request.get("tty", False))
+        stdout = _FrameWriter(wfile, "stdout", tty=tty)
+        stderr = _FrameWriter(wfile, "stderr", tty=tty)
+
+        self.module_cache.next_build()
+        start = time.perf_counter()
+        exit_code = 1
+        results: list[dict[str, Any]] = []
+        with _client_process_state(cwd, env, stdout, stderr):
+            try:
+                with (
+                    using_module_cache(self.module_cache),
+                    caching_tool_lookups(self.tool_lookups),
+                ):
+                    exit_code, build_results = self.run_func(argv)
+                results = [result.to_dict() for result in build_results]
+            except SystemExit as e:  # argparse errors
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:  # noqa: BLE001
+                stderr.write(f"Build server error: {e}\n")
+        self.builds_served += 1
+        with suppress(OSError):
+            _send_frame(wfile, {"exit_code": exit_code, "results": results})
+        getAppLogger().detail(
+            "🛰️  Served build #%d in %s (exit %d, %.1f ms)",
+            self.builds_served,
+            cwd,
+            exit_code,
+            (time.perf_counter() - start) * 1000,
+        )
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    """Make `socket_path` free to bind, removing a stale socket file.
+
+    The socket's directory is created owner-only if missing. An existing
+    one must belong to this user and not be writable by anyone else, who
+    could otherwise replace the socket with their own.
+
+    Raises:
+        RuntimeError: If a server is already listening there, or the
+            directory is not private to this user
+    """
+    sock = _connect(socket_path)
+    if sock is not None:
+        sock.close()
+        msg = f"A build server is already running on {socket_path}"
+        raise RuntimeError(msg)
+    parent = socket_path.parent
+    parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = parent.stat()
+    if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        msg = (
+            f"Refusing to serve builds from {parent}: it must belong to you and"
+            f" not be writable by others (try `chmod 700 {parent}`)"
+        )
+        raise RuntimeError(msg)
+    with suppress(FileNotFoundError):
+        socket_path.unlink()
+
+
+def serve(run_func: RunFunc, socket_path: Path | None = None) -> int:
+    """Run the build server until interrupted (`serger --serve`).
+
+    Args:
+        run_func: Runs one CLI invocation and returns its exit code and
+            build results (cli.run_cli)
+        socket_path: Socket to listen on (default: get_serve_socket_path())
+
+    Returns:
+        Exit code (0 once stopped)
+
+    Raises:
+        RuntimeError: If Unix sockets are unsupported or a server is already
+            running on the socket
+    """
+    logger = getAppLogger()
+    if not is_serve_supported():
+        msg = "--serve needs Unix domain sockets, which this platform lacks"
+        raise RuntimeError(msg)
+    path = socket_path or get_serve_socket_path()
+    with BuildServer(path, run_func) as server:
+        logger.info("🛰️  Serving builds on %s... Press Ctrl+C to stop.", path)
+        # stop (and remove the socket) on `kill` as on Ctrl+C
+        previous = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("\n🛑 Server stopped.")
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+    return 0
+
+
+def _raise_keyboard_interrupt(_signum: int, _frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+# --------------------------------------------------------------------------- #
+# client
+# --------------------------------------------------------------------------- #
+
+
+def request_build(  # noqa: PLR0911
+    argv: list[str],
+    *,
+    socket_path: Path | None = None,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+    accept_timeout: float = DEFAULT_SERVE_ACCEPT_TIMEOUT,
+    idle_timeout: float = DEFAULT_SERVE_IDLE_TIMEOUT,
+) -> ServeReply | None:
+    """Run a CLI invocation on the build server, streaming its output.
+
+    Args:
+        argv: CLI arguments (as passed to `serger`)
+        socket_path: Server socket (default: get_serve_socket_path())
+        cwd: Working directory for the build (default: current directory)
+        env: Environment for the build (default: this process's)
+        stdout: Where the build's stdout goes (default: sys.stdout)
+        stderr: Where the build's stderr goes (default: sys.stderr)
+        accept_timeout: Seconds to wait for the server to take the build
+            (it runs one build at a time)
+        idle_timeout: Seconds to wait for each piece of output once it has
+
+    Returns:
+        The server's reply, or None to build locally: no server is
+        listening, it belongs to another user, it refused the build (it
+        runs a different serger version or interpreter), or it did not
+        answer in time
+
+    Raises:
+        RuntimeError: If the server hangs up before the build finishes
+    """
+    if not is_serve_supported():
+        return None
+    sock = _connect(socket_path or get_serve_socket_path())
+    if sock is None:
+        return None
+    uid = _peer_uid(sock)
+    if uid not in (None, os.getuid()):
+        sock.close()
+        getAppLogger().warning(
+            "🛰️  Build server belongs to uid %s; building locally", uid
+        )
+        return None
+    out = stdout or sys.stdout
+    err = stderr or sys.stderr
+    request = {
+        "argv": argv,
+        "cwd": str(cwd or Path.cwd()),
+        "env": dict(os.environ if env is None else env),
+        "tty": out.isatty(),
+        **_runtime_identity(),
+    }
+    sock.settimeout(accept_timeout)
+    with sock, sock.makefile("rwb") as stream:
+        try:
+            _send_frame(stream, request)
+            lines = iter(stream)
+            frame = json.loads(next(lines, b"{}"))
+            if "refused" in frame:
+                getAppLogger().detail(
+                    "🛰️  Build server refused the build (%s); building locally",
+                    frame["refused"],
+                )
+                return None
+            sock.settimeout(idle_timeout)
+            frames = (json.loads(line) for line in lines)
+            return _read_reply(frames, out, err)
+        except TimeoutError:
+            getAppLogger().warning(
+                "🛰️  Build server did not answer in time; building locally"
+            )
+            return None
+
+
+def _read_reply(
+    frames: Iterator[dict[str, Any]], out: TextIO, err: TextIO
+) -> ServeReply:
+    """Print streamed output frames until the final one (see request_build)."""
+    for frame in frames:
+        if "exit_code" in frame:
+            return ServeReply(frame["exit_code"], frame.get("results", []))
+        target = out if frame.get("stream") == "stdout" else err
+        target.write(frame.get("text", ""))
+        target.flush()
+    msg = "Build server closed the connection before the build finished"
+    raise RuntimeError(msg)
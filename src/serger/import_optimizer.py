@@ -0,0 +1,172 @@
+# src/serger/import_optimizer.py
+"""Hoisted-import optimizer (`optimize_imports`).
+
+`_collect_modules()` dedups hoisted imports by their exact text, so
+`from os import path` and `from os import sep` stay two statements, and an
+import whose names the stitched code no longer uses (its only user was an
+internal import that got stripped, or a rename) still runs at startup.
+
+`optimize_hoisted_imports()` rewrites the hoisted block:
+
+- `from x import a` / `from x import b` are merged into `from x import a, b`
+- `import a, b` is split into one statement per module
+- names the stitched body never references are dropped
+- statements are sorted: `import x` first, then `from x import ...`,
+  each by module name
+
+Statements it does not understand (`__future__` and star imports, relative
+imports, TYPE_CHECKING blocks) are kept verbatim and in their original
+order: `__future__` imports first, the rest after the sorted imports.
+"""
+
+import ast
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from .constants import SIDE_EFFECT_IMPORT_MODULES
+from .logs import getAppLogger
+
+
+# Imports the shim system and main block rely on, whether referenced or not
+_RESERVED_IMPORT_MODULES = frozenset({"sys", "types"})
+
+# Longest single-line `from x import ...` before it is wrapped in parentheses
+_MAX_IMPORT_LINE = 88
+
+
+@dataclass
+class OptimizedImports:
+    """Result of optimizing the hoisted import block.
+
+    Attributes:
+        imports: Import statements in output order (each ends with a newline)
+        removed: Dropped bindings as `module` or `module.name`, sorted
+    """
+
+    imports: list[str]
+    removed: list[str] = field(default_factory=list[str])
+
+
+def _referenced_names(sources: Iterable[str]) -> set[str] | None:
+    """Return every name the sources load, store or mention in a string.
+
+    String constants count so `__all__` entries and `getattr(mod, "x")`
+    keep their imports. Returns None if any source does not parse.
+    """
+    names: set[str] = set()
+    for source in sources:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return None
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                names.add(node.id)
+            elif (
+                isinstance(node, ast.Constant)
+                and isinstance(node.value, str)
+                and node.value.isidentifier()
+            ):
+                names.add(node.value)
+    return names
+
+
+def _format_from_import(module: str, aliases: Iterable[ast.alias]) -> str:
+    names = [ast.unparse(alias) for alias in aliases]
+    line = f"from {module} import {', '.join(names)}\n"
+    if len(line) - 1 <= _MAX_IMPORT_LINE:
+        return line
+    body = "".join(f"    {name},\n" for name in names)
+    return f"from {module} import (\n{body})\n"
+
+
+# Imported names keyed by (name, asname), in first-seen order
+_ImportNames = dict[tuple[str, str | None], None]
+
+
+def _group_hoisted_imports(
+    imports: Iterable[str],
+) -> tuple[list[str], list[str], _ImportNames, dict[str, _ImportNames]]:
+    """Split hoisted statements into future, verbatim, plain and from imports."""
+    future: list[str] = []
+    verbatim: list[str] = []
+    plain: _ImportNames = {}
+    from_names: dict[str, _ImportNames] = {}
+    for imp in dict.fromkeys(imports):
+        try:
+            parsed = ast.parse(imp).body
+        except SyntaxError:
+            verbatim.append(imp)
+            continue
+        node = parsed[0] if len(parsed) == 1 else None
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                plain.setdefault((alias.name, alias.asname), None)
+        elif not isinstance(node, ast.ImportFrom) or node.level or not node.module:
+            verbatim.append(imp)
+        elif node.module == "__future__":
+            future.append(imp)
+        elif any(alias.name == "*" for alias in node.names):
+            verbatim.append(imp)
+        else:
+            names = from_names.setdefault(node.module, {})
+            for alias in node.names:
+                names.setdefault((alias.name, alias.asname), None)
+    return future, verbatim, plain, from_names
+
+
+def _sorted_aliases(names: _ImportNames) -> list[ast.alias]:
+    return [
+        ast.alias(name, asname)
+        for name, asname in sorted(names, key=lambda key: (key[0], key[1] or ""))
+    ]
+
+
+def optimize_hoisted_imports(
+    imports: Iterable[str],
+    body_sources: Iterable[str],
+) -> OptimizedImports:
+    """Merge, prune and sort hoisted import statements.
+
+    Args:
+        imports: Hoisted import statements, in collection order
+        body_sources: Code that runs with these imports in scope (module
+            sections, __main__ block). If any of it does not parse, nothing
+            is pruned; imports are still merged and sorted.
+
+    Returns:
+        OptimizedImports with the new statements and what was dropped
+    """
+    logger = getAppLogger()
+    future, verbatim, plain, from_names = _group_hoisted_imports(imports)
+
+    # Verbatim statements (TYPE_CHECKING blocks) may use hoisted names too
+    used = _referenced_names([*body_sources, *verbatim])
+    removed: list[str] = []
+
+    output = list(future)
+    for alias in _sorted_aliases(plain):
+        top = alias.name.split(".")[0]
+        if (
+            used is None
+            or top in _RESERVED_IMPORT_MODULES
+            or top in SIDE_EFFECT_IMPORT_MODULES
+            or (alias.asname or top) in used
+        ):
+            output.append(f"{ast.unparse(ast.Import(names=[alias]))}\n")
+        else:
+            removed.append(alias.name)
+    for module in sorted(from_names):
+        kept: list[ast.alias] = []
+        for alias in _sorted_aliases(from_names[module]):
+            if used is None or (alias.asname or alias.name) in used:
+                kept.append(alias)
+            else:
+                removed.append(f"{module}.{alias.name}")
+        if kept:
+            output.append(_format_from_import(module, kept))
+    output.extend(verbatim)
+
+    for name in removed:
+        logger.debug("optimize_imports: removed unused import %s", name)
+    return OptimizedImports(imports=output, removed=sorted(removed))
@@ -0,0 +1,335 @@
+# src/serger/lean_mode.py
+"""Runtime-lean source transform (`lean_mode`).
+
+Type hints cost startup time in a stitched tool: annotations are evaluated
+(or stored) at import, and `typing` helpers are imported only to spell them.
+`apply_lean_mode()` removes what the program does not need at runtime:
+
+- function argument and return annotations
+- variable annotations (`x: int = 1` becomes `x = 1`)
+- `if TYPE_CHECKING:` blocks
+- `typing` / `typing_extensions` imports left unused afterwards
+
+Annotations that are read at runtime stay: class-level annotations of any
+class with a decorator, base class or metaclass (dataclasses, TypedDict,
+NamedTuple, pydantic models, ...), functions with decorators that may
+inspect their signature, and every annotation in a module that introspects
+annotations itself (`__annotations__`, `get_type_hints`, `signature`).
+"""
+
+import ast
+import re
+
+from .logs import getAppLogger
+from .verify_script import verify_compiles_string
+
+
+# Decorators known not to read the decorated function's annotations
+_ANNOTATION_BLIND_DECORATORS = frozenset(
+    {
+        "abstractmethod",
+        "asynccontextmanager",
+        "cache",
+        "cached_property",
+        "classmethod",
+        "contextmanager",
+        "deleter",
+        "final",
+        "getter",
+        "lru_cache",
+        "overload",
+        "override",
+        "property",
+        "setter",
+        "staticmethod",
+        "wraps",
+    }
+)
+
+_TYPING_MODULES = frozenset({"typing", "typing_extensions"})
+
+# Signs that a module reads annotations at runtime
+_INTROSPECTION_RE = re.compile(r"__annotations__|get_type_hints|\bsignature\(")
+
+# Whitespace around the `=` of an argument default
+_DEFAULT_EQUALS_RE = re.compile(rb"\s*=\s*")
+
+# Whitespace, line continuations and comments between tokens
+_FILLER_RE = re.compile(rb"(?:\s|\\\n|#[^\n]*)*")
+_COMMENT_RE = re.compile(rb"#[^\n]*")
+
+# (start byte, end byte, replacement)
+_Edit = tuple[int, int, bytes]
+
+
+def _lean_decorator_name(node: ast.expr) -> str | None:
+    while isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def _is_type_checking_test(test: ast.expr) -> bool:
+    if isinstance(test, ast.Name):
+        return test.id == "TYPE_CHECKING"
+    return isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+
+
+def _is_plain_class(node: ast.ClassDef) -> bool:
+    return not (node.decorator_list or node.bases or node.keywords)
+
+
+class _LeanCollector:
+    """Collect byte-range edits that strip runtime-unneeded typing code."""
+
+    def __init__(self, source: bytes, *, strip_annotations: bool) -> None:
+        self.source = source
+        self.strip_annotations = strip_annotations
+        starts = [0]
+        for line in source.splitlines(keepends=True):
+            starts.append(starts[-1] + len(line))
+        self.line_starts = starts
+        self.edits: list[_Edit] = []
+        # Statements removed outright; used to replace emptied bodies
+        self.removed: set[int] = set()
+
+    def offset(self, lineno: int, col: int) -> int:
+        return self.line_starts[lineno - 1] + col
+
+    def annotation_end(self, prefix_start: int, ann: ast.expr) -> int:
+        """Return where `ann` ends, including parentheses around it.
+
+        The AST span of a parenthesized annotation (`x: ("int")`, possibly
+        over several lines) stops before the `)`, so each `(` between
+        `prefix_start` (the `:` or `->`) and the annotation is matched with a
+        `)` after it.
+        """
+        ann_start = self.offset(ann.lineno, ann.col_offset)
+        prefix = _COMMENT_RE.sub(b"", self.source[prefix_start:ann_start])
+        end = self.offset(ann.end_lineno or ann.lineno, ann.end_col_offset or 0)
+        for _ in range(prefix.count(b"(")):
+            filler = _FILLER_RE.match(self.source, end)
+            end = filler.end() if filler else end
+            if self.source[end : end + 1] != b")":
+                break
+            end += 1
+        return end
+
+    def stmt_span(self, stmt: ast.stmt) -> tuple[int, int]:
+        """Return the full lines a statement occupies (including newline)."""
+        decorators: list[ast.expr] = getattr(stmt, "decorator_list", [])
+        start_line = min([stmt.lineno] + [d.lineno for d in decorators])
+        end_line = stmt.end_lineno or stmt.lineno
+        return self.line_starts[start_line - 1], self.line_starts[end_line]
+
+    def visit_body(self, body: list[ast.stmt], *, in_plain_class: bool) -> None:
+        removable: list[ast.stmt] = []
+        for stmt in body:
+            if self._removable(stmt, in_plain_class=in_plain_class):
+                removable.append(stmt)
+                continue
+            self.visit_stmt(stmt, in_plain_class=in_plain_class)
+        if not removable:
+            return
+        # Statements sharing a line with others are left alone
+        lines = [
+            line
+            for stmt in body
+            if stmt not in removable
+            for line in range(stmt.lineno, (stmt.end_lineno or stmt.lineno) + 1)
+        ]
+        for stmt in removable:
+            if any(stmt.lineno <= line <= (stmt.end_lineno or 0) for line in lines):
+                continue
+            start, end = self.stmt_span(stmt)
+            replacement = b""
+            if all(id(other) in self.removed for other in body if other is not stmt):
+                # Last statement of the block: keep it syntactically valid
+                indent = self.source[start : start + stmt.col_offset]
+                replacement = indent + b"pass\n"
+            self.removed.add(id(stmt))
+            self.edits.append((start, end, replacement))
+
+    def _removable(self, stmt: ast.stmt, *, in_plain_class: bool) -> bool:
+        if isinstance(stmt, ast.If) and _is_type_checking_test(stmt.test):
+            return not stmt.orelse
+        return (
+            self.strip_annotations
+            and isinstance(stmt, ast.AnnAssign)
+            and stmt.value is None
+            and in_plain_class
+        )
+
+    def visit_stmt(self, stmt: ast.stmt, *, in_plain_class: bool) -> None:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if self.strip_annotations and all(
+                _lean_decorator_name(d) in _ANNOTATION_BLIND_DECORATORS
+                for d in stmt.decorator_list
+            ):
+                self.strip_function(stmt)
+            self.visit_body(stmt.body, in_plain_class=True)
+            return
+        if isinstance(stmt, ast.ClassDef):
+            self.visit_body(stmt.body, in_plain_class=_is_plain_class(stmt))
+            return
+        if isinstance(stmt, ast.AnnAssign):
+            if self.strip_annotations and in_plain_class and stmt.value is not None:
+                self.strip_ann_assign(stmt)
+            return
+        for field in ("body", "orelse", "finalbody"):
+            block = getattr(stmt, field, None)
+            if block:
+                self.visit_body(block, in_plain_class=True)
+        for handler in getattr(stmt, "handlers", []):
+            self.visit_body(handler.body, in_plain_class=True)
+        for case in getattr(stmt, "cases", []):
+            self.visit_body(case.body, in_plain_class=True)
+
+    def strip_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        args = node.args
+        all_args = [
+            *args.posonlyargs,
+            *args.args,
+            *([args.vararg] if args.vararg else []),
+            *args.kwonlyargs,
+            *([args.kwarg] if args.kwarg else []),
+        ]
+        for arg in all_args:
+            if arg.annotation is None:
+                continue
+            name_end = self.offset(arg.lineno, arg.col_offset) + len(
+                arg.arg.encode("utf-8")
+            )
+            ann_end = self.annotation_end(name_end, arg.annotation)
+            # `x: int = 1` becomes `x=1`, not `x = 1`
+            match = _DEFAULT_EQUALS_RE.match(self.source, ann_end)
+            if match:
+                self.edits.append((name_end, match.end(), b"="))
+            else:
+                self.edits.append((name_end, ann_end, b""))
+        if node.returns is not None:
+            ret = node.returns
+            ret_start = self.offset(ret.lineno, ret.col_offset)
+            arrow = self.source.rfind(b"->", 0, ret_start)
+            while arrow > 0 and self.source[arrow - 1 : arrow] in (b" ", b"\t"):
+                arrow -= 1
+            ret_end = self.annotation_end(self.source.rfind(b"->", 0, ret_start), ret)
+            self.edits.append((arrow, ret_end, b""))
+
+    def strip_ann_assign(self, node: ast.AnnAssign) -> None:
+        target = node.target
+        target_end = self.offset(
+            target.end_lineno or target.lineno, target.end_col_offset or 0
+        )
+        ann = node.annotation
+        ann_end = self.offset(ann.end_lineno or ann.lineno, ann.end_col_offset or 0)
+        equals = self.source.find(b"=", ann_end)
+        self.edits.append((target_end, equals, b" "))
+
+
+def _apply_edits(source: bytes, edits: list[_Edit]) -> bytes:
+    result = source
+    last_start = len(source) + 1
+    # Apply back to front; skip edits nested in an already applied range
+    for start, end, replacement in sorted(edits, key=lambda e: (e[0], -e[1]))[::-1]:
+        if end > last_start:
+            continue
+        result = result[:start] + replacement + result[end:]
+        last_start = start
+    return result
+
+
+def _used_names(tree: ast.Module) -> set[str]:
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif (
+            isinstance(node, (ast.Assign, ast.AnnAssign))
+            and node.value is not None
+            and any(
+                isinstance(t, ast.Name) and t.id == "__all__"
+                for t in (
+                    node.targets if isinstance(node, ast.Assign) else [node.target]
+                )
+            )
+        ):
+            # Re-exports listed in __all__ count as uses
+            names.update(
+                elt.value
+                for elt in ast.walk(node.value)
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            )
+    return names
+
+
+def _prune_typing_imports(source: bytes) -> bytes:
+    """Drop typing/typing_extensions imports (or names) nothing uses anymore."""
+    tree = ast.parse(source)
+    used = _used_names(tree)
+    collector = _LeanCollector(source, strip_annotations=False)
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ImportFrom) and stmt.module in _TYPING_MODULES:
+            keep = [a for a in stmt.names if (a.asname or a.name) in used]
+            if any(a.name == "*" for a in stmt.names):
+                continue
+        elif isinstance(stmt, ast.Import) and all(
+            a.name in _TYPING_MODULES for a in stmt.names
+        ):
+            keep = [a for a in stmt.names if (a.asname or a.name) in used]
+        else:
+            continue
+        if len(keep) == len(stmt.names):
+            continue
+        start, end = collector.stmt_span(stmt)
+        if stmt.lineno != (stmt.end_lineno or stmt.lineno) and keep:
+            continue
+        if keep:
+            rewritten = (
+                ast.ImportFrom(module=stmt.module, names=keep, level=0)
+                if isinstance(stmt, ast.ImportFrom)
+                else ast.Import(names=keep)
+            )
+            replacement = ast.unparse(rewritten).encode("utf-8") + b"\n"
+        else:
+            replacement = b""
+        collector.edits.append((start, end, replacement))
+    return _apply_edits(source, collector.edits)
+
+
+def apply_lean_mode(text: str, filename: str = "<string>") -> str:
+    """Strip annotations, TYPE_CHECKING blocks and unused typing imports.
+
+    The result is checked with `verify_compiles_string()`; if the transform
+    produced invalid code (or the input does not parse), the original text
+    is returned unchanged.
+
+    Args:
+        text: Python source code of one module
+        filename: Name used in log messages and compile errors
+
+    Returns:
+        The lean source code
+    """
+    logger = getAppLogger()
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return text
+
+    source = text.encode("utf-8")
+    collector = _LeanCollector(
+        source, strip_annotations=not _INTROSPECTION_RE.search(text)
+    )
+    collector.visit_body(tree.body, in_plain_class=True)
+    try:
+        lean = _prune_typing_imports(_apply_edits(source, collector.edits))
+        lean_text = lean.decode("utf-8")
+        verify_compiles_string(lean_text, filename=filename)
+    except SyntaxError as e:
+        logger.warning("lean_mode skipped for %s: %s", filename, e)
+        return text
+    return lean_text
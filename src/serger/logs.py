@@ -1,11 +1,17 @@
 # src/serger/logs.py
 
-from typing import cast
+import logging
+import queue
+from collections.abc import Callable
+from logging.handlers import QueueListener
+from typing import Any, cast
 
 from apathetic_logging import (
     INHERIT_LEVEL,
+    TRACE_LEVEL,
+    DualStreamHandler,
     Logger,
-    getLogger,
+    getLoggerOfType,
     registerDefaultLogLevel,
     registerLogger,
     registerLogLevelEnvVars,
@@ -20,7 +26,74 @@ from .meta import PROGRAM_ENV, PROGRAM_PACKAGE
 class AppLogger(Logger):
     """App-specific logger class."""
 
-    # for future use if needed, empty for now
+    def isTraceEnabled(self) -> bool:  # noqa: N802
+        """Return whether trace messages are emitted.
+
+        Guard hot-loop trace output whose arguments are costly to compute:
+        `logger.trace("...", *args)` already skips formatting when disabled,
+        but its arguments are still evaluated.
+        """
+        return self.isEnabledFor(TRACE_LEVEL)
+
+
+class Lazy:
+    """Log argument computed only if the message is actually formatted.
+
+    `logger.trace("found %s", Lazy(expensive, arg))` calls `expensive(arg)`
+    only when trace output is enabled.
+    """
+
+    __slots__ = ("_args", "_func")
+
+    def __init__(self, func: Callable[..., object], *args: object) -> None:
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+    def __repr__(self) -> str:
+        return repr(self._func(*self._args))
+
+
+class QueuedDualStreamHandler(DualStreamHandler):
+    """DualStreamHandler that writes records on a background thread.
+
+    Messages are formatted in the logging thread (so lazy arguments see the
+    state they describe) and queued; a listener thread does the colouring
+    and the stream I/O. Used at trace level, where writing to stderr would
+    otherwise dominate the build. Being a DualStreamHandler, apathetic
+    logging keeps it as the root handler.
+    """
+
+    def __init__(self, target: DualStreamHandler) -> None:
+        super().__init__()
+        self.setFormatter(target.formatter)
+        self.enable_color = target.enable_color
+        self._target = target
+        self._queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        self._listener = QueueListener(self._queue, target)
+        self._listener.start()
+
+    def emit(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        try:
+            # Freeze the message now; args may change or be lazy
+            record.msg = record.getMessage()
+            record.args = None
+            self._target.enable_color = self.enable_color
+            self._queue.put_nowait(record)
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        self._queue.join()
+        self._target.flush()
+
+    def close(self) -> None:
+        self._listener.stop()
+        self._target.close()
+        super().close()
 
 
 # --- Logger initialization ---------------------------------------------------
@@ -48,11 +121,12 @@ AppLogger.extendLoggingModule()
 # (Child loggers will do their own filtering based on their level)
 setRootLevel("info")
 
-# Create the app logger instance via getLogger()
+# Create the app logger instance via getLoggerOfType()
 # This is a child logger that inherits from the root logger.
 # The root logger (created by extendLoggingModule) has the DualStreamHandler,
 # and this child logger propagates to it via propagate=True.
-_APP_LOGGER = cast("AppLogger", getLogger(PROGRAM_PACKAGE))
+# getLoggerOfType() (unlike getLogger()) creates it as an AppLogger.
+_APP_LOGGER = getLoggerOfType(PROGRAM_PACKAGE, AppLogger)
 
 # Set the app logger level to INHERIT_LEVEL so it inherits from its parent
 _APP_LOGGER.setLevel(INHERIT_LEVEL)
@@ -69,3 +143,30 @@ def getAppLogger() -> AppLogger:  # noqa: N802
     better type hints.
     """
     return _APP_LOGGER
+
+
+def configureLogQueue(*, enabled: bool) -> None:  # noqa: N802
+    """Route root log output through a background writer (or stop doing so).
+
+    Enabled for `--log-level trace`; writes already queued are flushed when
+    it is disabled. If the output streams change (e.g. captured in tests),
+    apathetic logging replaces the handler with a plain one.
+    """
+    root = cast("Logger", logging.getLogger())
+    root.manageHandlers()
+    for i, handler in enumerate(root.handlers):
+        if isinstance(handler, QueuedDualStreamHandler):
+            if not enabled:
+                # the target handler keeps writing directly once unqueued
+                handler.flush()
+                handler._listener.stop()  # noqa: SLF001
+                root.handlers[i] = handler._target  # noqa: SLF001
+        elif enabled and isinstance(handler, DualStreamHandler):
+            root.handlers[i] = QueuedDualStreamHandler(handler)
+
+
+def flushLogs() -> None:  # noqa: N802
+    """Write out queued log records (see configureLogQueue())."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, QueuedDualStreamHandler):
+            handler.flush()
@@ -1,5 +1,8 @@
 """Module actions processing for renaming, moving, copying, and deleting modules."""
 
+import functools
+import re
+from collections import Counter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -8,6 +11,8 @@ from serger.utils.utils_modules import derive_module_name
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from serger.config.config_types import (
         ModuleActionFull,
         ModuleActionMode,
@@ -55,8 +60,9 @@ def extract_module_name_from_source_path(
     if extracted_module_name == expected_source:
         # Exact match
         logger.trace(
-            f"[source_path] Module name matches: "
-            f"{extracted_module_name} == {expected_source}"
+            "[source_path] Module name matches: %s == %s",
+            extracted_module_name,
+            expected_source,
         )
         return extracted_module_name
 
@@ -67,8 +73,9 @@ def extract_module_name_from_source_path(
     if extracted_module_name.endswith((f".{expected_source}", expected_source)):
         # Suffix match - this is allowed
         logger.trace(
-            f"[source_path] Module name suffix matches: "
-            f"{extracted_module_name} ends with {expected_source}"
+            "[source_path] Module name suffix matches: %s ends with %s",
+            extracted_module_name,
+            expected_source,
         )
         return extracted_module_name
 
@@ -374,6 +381,8 @@ def validate_no_conflicting_operations(  # noqa: C901, PLR0912, PLR0915
     # Collect all sources and destinations
     sources: set[str] = set()
     dests: set[str] = set()
+    # computed destination -> number of actions moving/copying there
+    dest_counts: Counter[str] = Counter()
     deleted: set[str] = set()
     moved_from: set[str] = set()
     copied_from: set[str] = set()
@@ -387,6 +396,8 @@ def validate_no_conflicting_operations(  # noqa: C901, PLR0912, PLR0915
 
         if action_type == "delete":
             deleted.add(source)
+            if dest is not None:
+                dest_counts[dest] += 1
         elif action_type in ("move", "rename"):
             moved_from.add(source)
             if dest is not None:
@@ -398,12 +409,17 @@ def validate_no_conflicting_operations(  # noqa: C901, PLR0912, PLR0915
                     else:
                         full_dest = dest
                     dests.add(full_dest)
+                    dest_counts[full_dest] += 1
                 else:
                     dests.add(dest)
+                    dest_counts[dest] += 1
         elif action_type == "copy":
             copied_from.add(source)
             if dest is not None:
                 dests.add(dest)
+                dest_counts[dest] += 1
+        elif dest is not None:
+            dest_counts[dest] += 1
 
     # Check: Can't delete something that's being moved/copied
     for action in actions:
@@ -455,29 +471,9 @@ def validate_no_conflicting_operations(  # noqa: C901, PLR0912, PLR0915
         ):
             # But allow if dest is also a destination in other actions
             # (it's being moved into, then moved from - this is valid)
-            # Only error if dest is ONLY a source (not also a destination)
-            # Check if dest appears as a destination in any other action
-            dest_is_also_destination = False
-            for other_action in actions:
-                if other_action is action:
-                    continue
-                other_dest = other_action.get("dest")
-                if other_dest is not None:
-                    # For rename actions, construct full destination path
-                    other_action_type = other_action.get("action", "move")
-                    if other_action_type == "rename":
-                        other_source = other_action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
-                        if "." in other_source:
-                            other_parent = ".".join(other_source.split(".")[:-1])
-                            other_computed_dest = f"{other_parent}.{other_dest}"
-                        else:
-                            other_computed_dest = other_dest
-                        if other_computed_dest == computed_dest:
-                            dest_is_also_destination = True
-                            break
-                    elif other_dest == computed_dest:
-                        dest_is_also_destination = True
-                        break
+            # Only error if dest is ONLY a source (not also a destination);
+            # this action accounts for one of the counted destinations
+            dest_is_also_destination = dest_counts[computed_dest] > 1
             if not dest_is_also_destination:
                 msg = (
                     f"Cannot {action_type} to '{computed_dest}' because it is being "
@@ -528,6 +524,12 @@ def validate_module_actions(
     # with the current transformed module set.
     available_modules = original_modules
 
+    # Pattern sources are validated in their compiled form: one concrete
+    # action per matched module
+    filtered_actions = expand_module_action_patterns(
+        filtered_actions, available_modules, scope=scope
+    )
+
     # Validate each action's source exists
     for action in filtered_actions:
         action_scope = action.get("scope") or scope
@@ -571,6 +573,8 @@ def _transform_module_name(  # noqa: PLR0911
     source: str,
     dest: str,
     mode: "ModuleActionMode",
+    *,
+    exact: bool = False,
 ) -> str | None:
     """Transform a single module name based on action.
 
@@ -583,12 +587,15 @@ def _transform_module_name(  # noqa: PLR0911
         source: Source module path (e.g., "apathetic_logs")
         dest: Destination module path (e.g., "grinch")
         mode: Transformation mode ("preserve" or "flatten")
+        exact: Only match source and its submodules (no component matching)
 
     Returns:
         Transformed module name, or None if module doesn't match source
     """
     # Check if module_name starts with source
     if not module_name.startswith(source):
+        if exact:
+            return None
         # Try component matching: check if all source components appear in module_name
         # (e.g., "mypkg.module" should match "mypkg.pkg1.module")
         source_parts = source.split(".")
@@ -674,7 +681,9 @@ def _apply_move_action(
 
     result: list[str] = []
     for module_name in module_names:
-        transformed = _transform_module_name(module_name, source, dest, mode)
+        transformed = _transform_module_name(
+            module_name, source, dest, mode, exact=action.get("exact", False)
+        )
         if transformed is not None:
             # Replace source module with transformed name
             result.append(transformed)
@@ -718,7 +727,9 @@ def _apply_copy_action(
         result.append(module_name)
 
         # Also add transformed version if it matches source
-        transformed = _transform_module_name(module_name, source, dest, mode)
+        transformed = _transform_module_name(
+            module_name, source, dest, mode, exact=action.get("exact", False)
+        )
         if transformed is not None:
             result.append(transformed)
 
@@ -764,7 +775,13 @@ def _apply_rename_action(
     # We use _transform_module_name with preserve mode to handle submodules
     result: list[str] = []
     for module_name in module_names:
-        transformed = _transform_module_name(module_name, source, full_dest, "preserve")
+        transformed = _transform_module_name(
+            module_name,
+            source,
+            full_dest,
+            "preserve",
+            exact=action.get("exact", False),
+        )
         if transformed is not None:
             # Replace source module with transformed name
             result.append(transformed)
@@ -792,28 +809,25 @@ def _apply_delete_action(
     """
     source = action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
 
-    result: list[str] = []
-    for module_name in module_names:
-        # Keep modules that don't match source
-        # Check exact match, starts with source., or source appears as component
-        if module_name == source:
-            # Exact match: delete it
-            continue
-        if module_name.startswith(f"{source}."):
-            # Submodule: delete it
-            continue
-        # Check if source appears as a component in module_name
-        # (e.g., "mypkg.pkg1" contains "pkg1" as a component)
-        if source in module_name.split("."):
-            # Source is a component: delete it
-            continue
-        # Keep this module
-        result.append(module_name)
-
-    return result
+    # Keep modules that don't match source
+    exact = action.get("exact", False)
+    return [
+        name for name in module_names if not _is_deleted_by(name, source, exact=exact)
+    ]
+
+
+def _is_deleted_by(module_name: str, source: str, *, exact: bool = False) -> bool:
+    """Return True if a delete action on `source` removes `module_name`."""
+    # Check exact match, starts with source., or source appears as component
+    # (e.g., "mypkg.pkg1" contains "pkg1" as a component)
+    return (
+        module_name == source
+        or module_name.startswith(f"{source}.")
+        or (not exact and source in module_name.split("."))
+    )
 
 
-def apply_single_action(
+def apply_single_action(  # noqa: PLR0911
     module_names: list[str],
     action: "ModuleActionFull",
     detected_packages: set[str],  # noqa: ARG001
@@ -835,6 +849,8 @@ def apply_single_action(
     """
     action_type = action.get("action", "move")
 
+    if action_type != "none" and is_module_pattern(action.get("source", "")):
+        return compile_module_actions([action]).apply(module_names)
     if action_type == "move":
         return _apply_move_action(module_names, action)
     if action_type == "copy":
@@ -854,15 +870,559 @@ def apply_single_action(
     raise ValueError(msg)
 
 
+# Characters that make a module action source a pattern (never valid in
+# module names)
+_PATTERN_CHARS = frozenset("*?{")
+_CAPTURE_RE = re.compile(r"\{([^{}]*)\}")
+
+
+def is_module_pattern(source: str) -> bool:
+    """Return True if a module action source is a glob/capture pattern."""
+    return not _PATTERN_CHARS.isdisjoint(source)
+
+
+class ModulePattern:
+    """A module action source pattern, compiled to a regular expression.
+
+    Patterns are dotted module names whose components may use:
+    - `*`: any text within one component (`vendor.*.impl`, `lib_*`)
+    - `?`: any single character within one component
+    - `**`: zero or more whole components (`**.tests`)
+    - `{name}`: one whole component, captured under `name`
+
+    Every `*`, `**` and `{name}` is also captured by position, so dest
+    templates can use `{1}`, `{2}`, ... or `{name}`
+    (e.g. `vendor.*.impl` -> `{1}._impl`).
+
+    Like a plain source, a pattern matches a module and its submodules:
+    match() returns the matched module (a dotted prefix of the name) and
+    its captures.
+    """
+
+    __slots__ = ("_names", "_regex", "literal_prefix", "pattern")
+
+    def __init__(self, pattern: str) -> None:
+        """Compile `pattern`.
+
+        Raises:
+            ValueError: If the pattern is malformed
+        """
+        self.pattern = pattern
+        # capture number (1-based) -> name, for named captures
+        self._names: dict[str, int] = {}
+        regex = ""
+        need_sep = False
+        count = 0
+        literal: list[str] = []
+        in_literal_prefix = True
+        parts = pattern.split(".")
+        for i, part in enumerate(parts):
+            if not part:
+                msg = f"Invalid module pattern '{pattern}': empty component"
+                raise ValueError(msg)
+            if in_literal_prefix and is_module_pattern(part):
+                in_literal_prefix = False
+            if in_literal_prefix:
+                literal.append(part)
+            if part == "**":
+                if i > 0 and parts[i - 1] == "**":
+                    msg = f"Invalid module pattern '{pattern}': repeated '**'"
+                    raise ValueError(msg)
+                count += 1
+                body = rf"(?P<c{count}>[^.]+(?:\.[^.]+)*)"
+                if i == len(parts) - 1:
+                    regex += rf"(?:\.{body})?" if need_sep else body
+                else:
+                    regex += (r"\." if need_sep else "") + rf"(?:{body}\.)?"
+                    need_sep = False
+                continue
+            if "**" in part:
+                msg = (
+                    f"Invalid module pattern '{pattern}': '**' must be a whole "
+                    f"component"
+                )
+                raise ValueError(msg)
+            if need_sep:
+                regex += r"\."
+            regex, count = self._compile_component(part, regex, count)
+            need_sep = True
+        self.literal_prefix: tuple[str, ...] = tuple(literal)
+        # match a whole module, i.e. end at a component boundary
+        self._regex = re.compile(rf"(?:{regex})(?=\.|$)")
+
+    def _compile_component(self, part: str, regex: str, count: int) -> tuple[str, int]:
+        pos = 0
+        while pos < len(part):
+            char = part[pos]
+            if char == "{":
+                end = part.find("}", pos)
+                name = part[pos + 1 : end] if end != -1 else ""
+                if end == -1 or not name.isidentifier():
+                    msg = (
+                        f"Invalid module pattern '{self.pattern}': captures must "
+                        f"be written as {{name}} with an identifier name"
+                    )
+                    raise ValueError(msg)
+                if name in self._names:
+                    msg = (
+                        f"Invalid module pattern '{self.pattern}': capture "
+                        f"'{name}' used twice"
+                    )
+                    raise ValueError(msg)
+                count += 1
+                self._names[name] = count
+                regex += rf"(?P<c{count}>[^.]+)"
+                pos = end + 1
+                continue
+            if char == "*":
+                count += 1
+                regex += rf"(?P<c{count}>[^.]{'+' if part == '*' else '*'})"
+            elif char == "?":
+                regex += "[^.]"
+            elif char == "}":
+                msg = f"Invalid module pattern '{self.pattern}': unbalanced '}}'"
+                raise ValueError(msg)
+            else:
+                regex += re.escape(char)
+            pos += 1
+        return regex, count
+
+    @property
+    def capture_count(self) -> int:
+        return self._regex.groups
+
+    def match(self, module_name: str) -> tuple[str, dict[str, str]] | None:
+        """Match a module (or a submodule of one) against the pattern.
+
+        Returns:
+            (matched module name, captures by number and by name), or None
+        """
+        found = self._regex.match(module_name)
+        if found is None:
+            return None
+        captures = {
+            str(number): found.group(f"c{number}") or ""
+            for number in range(1, self.capture_count + 1)
+        }
+        for name, number in self._names.items():
+            captures[name] = captures[str(number)]
+        return found.group(0), captures
+
+    def check_template(self, template: str) -> None:
+        """Raise ValueError if `template` uses captures this pattern lacks."""
+        for placeholder in _CAPTURE_RE.findall(template):
+            if placeholder in self._names or (
+                placeholder.isdigit() and 1 <= int(placeholder) <= self.capture_count
+            ):
+                continue
+            msg = (
+                f"Module action dest '{template}' uses '{{{placeholder}}}', "
+                f"which source pattern '{self.pattern}' does not capture"
+            )
+            raise ValueError(msg)
+        leftover = _CAPTURE_RE.sub("", template)
+        if "{" in leftover or "}" in leftover:
+            msg = f"Module action dest '{template}' has an unbalanced brace"
+            raise ValueError(msg)
+
+    def expand(self, template: str, captures: dict[str, str]) -> str:
+        """Fill a dest template; empty components (from `**`) are dropped."""
+        filled = _CAPTURE_RE.sub(lambda m: captures[m.group(1)], template)
+        return ".".join(part for part in filled.split(".") if part)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_module_pattern(pattern: str) -> ModulePattern:
+    """Return the (cached) compiled ModulePattern for a source pattern."""
+    return ModulePattern(pattern)
+
+
+def validate_action_pattern(
+    action: "ModuleActionFull",
+    *,
+    scope: "ModuleActionScope | None" = None,
+) -> None:
+    """Validate a pattern source and the captures used by its dest.
+
+    Args:
+        action: Action to validate
+        scope: Optional scope for error message context
+
+    Raises:
+        ValueError: If the pattern or dest template is invalid
+    """
+    source = action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+    dest = action.get("dest")
+    scope_str = f" (scope: '{scope}')" if scope else ""
+    if not is_module_pattern(source):
+        if dest is not None and _CAPTURE_RE.search(dest):
+            msg = (
+                f"Module action dest '{dest}' uses captures, but source "
+                f"'{source}' is not a pattern{scope_str}"
+            )
+            raise ValueError(msg)
+        return
+    try:
+        pattern = compile_module_pattern(source)
+        if dest is not None:
+            pattern.check_template(dest)
+    except ValueError as e:
+        msg = f"{e}{scope_str}"
+        raise ValueError(msg) from e
+    if action.get("source_path") is not None:
+        msg = (
+            f"Module action source pattern '{source}' cannot be used with "
+            f"'source_path'{scope_str}"
+        )
+        raise ValueError(msg)
+
+
+def _expand_pattern_dest(
+    pattern: ModulePattern,
+    action_type: str,
+    dest: str,
+    module: str,
+    captures: dict[str, str],
+) -> str:
+    """Fill in the dest of a pattern action for one matched module."""
+    target = pattern.expand(dest, captures)
+    if not target:
+        msg = (
+            f"Module action dest '{dest}' is empty for module '{module}' "
+            f"(source pattern '{pattern.pattern}')"
+        )
+        raise ValueError(msg)
+    if action_type == "rename" and "." in target:
+        msg = (
+            f"Module action 'rename' dest must not contain dots. Got "
+            f"dest='{target}' for module '{module}' (source pattern "
+            f"'{pattern.pattern}')"
+        )
+        raise ValueError(msg)
+    return target
+
+
+def expand_module_action_patterns(
+    actions: list["ModuleActionFull"],
+    module_names: "Iterable[str]",
+    *,
+    scope: "ModuleActionScope | None" = None,
+) -> list["ModuleActionFull"]:
+    """Replace pattern actions by the concrete actions they stand for.
+
+    Each module matched by a pattern becomes one action with that module as
+    source and the filled-in dest, so the regular validators (destination
+    conflicts, circular moves, conflicting operations) check the compiled
+    form. These actions are marked `exact`: like the pattern, each one only
+    matches its module and submodules, never another module through
+    component matching. Non-pattern actions are returned unchanged.
+
+    Args:
+        actions: Actions, possibly with pattern sources
+        module_names: Modules the patterns are matched against
+        scope: Optional scope for error message context
+
+    Returns:
+        Actions with every pattern expanded
+
+    Raises:
+        ValueError: If a pattern matches no module, or maps two modules to
+            the same destination
+    """
+    scope_str = f" (scope: '{scope}')" if scope else ""
+    names = sorted(set(module_names))
+    result: list[ModuleActionFull] = []
+    for action in actions:
+        source = action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        if not is_module_pattern(source):
+            result.append(action)
+            continue
+        validate_action_pattern(action, scope=scope)
+        pattern = compile_module_pattern(source)
+        dest = action.get("dest")
+        action_type = action.get("action", "move")
+        # matched module -> filled-in dest
+        targets: dict[str, str | None] = {}
+        # filled-in dest -> matched module (collision check)
+        claimed: dict[str, str] = {}
+        for name in names:
+            matched = pattern.match(name)
+            if matched is None or matched[0] in targets:
+                continue
+            module, captures = matched
+            target = None
+            if dest is not None and action_type != "delete":
+                target = _expand_pattern_dest(
+                    pattern, action_type, dest, module, captures
+                )
+                full_target = target
+                if action_type == "rename":
+                    parent = module.rpartition(".")[0]
+                    full_target = f"{parent}.{target}" if parent else target
+                other = claimed.setdefault(full_target, module)
+                if other != module:
+                    msg = (
+                        f"Module action source pattern '{source}' maps both "
+                        f"'{other}' and '{module}' to '{full_target}'{scope_str}"
+                    )
+                    raise ValueError(msg)
+            targets[module] = target
+        if not targets:
+            msg = (
+                f"Module action source pattern '{source}' does not match any "
+                f"available module{scope_str}"
+            )
+            raise ValueError(msg)
+        for module, target in targets.items():
+            concrete: ModuleActionFull = dict(action)  # type: ignore[assignment]
+            concrete["source"] = module
+            concrete["exact"] = True
+            if target is not None:
+                concrete["dest"] = target
+            result.append(concrete)
+    return result
+
+
+class _PrefixTrieNode:
+    """Node of the dotted-name trie used by ModuleActionPlan."""
+
+    __slots__ = ("actions", "children")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixTrieNode] = {}
+        self.actions: list[int] = []
+
+
+class ModuleActionPlan:
+    """Module actions compiled into a single name -> final names lookup.
+
+    Applying actions one after another costs O(actions x modules). Every
+    action maps each module name independently (move/rename: one name,
+    copy: the original plus the copy, delete: none) and keeps the list
+    order, so the same result is obtained by following each name through
+    the actions that can match it. Those are found via a trie of action
+    sources (exact and submodule matches; pattern sources under their
+    literal leading components) and small indexes for component matching,
+    instead of trying every action.
+
+    Use compile_module_actions() to get a (cached) plan.
+    """
+
+    __slots__ = (
+        "_actions",
+        "_by_component",
+        "_by_ends",
+        "_memo",
+        "_patterns",
+        "_trie",
+        "_unanchored",
+    )
+
+    def __init__(self, actions: tuple[tuple[str, str, str, str, bool], ...]) -> None:
+        """Index normalized (action, source, dest, mode, exact) tuples.
+
+        For rename, dest is the full destination path (or, for a pattern
+        source, the new last component). "none" actions are dropped.
+        Exact sources are left out of the component matching indexes.
+        """
+        self._actions = actions
+        self._trie = _PrefixTrieNode()
+        # (first, last) component of multi-part sources -> action indexes
+        self._by_ends: dict[tuple[str, str], list[int]] = {}
+        # delete source -> action indexes (it also matches as a component)
+        self._by_component: dict[str, list[int]] = {}
+        self._memo: dict[str, tuple[str, ...]] = {}
+        # pattern sources; those without a literal first component are
+        # candidates for every module
+        self._patterns: dict[int, ModulePattern] = {}
+        self._unanchored: list[int] = []
+
+        for index, (action_type, source, _dest, _mode, exact) in enumerate(actions):
+            pattern = None
+            if is_module_pattern(source):
+                pattern = compile_module_pattern(source)
+                self._patterns[index] = pattern
+                if not pattern.literal_prefix:
+                    self._unanchored.append(index)
+                    continue
+            node = self._trie
+            for part in pattern.literal_prefix if pattern else source.split("."):
+                node = node.children.setdefault(part, _PrefixTrieNode())
+            node.actions.append(index)
+            if pattern is not None or exact:
+                continue
+            if action_type == "delete":
+                self._by_component.setdefault(source, []).append(index)
+                continue
+            parts = source.split(".")
+            if len(parts) > 1:
+                self._by_ends.setdefault((parts[0], parts[-1]), []).append(index)
+
+    def _candidates(self, module_name: str, start: int) -> list[int]:
+        """Return indexes (>= start, ascending) of actions that may match."""
+        parts = module_name.split(".")
+        found: set[int] = set()
+        node = self._trie
+        for part in parts:
+            next_node = node.children.get(part)
+            if next_node is None:
+                break
+            node = next_node
+            found.update(node.actions)
+        if len(parts) > 1:
+            found.update(self._by_ends.get((parts[0], parts[-1]), ()))
+        if self._by_component:
+            for part in parts:
+                found.update(self._by_component.get(part, ()))
+        found.update(self._unanchored)
+        return sorted(index for index in found if index >= start)
+
+    def _apply_one(self, index: int, module_name: str) -> tuple[str, ...] | None:
+        """Apply action `index` to one name; None if it does not match."""
+        action_type, source, dest, mode, exact = self._actions[index]
+        pattern = self._patterns.get(index)
+        if pattern is not None:
+            return self._apply_pattern(pattern, index, module_name)
+        if action_type == "delete":
+            return () if _is_deleted_by(module_name, source, exact=exact) else None
+        transformed = _transform_module_name(
+            module_name,
+            source,
+            dest,
+            mode,  # pyright: ignore[reportArgumentType]
+            exact=exact,
+        )
+        if transformed is None:
+            return None
+        if action_type == "copy":
+            return (module_name, transformed)
+        return (transformed,)
+
+    def _apply_pattern(
+        self, pattern: ModulePattern, index: int, module_name: str
+    ) -> tuple[str, ...] | None:
+        action_type, _source, dest, mode, _exact = self._actions[index]
+        matched = pattern.match(module_name)
+        if matched is None:
+            return None
+        if action_type == "delete":
+            return ()
+        module, captures = matched
+        target = _expand_pattern_dest(pattern, action_type, dest, module, captures)
+        if action_type == "rename":
+            parent = module.rpartition(".")[0]
+            target = f"{parent}.{target}" if parent else target
+        # Same preserve/flatten handling as plain sources (the pattern
+        # already matched the module itself or one of its packages)
+        suffix = module_name[len(module) + 1 :]
+        if suffix and mode == "flatten":
+            suffix = suffix.rpartition(".")[2]
+        transformed = f"{target}.{suffix}" if suffix else target
+        if action_type == "copy":
+            return (module_name, transformed)
+        return (transformed,)
+
+    def _resolve(self, module_name: str, start: int) -> tuple[str, ...]:
+        while True:
+            for index in self._candidates(module_name, start):
+                results = self._apply_one(index, module_name)
+                if results is not None:
+                    break
+            else:
+                return (module_name,)
+            if len(results) != 1:
+                # deleted, or copied (both names continue independently)
+                return tuple(
+                    final
+                    for name in results
+                    for final in self._resolve(name, index + 1)
+                )
+            module_name, start = results[0], index + 1
+
+    def resolve(self, module_name: str) -> tuple[str, ...]:
+        """Return the final name(s) of one module after all actions."""
+        cached = self._memo.get(module_name)
+        if cached is None:
+            cached = self._resolve(module_name, 0)
+            self._memo[module_name] = cached
+        return cached
+
+    def apply(self, module_names: list[str]) -> list[str]:
+        """Same result as applying each action to the list in turn."""
+        return [final for name in module_names for final in self.resolve(name)]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_action_plan(
+    actions: tuple[tuple[str, str, str, str, bool], ...],
+) -> ModuleActionPlan:
+    return ModuleActionPlan(actions)
+
+
+def compile_module_actions(
+    actions: list["ModuleActionFull"],
+) -> ModuleActionPlan:
+    """Compile actions into a ModuleActionPlan (cached per action list).
+
+    Args:
+        actions: List of actions, in the order they apply
+
+    Returns:
+        Plan mapping any module name to its final name(s)
+
+    Raises:
+        ValueError: If action type is invalid or missing required fields
+            (same checks, in the same order, as apply_single_action())
+    """
+    normalized: list[tuple[str, str, str, str, bool]] = []
+    for action in actions:
+        action_type = action.get("action", "move")
+        if action_type == "none":
+            continue
+        if action_type not in ("move", "copy", "rename", "delete"):
+            msg = (
+                f"Invalid action type '{action_type}', must be "
+                "'move', 'copy', 'delete', 'rename', or 'none'"
+            )
+            raise ValueError(msg)
+        source = action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        validate_action_pattern(action)
+        exact = action.get("exact", False)
+        if action_type == "delete":
+            normalized.append((action_type, source, "", "", exact))
+            continue
+        dest = action.get("dest")
+        if dest is None:
+            msg = f"{action_type.capitalize()} action requires 'dest' field"
+            raise ValueError(msg)
+        if action_type == "rename" and is_module_pattern(source):
+            # the new last component is filled in per matched module
+            normalized.append((action_type, source, dest, "preserve", exact))
+            continue
+        if action_type == "rename":
+            # Rename acts like a move (preserve) to source's parent + dest
+            parent, _sep, _last = source.rpartition(".")
+            full_dest = f"{parent}.{dest}" if parent else dest
+            normalized.append((action_type, source, full_dest, "preserve", exact))
+            continue
+        mode = action.get("mode", "preserve")
+        if mode not in ("preserve", "flatten"):
+            msg = f"Invalid mode '{mode}', must be 'preserve' or 'flatten'"
+            raise ValueError(msg)
+        normalized.append((action_type, source, dest, mode, exact))
+    return _compile_action_plan(tuple(normalized))
+
+
 def apply_module_actions(
     module_names: list[str],
     actions: list["ModuleActionFull"],
-    detected_packages: set[str],
+    detected_packages: set[str],  # noqa: ARG001
 ) -> list[str]:
     """Apply module actions to transform module names.
 
     Applies all actions in sequence to transform the module names list.
-    Each action is applied to the result of the previous action.
+    Each action is applied to the result of the previous action (via a
+    compiled ModuleActionPlan, so each name only meets matching actions).
 
     Args:
         module_names: Initial list of module names
@@ -875,13 +1435,7 @@ def apply_module_actions(
     Raises:
         ValueError: For invalid operations
     """
-    result = list(module_names)
-
-    # Apply each action in sequence
-    for action in actions:
-        result = apply_single_action(result, action, detected_packages)
-
-    return result
+    return compile_module_actions(actions).apply(list(module_names))
 
 
 def _generate_force_actions(  # noqa: PLR0912, C901
@@ -1191,24 +1745,36 @@ def get_deleted_modules_from_actions(
     Returns:
         Set of module names that are deleted
     """
-    # Start with all initial modules
-    current_modules = set(initial_modules)
-
-    # Apply delete actions to track what gets deleted
-    for action in actions:
-        action_type = action.get("action", "move")
-        if action_type == "delete":
-            source = action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
-            # Remove source and all submodules
-            to_remove: set[str] = set()
-            for mod in current_modules:
-                if mod == source or mod.startswith(f"{source}."):
-                    to_remove.add(mod)
-            current_modules -= to_remove
-
-    # Return the difference (what was deleted)
-    initial_set = set(initial_modules)
-    return initial_set - current_modules
+    deleted_sources = {
+        action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        for action in actions
+        if action.get("action", "move") == "delete"
+    }
+    if not deleted_sources:
+        return set()
+
+    # Patterns delete whatever module they match (and its submodules)
+    deleted_patterns = [
+        compile_module_pattern(source)
+        for source in deleted_sources
+        if is_module_pattern(source)
+    ]
+    deleted: set[str] = {
+        mod
+        for mod in initial_modules
+        if any(pattern.match(mod) for pattern in deleted_patterns)
+    }
+
+    # A module is deleted if it, or any package above it, is a delete source
+    # (source and all submodules are removed)
+    for mod in initial_modules:
+        prefix = ""
+        for part in mod.split("."):
+            prefix = f"{prefix}.{part}" if prefix else part
+            if prefix in deleted_sources:
+                deleted.add(mod)
+                break
+    return deleted
 
 
 def check_shim_stitching_mismatches(
@@ -1235,6 +1801,13 @@ def check_shim_stitching_mismatches(
     if not broken_shims:
         return mismatches
 
+    # component -> broken shims containing it (a matching source's first
+    # component is always one of the shim's components)
+    shims_by_component: dict[str, list[str]] = {}
+    for broken_shim in sorted(broken_shims):
+        for part in set(broken_shim.split(".")):
+            shims_by_component.setdefault(part, []).append(broken_shim)
+
     # For each action, check if it could have caused the mismatch
     # (i.e., if it deleted from stitching but not from shims)
     for action in actions:
@@ -1249,7 +1822,16 @@ def check_shim_stitching_mismatches(
             # source is a package/module name (e.g., "pkg1")
             # We need to check if the broken shim belongs to the deleted package
             action_broken_shims: set[str] = set()
-            for broken_shim in broken_shims:
+            if is_module_pattern(source):
+                pattern = compile_module_pattern(source)
+                action_broken_shims = {
+                    shim for shim in broken_shims if pattern.match(shim)
+                }
+                if action_broken_shims:
+                    mismatches.append((action, action_broken_shims))
+                continue
+            first_component = source.split(".", 1)[0]
+            for broken_shim in shims_by_component.get(first_component, ()):
                 # Check if broken shim matches source exactly
                 # Also check if source appears as a path component in broken_shim
                 # (e.g., "mypkg.pkg1.module" contains "pkg1" as a component)
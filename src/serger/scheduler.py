@@ -0,0 +1,212 @@
+# src/serger/scheduler.py
+"""Overlap I/O-bound build steps with the main (CPU-bound) build timeline.
+
+The build itself stays a straight line of stages on the calling thread
+(collect → analyze → stitch). Independent I/O-bound work (git metadata,
+tool discovery) is submitted to a small thread pool and joined only where
+its result is needed. Time the main thread spends blocked
+on a task is recorded, so the reported critical path shows which background
+task (if any) actually delayed the build.
+"""
+
+import contextvars
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import DEFAULT_SCHEDULER_WORKERS
+from .logs import getAppLogger
+from .timings import span
+
+
+# Called at every stage boundary; raises to stop the build there (the asyncio
+# API uses it to stop cancelled builds between stages)
+_stage_check: contextvars.ContextVar[Callable[[], None] | None] = (
+    contextvars.ContextVar("serger_stage_check", default=None)
+)
+
+
+@contextmanager
+def using_stage_check(check: Callable[[], None]) -> Iterator[None]:
+    """Call `check` whenever a build in this context begins a stage."""
+    token = _stage_check.set(check)
+    try:
+        yield
+    finally:
+        _stage_check.reset(token)
+
+
+@dataclass
+class TaskTiming:
+    """Timing of one background task.
+
+    Attributes:
+        name: Task name
+        duration: Seconds the task ran on its worker thread
+        waited: Seconds the main thread was blocked waiting for it
+    """
+
+    name: str
+    duration: float = 0.0
+    waited: float = 0.0
+
+
+@dataclass
+class _Task:
+    future: Future[Any]
+    timing: TaskTiming
+
+
+class BuildScheduler:
+    """Run independent tasks in the background while the build proceeds.
+
+    Usage:
+        scheduler = BuildScheduler()
+        try:
+            scheduler.submit("git", extract_commit, root)
+            scheduler.begin_stage("collect")
+            ...
+            commit = scheduler.result("git")
+        finally:
+            scheduler.close()
+        scheduler.report()
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_SCHEDULER_WORKERS) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="serger-build"
+        )
+        self._tasks: dict[str, _Task] = {}
+        # Main-thread timeline: (label, seconds); waits are "wait:<task>"
+        self._timeline: list[tuple[str, float]] = []
+        self._stage: str | None = None
+        self._stage_start = 0.0
+        self._start = time.perf_counter()
+        self._end: float | None = None
+
+    def close(self) -> None:
+        """Finish the current stage and release the pool.
+
+        Tasks whose results were never requested (early exits) are cancelled
+        if not yet started; running ones finish on their own.
+        """
+        if self._end is not None:
+            return
+        self._close_stage()
+        self._end = time.perf_counter()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- tasks -------------------------------------------------------------
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Start `fn(*args, **kwargs)` in the background under `name`."""
+        if name in self._tasks:
+            xmsg = f"Task {name!r} was already submitted"
+            raise ValueError(xmsg)
+        timing = TaskTiming(name)
+
+        def _timed() -> Any:
+            start = time.perf_counter()
+            try:
+                with span(f"task:{name}"):
+                    return fn(*args, **kwargs)
+            finally:
+                timing.duration = time.perf_counter() - start
+
+        # Run in a copy of the caller's context so spans reach its recorder
+        context = contextvars.copy_context()
+        self._tasks[name] = _Task(self._pool.submit(context.run, _timed), timing)
+
+    def result(self, name: str) -> Any:
+        """Return the result of task `name`, blocking (and timing) if needed.
+
+        Exceptions raised by the task are re-raised here, on the main thread.
+        """
+        task = self._tasks[name]
+        if not task.future.done():
+            # Split the current stage around the wait so the timeline stays
+            # in order and the wait is not counted as stage time
+            stage = self._stage
+            self._close_stage()
+            start = time.perf_counter()
+            try:
+                return task.future.result()
+            finally:
+                waited = time.perf_counter() - start
+                task.timing.waited += waited
+                self._timeline.append((f"wait:{name}", waited))
+                if stage is not None:
+                    self.begin_stage(stage)
+        return task.future.result()
+
+    # --- main-thread stages ------------------------------------------------
+
+    def begin_stage(self, name: str) -> None:
+        """End the current main-thread stage (if any) and start `name`."""
+        self._close_stage()
+        check = _stage_check.get()
+        if check is not None:
+            check()
+        self._stage = name
+        self._stage_start = time.perf_counter()
+
+    def _close_stage(self) -> None:
+        if self._stage is not None:
+            self._timeline.append(
+                (self._stage, time.perf_counter() - self._stage_start)
+            )
+            self._stage = None
+
+    # --- reporting ---------------------------------------------------------
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds from creation to close (or now)."""
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    @property
+    def task_timings(self) -> list[TaskTiming]:
+        """Timings of all submitted tasks, in submission order."""
+        return [task.timing for task in self._tasks.values()]
+
+    def critical_path(self) -> list[tuple[str, float]]:
+        """Return the main-thread timeline: stages and blocking waits, in order.
+
+        Background tasks only appear (as "wait:<name>") when the build had to
+        wait for them; fully overlapped tasks are off the critical path.
+        Consecutive entries with the same label are merged.
+        """
+        merged: list[tuple[str, float]] = []
+        for label, seconds in self._timeline:
+            if merged and merged[-1][0] == label:
+                merged[-1] = (label, merged[-1][1] + seconds)
+            else:
+                merged.append((label, seconds))
+        return merged
+
+    def report(self) -> None:
+        """Log the critical path and the overlapped background tasks."""
+        logger = getAppLogger()
+        path = " → ".join(
+            f"{label} {seconds * 1000:.1f}ms" for label, seconds in self.critical_path()
+        )
+        logger.debug(
+            "⏱️  Build critical path (%.1fms): %s", self.elapsed * 1000, path or "-"
+        )
+        overlapped = [
+            f"{t.name} {t.duration * 1000:.1f}ms"
+            + (f" (waited {t.waited * 1000:.1f}ms)" if t.waited else "")
+            for t in self.task_timings
+        ]
+        if overlapped:
+            logger.debug("⏱️  Background tasks: %s", ", ".join(overlapped))
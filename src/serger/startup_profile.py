@@ -0,0 +1,79 @@
+# src/serger/startup_profile.py
+"""Startup profiling probes for stitched scripts.
+
+With `startup_profiling` enabled, the stitched output times its own startup:
+the hoisted import block, each `# === module ===` section and the package
+shim setup. Probes are plain `if _SERGER_PROFILE:` checks, so they cost one
+global lookup when profiling is off. Setting `SERGER_PROFILE=1` at runtime
+prints a table (slowest first) to stderr; `SERGER_PROFILE=json` prints JSON.
+"""
+
+from .meta import PROGRAM_ENV
+
+
+# Runtime switch read by the stitched script
+STARTUP_PROFILE_ENV = f"{PROGRAM_ENV}_PROFILE"
+
+# Placed before the hoisted import block so its cost is measured too.
+# Filled via str.format(): {env} is STARTUP_PROFILE_ENV.
+_PRELUDE_TEMPLATE = """\
+# --- startup profiling probes (set {env}=1, or {env}=json) ---
+from os import environ as _serger_environ
+
+_SERGER_PROFILE = _serger_environ.get("{env}", "") not in ("", "0")
+if _SERGER_PROFILE:
+    from time import perf_counter as _serger_clock
+
+    _serger_laps = []
+    _serger_last = _serger_clock()
+
+    def _serger_lap(kind: str, name: str) -> None:
+        global _serger_last  # noqa: PLW0603
+        _now = _serger_clock()
+        _serger_laps.append((kind, name, _now - _serger_last))
+        _serger_last = _now
+
+    def _serger_report() -> None:
+        import json
+        import sys
+
+        _laps = sorted(_serger_laps, key=lambda lap: lap[2], reverse=True)
+        _total = sum(lap[2] for lap in _laps)
+        if _serger_environ["{env}"].lower() == "json":
+            _entries = [
+                {{"kind": kind, "name": name, "ms": round(secs * 1000, 3)}}
+                for kind, name, secs in _laps
+            ]
+            _payload = {{"total_ms": round(_total * 1000, 3), "entries": _entries}}
+            print(json.dumps(_payload), file=sys.stderr)
+            return
+        print(f"startup profile: {{_total * 1000:.3f}} ms", file=sys.stderr)
+        print(f"{{'ms':>10}}  {{'%':>5}}  {{'kind':<7}}  name", file=sys.stderr)
+        for _kind, _name, _secs in _laps:
+            _share = _secs / _total * 100 if _total else 0.0
+            print(
+                f"{{_secs * 1000:10.3f}}  {{_share:5.1f}}  {{_kind:<7}}  {{_name}}",
+                file=sys.stderr,
+            )
+"""
+
+# Printed once startup is done, before the __main__ block runs
+PROFILE_REPORT = "if _SERGER_PROFILE:\n    _serger_report()\n"
+
+
+def make_profile_prelude() -> str:
+    """Return the probe setup code placed before the hoisted imports."""
+    return _PRELUDE_TEMPLATE.format(env=STARTUP_PROFILE_ENV)
+
+
+def make_profile_probe(kind: str, name: str) -> str:
+    """Return a probe that attributes the time since the previous one.
+
+    Args:
+        kind: Category shown in the report (e.g. "module", "shims")
+        name: What ran since the previous probe (e.g. a module name)
+
+    Returns:
+        The probe statement (no trailing newline)
+    """
+    return f"if _SERGER_PROFILE:\n    _serger_lap({kind!r}, {name!r})"
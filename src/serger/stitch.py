@@ -7,15 +7,26 @@ import handling, code analysis, and assembly.
 """
 
 import ast
+import binascii
 import importlib
+import importlib.util
+import io
+import itertools
 import json
+import marshal
 import os
 import re
 import subprocess
+import types
+import zipfile
+import zlib
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from apathetic_utils import (
     detect_packages_from_files,
@@ -24,6 +35,7 @@ from apathetic_utils import (
     load_toml,
 )
 
+from .bytecode_cache import wrap_with_bytecode_cache
 from .config import (
     CommentsMode,
     DocstringMode,
@@ -33,23 +45,36 @@ from .config import (
     IncludeResolved,
     InternalImportMode,
     ModuleActionFull,
+    ModuleLoading,
     ModuleMode,
+    OutFormat,
     PostProcessingConfigResolved,
     RootConfigResolved,
+    ShimAttrsMode,
     ShimSetting,
     StitchMode,
 )
 from .constants import (
     BUILD_TOOL_FIND_MAX_LINES,
+    DEFAULT_BYTECODE_CACHE,
     DEFAULT_COMMENTS_MODE,
     DEFAULT_DOCSTRING_MODE,
     DEFAULT_EXTERNAL_IMPORTS,
     DEFAULT_INTERNAL_IMPORTS,
+    DEFAULT_LEAN_MODE,
+    DEFAULT_MODULE_LOADING,
     DEFAULT_MODULE_MODE,
+    DEFAULT_OPTIMIZE_IMPORTS,
+    DEFAULT_OUT_FORMAT,
     DEFAULT_SHIM,
+    DEFAULT_SHIM_ATTRS,
+    DEFAULT_STARTUP_PROFILING,
     DEFAULT_STITCH_MODE,
+    DEFAULT_TREE_SHAKE,
 )
-from .logs import getAppLogger
+from .import_optimizer import optimize_hoisted_imports
+from .lean_mode import apply_lean_mode
+from .logs import Lazy, getAppLogger
 from .main_config import (
     MainBlock,
     detect_collisions,
@@ -66,13 +91,24 @@ from .module_actions import (
     apply_module_actions,
     apply_single_action,
     check_shim_stitching_mismatches,
+    compile_module_actions,
+    expand_module_action_patterns,
     generate_actions_from_mode,
+    is_module_pattern,
     separate_actions_by_affects,
     set_mode_generated_action_defaults,
     validate_action_source_exists,
     validate_module_actions,
 )
+from .startup_profile import (
+    PROFILE_REPORT,
+    make_profile_prelude,
+    make_profile_probe,
+)
+from .timings import record_cache, record_size, span, timed
+from .tree_shake import tree_shake_script
 from .utils import derive_module_name, shorten_path_for_display
+from .utils.utils_subprocess import run_subprocess
 from .utils.utils_validation import validate_required_keys
 from .verify_script import (
     _cleanup_error_files,  # pyright: ignore[reportPrivateUsage]
@@ -80,6 +116,283 @@ from .verify_script import (
     post_stitch_processing,
     verify_compiles_string,
 )
+from .zipapp_output import build_zipapp
+
+
+# Runtime helper emitted for shim_attrs="copy": every stitched global is copied
+# onto each package module
+_COPY_PKG_SHIM_HELPERS: tuple[str, ...] = (
+    "def _setup_pkg_modules(  # noqa: C901, PLR0912",
+    "pkg_name: str, module_names: list[str], "
+    "name_mapping: dict[str, str] | None = None",
+    ") -> None:",
+    '    """Set up package module attributes and register submodules."""',
+    "    _mod = sys.modules.get(pkg_name)",
+    "    if not _mod:",
+    "        return",
+    "    # Copy attributes from all modules under this package",
+    "    _globals = globals()",
+    "    # Debug: log what's in globals for this package",
+    "    # Note: This copies all globals to the package module",
+    "    for _key, _value in _globals.items():",
+    "        setattr(_mod, _key, _value)",
+    "    # Set up package attributes for nested packages BEFORE registering",
+    "    # modules (so packages are available when modules are registered)",
+    "    _seen_packages: set[str] = set()",
+    "    for _name in module_names:",
+    "        if _name != pkg_name and _name.startswith(pkg_name + '.'):",
+    "            # Extract parent package (e.g., mypkg.public from",
+    "            # mypkg.public.utils)",
+    "            _name_parts = _name.split('.')",
+    "            if len(_name_parts) > 2:  # noqa: PLR2004",
+    "                # Has at least one intermediate package",
+    "                _parent_pkg = '.'.join(_name_parts[:-1])",
+    "                if _parent_pkg.startswith(pkg_name + '.') and "
+    "_parent_pkg not in _seen_packages:",
+    "                    _seen_packages.add(_parent_pkg)",
+    "                    _pkg_obj = sys.modules.get(_parent_pkg)",
+    "                    if _pkg_obj and _pkg_obj != _mod:",
+    "                        # Set parent package as attribute",
+    "                        _pkg_attr_name = _name_parts[1]",
+    "                        if not hasattr(_mod, _pkg_attr_name):",
+    "                            setattr(_mod, _pkg_attr_name, _pkg_obj)",
+    "    # Register all modules under this package",
+    "    for _name in module_names:",
+    "        # Try to find module by transformed name first",
+    "        _module_obj = sys.modules.get(_name)",
+    "        if not _module_obj and name_mapping:",
+    "            # If not found, try to find by original name",
+    "            _original_name = name_mapping.get(_name)",
+    "            if _original_name:",
+    "                _module_obj = sys.modules.get(_original_name)",
+    "                if _module_obj:",
+    "                    # Register with transformed name",
+    "                    sys.modules[_name] = _module_obj",
+    "        # If still not found, use package module",
+    "        if not _module_obj:",
+    "            sys.modules[_name] = _mod",
+    "    # Set submodules as attributes on parent package",
+    "    for _name in module_names:",
+    "        if _name != pkg_name and _name.startswith(pkg_name + '.'):",
+    "            _submodule_name = _name.split('.')[-1]",
+    "            # Try to get actual module object",
+    "            _module_obj = sys.modules.get(_name)",
+    "            if not _module_obj and name_mapping:",
+    "                _original_name = name_mapping.get(_name)",
+    "                if _original_name:",
+    "                    _module_obj = sys.modules.get(_original_name)",
+    "            # Use actual module object if found, otherwise package",
+    "            _target = _module_obj if _module_obj else _mod",
+    "            if not hasattr(_mod, _submodule_name):",
+    "                setattr(_mod, _submodule_name, _target)",
+    "            elif isinstance(getattr(_mod, _submodule_name, None), "
+    "types.ModuleType):",
+    "                setattr(_mod, _submodule_name, _target)",
+    "",
+)
+
+
+# Runtime helper emitted for shim_attrs="lazy": package modules forward missing
+# attributes to the stitched globals (PEP 562) instead of copying every global
+_LAZY_PKG_SHIM_HELPERS: tuple[str, ...] = (
+    "def _setup_lazy_pkg_modules(",
+    "    table: tuple[tuple[str, tuple[str, ...]], ...],",
+    "    name_mapping: dict[str, str] | None = None,",
+    ") -> None:",
+    '    """Register package modules; attributes resolve lazily (PEP 562)."""',
+    "    _globals = globals()",
+    "",
+    "    def _install_lazy_attrs(pkg_name: str, pkg_mod: types.ModuleType) -> None:",
+    "        def _pkg_getattr(name: str) -> object:",
+    "            try:",
+    "                return _globals[name]",
+    "            except KeyError:",
+    "                _msg = f'module {pkg_name!r} has no attribute {name!r}'",
+    "                raise AttributeError(_msg) from None",
+    "",
+    "        def _pkg_dir() -> list[str]:",
+    "            return sorted(set(_globals) | set(vars(pkg_mod)))",
+    "",
+    "        vars(pkg_mod).update(__getattr__=_pkg_getattr, __dir__=_pkg_dir)",
+    "",
+    "    for _pkg_name, _module_names in table:",
+    "        _mod = sys.modules.get(_pkg_name)",
+    "        if not _mod:",
+    "            continue",
+    "        _install_lazy_attrs(_pkg_name, _mod)",
+    "        for _name in _module_names:",
+    "            # Find module by transformed name, then by original name",
+    "            _module_obj = sys.modules.get(_name)",
+    "            if not _module_obj and name_mapping:",
+    "                _original_name = name_mapping.get(_name)",
+    "                if _original_name:",
+    "                    _module_obj = sys.modules.get(_original_name)",
+    "                    if _module_obj:",
+    "                        sys.modules[_name] = _module_obj",
+    "            # If still not found, use package module",
+    "            if not _module_obj:",
+    "                _module_obj = _mod",
+    "                sys.modules[_name] = _mod",
+    "            if _name == _pkg_name:",
+    "                continue",
+    "            # Set submodule as attribute unless a non-module global shadows it",
+    "            _sub = _name.rsplit('.', 1)[-1]",
+    "            _existing = vars(_mod).get(_sub, _globals.get(_sub, _mod))",
+    "            if isinstance(_existing, types.ModuleType):",
+    "                setattr(_mod, _sub, _module_obj)",
+    "",
+)
+
+
+# Runtime helper emitted for external_imports="lazy": modules load on first
+# attribute access. Only plain source modules are deferred; anything else
+# (builtins, extensions, zipimports, already-imported modules) imports normally.
+_LAZY_IMPORT_HELPER: tuple[str, ...] = (
+    "def _lazy_external_import(name: str) -> types.ModuleType:",
+    '    """Import `name`, deferring execution until first attribute access."""',
+    "    if name in sys.modules:",
+    "        return sys.modules[name]",
+    "    try:",
+    "        _spec = importlib.util.find_spec(name)",
+    "    except (ImportError, ValueError):",
+    "        _spec = None",
+    "    if _spec is None or not isinstance(",
+    "        _spec.loader, importlib.machinery.SourceFileLoader",
+    "    ):",
+    "        return importlib.import_module(name)",
+    "    _spec.loader = importlib.util.LazyLoader(_spec.loader)",
+    "    _module = importlib.util.module_from_spec(_spec)",
+    "    sys.modules[name] = _module",
+    "    _spec.loader.exec_module(_module)",
+    "    _parent, _, _child = name.rpartition('.')",
+    "    if _parent and _parent in sys.modules:",
+    "        setattr(sys.modules[_parent], _child, _module)",
+    "    return _module",
+    "",
+)
+
+# Imports the stitched runtime itself needs immediately
+_EAGER_EXTERNAL_IMPORTS = {"sys", "types", "importlib", "importlib.util"}
+
+# Imports the exec-mode loader needs
+_EXEC_LOADER_IMPORTS: tuple[str, ...] = (
+    "import binascii\n",
+    "import importlib\n",
+    "import importlib.util\n",
+    "import marshal\n",
+    "import sys\n",
+    "import types\n",
+    "import zlib\n",
+)
+
+# Metadata globals the script header defines (see _build_final_script) that
+# exec-mode modules also get. __STITCHED__ is left out: it tells code that all
+# modules share one namespace, which exec mode does not do.
+_STITCHED_HEADER_GLOBALS: tuple[str, ...] = (
+    "__version__",
+    "__commit__",
+    "__build_date__",
+    "__AUTHORS__",
+    "__STITCH_SOURCE__",
+)
+
+# Runtime loader emitted for stitch_mode="exec": a sys.meta_path importer
+# serves every stitched module from its build-time compiled code, so each
+# module gets its own namespace and real __name__/__package__ values, seeded
+# with the script header's metadata (__version__, __STITCH_SOURCE__, ...). Code
+# objects only load on the bytecode version they were built with; any other
+# interpreter compiles the embedded sources instead.
+_EXEC_LOADER_HELPER: tuple[str, ...] = (
+    "class _StitchedImporter:",
+    '    """Serve the stitched modules to the import system from their code."""',
+    "",
+    "    def __init__(",
+    "        self,",
+    "        modules: tuple[tuple[str, str, bool], ...],",
+    "        codes: tuple[types.CodeType, ...],",
+    "        source_blob: str,",
+    "    ) -> None:",
+    "        self._file = globals().get('__file__')",
+    "        # Header metadata every module sees, as in raw stitch mode",
+    "        self._header = {",
+    "            _key: _value",
+    "            for _key, _value in globals().items()",
+    "            if _key in _STITCHED_HEADER_NAMES",
+    "        }",
+    "        self._source_blob = source_blob",
+    "        self._sources: dict[str, str] | None = None",
+    "        self.entries = {_entry[0]: (_entry[1], _entry[2]) for _entry in modules}",
+    "        self._codes = {_entry[0]: _code for _entry, _code in zip(modules, codes)}",
+    "        # Parent packages without a stitched __init__ are created empty",
+    "        for _name in list(self.entries):",
+    "            _parts = _name.split('.')",
+    "            for _depth in range(1, len(_parts)):",
+    "                _parent = '.'.join(_parts[:_depth])",
+    "                _dirname = _parent.replace('.', '/')",
+    "                self.entries.setdefault(_parent, (_dirname, True))",
+    "",
+    "    def find_spec(",
+    "        self,",
+    "        fullname: str,",
+    "        path: object = None,",
+    "        target: object = None,",
+    "    ) -> object:",
+    "        if fullname not in self.entries:",
+    "            return None",
+    "        _filename, _is_pkg = self.entries[fullname]",
+    "        return importlib.util.spec_from_loader(",
+    "            fullname, self, origin=_filename, is_package=_is_pkg",
+    "        )",
+    "",
+    "    def create_module(self, spec: object) -> None:",
+    "        return None",
+    "",
+    "    def exec_module(self, module: types.ModuleType) -> None:",
+    "        vars(module).update(self._header)",
+    "        module.__file__ = self._file",
+    "        _code = self._codes.get(module.__name__)",
+    "        if _code is not None:",
+    "            exec(_code, vars(module))",
+    "",
+    "    def get_source(self, fullname: str) -> str | None:",
+    "        if self._sources is None:",
+    "            _table = marshal.loads(",
+    "                zlib.decompress(binascii.a2b_base64(self._source_blob))",
+    "            )",
+    "            self._sources = dict(zip(self._codes, _table))",
+    "        return self._sources.get(fullname)",
+    "",
+    "",
+    "def _load_stitched_modules(",
+    "    modules: tuple[tuple[str, str, bool], ...],",
+    "    code_blob: str,",
+    "    source_blob: str,",
+    "    magic: bytes,",
+    "    *,",
+    "    eager: bool,",
+    ") -> None:",
+    '    """Install the stitched modules; import them all up front if eager."""',
+    "    if importlib.util.MAGIC_NUMBER == magic:",
+    "        _codes = marshal.loads(zlib.decompress(binascii.a2b_base64(code_blob)))",
+    "    else:",
+    "        # Built for another bytecode version: compile the embedded sources",
+    "        _sources = marshal.loads(",
+    "            zlib.decompress(binascii.a2b_base64(source_blob))",
+    "        )",
+    "        _codes = tuple(",
+    "            compile(_source, _entry[1], 'exec', dont_inherit=True)",
+    "            for _entry, _source in zip(modules, _sources)",
+    "        )",
+    "    _importer = _StitchedImporter(modules, _codes, source_blob)",
+    "    # Stitched modules replace any same-named modules imported before",
+    "    for _name in _importer.entries:",
+    "        sys.modules.pop(_name, None)",
+    "    sys.meta_path.insert(0, _importer)",
+    "    if eager:",
+    "        for _name, _, _ in modules:",
+    "            importlib.import_module(_name)",
+    "",
+)
 
 
 def extract_version(pyproject_path: Path) -> str:
@@ -109,10 +422,161 @@ def extract_version(pyproject_path: Path) -> str:
     return "unknown"
 
 
-def extract_commit(root_path: Path) -> str:  # noqa: PLR0915
+# Minimum abbreviation length git uses for short hashes (core.abbrev=auto)
+_GIT_MIN_ABBREV = 7
+_GIT_SHA_RE = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+# Symbolic refs deeper than this are treated as broken (git uses 5 too)
+_GIT_MAX_SYMREF_DEPTH = 5
+
+
+def _find_git_dir(start: Path) -> Path | None:
+    """Locate the git directory for `start` (walking up like git does).
+
+    Handles `.git` directories and `.git` files (worktrees, submodules)
+    containing a `gitdir: <path>` pointer.
+    """
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            target = Path(content[len("gitdir:") :].strip())
+            if not target.is_absolute():
+                target = candidate / target
+            return target.resolve() if target.is_dir() else None
+    return None
+
+
+def _read_packed_ref(common_dir: Path, ref: str) -> str | None:
+    try:
+        text = (common_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in text.splitlines():
+        # Skip the header and peeled-tag lines
+        if not line or line[0] in "#^":
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def _read_git_core_abbrev(common_dir: Path) -> str | None:
+    """Return the raw core.abbrev value from the repository config, if set."""
+    try:
+        text = (common_dir / "config").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    abbrev: str | None = None
+    section = ""
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if line.startswith("["):
+            section = line.strip("[]").strip().lower()
+        elif section == "core" and "=" in line:
+            key, _, value = line.partition("=")
+            if key.strip().lower() == "abbrev":
+                abbrev = value.split("#")[0].split(";")[0].strip().lower()
+    return abbrev
+
+
+def _pack_object_count(idx_path: Path) -> int:
+    """Return the object count recorded in a pack .idx file (0 if unreadable)."""
+    try:
+        with idx_path.open("rb") as f:
+            header = f.read(8)
+            # v2 idx: magic + version, then 256 fanout entries; the last
+            # entry is the object count. v1 has no header.
+            f.seek(8 + 255 * 4 if header[:4] == b"\xfftOc" else 255 * 4)
+            return int.from_bytes(f.read(4), "big")
+    except OSError:
+        return 0
+
+
+def _git_abbrev_length(common_dir: Path) -> int | None:
+    """Return the short-hash length `git rev-parse --short` would use.
+
+    Honors core.abbrev; for "auto" mirrors git's estimate from the packed
+    object count (2^(2n) objects → n hex digits, minimum 7). Returns None
+    for "no"/full-length hashes. Ambiguity-driven extension is not modelled.
+    """
+    abbrev = _read_git_core_abbrev(common_dir)
+    if abbrev in ("no", "false", "off"):
+        return None
+    if abbrev and abbrev.isdigit():
+        return max(4, int(abbrev))
+    count = sum(
+        _pack_object_count(idx)
+        for idx in (common_dir / "objects" / "pack").glob("*.idx")
+    )
+    return max(_GIT_MIN_ABBREV, (count.bit_length() + 1) // 2)
+
+
+def read_git_head(root_path: Path) -> str | None:  # noqa: PLR0911
+    """Resolve HEAD to a commit hash without running git.
+
+    Reads `.git` (directory or `gitdir:` file), follows symbolic refs through
+    loose refs and `packed-refs`, and honors linked worktrees (`commondir`).
+
+    Args:
+        root_path: Directory inside the repository
+
+    Returns:
+        Short commit hash as `git rev-parse --short HEAD` prints it, or None
+        if the repository layout is not understood (e.g. reftable storage,
+        $GIT_DIR overrides, unborn branches). Callers should fall back to git.
+    """
+    if os.getenv("GIT_DIR") or os.getenv("GIT_COMMON_DIR"):
+        return None
+    git_dir = _find_git_dir(root_path.resolve())
+    if git_dir is None:
+        return None
+    common_dir = git_dir
+    try:
+        common_rel = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        common_dir = (git_dir / common_rel).resolve()
+    except OSError:
+        pass
+    if (common_dir / "reftable").is_dir():
+        return None
+
+    ref = "HEAD"
+    for _ in range(_GIT_MAX_SYMREF_DEPTH):
+        value: str | None = None
+        # Per-worktree refs (HEAD, refs/bisect, ...) live in git_dir
+        for base in (git_dir, common_dir):
+            try:
+                value = (base / ref).read_text(encoding="utf-8").strip()
+                break
+            except OSError:
+                continue
+        if value is None:
+            value = _read_packed_ref(common_dir, ref)
+        if value is None:
+            return None
+        if value.startswith("ref:"):
+            ref = value[len("ref:") :].strip()
+            continue
+        if not _GIT_SHA_RE.match(value):
+            return None
+        length = _git_abbrev_length(common_dir)
+        return value if length is None else value[:length]
+    return None
+
+
+def extract_commit(root_path: Path) -> str:
     """Extract git commit hash.
 
-    Only embeds commit hash if in CI or release tag context.
+    Only embeds commit hash if in CI or release tag context. HEAD is read
+    directly from the repository (see read_git_head()); `git rev-parse` is
+    only spawned when the layout is not understood.
 
     Args:
         root_path: Project root directory
@@ -121,139 +585,74 @@ def extract_commit(root_path: Path) -> str:  # noqa: PLR0915
         Short commit hash, or "unknown (local build)" if not in CI
     """
     logger = getAppLogger()
-    # Comprehensive logging for troubleshooting
     in_ci = is_ci()
-    ci_env = os.getenv("CI")
-    github_actions = os.getenv("GITHUB_ACTIONS")
-    git_tag = os.getenv("GIT_TAG")
-    github_ref = os.getenv("GITHUB_REF")
-    logger.trace(
-        "extract_commit called: root_path=%s, in_ci=%s, CI=%s, GITHUB_ACTIONS=%s, "
-        "GIT_TAG=%s, GITHUB_REF=%s",
-        root_path,
-        in_ci,
-        ci_env,
-        github_actions,
-        git_tag,
-        github_ref,
-    )
-    logger.trace(
-        "extract_commit: root_path=%s, in_ci=%s, CI=%s, GITHUB_ACTIONS=%s, "
-        "GIT_TAG=%s, GITHUB_REF=%s",
-        root_path,
-        in_ci,
-        ci_env,
-        github_actions,
-        git_tag,
-        github_ref,
-    )
+    if logger.isTraceEnabled():
+        logger.trace(
+            "extract_commit: root_path=%s, in_ci=%s, CI=%s, GITHUB_ACTIONS=%s, "
+            "GIT_TAG=%s, GITHUB_REF=%s",
+            root_path,
+            in_ci,
+            os.getenv("CI"),
+            os.getenv("GITHUB_ACTIONS"),
+            os.getenv("GIT_TAG"),
+            os.getenv("GITHUB_REF"),
+        )
 
     # Only embed commit hash if in CI or release tag context
     if not in_ci:
-        result = "unknown (local build)"
-        logger.trace("extract_commit: Not in CI context, returning: %s", result)
-        return result
+        return "unknown (local build)"
 
-    # Resolve path and verify it exists
     resolved_path = root_path.resolve()
-    logger.info("extract_commit: resolved_path=%s", resolved_path)
-    logger.trace("extract_commit: resolved_path=%s", resolved_path)
-
     if not resolved_path.exists():
         logger.warning("Git root path does not exist: %s", resolved_path)
-        logger.trace("extract_commit: Path does not exist: %s", resolved_path)
         return "unknown"
 
-    # Check if .git exists (directory or file for worktrees)
-    git_dir = resolved_path / ".git"
-    parent_git = resolved_path.parent / ".git"
-    git_dir_exists = git_dir.exists()
-    parent_git_exists = parent_git.exists()
+    commit_hash = read_git_head(resolved_path)
+    source = "HEAD"
+    if commit_hash is None:
+        commit_hash = _extract_commit_via_git(resolved_path)
+        source = "git rev-parse"
+
+    # In CI, always log the final commit value for debugging
     logger.info(
-        "extract_commit: git_dir=%s (exists=%s), parent_git=%s (exists=%s)",
-        git_dir,
-        git_dir_exists,
-        parent_git,
-        parent_git_exists,
-    )
-    logger.trace(
-        "extract_commit: git_dir=%s (exists=%s), parent_git=%s (exists=%s)",
-        git_dir,
-        git_dir_exists,
-        parent_git,
-        parent_git_exists,
+        "Final commit hash for embedding: %s (from %s, %s)",
+        commit_hash,
+        resolved_path,
+        source,
     )
+    return commit_hash
 
-    if not (git_dir_exists or parent_git_exists):
-        logger.warning("No .git directory found at %s", resolved_path)
-        logger.trace("extract_commit: No .git found, returning 'unknown'")
-        return "unknown"
 
-    commit_hash = "unknown"
+def _extract_commit_via_git(resolved_path: Path) -> str:
+    """Fallback for extract_commit(): ask git itself."""
+    logger = getAppLogger()
+    logger.trace("extract_commit: running git rev-parse in %s", resolved_path)
     try:
-        # Convert Path to string for subprocess compatibility
-        cwd_str = str(resolved_path)
-        logger.info("extract_commit: Running git rev-parse in: %s", cwd_str)
-        logger.trace("extract_commit: Running git rev-parse in: %s", cwd_str)
-
-        git_result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
-            cwd=cwd_str,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        commit_hash = git_result.stdout.strip()
-        logger.info(
-            "extract_commit: git rev-parse stdout=%r, stderr=%r",
-            git_result.stdout,
-            git_result.stderr,
-        )
-        logger.trace(
-            "extract_commit: git rev-parse stdout=%r, stderr=%r",
-            git_result.stdout,
-            git_result.stderr,
-        )
-
-        if not commit_hash:
-            logger.warning("git rev-parse returned empty string")
-            logger.trace("extract_commit: Empty commit hash, using 'unknown'")
-            commit_hash = "unknown"
-        else:
-            logger.info("extract_commit: Successfully extracted: %s", commit_hash)
-            logger.trace("extract_commit: Successfully extracted: %s", commit_hash)
-
+        with span("git rev-parse", category="subprocess"):
+            git_result = run_subprocess(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=str(resolved_path),
+                capture_output=True,
+                text=True,
+                check=True,
+            )
     except subprocess.CalledProcessError as e:
         stderr_msg = e.stderr.strip() or "no error message"
         logger.warning(
-            "git rev-parse failed at %s: %s (stderr: %s, returncode: %s)",
+            "git rev-parse failed at %s: %s (returncode: %s)",
             resolved_path,
             stderr_msg,
-            stderr_msg,
             e.returncode,
         )
-        logger.trace(
-            "extract_commit: git rev-parse failed: returncode=%s, stderr=%s",
-            e.returncode,
-            stderr_msg,
-        )
+        return "unknown"
     except FileNotFoundError:
         logger.warning("git not available in environment")
-        logger.trace("extract_commit: git not found in PATH")
-
-    # In CI, always log the final commit value for debugging
-    if in_ci:
-        logger.info(
-            "Final commit hash for embedding: %s (from %s)",
-            commit_hash,
-            resolved_path,
-        )
-        logger.trace(
-            "extract_commit: FINAL RESULT: %s (from %s)",
-            commit_hash,
-            resolved_path,
-        )
+        return "unknown"
 
+    commit_hash = git_result.stdout.strip()
+    if not commit_hash:
+        logger.warning("git rev-parse returned empty string")
+        return "unknown"
     return commit_hash
 
 
@@ -263,7 +662,8 @@ def is_serger_build(file_path: Path, max_lines: int | None = None) -> bool:
 
     Checks for the "# Build Tool: serger" comment line that appears early
     in the metadata section of serger-generated files (typically around
-    line 11, after the docstring and before imports).
+    line 11, after the docstring and before imports). For zipapp outputs,
+    the archive's `__main__.py` is checked instead.
 
     Args:
         file_path: Path to the file to check
@@ -281,13 +681,21 @@ def is_serger_build(file_path: Path, max_lines: int | None = None) -> bool:
 
     try:
         # Read first N lines to catch the metadata section
-        # where "# Build Tool: serger" appears (typically around line 11)
-        with file_path.open(encoding="utf-8") as f:
-            lines: list[str] = []
-            for i, line in enumerate(f):
-                if i >= line_limit:
-                    break
-                lines.append(line)
+        # where "# Build Tool: serger" appears (typically around line 11).
+        # Zipapp builds carry the script as the archive's __main__.py.
+        lines: list[str] = []
+        if zipfile.is_zipfile(file_path):
+            with (
+                zipfile.ZipFile(file_path) as archive,
+                io.TextIOWrapper(archive.open("__main__.py"), encoding="utf-8") as f,
+            ):
+                lines.extend(itertools.islice(f, line_limit))
+        else:
+            with file_path.open(encoding="utf-8") as f:
+                for i, line in enumerate(f):
+                    if i >= line_limit:
+                        break
+                    lines.append(line)
 
         content = "".join(lines)
 
@@ -296,17 +704,295 @@ def is_serger_build(file_path: Path, max_lines: int | None = None) -> bool:
         pattern = r"#\s*Build\s+Tool:\s*serger"
         return bool(re.search(pattern, content, re.IGNORECASE))
 
-    except (OSError, UnicodeDecodeError):
+    except (OSError, UnicodeDecodeError, KeyError, zipfile.BadZipFile):
         # If we can't read the file, assume it's not a serger build
         # (safer to err on the side of caution)
         return False
 
 
+def _function_scopes_using(
+    tree: ast.Module,
+    names: set[str],
+    import_node: ast.ImportFrom,
+) -> list[ast.FunctionDef | ast.AsyncFunctionDef] | None:
+    """Return the outermost functions whose bodies use `names`.
+
+    Used by external_imports="lazy" to move a `from x import y` into the
+    functions that need it. Returns None when that is not provably safe: a name
+    is used or rebound where it runs at import time (module level, class
+    bodies, decorators, defaults, annotations), declared global/nonlocal,
+    mentioned in a module-level string (e.g. `__all__`), or never used at all
+    (it may be a re-export).
+    """
+    targets: dict[int, ast.FunctionDef | ast.AsyncFunctionDef] = {}
+    unsafe = False
+
+    def visit(  # noqa: PLR0911, PLR0912
+        node: ast.AST, outer: ast.FunctionDef | ast.AsyncFunctionDef | None
+    ) -> None:
+        nonlocal unsafe
+        if unsafe:
+            return
+        if isinstance(node, ast.Name) and node.id in names:
+            if outer is None:
+                unsafe = True
+            else:
+                targets[id(outer)] = outer
+            return
+        if isinstance(node, (ast.Global, ast.Nonlocal)) and names & set(node.names):
+            unsafe = True
+            return
+        if outer is None and node is not import_node:
+            if isinstance(node, (ast.Import, ast.ImportFrom)) and any(
+                (alias.asname or alias.name).split(".")[0] in names
+                for alias in node.names
+            ):
+                unsafe = True
+                return
+            if (
+                isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                and node.name in names
+            ) or (isinstance(node, ast.Constant) and node.value in names):
+                unsafe = True
+                return
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # Decorators, defaults and annotations run where the def runs
+            for child in (*node.decorator_list, node.args, node.returns):
+                if child is not None:
+                    visit(child, outer)
+            for stmt in node.body:
+                visit(stmt, outer or node)
+            return
+        for child in ast.iter_child_nodes(node):
+            visit(child, outer)
+
+    visit(tree, None)
+    if unsafe or not targets:
+        return None
+    return list(targets.values())
+
+
+def _function_body_insert_point(
+    func: ast.FunctionDef | ast.AsyncFunctionDef,
+    lines: list[str],
+) -> tuple[int, str] | None:
+    """Return (line index, indent) where a statement can open `func`'s body.
+
+    The statement goes after the docstring. Returns None if the body does not
+    start on its own line (e.g. `def f(): return x`).
+    """
+    body = func.body
+    first = body[0]
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        if len(body) == 1:
+            return None
+        first = body[1]
+    start = first.lineno
+    if isinstance(first, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        start = min([start, *(d.lineno for d in first.decorator_list)])
+    line = lines[start - 1]
+    indent = line[: len(line) - len(line.lstrip())]
+    if start <= func.lineno or not indent:
+        return None
+    return start - 1, indent
+
+
+def _lazy_from_import_insert_points(
+    node: ast.ImportFrom,
+    tree: ast.Module,
+    lines: list[str],
+    shared_names: frozenset[str] = frozenset(),
+) -> list[tuple[int, str]] | None:
+    """Return where to re-emit `node` inside functions, or None to hoist it.
+
+    Names in `shared_names` are referred to by other stitched modules, which
+    rely on the hoisted binding in the shared namespace, so they stay hoisted.
+    """
+    names = {alias.asname or alias.name for alias in node.names}
+    if "*" in names or node.module == "__future__" or names & shared_names:
+        return None
+    funcs = _function_scopes_using(tree, names, node)
+    if funcs is None:
+        return None
+    points: list[tuple[int, str]] = []
+    for func in funcs:
+        point = _function_body_insert_point(func, lines)
+        if point is None:
+            return None
+        points.append(point)
+    return points
+
+
+def _lazy_import_shared_names(
+    module_texts: dict[Path, str],
+) -> dict[Path, frozenset[str]]:
+    """Return the `from x import y` names of each module that others refer to.
+
+    Used by external_imports="lazy": stitched modules share one namespace, and
+    a stripped internal import (`from .a import y`) or a shim attribute access
+    (`pkg.a.y`) in another module finds `y` only if module `a` keeps its import
+    hoisted. Any reference counts: a name, an attribute, a re-import or a
+    string (e.g. `__all__`, getattr()).
+
+    Args:
+        module_texts: Source text of every stitched module
+
+    Returns:
+        Mapping of module path to the imported names other modules refer to
+    """
+    bound: dict[Path, set[str]] = {}
+    referrers: dict[str, set[Path]] = {}
+    for path, text in module_texts.items():
+        try:
+            tree = ast.parse(text)
+        except SyntaxError:
+            continue
+        bound[path] = set()
+        for node in ast.walk(tree):
+            referenced: list[str] = []
+            if isinstance(node, ast.ImportFrom):
+                bound[path].update(alias.asname or alias.name for alias in node.names)
+                referenced = [alias.name for alias in node.names]
+            elif isinstance(node, ast.Name):
+                referenced = [node.id]
+            elif isinstance(node, ast.Attribute):
+                referenced = [node.attr]
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                referenced = [node.value]
+            for name in referenced:
+                referrers.setdefault(name, set()).add(path)
+    return {
+        path: frozenset(name for name in names if referrers.get(name, set()) - {path})
+        for path, names in bound.items()
+    }
+
+
+def _make_lazy_import_block(imports: list[str]) -> str:
+    """Turn hoisted `import x [as y]` statements into lazy module proxies.
+
+    `from x import y`, dotted imports without an alias (which bind the top
+    package), TYPE_CHECKING blocks and the runtime's own imports stay eager.
+    The helper is only emitted if at least one import became lazy.
+
+    Args:
+        imports: Hoisted import statements, in output order
+
+    Returns:
+        Import block text for the stitched script
+    """
+    eager: list[str] = []
+    lazy: list[str] = []
+    for imp in imports:
+        try:
+            parsed = ast.parse(imp).body
+        except SyntaxError:
+            eager.append(imp)
+            continue
+        if len(parsed) != 1 or not isinstance(parsed[0], ast.Import):
+            eager.append(imp)
+            continue
+        for alias in parsed[0].names:
+            if alias.name in _EAGER_EXTERNAL_IMPORTS or (
+                "." in alias.name and not alias.asname
+            ):
+                eager.append(f"{ast.unparse(ast.Import(names=[alias]))}\n")
+            else:
+                bound = alias.asname or alias.name
+                lazy.append(f"{bound} = _lazy_external_import({alias.name!r})\n")
+    if not lazy:
+        return "".join(eager)
+    eager.extend(["import importlib.machinery\n", "import importlib.util\n"])
+    return (
+        "".join(dict.fromkeys(eager))
+        + "\n"
+        + "\n".join(_LAZY_IMPORT_HELPER)
+        + "\n"
+        + "".join(dict.fromkeys(lazy))
+    )
+
+
+def _exec_module_name(name: str) -> str:
+    """Return the import name for a derived module name (`pkg.__init__` → `pkg`)."""
+    return name.removesuffix(".__init__")
+
+
+def _encode_exec_blob(data: bytes) -> str:
+    """Compress `data` and encode it as a single-line ASCII string literal."""
+    return binascii.b2a_base64(zlib.compress(data, 9), newline=False).decode("ascii")
+
+
+def _make_exec_modules_block(
+    modules: list[tuple[str, bool]],
+    module_sources: dict[str, str],
+    *,
+    eager: bool = True,
+) -> str:
+    """Compile each module and emit the exec-mode loader with embedded code.
+
+    Each module is compiled on its own (with a `<module>.py`-style filename),
+    so `__future__` imports, relative imports and tracebacks behave per
+    module. The code objects are marshalled together with this interpreter's
+    bytecode magic number; the module sources are embedded as a fallback for
+    interpreters with a different bytecode version.
+
+    Args:
+        modules: (derived module name, is package) pairs, in execution order
+        module_sources: Mapping of "<module name>.py" to processed source
+        eager: Import every module at startup (otherwise each module runs on
+            first import)
+
+    Returns:
+        Loader, module table and load call for the stitched script
+
+    Raises:
+        SyntaxError: If a module does not compile
+    """
+    table: list[tuple[str, str, bool]] = []
+    sources: list[str] = []
+    codes: list[types.CodeType] = []
+    for source_name, is_pkg in modules:
+        source = module_sources[f"{source_name}.py"]
+        name = _exec_module_name(source_name)
+        filename = name.replace(".", "/") + ("/__init__.py" if is_pkg else ".py")
+        codes.append(compile(source, filename, "exec", dont_inherit=True))
+        sources.append(source)
+        table.append((name, filename, is_pkg))
+
+    code_blob = _encode_exec_blob(marshal.dumps(tuple(codes)))
+    # Version 4 keeps the source blob loadable by every supported Python
+    source_blob = _encode_exec_blob(marshal.dumps(tuple(sources), 4))
+    table_lines = "".join(f"    {entry!r},\n" for entry in table)
+    return (
+        f"_STITCHED_HEADER_NAMES = {_STITCHED_HEADER_GLOBALS!r}\n"
+        "\n"
+        + "\n".join(_EXEC_LOADER_HELPER)
+        + "\n"
+        + f"_STITCHED_MODULES = (\n{table_lines})\n"
+        + f"_STITCHED_MAGIC = {importlib.util.MAGIC_NUMBER!r}\n"
+        + f"_STITCHED_CODE = {code_blob!r}\n"
+        + f"_STITCHED_SOURCE = {source_blob!r}\n"
+        + "\n"
+        + "_load_stitched_modules(\n"
+        + "    _STITCHED_MODULES,\n"
+        + "    _STITCHED_CODE,\n"
+        + "    _STITCHED_SOURCE,\n"
+        + "    _STITCHED_MAGIC,\n"
+        + f"    eager={eager!r},\n"
+        + ")\n"
+    )
+
+
 def split_imports(  # noqa: C901, PLR0912, PLR0915
     text: str,
     package_names: list[str],
     external_imports: ExternalImportMode = "top",
     internal_imports: InternalImportMode = "force_strip",
+    *,
+    shared_names: frozenset[str] = frozenset(),
 ) -> tuple[list[str], str]:
     """Extract external imports and body text using AST.
 
@@ -329,6 +1015,11 @@ def split_imports(  # noqa: C901, PLR0912, PLR0915
               Empty `if TYPE_CHECKING:` blocks (including those with only pass
               statements) are removed entirely.
             - "keep": Leave external imports in their original locations
+            - "lazy": Like "top", but hoisted `import x` statements become lazy
+              module proxies (see _build_final_script), and `from x import y`
+              statements whose names are only used inside functions are moved
+              into those functions instead of being hoisted (unless the name
+              is in `shared_names`).
             - "force_strip": Remove all external imports regardless of location
               (module-level, function-local, in conditionals, etc.). Empty
               structures (if, try, etc.) get a `pass` statement. Empty
@@ -358,6 +1049,8 @@ def split_imports(  # noqa: C901, PLR0912, PLR0915
               imports. Assignments are included in collision detection. Note: `import
               module` statements for internal packages may not work correctly as
               there are no module objects in stitched mode.
+        shared_names: Names other stitched modules refer to; "lazy" mode keeps
+            their `from x import y` hoisted (see _lazy_import_shared_names())
 
     Returns:
         Tuple of (external_imports, body_text) where external_imports is a
@@ -379,6 +1072,9 @@ def split_imports(  # noqa: C901, PLR0912, PLR0915
     # For assign mode: track imports to replace with assignments
     # Maps (start, end) range to assignment code
     import_replacements: dict[tuple[int, int], str] = {}
+    # For lazy mode: imports moved into function bodies
+    # Maps line index -> import lines to insert before it
+    import_insertions: dict[int, list[str]] = {}
 
     def find_parent(
         node: ast.AST,
@@ -677,6 +1373,32 @@ def split_imports(  # noqa: C901, PLR0912, PLR0915
                         else:
                             external_imports_list.append(import_text)
                 # Function-local and conditional external imports stay in place
+            elif external_imports == "lazy":
+                # Same placement rules as "top"; `from x import y` used only
+                # inside functions is moved there instead of being hoisted
+                is_module_level = not find_parent(
+                    node, tree, (ast.FunctionDef, ast.AsyncFunctionDef)
+                )
+                if is_module_level and not is_in_conditional(node, tree):
+                    all_import_ranges.append((start, end))
+                    import_text = snippet.strip()
+                    insert_points = (
+                        _lazy_from_import_insert_points(node, tree, lines, shared_names)
+                        if isinstance(node, ast.ImportFrom) and not is_type_checking
+                        else None
+                    )
+                    if insert_points is not None:
+                        for index, indent in insert_points:
+                            import_insertions.setdefault(index, []).append(
+                                f"{indent}{ast.unparse(node)}\n"
+                            )
+                    elif import_text:
+                        if not import_text.endswith("\n"):
+                            import_text += "\n"
+                        if is_type_checking:
+                            type_checking_imports_list.append(import_text)
+                        else:
+                            external_imports_list.append(import_text)
             elif external_imports == "force_strip":
                 # Strip all external imports regardless of location
                 # (module-level, function-local, in conditionals, etc.)
@@ -702,7 +1424,7 @@ def split_imports(  # noqa: C901, PLR0912, PLR0915
                 # not yet implemented
                 msg = (
                     f"external_imports mode '{external_imports}' is not yet "
-                    "implemented. Only 'force_top', 'top', 'keep', "
+                    "implemented. Only 'force_top', 'top', 'keep', 'lazy', "
                     "'force_strip', and 'strip' modes are currently supported."
                 )
                 raise ValueError(msg)
@@ -720,6 +1442,8 @@ def split_imports(  # noqa: C901, PLR0912, PLR0915
     new_lines: list[str] = []
     i = 0
     while i < len(lines):
+        # Imports moved into a function body go before its first statement
+        new_lines.extend(import_insertions.pop(i, []))
         # Check if this line is part of an import to remove
         in_import_range = False
         replacement_range: tuple[int, int] | None = None
@@ -1195,6 +1919,7 @@ def _extract_top_level_symbols(code: str) -> ModuleSymbols:
 
     try:
         tree = ast.parse(code)
+        record_size("module_ast", tree)
         for node in tree.body:
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 functions.add(node.name)
@@ -1411,10 +2136,38 @@ def _extract_import_module_info(  # pyright: ignore[reportUnusedFunction]
     return None
 
 
+def _iter_import_time_nodes(tree: ast.Module) -> list[ast.AST]:
+    """Return the nodes of `tree` that run when the module is imported.
+
+    Function bodies (and lambdas) only run when called and `if TYPE_CHECKING:`
+    blocks never run, so both are skipped. Class bodies run at import time.
+    """
+    nodes: list[ast.AST] = []
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        if isinstance(node, ast.If) and (
+            (isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING")
+            or (
+                isinstance(node.test, ast.Attribute)
+                and node.test.attr == "TYPE_CHECKING"
+            )
+        ):
+            stack.extend(node.orelse)
+            continue
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    return nodes
+
+
 def _extract_internal_imports_for_deps(  # noqa: PLR0912
     source: str,
     module_name: str,
     detected_packages: set[str],
+    *,
+    eager_only: bool = False,
 ) -> set[str]:
     """Extract internal import module names for dependency graph building.
 
@@ -1426,6 +2179,8 @@ def _extract_internal_imports_for_deps(  # noqa: PLR0912
         source: Source code of the module
         module_name: The current module name (e.g., "serger.actions")
         detected_packages: Set of detected package names
+        eager_only: Only include imports that run at import time (skip
+            function bodies and `if TYPE_CHECKING:` blocks)
 
     Returns:
         Set of internal module names that this module imports (resolved from
@@ -1444,7 +2199,8 @@ def _extract_internal_imports_for_deps(  # noqa: PLR0912
     # if/else blocks, functions, etc. This is necessary because
     # imports inside conditionals (like "if not __STITCHED__: from .x import y")
     # still represent dependencies that affect module ordering.
-    for node in ast.walk(tree):
+    nodes = _iter_import_time_nodes(tree) if eager_only else ast.walk(tree)
+    for node in nodes:
         if isinstance(node, ast.ImportFrom):
             # Handle relative imports (node.level > 0)
             if node.level > 0:
@@ -1562,36 +2318,31 @@ def _deterministic_topological_sort(
     return result
 
 
-def compute_module_order(  # noqa: C901, PLR0912
+def _build_module_dependency_graph(  # noqa: C901, PLR0912
     file_paths: list[Path],
     package_root: Path,
-    _package_name: str,
     file_to_include: dict[Path, IncludeResolved],
     *,
     detected_packages: set[str],
     source_bases: list[str] | None = None,
     user_provided_source_bases: list[str] | None = None,
-) -> list[Path]:
-    """Compute correct module order based on import dependencies.
-
-    Uses topological sorting of internal imports to determine the correct
-    order for stitching.
+    eager_only: bool = False,
+) -> tuple[dict[str, set[str]], dict[str, Path]]:
+    """Build the internal import graph between the included modules.
 
     Args:
         file_paths: List of file paths in initial order
         package_root: Common root of all included files
-        _package_name: Root package name (unused, kept for API consistency)
         file_to_include: Mapping of file path to its include (for dest access)
         detected_packages: Pre-detected package names
         source_bases: Optional list of module base directories for external files
         user_provided_source_bases: Optional list of user-provided module bases
-            (from config, excludes auto-discovered package directories)
+        eager_only: Only count imports that run at import time (see
+            _extract_internal_imports_for_deps)
 
     Returns:
-        Topologically sorted list of file paths
-
-    Raises:
-        RuntimeError: If circular imports are detected
+        Tuple of (module name -> names of modules it imports,
+        module name -> file path)
     """
     logger = getAppLogger()
     # Map file paths to derived module names
@@ -1628,7 +2379,7 @@ def compute_module_order(  # noqa: C901, PLR0912
         # Extract internal imports using the extraction function
         # This parses the AST once and extracts all internal module names
         internal_imports = _extract_internal_imports_for_deps(
-            source, module_name, detected_packages
+            source, module_name, detected_packages, eager_only=eager_only
         )
 
         # Build dependency graph from extracted imports
@@ -1728,13 +2479,137 @@ def compute_module_order(  # noqa: C901, PLR0912
                             )
                             deps[module_name].add(dep_module)
 
-    # Perform deterministic topological sort using file path as tie-breaker
-    # This ensures reproducible builds even when multiple valid orderings exist
-    topo_modules = _deterministic_topological_sort(deps, module_to_file)
+    return deps, module_to_file
+
+
+@timed()
+def compute_module_order(
+    file_paths: list[Path],
+    package_root: Path,
+    _package_name: str,
+    file_to_include: dict[Path, IncludeResolved],
+    *,
+    detected_packages: set[str],
+    source_bases: list[str] | None = None,
+    user_provided_source_bases: list[str] | None = None,
+) -> list[Path]:
+    """Compute correct module order based on import dependencies.
+
+    Uses topological sorting of internal imports to determine the correct
+    order for stitching.
+
+    Args:
+        file_paths: List of file paths in initial order
+        package_root: Common root of all included files
+        _package_name: Root package name (unused, kept for API consistency)
+        file_to_include: Mapping of file path to its include (for dest access)
+        detected_packages: Pre-detected package names
+        source_bases: Optional list of module base directories for external files
+        user_provided_source_bases: Optional list of user-provided module bases
+            (from config, excludes auto-discovered package directories)
+
+    Returns:
+        Topologically sorted list of file paths
+
+    Raises:
+        RuntimeError: If circular imports are detected
+    """
+    deps, module_to_file = _build_module_dependency_graph(
+        file_paths,
+        package_root,
+        file_to_include,
+        detected_packages=detected_packages,
+        source_bases=source_bases,
+        user_provided_source_bases=user_provided_source_bases,
+    )
+
+    # Perform deterministic topological sort using file path as tie-breaker
+    # This ensures reproducible builds even when multiple valid orderings exist
+    topo_modules = _deterministic_topological_sort(deps, module_to_file)
+
+    # Convert back to file paths
+    topo_paths = [module_to_file[mod] for mod in topo_modules if mod in module_to_file]
+    return topo_paths
+
+
+def find_eager_import_cycles(
+    file_paths: list[Path],
+    package_root: Path,
+    file_to_include: dict[Path, IncludeResolved],
+    *,
+    detected_packages: set[str],
+    source_bases: list[str] | None = None,
+    user_provided_source_bases: list[str] | None = None,
+) -> list[list[str]]:
+    """Find groups of modules that import each other at import time.
+
+    Only imports that run when a module is imported count (not those inside
+    functions). When modules are executed on import (stitch_mode "exec"), one
+    module of such a cycle sees the others partially initialized.
 
-    # Convert back to file paths
-    topo_paths = [module_to_file[mod] for mod in topo_modules if mod in module_to_file]
-    return topo_paths
+    Args:
+        file_paths: List of file paths of the included modules
+        package_root: Common root of all included files
+        file_to_include: Mapping of file path to its include (for dest access)
+        detected_packages: Pre-detected package names
+        source_bases: Optional list of module base directories for external files
+        user_provided_source_bases: Optional list of user-provided module bases
+
+    Returns:
+        Sorted module names of each cycle, cycles sorted by first module
+    """
+    deps, _module_to_file = _build_module_dependency_graph(
+        file_paths,
+        package_root,
+        file_to_include,
+        detected_packages=detected_packages,
+        source_bases=source_bases,
+        user_provided_source_bases=user_provided_source_bases,
+        eager_only=True,
+    )
+
+    # Tarjan's strongly connected components (iterative)
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    cycles: list[list[str]] = []
+    for root in sorted(deps):
+        if root in index:
+            continue
+        work: list[tuple[str, list[str]]] = [(root, sorted(deps[root]))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, pending = work[-1]
+            if pending:
+                dep = pending.pop()
+                if dep not in deps:
+                    continue
+                if dep not in index:
+                    index[dep] = lowlink[dep] = len(index)
+                    stack.append(dep)
+                    on_stack.add(dep)
+                    work.append((dep, sorted(deps[dep])))
+                elif dep in on_stack:
+                    lowlink[node] = min(lowlink[node], index[dep])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1:
+                    cycles.append(sorted(component))
+    return sorted(cycles)
 
 
 def suggest_order_mismatch(
@@ -1874,6 +2749,7 @@ def _is_inside_string_literal(text: str, pos: int) -> bool:
     return in_string
 
 
+@timed()
 def verify_no_broken_imports(  # noqa: C901, PLR0912
     final_text: str,
     package_names: list[str],
@@ -2078,7 +2954,148 @@ def force_mtime_advance(path: Path, seconds: float = 1.0, max_tries: int = 50) -
     raise AssertionError(xmsg)
 
 
-def _collect_modules(  # noqa: PLR0912, PLR0915, C901
+# (module text, processing options) → (hoisted imports, module body)
+_ModuleCacheKey = tuple[Any, ...]
+_ModuleCacheValue = tuple[tuple[str, ...], str]
+
+
+class ModuleCache:
+    """Processed module bodies kept between builds (e.g. by `serger --serve`).
+
+    Entries are keyed by the module's source text and every option that
+    affects processing, so a changed file or setting is simply a miss.
+    Entries the last build did not use are dropped by next_build().
+    """
+
+    __slots__ = ("_current", "_previous")
+
+    def __init__(self) -> None:
+        self._current: dict[_ModuleCacheKey, _ModuleCacheValue] = {}
+        self._previous: dict[_ModuleCacheKey, _ModuleCacheValue] = {}
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def get(self, key: _ModuleCacheKey) -> _ModuleCacheValue | None:
+        """Return the cached entry for `key` (None on a miss)."""
+        value = self._current.get(key)
+        if value is None:
+            value = self._previous.pop(key, None)
+            if value is not None:
+                self._current[key] = value
+        return value
+
+    def put(self, key: _ModuleCacheKey, value: _ModuleCacheValue) -> None:
+        self._current[key] = value
+
+    def next_build(self) -> None:
+        """Start a new build, forgetting entries the last one did not use."""
+        self._previous = self._current
+        self._current = {}
+
+
+_module_cache: ContextVar[ModuleCache | None] = ContextVar(
+    "serger_module_cache", default=None
+)
+
+
+@contextmanager
+def using_module_cache(cache: ModuleCache) -> Iterator[None]:
+    """Reuse processed module bodies from `cache` for builds in this block."""
+    token = _module_cache.set(cache)
+    try:
+        yield
+    finally:
+        _module_cache.reset(token)
+
+
+def _process_module_text(
+    module_text: str,
+    file_path: Path,
+    package_names_list: list[str],
+    external_imports: ExternalImportMode,
+    internal_imports: InternalImportMode,
+    comments_mode: CommentsMode,
+    docstring_mode: DocstringMode,
+    *,
+    lean_mode: bool,
+    shared_names: frozenset[str] = frozenset(),
+) -> _ModuleCacheValue:
+    """Turn one module's source into (hoisted imports, module body).
+
+    Answers from the active ModuleCache (see using_module_cache()) when the
+    same text was processed with the same options before.
+    """
+    logger = getAppLogger()
+    cache = _module_cache.get()
+    key: _ModuleCacheKey = ()
+    if cache is not None:
+        key = (
+            module_text,
+            tuple(package_names_list),
+            external_imports,
+            internal_imports,
+            comments_mode,
+            json.dumps(docstring_mode, sort_keys=True),
+            lean_mode,
+            tuple(sorted(shared_names)),
+        )
+        cached = cache.get(key)
+        record_cache("modules", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+    module_text = strip_redundant_blocks(module_text)
+
+    # Process comments according to mode
+    # IMPORTANT: This must happen BEFORE split_imports, as split_imports
+    # works with the text directly and will preserve any comments that
+    # are still in the text at that point
+    logger.trace(
+        "Processing comments: mode=%s, file=%s, text_length=%d",
+        comments_mode,
+        file_path,
+        len(module_text),
+    )
+    module_text = process_comments(module_text, comments_mode)
+    logger.trace("After process_comments: text_length=%d", len(module_text))
+
+    # Process docstrings according to mode
+    # IMPORTANT: This must happen BEFORE split_imports, similar to comments
+    logger.trace(
+        "Processing docstrings: mode=%s, file=%s, text_length=%d",
+        docstring_mode,
+        file_path,
+        len(module_text),
+    )
+    module_text = process_docstrings(module_text, docstring_mode)
+    logger.trace(
+        "After process_docstrings: text_length=%d",
+        len(module_text),
+    )
+
+    # Strip runtime-unneeded typing code; also BEFORE split_imports so
+    # pruned typing imports never reach the hoisted import block
+    if lean_mode:
+        module_text = apply_lean_mode(module_text, filename=str(file_path))
+        logger.trace("After apply_lean_mode: text_length=%d", len(module_text))
+
+    # Extract imports - pass all detected package names and modes
+    external_imports_list, module_body = split_imports(
+        module_text,
+        package_names_list,
+        external_imports,
+        internal_imports,
+        shared_names=shared_names,
+    )
+    result = (tuple(external_imports_list), module_body)
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+@timed()
+def _collect_modules(  # noqa: PLR0912, PLR0913, PLR0915, C901
     file_paths: list[Path],
     package_root: Path,
     _package_name: str,
@@ -2090,6 +3107,8 @@ def _collect_modules(  # noqa: PLR0912, PLR0915, C901
     docstring_mode: DocstringMode = "keep",
     source_bases: list[str] | None = None,
     user_provided_source_bases: list[str] | None = None,
+    *,
+    lean_mode: bool = False,
 ) -> tuple[dict[str, str], OrderedDict[str, None], list[str], list[str]]:
     """Collect and process module sources from file paths.
 
@@ -2106,6 +3125,7 @@ def _collect_modules(  # noqa: PLR0912, PLR0915, C901
         source_bases: Optional list of module base directories for external files
         user_provided_source_bases: Optional list of user-provided module bases
             (from config, excludes auto-discovered package directories)
+        lean_mode: Strip annotations and TYPE_CHECKING-only code
 
     Returns:
         Tuple of (module_sources, all_imports, parts, derived_module_names)
@@ -2200,9 +3220,12 @@ def _collect_modules(  # noqa: PLR0912, PLR0915, C901
                 ):
                     should_prepend = False
                     logger.trace(
-                        f"[COLLECT] First pass: skipping package name prepending "
-                        f"for installed package: module={module_name}, "
-                        f"detected_pkg={pkg}, main_pkg={_package_name}",
+                        "[COLLECT] First pass: skipping package name prepending "
+                        "for installed package: module=%s, detected_pkg=%s, "
+                        "main_pkg=%s",
+                        module_name,
+                        pkg,
+                        _package_name,
                     )
                     break
 
@@ -2233,6 +3256,16 @@ def _collect_modules(  # noqa: PLR0912, PLR0915, C901
 
         first_pass_module_names[file_path] = module_name
 
+    # Lazy `from x import y` moves need to know what the other modules use
+    shared_names: dict[Path, frozenset[str]] = {}
+    if external_imports == "lazy":
+        shared_names = _lazy_import_shared_names(
+            {
+                file_path: file_path.read_text(encoding="utf-8")
+                for file_path in first_pass_module_names
+            }
+        )
+
     # ===== SECOND PASS: Process files and imports using pre-derived names =====
     for file_path in file_paths:
         if not file_path.exists():
@@ -2243,62 +3276,38 @@ def _collect_modules(  # noqa: PLR0912, PLR0915, C901
         module_name = first_pass_module_names[file_path]
         derived_module_names.append(module_name)
 
-        module_text = file_path.read_text(encoding="utf-8")
-        module_text = strip_redundant_blocks(module_text)
-
-        # Process comments according to mode
-        # IMPORTANT: This must happen BEFORE split_imports, as split_imports
-        # works with the text directly and will preserve any comments that
-        # are still in the text at that point
-        logger.trace(
-            "Processing comments: mode=%s, file=%s, text_length=%d",
-            comments_mode,
-            file_path,
-            len(module_text),
-        )
-        has_comment_before = "# This comment should be removed" in module_text
-        module_text = process_comments(module_text, comments_mode)
-        has_comment_after = "# This comment should be removed" in module_text
-        logger.trace(
-            "After process_comments: text_length=%d, had_comment_before=%s, "
-            "has_comment_after=%s",
-            len(module_text),
-            has_comment_before,
-            has_comment_after,
-        )
-
-        # Process docstrings according to mode
-        # IMPORTANT: This must happen BEFORE split_imports, similar to comments
-        logger.trace(
-            "Processing docstrings: mode=%s, file=%s, text_length=%d",
-            docstring_mode,
-            file_path,
-            len(module_text),
-        )
-        module_text = process_docstrings(module_text, docstring_mode)
-        logger.trace(
-            "After process_docstrings: text_length=%d",
-            len(module_text),
-        )
+        with span(module_name, category="module", args={"file": str(file_path)}):
+            module_text = file_path.read_text(encoding="utf-8")
+            external_imports_list, module_body = _process_module_text(
+                module_text,
+                file_path,
+                package_names_list,
+                external_imports,
+                internal_imports,
+                comments_mode,
+                docstring_mode,
+                lean_mode=lean_mode,
+                shared_names=shared_names.get(file_path, frozenset()),
+            )
 
-        # Extract imports - pass all detected package names and modes
-        external_imports_list, module_body = split_imports(
-            module_text, package_names_list, external_imports, internal_imports
-        )
-        # Store transformed body for symbol extraction (collision detection)
-        # This ensures assign mode assignments are included in collision checks
-        module_sources[f"{module_name}.py"] = module_body
-        for imp in external_imports_list:
-            all_imports.setdefault(imp, None)
+            # Store transformed body for symbol extraction (collision detection)
+            # This ensures assign mode assignments are included in collision checks
+            module_sources[f"{module_name}.py"] = module_body
+            for imp in external_imports_list:
+                all_imports.setdefault(imp, None)
 
-        # Create module section - use derived module name in header
-        # Note: serger-generated comments (like headers) are added here and should
-        # remain even in strip mode, as they're part of serger's output, not user code
-        header = f"# === {module_name} ==="
-        parts.append(f"\n{header}\n{module_body.strip()}\n\n")
+            # Create module section - use derived module name in header
+            # Note: serger-generated comments (like headers) are added here and
+            # should remain even in strip mode, as they're part of serger's
+            # output, not user code
+            header = f"# === {module_name} ==="
+            parts.append(f"\n{header}\n{module_body.strip()}\n\n")
 
-        file_display = shorten_path_for_display(file_path)
-        logger.trace("Processed module: %s (from %s)", module_name, file_display)
+            logger.trace(
+                "Processed module: %s (from %s)",
+                module_name,
+                Lazy(shorten_path_for_display, file_path),
+            )
 
     return module_sources, all_imports, parts, derived_module_names
 
@@ -2485,6 +3494,7 @@ def _format_license(license_text: str) -> str:
     return f"# License: {stripped}\n"
 
 
+@timed()
 def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
     *,
     package_name: str,
@@ -2496,7 +3506,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
     module_mode: str,
     module_actions: list[ModuleActionFull],
     shim: ShimSetting,
-    order_paths: list[Path] | None = None,  # noqa: ARG001
+    order_paths: list[Path] | None = None,
     package_root: Path | None = None,  # noqa: ARG001
     file_to_include: dict[Path, IncludeResolved] | None = None,  # noqa: ARG001
     _original_order_names_for_shims: list[str] | None = None,
@@ -2531,7 +3541,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
         module_mode: How to generate import shims ("none", "multi", "force")
         module_actions: List of module actions (already normalized)
         shim: Shim setting ("all", "public", "none")
-        order_paths: Optional list of file paths (unused, kept for API consistency)
+        order_paths: Optional list of file paths (exec mode: package detection)
         package_root: Optional common root (unused, kept for API consistency)
         file_to_include: Optional mapping (unused, kept for API consistency)
         license_text: License text (will be formatted automatically)
@@ -2559,7 +3569,24 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
             del all_imports[imp]
 
     future_block = "".join(future_imports.keys())
-    import_block = "".join(all_imports.keys())
+    external_imports_mode = (
+        config.get("external_imports", "top") if config is not None else "top"
+    )
+    stitch_mode = config.get("stitch_mode", "raw") if config else "raw"
+    startup_profiling = bool(
+        config.get("startup_profiling", DEFAULT_STARTUP_PROFILING)
+        if config
+        else DEFAULT_STARTUP_PROFILING
+    )
+    if stitch_mode == "exec":
+        # Modules keep their own imports; only the loader's are hoisted
+        import_block = "".join(
+            dict.fromkeys([*_EXEC_LOADER_IMPORTS, *all_imports.keys()])
+        )
+    elif external_imports_mode == "lazy":
+        import_block = _make_lazy_import_block(list(all_imports.keys()))
+    else:
+        import_block = "".join(all_imports.keys())
 
     # Update module section headers in parts to use transformed names
     # This must happen BEFORE shim generation, as headers are part of the stitched code
@@ -2593,11 +3620,18 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                     len(transformed_order_names),
                     len(order_names),
                 )
+            # Header line -> indexes of the parts it starts, so each rename
+            # only touches its own part(s) instead of searching all parts
+            parts_by_header: dict[str, list[int]] = {}
+            for j, part in enumerate(parts):
+                if part.startswith("\n# === "):
+                    header_line = part[1:].split("\n", 1)[0]
+                    parts_by_header.setdefault(header_line, []).append(j)
             for i, original_name in enumerate(order_names):
                 if i < len(transformed_order_names):
                     transformed_name = transformed_order_names[i]
                     if transformed_name != original_name:
-                        # Update header - search and replace in parts
+                        # Update header - replace in the parts it heads
                         # Headers are created as "\n# === {module_name} ===\n"
                         # "{module_body}\n\n"
                         # Use simple string replacement (headers are on their own lines)
@@ -2609,25 +3643,20 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                             header_pattern,
                             new_header,
                         )
-                        # Update all parts that contain this header
-                        # Replace all occurrences in each part
-                        replaced = False
-                        for j, part in enumerate(parts):
-                            if header_pattern in part:
-                                logger.debug(
-                                    "Found header pattern in part %d: %s",
-                                    j,
-                                    repr(part[:100]),
-                                )
-                                # Replace the header pattern with new header
-                                parts[j] = part.replace(header_pattern, new_header)
-                                logger.debug(
-                                    "Replaced header in part %d: %s",
-                                    j,
-                                    repr(parts[j][:100]),
-                                )
-                                replaced = True
-                        if not replaced:
+                        matching_parts = parts_by_header.pop(header_pattern, [])
+                        for j in matching_parts:
+                            # Replace the header pattern with new header
+                            parts[j] = parts[j].replace(header_pattern, new_header)
+                            logger.debug(
+                                "Replaced header in part %d: %s",
+                                j,
+                                Lazy(repr, parts[j][:100]),
+                            )
+                        if matching_parts:
+                            parts_by_header.setdefault(new_header, []).extend(
+                                matching_parts
+                            )
+                        else:
                             logger.debug(
                                 "Header pattern '%s' not found in parts for "
                                 "transformation to '%s'. Parts sample: %s",
@@ -2686,8 +3715,11 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
 
     # Generate import shims based on module_actions and shim setting
     # If shim == "none" or module_mode == "none", skip shim generation
-    if shim == "none" or module_mode == "none":
-        # No shims generated
+    shim_attrs = (
+        config.get("shim_attrs", DEFAULT_SHIM_ATTRS) if config else DEFAULT_SHIM_ATTRS
+    )
+    if shim == "none" or module_mode == "none" or stitch_mode == "exec":
+        # No shims generated (exec mode registers real modules instead)
         shim_text = ""
     else:
         # IMPORTANT: Module names in order_names are relative to package_root
@@ -2769,7 +3801,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
             # actions only reference root packages that should exist
             for action in original_scope_actions:
                 source = action.get("source")
-                if source:
+                if source and not is_module_pattern(source):
                     available_modules_for_validation.add(source)
             # Also add package names from detected_packages that appear anywhere
             # in module names (as a fallback for edge cases)
@@ -2804,6 +3836,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
         # (e.g., "utils.utils_text" -> "serger.utils.utils_text")
         # Note: flat mode has special handling for loose files (keeps them top-level)
         shim_names: list[str] = []
+        transformed_name_set = set(transformed_names)
         for name in transformed_names:
             # Flat mode: treat loose files as top-level modules (not under package)
             # Packages still get shims as usual
@@ -2839,7 +3872,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                 if (
                     first_part in detected_packages
                     and first_part != package_name
-                    and first_part not in transformed_names
+                    and first_part not in transformed_name_set
                 ):
                     # First part is a separate package (not in our module list)
                     # - use as-is
@@ -2862,7 +3895,12 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                     # After mode transformations, source might need component matching
                     # (e.g., "mypkg.module" might need to match "mypkg.pkg1.module")
                     source = action.get("source")
-                    if source:
+                    if source and is_module_pattern(source):
+                        # Must match a shim; also checks dest collisions
+                        expand_module_action_patterns(
+                            [action], shim_names, scope="shim"
+                        )
+                    elif source:
                         if source not in shim_names:
                             # Check if source matches any component in shim_names
                             # For "mypkg.module", check if it matches
@@ -2918,7 +3956,12 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                     action_scope = action.get("scope", "shim")
                     if action_scope == "shim":
                         source = action.get("source")
-                        if source:
+                        if source and is_module_pattern(source):
+                            # Must match a shim; also checks dest collisions
+                            expand_module_action_patterns(
+                                [action], shim_names, scope="shim"
+                            )
+                        elif source:
                             if source not in shim_names:
                                 # Check if source matches any component in shim_names
                                 # For "mypkg.module", check if it matches
@@ -2957,7 +4000,11 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                     # (e.g., source "pkg1" should match "mypkg.pkg1")
                     elif action_scope == "original":
                         source = action.get("source")
-                        if source:
+                        if source and is_module_pattern(source):
+                            expand_module_action_patterns(
+                                [action], shim_names, scope="original"
+                            )
+                        elif source:
                             # Check if source appears as a component in any shim_name
                             source_found = False
                             for shim_name in shim_names:
@@ -3290,110 +4337,16 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
         shim_blocks.append("    return _mod")
         shim_blocks.append("")
 
-        # ignores must be on their own line
-        # or they may get reformated to the wrong place
-        shim_blocks.append("def _setup_pkg_modules(  # noqa: C901, PLR0912")
-        shim_blocks.append(
-            "pkg_name: str, module_names: list[str], "
-            "name_mapping: dict[str, str] | None = None"
-        )
-        shim_blocks.append(") -> None:")
-        shim_blocks.append(
-            '    """Set up package module attributes and register submodules."""'
-        )
-        shim_blocks.append("    _mod = sys.modules.get(pkg_name)")
-        shim_blocks.append("    if not _mod:")
-        shim_blocks.append("        return")
-        shim_blocks.append("    # Copy attributes from all modules under this package")
-        shim_blocks.append("    _globals = globals()")
-        shim_blocks.append("    # Debug: log what's in globals for this package")
-        shim_blocks.append("    # Note: This copies all globals to the package module")
-        shim_blocks.append("    for _key, _value in _globals.items():")
-        shim_blocks.append("        setattr(_mod, _key, _value)")
-        shim_blocks.append(
-            "    # Set up package attributes for nested packages BEFORE registering"
-        )
-        shim_blocks.append(
-            "    # modules (so packages are available when modules are registered)"
-        )
-        shim_blocks.append("    _seen_packages: set[str] = set()")
-        shim_blocks.append("    for _name in module_names:")
-        shim_blocks.append(
-            "        if _name != pkg_name and _name.startswith(pkg_name + '.'):"
-        )
-        shim_blocks.append(
-            "            # Extract parent package (e.g., mypkg.public from"
-        )
-        shim_blocks.append("            # mypkg.public.utils)")
-        shim_blocks.append("            _name_parts = _name.split('.')")
-        shim_blocks.append("            if len(_name_parts) > 2:  # noqa: PLR2004")
-        shim_blocks.append("                # Has at least one intermediate package")
-        shim_blocks.append("                _parent_pkg = '.'.join(_name_parts[:-1])")
-        shim_blocks.append(
-            "                if _parent_pkg.startswith(pkg_name + '.') and "
-            "_parent_pkg not in _seen_packages:"
-        )
-        shim_blocks.append("                    _seen_packages.add(_parent_pkg)")
-        shim_blocks.append(
-            "                    _pkg_obj = sys.modules.get(_parent_pkg)"
-        )
-        shim_blocks.append("                    if _pkg_obj and _pkg_obj != _mod:")
-        shim_blocks.append("                        # Set parent package as attribute")
-        shim_blocks.append("                        _pkg_attr_name = _name_parts[1]")
-        shim_blocks.append(
-            "                        if not hasattr(_mod, _pkg_attr_name):"
-        )
-        shim_blocks.append(
-            "                            setattr(_mod, _pkg_attr_name, _pkg_obj)"
-        )
-        shim_blocks.append("    # Register all modules under this package")
-        shim_blocks.append("    for _name in module_names:")
-        shim_blocks.append("        # Try to find module by transformed name first")
-        shim_blocks.append("        _module_obj = sys.modules.get(_name)")
-        shim_blocks.append("        if not _module_obj and name_mapping:")
-        shim_blocks.append("            # If not found, try to find by original name")
-        shim_blocks.append("            _original_name = name_mapping.get(_name)")
-        shim_blocks.append("            if _original_name:")
-        shim_blocks.append(
-            "                _module_obj = sys.modules.get(_original_name)"
-        )
-        shim_blocks.append("                if _module_obj:")
-        shim_blocks.append("                    # Register with transformed name")
-        shim_blocks.append("                    sys.modules[_name] = _module_obj")
-        shim_blocks.append("        # If still not found, use package module")
-        shim_blocks.append("        if not _module_obj:")
-        shim_blocks.append("            sys.modules[_name] = _mod")
-        shim_blocks.append("    # Set submodules as attributes on parent package")
-        shim_blocks.append("    for _name in module_names:")
-        shim_blocks.append(
-            "        if _name != pkg_name and _name.startswith(pkg_name + '.'):"
-        )
-        shim_blocks.append("            _submodule_name = _name.split('.')[-1]")
-        shim_blocks.append("            # Try to get actual module object")
-        shim_blocks.append("            _module_obj = sys.modules.get(_name)")
-        shim_blocks.append("            if not _module_obj and name_mapping:")
-        shim_blocks.append("                _original_name = name_mapping.get(_name)")
-        shim_blocks.append("                if _original_name:")
-        shim_blocks.append(
-            "                    _module_obj = sys.modules.get(_original_name)"
-        )
-        shim_blocks.append(
-            "            # Use actual module object if found, otherwise package"
-        )
-        shim_blocks.append("            _target = _module_obj if _module_obj else _mod")
-        shim_blocks.append("            if not hasattr(_mod, _submodule_name):")
-        shim_blocks.append("                setattr(_mod, _submodule_name, _target)")
-        shim_blocks.append(
-            "            elif isinstance(getattr(_mod, _submodule_name, None), "
-            "types.ModuleType):"
+        shim_blocks.extend(
+            _LAZY_PKG_SHIM_HELPERS if shim_attrs == "lazy" else _COPY_PKG_SHIM_HELPERS
         )
-        shim_blocks.append("                setattr(_mod, _submodule_name, _target)")
-        shim_blocks.append("")
 
         # First pass: Create all package modules and set up parent-child relationships
         shim_blocks.extend(
             f"_create_pkg_module({pkg_name!r})" for pkg_name in sorted_packages
         )
+        if startup_profiling:
+            shim_blocks.append(make_profile_probe("shims", "_create_pkg_module"))
 
         shim_blocks.append("")
 
@@ -3420,6 +4373,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
         # Second pass: Copy attributes and register modules
         # Process in any order since all modules are now created
         logger.trace("Packages dict: %s", packages)
+        pkg_registrations: list[tuple[str, list[str]]] = []
         for pkg_name in sorted_packages:
             logger.trace(
                 "Processing package %s (in packages dict: %s)",
@@ -3434,9 +4388,7 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                     pkg_name,
                 )
                 # Set up empty package - just register it
-                shim_blocks.append(
-                    f"_setup_pkg_modules({pkg_name!r}, [], {name_mapping_str})"
-                )
+                pkg_registrations.append((pkg_name, []))
                 continue
 
             # Sort module names for deterministic output
@@ -3457,16 +4409,32 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                 )
                 for name in module_names_for_pkg
             ]
-            module_names_str = ", ".join(repr(name) for name in full_module_names)
             logger.trace(
-                "Calling _setup_pkg_modules for %s with modules: %s",
+                "Registering package %s with modules: %s",
                 pkg_name,
                 full_module_names,
             )
+            pkg_registrations.append((pkg_name, full_module_names))
+
+        if shim_attrs == "lazy":
+            # One precomputed table, one call: startup cost no longer scales
+            # with globals x packages
+            shim_blocks.append("_SHIM_PACKAGES = (")
+            shim_blocks.extend(
+                f"    ({pkg_name!r}, {tuple(module_names)!r}),"
+                for pkg_name, module_names in pkg_registrations
+            )
+            shim_blocks.append(")")
             shim_blocks.append(
-                f"_setup_pkg_modules({pkg_name!r}, [{module_names_str}], "
-                f"{name_mapping_str})"
+                f"_setup_lazy_pkg_modules(_SHIM_PACKAGES, {name_mapping_str})"
             )
+        else:
+            for pkg_name, module_names in pkg_registrations:
+                module_names_str = ", ".join(repr(name) for name in module_names)
+                shim_blocks.append(
+                    f"_setup_pkg_modules({pkg_name!r}, [{module_names_str}], "
+                    f"{name_mapping_str})"
+                )
 
         # Handle top-level modules for flat mode
         if module_mode == "flat" and top_level_modules:
@@ -3555,13 +4523,19 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                         shim_blocks.append("        # __name__ not set yet, skip")
                         shim_blocks.append("        pass")
 
+        if startup_profiling:
+            setup_helper = (
+                "_setup_lazy_pkg_modules"
+                if shim_attrs == "lazy"
+                else "_setup_pkg_modules"
+            )
+            shim_blocks.append(make_profile_probe("shims", setup_helper))
         shim_text = "\n".join(shim_blocks)
 
     # Auto-rename collision handling (raw mode only)
     # After applying module_mode transformations and user's module_actions,
     # check if multiple functions exist with the same name as the main function.
     # If yes, and in raw mode, auto-rename others to main_1, main_2, etc.
-    stitch_mode = config.get("stitch_mode", "raw") if config else "raw"
     if (
         stitch_mode == "raw"
         and main_function_result is not None
@@ -3661,7 +4635,17 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                 selected_main_block.file_path,
             )
             # Use the selected block content
-            main_block = f"\n{selected_main_block.content}\n"
+            if stitch_mode == "exec":
+                exec_main_module = _exec_module_name(selected_main_block.module_name)
+                # Run the block in its own module's namespace, as __main__
+                main_block = (
+                    "\nif __name__ == '__main__':\n"
+                    f"    exec({selected_main_block.content!r}, "
+                    f"{{**vars(importlib.import_module({exec_main_module!r})), "
+                    "'__name__': '__main__'})\n"
+                )
+            else:
+                main_block = f"\n{selected_main_block.content}\n"
         elif main_function_result is not None:
             # No existing block found, but we have a main function
             # Generate our own __main__ block
@@ -3695,14 +4679,21 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
                         pass
 
             # Generate block based on parameters
+            # (exec mode: the function lives in its module, not in the script)
+            main_target = (
+                f"importlib.import_module({_exec_module_name(_module_path)!r})"
+                f".{function_name}"
+                if stitch_mode == "exec"
+                else function_name
+            )
             if has_params:
                 main_block = (
                     f"\nif __name__ == '__main__':\n"
-                    f"    sys.exit({function_name}(sys.argv[1:]))\n"
+                    f"    sys.exit({main_target}(sys.argv[1:]))\n"
                 )
             else:
                 main_block = (
-                    f"\nif __name__ == '__main__':\n    sys.exit({function_name}())\n"
+                    f"\nif __name__ == '__main__':\n    sys.exit({main_target}())\n"
                 )
             logger.info("__main__ block...........inserted")
         elif main_name is not None:
@@ -3719,21 +4710,60 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
 
     # Log commit value being written to script (for CI debugging)
     logger = getAppLogger()
-    logger.info(
-        "_build_final_script: Writing commit to script: %s (version=%s, build_date=%s)",
-        commit,
-        version,
-        build_date,
-    )
     logger.trace(
         "_build_final_script: Writing commit=%s, version=%s, build_date=%s",
         commit,
         version,
         build_date,
     )
-    if is_ci():
-        logger.info("Writing commit to script: %s", commit)
-        logger.trace("_build_final_script: CI mode: commit=%s", commit)
+
+    if stitch_mode == "exec":
+        # Package flags come from the source files when they line up with
+        # order_names; implicit parents are created by the loader either way
+        existing_paths = [p for p in order_paths or [] if p.exists()]
+        if len(existing_paths) == len(order_names):
+            package_flags = [p.name == "__init__.py" for p in existing_paths]
+        else:
+            package_flags = [
+                name.endswith(".__init__")
+                or any(other.startswith(f"{name}.") for other in order_names)
+                for name in order_names
+            ]
+        module_loading = (
+            config.get("module_loading", DEFAULT_MODULE_LOADING)
+            if config
+            else DEFAULT_MODULE_LOADING
+        )
+        body_text = _make_exec_modules_block(
+            list(zip(order_names, package_flags, strict=True)),
+            module_sources or {},
+            eager=module_loading == "eager",
+        )
+        if startup_profiling:
+            # Coarse: modules may load lazily or import each other
+            body_text += make_profile_probe("modules", "stitched modules") + "\n"
+    else:
+        section_texts = parts
+        if startup_profiling:
+            # Close each "# === module ===" section with a probe
+            section_texts = []
+            for part in parts:
+                header = re.search(r"^# === (.+) ===$", part, re.MULTILINE)
+                module_label = header.group(1) if header else "<module>"
+                section_texts.append(
+                    f"{part}{make_profile_probe('module', module_label)}\n"
+                )
+        body_text = (
+            "\n".join(section_texts) + "\n" + (f"{shim_text}\n" if shim_text else "")
+        )
+
+    profile_prelude = ""
+    imports_probe = ""
+    profile_report = ""
+    if startup_profiling:
+        profile_prelude = make_profile_prelude() + "\n"
+        imports_probe = make_profile_probe("imports", "hoisted imports") + "\n"
+        profile_report = "\n" + PROFILE_REPORT
 
     script_text = (
         "#!/usr/bin/env python3\n"
@@ -3761,7 +4791,9 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
         + "\n# noqa: E402\n"
         "\n"
         f"{future_block}\n"
+        f"{profile_prelude}"
         f"{import_block}\n"
+        f"{imports_probe}"
         "\n"
         # constants come *after* imports to avoid breaking __future__ rules
         f"__version__ = {json.dumps(version)}\n"
@@ -3772,17 +4804,108 @@ def _build_final_script(  # noqa: C901, PLR0912, PLR0913, PLR0915
         f"__STITCH_SOURCE__ = {json.dumps(PROGRAM_PACKAGE)}\n"
         f"__package__ = {json.dumps(package_name)}\n"
         "\n"
-        "\n"
-        + "\n".join(parts)
-        + "\n"
-        + (f"{shim_text}\n" if shim_text else "")
-        + f"{main_block}"
+        "\n" + body_text + f"{profile_report}{main_block}"
     )
 
     # Return script text and detected packages (sorted for consistency)
     return script_text, sorted(detected_packages)
 
 
+def _optimize_collected_imports(
+    all_imports: OrderedDict[str, None],
+    parts: list[str],
+    selected_main_block: MainBlock | None,
+) -> OrderedDict[str, None]:
+    """Run the hoisted-import optimizer and log what it changed.
+
+    Args:
+        all_imports: Hoisted imports collected from all modules
+        parts: Stitched module sections
+        selected_main_block: __main__ block that will be emitted (if any)
+
+    Returns:
+        Optimized imports, in output order
+    """
+    logger = getAppLogger()
+    body_sources = list(parts)
+    if selected_main_block is not None:
+        body_sources.append(selected_main_block.content)
+    result = optimize_hoisted_imports(all_imports, body_sources)
+    logger.info(
+        "Hoisted imports.........%d → %d statements (%d unused removed)",
+        len(all_imports),
+        len(result.imports),
+        len(result.removed),
+    )
+    return OrderedDict.fromkeys(result.imports)
+
+
+def _tree_shake_final_script(script_text: str, keep: list[str]) -> str:
+    """Drop unreachable definitions from the final script and report escapes."""
+    logger = getAppLogger()
+    try:
+        result = tree_shake_script(script_text, keep=keep)
+    except SyntaxError:
+        # Let the compile step report the error against the full script
+        logger.debug("tree_shake skipped: script does not parse")
+        return script_text
+
+    logger.info(
+        "Tree shaking removed %d definitions (%d -> %d bytes)",
+        len(result.removed),
+        len(script_text.encode("utf-8")),
+        len(result.script_text.encode("utf-8")),
+    )
+    for name in result.removed:
+        logger.debug("tree_shake: removed %s", name)
+    for name, modules in result.string_references.items():
+        logger.info(
+            "tree_shake: kept %s (string reference in %s)", name, ", ".join(modules)
+        )
+    if result.dropped_exports:
+        logger.warning(
+            "tree_shake removed %d names listed in __all__ "
+            "(add them to tree_shake_keep to export them): %s",
+            len(result.dropped_exports),
+            ", ".join(result.dropped_exports),
+        )
+    if result.dynamic_lookups:
+        logger.warning(
+            "tree_shake found %d dynamic name lookups; names reached only this "
+            "way may have been removed (add them to tree_shake_keep):\n  %s",
+            len(result.dynamic_lookups),
+            "\n  ".join(result.dynamic_lookups),
+        )
+    return result.script_text
+
+
+def _write_bytecode_cached_script(out_path: Path) -> None:
+    """Rewrite `out_path` as a self-caching loader followed by its program."""
+    logger = getAppLogger()
+    script_text = out_path.read_text(encoding="utf-8")
+    try:
+        wrapped = wrap_with_bytecode_cache(script_text)
+    except ValueError as e:
+        logger.warning("bytecode_cache skipped: %s", e)
+        return
+    verify_compiles_string(wrapped, filename=str(out_path))
+    out_path.write_text(wrapped, encoding="utf-8")
+    force_mtime_advance(out_path)
+    logger.debug("Wrapped output in bytecode-cached loader")
+
+
+def _write_zipapp(out_path: Path, python: str | None) -> None:
+    """Replace the stitched script at `out_path` with a zipapp holding it."""
+    logger = getAppLogger()
+    script_text = out_path.read_text(encoding="utf-8")
+    archive = build_zipapp(script_text, archive_name=out_path.name, python=python)
+    out_path.write_bytes(archive)
+    out_path.chmod(0o755)
+    force_mtime_advance(out_path)
+    logger.debug("Packaged output as zipapp (%d bytes)", len(archive))
+
+
+@timed()
 def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
     *,
     config: dict[str, object],
@@ -3937,6 +5060,74 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
         )
         raise ValueError(msg)
 
+    # Validate shim_attrs (how package shims expose stitched globals)
+    valid_shim_attrs = literal_to_set(ShimAttrsMode)
+    shim_attrs = config.get("shim_attrs", DEFAULT_SHIM_ATTRS)
+    if shim_attrs not in valid_shim_attrs:
+        msg = (
+            f"Invalid shim_attrs setting: {shim_attrs!r}. "
+            f"Must be one of: {', '.join(sorted(valid_shim_attrs))}"
+        )
+        raise ValueError(msg)
+
+    # Extract bytecode_cache (wrap the output in a self-caching loader)
+    bytecode_cache = config.get("bytecode_cache", DEFAULT_BYTECODE_CACHE)
+    if not isinstance(bytecode_cache, bool):
+        msg = "Config 'bytecode_cache' must be a boolean"
+        raise TypeError(msg)
+
+    # Extract startup_profiling (embed SERGER_PROFILE timing probes)
+    startup_profiling = config.get("startup_profiling", DEFAULT_STARTUP_PROFILING)
+    if not isinstance(startup_profiling, bool):
+        msg = "Config 'startup_profiling' must be a boolean"
+        raise TypeError(msg)
+
+    # Validate out_format (plain script or zipapp archive)
+    valid_out_formats = literal_to_set(OutFormat)
+    out_format = config.get("out_format", DEFAULT_OUT_FORMAT)
+    if out_format not in valid_out_formats:
+        msg = (
+            f"Invalid out_format setting: {out_format!r}. "
+            f"Must be one of: {', '.join(sorted(valid_out_formats))}"
+        )
+        raise ValueError(msg)
+    zipapp_python = config.get("zipapp_python")
+    if zipapp_python is not None and not isinstance(zipapp_python, str):
+        msg = "Config 'zipapp_python' must be a string"
+        raise TypeError(msg)
+    if out_format == "zipapp" and bytecode_cache:
+        # The archive already ships precompiled bytecode
+        msg = "bytecode_cache cannot be combined with out_format 'zipapp'"
+        raise ValueError(msg)
+
+    # Validate module_loading (when exec-mode modules execute)
+    valid_module_loading = literal_to_set(ModuleLoading)
+    module_loading = config.get("module_loading", DEFAULT_MODULE_LOADING)
+    if module_loading not in valid_module_loading:
+        msg = (
+            f"Invalid module_loading setting: {module_loading!r}. "
+            f"Must be one of: {', '.join(sorted(valid_module_loading))}"
+        )
+        raise ValueError(msg)
+    if module_loading == "lazy" and stitch_mode != "exec":
+        msg = f"module_loading 'lazy' requires stitch_mode 'exec' (got {stitch_mode!r})"
+        raise ValueError(msg)
+
+    # Extract tree_shake settings (drop unreachable top-level definitions)
+    tree_shake = config.get("tree_shake", DEFAULT_TREE_SHAKE)
+    if not isinstance(tree_shake, bool):
+        msg = "Config 'tree_shake' must be a boolean"
+        raise TypeError(msg)
+    tree_shake_keep_raw = config.get("tree_shake_keep", [])
+    if not isinstance(tree_shake_keep_raw, list):
+        msg = "Config 'tree_shake_keep' must be a list"
+        raise TypeError(msg)
+    tree_shake_keep = cast("list[str]", tree_shake_keep_raw)
+    if tree_shake and stitch_mode != "raw":
+        # Other modes keep one namespace per module
+        msg = f"tree_shake requires stitch_mode 'raw' (got {stitch_mode!r})"
+        raise ValueError(msg)
+
     # Extract module_actions from config (already normalized in RootConfigResolved)
     module_actions_raw = config.get("module_actions", [])
     if not isinstance(module_actions_raw, list):
@@ -3946,10 +5137,10 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
     module_actions = cast("list[ModuleActionFull]", module_actions_raw)
 
     # Check if non-raw modes are implemented
-    if stitch_mode != "raw":
+    if stitch_mode not in ("raw", "exec"):
         msg = (
             f"stitch_mode '{stitch_mode}' is not yet implemented. "
-            "Only 'raw' mode is currently supported."
+            "Only 'raw' and 'exec' modes are currently supported."
         )
         raise NotImplementedError(msg)
 
@@ -4075,11 +5266,31 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
             # Actions reference package names (e.g., "pkg1"), but we need to
             # check file paths to see if they belong to deleted packages
             deleted_sources: set[str] = set()
+            pattern_deletes: list[ModuleActionFull] = []
             for action in stitching_actions:
                 action_type = action.get("action", "move")
                 if action_type == "delete":
                     source = action["source"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
-                    deleted_sources.add(source)
+                    if is_module_pattern(source):
+                        pattern_deletes.append(action)
+                    else:
+                        deleted_sources.add(source)
+
+            # Pattern deletes match module names, not file paths
+            if pattern_deletes:
+                delete_plan = compile_module_actions(pattern_deletes)
+                deleted_files = {
+                    file_path
+                    for module_name, file_path in module_to_file_for_filtering.items()
+                    if not delete_plan.resolve(module_name)
+                }
+                logger.debug(
+                    "Filtering files: excluding %d file(s) matched by delete "
+                    "patterns: %s",
+                    len(deleted_files),
+                    [a.get("source") for a in pattern_deletes],
+                )
+                order_paths = [p for p in order_paths if p not in deleted_files]
 
             # Filter order_paths to exclude files belonging to deleted packages
             if deleted_sources:
@@ -4176,6 +5387,17 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
         raise TypeError(msg)
     internal_imports = cast("InternalImportMode", internal_imports_raw)
 
+    # exec mode runs every module in its own namespace, so each module must
+    # keep its imports exactly where they are
+    if stitch_mode == "exec" and (
+        external_imports != "keep" or internal_imports != "keep"
+    ):
+        msg = (
+            "stitch_mode 'exec' requires external_imports and internal_imports "
+            f"to be 'keep' (got {external_imports!r} and {internal_imports!r})"
+        )
+        raise ValueError(msg)
+
     # Extract comments_mode from config
     comments_mode_raw = config.get("comments_mode", DEFAULT_COMMENTS_MODE)
     if not isinstance(comments_mode_raw, str):
@@ -4191,6 +5413,18 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
         raise TypeError(msg)
     docstring_mode = cast("DocstringMode", docstring_mode_raw)
 
+    # Extract optimize_imports (merge, prune and sort hoisted imports)
+    optimize_imports = config.get("optimize_imports", DEFAULT_OPTIMIZE_IMPORTS)
+    if not isinstance(optimize_imports, bool):
+        msg = "Config 'optimize_imports' must be a boolean"
+        raise TypeError(msg)
+
+    # Extract lean_mode (strip annotations and TYPE_CHECKING-only code)
+    lean_mode = config.get("lean_mode", DEFAULT_LEAN_MODE)
+    if not isinstance(lean_mode, bool):
+        msg = "Config 'lean_mode' must be a boolean"
+        raise TypeError(msg)
+
     # source_bases already extracted above (before package detection)
     module_sources, all_imports, parts, derived_module_names = _collect_modules(
         order_paths,
@@ -4204,7 +5438,11 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
         docstring_mode,
         source_bases=source_bases,
         user_provided_source_bases=user_provided_source_bases,
+        lean_mode=lean_mode,
     )
+    record_size("module_sources", module_sources)
+    record_size("parts", parts)
+    record_size("all_imports", all_imports)
 
     # --- Parse AST once for all modules ---
     # Extract symbols (functions, classes, assignments) from all modules
@@ -4252,8 +5490,27 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
             ignore_functions.add(main_function_name)
 
     # --- Collision Detection ---
-    logger.debug("Detecting name collisions...")
-    detect_name_collisions(module_symbols, ignore_functions=ignore_functions)
+    # (exec mode keeps one namespace per module, so names cannot collide)
+    if stitch_mode != "exec":
+        logger.debug("Detecting name collisions...")
+        detect_name_collisions(module_symbols, ignore_functions=ignore_functions)
+    else:
+        # Modules run on import, so import-time cycles matter again
+        for cycle in find_eager_import_cycles(
+            order_paths,
+            package_root,
+            file_to_include,
+            detected_packages=detected_packages,
+            source_bases=source_bases,
+            user_provided_source_bases=user_provided_source_bases,
+        ):
+            logger.warning(
+                "Modules import each other at import time: %s. "
+                "With stitch_mode 'exec' one of them will see the others "
+                "partially initialized; move an import into a function if "
+                "this fails at runtime.",
+                ", ".join(cycle),
+            )
 
     # --- __main__ Block Detection ---
     # Detect all __main__ blocks from original file paths (before stripping)
@@ -4292,6 +5549,13 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
                 block.file_path,
             )
 
+    # --- Hoisted Import Optimization ---
+    # (exec mode modules keep their own imports; only the loader's are hoisted)
+    if optimize_imports and stitch_mode != "exec":
+        all_imports = _optimize_collected_imports(
+            all_imports, parts, selected_main_block
+        )
+
     # --- Final Assembly ---
     # Extract display configuration
     display_name_raw = config.get("display_name", "")
@@ -4337,6 +5601,20 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
         module_sources=module_sources,
         source_bases=source_bases,
     )
+    record_size("final_script", final_script)
+
+    # --- Tree shaking ---
+    if tree_shake:
+        has_entry_point = (
+            main_function_result is not None or selected_main_block is not None
+        )
+        if not has_entry_point and not tree_shake_keep:
+            logger.warning(
+                "tree_shake skipped: no main function, __main__ block or "
+                "tree_shake_keep names to start from"
+            )
+        else:
+            final_script = _tree_shake_final_script(final_script, tree_shake_keep)
 
     # --- Verification ---
     logger.debug("Verifying assembled script...")
@@ -4347,7 +5625,8 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
     # --- Compile in-memory before writing ---
     logger.debug("Compiling stitched code in-memory...")
     try:
-        verify_compiles_string(final_script, filename=str(out_path))
+        with span("verify_compiles_string"):
+            verify_compiles_string(final_script, filename=str(out_path))
     except SyntaxError as e:
         # Compilation failed - write error file and raise
         logger.exception("Stitched code does not compile")
@@ -4379,6 +5658,15 @@ def stitch_modules(  # noqa: PLR0915, PLR0912, PLR0913, C901
     # failures - it will revert and continue
     post_stitch_processing(out_path, post_processing=post_processing)
 
+    # Bytecode cache: wrap the final (post-processed) script in a loader.
+    # Done last so formatters never touch the commented-out program.
+    if bytecode_cache:
+        _write_bytecode_cached_script(out_path)
+
+    # Zipapp: package the final script with bytecode compiled for the target
+    if out_format == "zipapp":
+        _write_zipapp(out_path, zipapp_python)
+
     logger.info(
         "Successfully stitched %d modules into %s",
         len(parts),
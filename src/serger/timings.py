@@ -0,0 +1,683 @@
+# src/serger/timings.py
+"""Lightweight spans for build timing (`--timings`, `--timings-json`,
+`--trace-out`).
+
+Code marks a phase with `with span("name"):` or the `@timed()` decorator.
+Spans are only recorded while a `SpanRecorder` is active (see
+`recording()`); otherwise `span()` returns a shared no-op context manager,
+so an instrumented call costs one context-variable lookup.
+
+The active recorder and the current span path live in context variables:
+they follow asyncio tasks, and `BuildScheduler` copies the context into its
+worker threads, so background tasks are recorded too.
+
+Inside `memory_accounting()` (`--memory-report`, `memory_budget_mb`),
+spans also record `tracemalloc` memory at entry, peak and exit, and
+`record_size()` measures named data structures of the pipeline.
+tracemalloc's peak is process-wide, so only spans on the thread that
+started tracing measure memory; spans on other threads (scheduler workers,
+concurrent builds) are recorded without it. Their allocations still count
+towards the measured spans open meanwhile, so per-phase peaks are only
+approximate while other threads run.
+
+`timings_to_chrome_trace()` exports the spans in the Chrome trace-event
+format, loadable in Perfetto (ui.perfetto.dev) or chrome://tracing: one lane
+per process and thread, so worker-pool builds show up side by side.
+"""
+
+import ast
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+_active_recorder: ContextVar["SpanRecorder | None"] = ContextVar(
+    "serger_span_recorder", default=None
+)
+# Names of the open spans, outermost first
+_span_path: ContextVar[tuple[str, ...]] = ContextVar("serger_span_path", default=())
+# Whether spans record tracemalloc memory (see memory_accounting())
+_memory_on: ContextVar[bool] = ContextVar("serger_memory_on", default=False)
+# Highest traced memory seen so far inside the innermost open span; spans
+# reset tracemalloc's peak on entry, so they hand their peak up to the parent
+_memory_peak: ContextVar[list[int] | None] = ContextVar(
+    "serger_memory_peak", default=None
+)
+# Thread whose spans measure memory (the one that started tracing); spans
+# reset tracemalloc's process-wide peak, which only one thread may do
+_memory_owner: int | None = None
+_memory_owner_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed region.
+
+    Attributes:
+        name: Span name (usually the instrumented function)
+        path: Names of the enclosing spans, outermost first, ending with name
+        start: `time.perf_counter()` at entry (comparable across processes
+            on the same machine)
+        duration: Seconds spent inside the span
+        pid: Process that recorded the span
+        thread: Thread identifier that recorded the span
+        thread_name: Name of that thread
+        category: Kind of span ("phase", "module", "tool", "subprocess", ...)
+        args: Extra details shown with the span in trace viewers
+        mem_start: Traced bytes at entry (None unless accounting memory)
+        mem_peak: Highest traced bytes while the span was open
+        mem_end: Traced bytes at exit
+    """
+
+    name: str
+    path: tuple[str, ...]
+    start: float
+    duration: float
+    pid: int
+    thread: int
+    thread_name: str = ""
+    category: str = "phase"
+    args: dict[str, str] = field(
+        default_factory=dict[str, str], compare=False, hash=False
+    )
+    mem_start: int | None = None
+    mem_peak: int | None = None
+    mem_end: int | None = None
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+    @property
+    def mem_growth(self) -> int | None:
+        """Peak bytes allocated above what was live at entry."""
+        if self.mem_peak is None or self.mem_start is None:
+            return None
+        return self.mem_peak - self.mem_start
+
+    @property
+    def mem_retained(self) -> int | None:
+        """Bytes still allocated at exit that were not live at entry."""
+        if self.mem_end is None or self.mem_start is None:
+            return None
+        return self.mem_end - self.mem_start
+
+    def to_dict(self, origin: float = 0.0) -> dict[str, object]:
+        """Return a JSON-friendly dict, with times in ms relative to origin."""
+        return {
+            "name": self.name,
+            "path": "/".join(self.path),
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+            "pid": self.pid,
+            "thread": self.thread,
+            "category": self.category,
+            **self.memory_dict(),
+        }
+
+    def memory_dict(self) -> dict[str, int]:
+        """Return peak growth and retained bytes (empty without accounting)."""
+        growth, retained = self.mem_growth, self.mem_retained
+        if growth is None or retained is None:
+            return {}
+        return {"mem_peak_bytes": growth, "mem_retained_bytes": retained}
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counts of one cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that hit (0.0 when there were none)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+@dataclass(frozen=True)
+class CriticalPath:
+    """Main-thread timeline of one build (see BuildScheduler.critical_path()).
+
+    Attributes:
+        build: Build label (package → output)
+        elapsed: Wall-clock seconds of the build
+        steps: (label, seconds) in order; waits on background tasks are
+            "wait:<task>"
+    """
+
+    build: str
+    elapsed: float
+    steps: tuple[tuple[str, float], ...]
+
+    def format_steps(self) -> str:
+        return " → ".join(
+            f"{label} {seconds * 1000:.1f}ms" for label, seconds in self.steps
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "build": self.build,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "steps": [
+                {"name": label, "ms": round(seconds * 1000, 3)}
+                for label, seconds in self.steps
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class SizeSample:
+    """Deep size of a named data structure, measured by `record_size()`.
+
+    Attributes:
+        name: What was measured (e.g. "module_sources")
+        size: Approximate bytes held by the object and everything it contains
+        path: Names of the spans open when it was measured
+    """
+
+    name: str
+    size: int
+    path: tuple[str, ...]
+
+
+@dataclass
+class SpanRecorder:
+    """Collects spans and cache counters while active.
+
+    Attributes:
+        origin: `time.perf_counter()` when the recorder was created
+        pid: Process that created the recorder (the main lane in traces)
+        spans: Finished spans, in completion order (children first)
+        caches: Cache counters by cache name
+        sizes: Data structure sizes from `record_size()`, in recording order
+        critical_paths: Main-thread timeline of each build, in finishing order
+    """
+
+    origin: float = field(default_factory=time.perf_counter)
+    pid: int = field(default_factory=os.getpid)
+    spans: list[Span] = field(default_factory=list[Span])
+    caches: dict[str, CacheStats] = field(default_factory=dict[str, CacheStats])
+    sizes: list[SizeSample] = field(default_factory=list[SizeSample])
+    critical_paths: list[CriticalPath] = field(default_factory=list[CriticalPath])
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def add_size(self, sample: SizeSample) -> None:
+        with self._lock:
+            self.sizes.append(sample)
+
+    def add_critical_path(self, path: CriticalPath) -> None:
+        with self._lock:
+            self.critical_paths.append(path)
+
+    def merge(
+        self,
+        spans: list[Span],
+        caches: dict[str, CacheStats],
+        sizes: list[SizeSample] | None = None,
+        critical_paths: list[CriticalPath] | None = None,
+    ) -> None:
+        """Add spans, caches and sizes recorded elsewhere (e.g. a subprocess)."""
+        with self._lock:
+            self.spans.extend(spans)
+            self.sizes.extend(sizes or [])
+            self.critical_paths.extend(critical_paths or [])
+            for name, stats in caches.items():
+                mine = self.caches.setdefault(name, CacheStats())
+                mine.hits += stats.hits
+                mine.misses += stats.misses
+
+    def count_cache(self, name: str, *, hit: bool) -> None:
+        with self._lock:
+            stats = self.caches.setdefault(name, CacheStats())
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def cache_snapshot(self) -> dict[str, tuple[int, int]]:
+        """Return current (hits, misses) per cache, for `caches_since()`."""
+        with self._lock:
+            return {name: (s.hits, s.misses) for name, s in self.caches.items()}
+
+    def caches_since(
+        self, snapshot: dict[str, tuple[int, int]]
+    ) -> dict[str, CacheStats]:
+        """Return the cache lookups made after `snapshot` was taken."""
+        delta: dict[str, CacheStats] = {}
+        with self._lock:
+            for name, stats in self.caches.items():
+                hits, misses = snapshot.get(name, (0, 0))
+                if stats.hits != hits or stats.misses != misses:
+                    delta[name] = CacheStats(stats.hits - hits, stats.misses - misses)
+        return delta
+
+
+def current_recorder() -> SpanRecorder | None:
+    """Return the active recorder, or None when timing is off."""
+    return _active_recorder.get()
+
+
+@contextmanager
+def recording(recorder: SpanRecorder | None = None) -> Iterator[SpanRecorder]:
+    """Activate `recorder` (or a new one) for the duration of the block."""
+    active = recorder if recorder is not None else SpanRecorder()
+    token = _active_recorder.set(active)
+    try:
+        yield active
+    finally:
+        _active_recorder.reset(token)
+
+
+def memory_accounting_enabled() -> bool:
+    """Return whether spans currently record memory."""
+    return _memory_on.get()
+
+
+@contextmanager
+def memory_accounting() -> Iterator[None]:
+    """Record `tracemalloc` memory in spans and sizes for the block.
+
+    Starts `tracemalloc` if it is not running (and stops it again after), so
+    allocations made before the block are not traced. Tracing slows Python
+    code down noticeably; only the peak and current totals are read, so no
+    tracebacks are kept beyond one frame.
+
+    Spans measure memory on this thread only, and not at all if another
+    thread is already accounting memory (see the module docstring).
+    """
+    global _memory_owner  # noqa: PLW0603
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    with _memory_owner_lock:
+        owns = _memory_owner is None
+        if owns:
+            _memory_owner = threading.get_ident()
+    token = _memory_on.set(True)
+    try:
+        yield
+    finally:
+        _memory_on.reset(token)
+        if owns:
+            with _memory_owner_lock:
+                _memory_owner = None
+        if started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def _recorded_span(
+    recorder: SpanRecorder,
+    name: str,
+    category: str = "phase",
+    args: dict[str, str] | None = None,
+) -> Iterator[None]:
+    path = (*_span_path.get(), name)
+    token = _span_path.set(path)
+    memory = (
+        _memory_on.get()
+        and _memory_owner == threading.get_ident()
+        and tracemalloc.is_tracing()
+    )
+    if memory:
+        mem_start, outer_peak = tracemalloc.get_traced_memory()
+        parent_peak = _memory_peak.get()
+        if parent_peak is not None:
+            parent_peak[0] = max(parent_peak[0], outer_peak)
+        peak = [mem_start]
+        peak_token = _memory_peak.set(peak)
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        _span_path.reset(token)
+        mem_fields: tuple[int | None, int | None, int | None] = (None, None, None)
+        if memory:
+            mem_end, inner_peak = tracemalloc.get_traced_memory()
+            peak[0] = max(peak[0], inner_peak)
+            _memory_peak.reset(peak_token)
+            if parent_peak is not None:
+                parent_peak[0] = max(parent_peak[0], peak[0])
+            mem_fields = (mem_start, peak[0], mem_end)
+        thread = threading.current_thread()
+        recorder.add(
+            Span(
+                name,
+                path,
+                start,
+                duration,
+                os.getpid(),
+                threading.get_ident(),
+                thread.name,
+                category,
+                args or {},
+                *mem_fields,
+            )
+        )
+
+
+def span(
+    name: str,
+    *,
+    category: str = "phase",
+    args: dict[str, str] | None = None,
+) -> AbstractContextManager[None]:
+    """Time the enclosed block as `name` (a no-op unless recording).
+
+    Args:
+        name: Span name
+        category: Kind of span, used to colour and filter trace events
+        args: Extra details (e.g. a file path or command) for trace viewers
+    """
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return _NO_SPAN
+    return _recorded_span(recorder, name, category, args)
+
+
+def timed(name: str | None = None, *, category: str = "phase") -> Callable[[_F], _F]:
+    """Decorator: time every call as a span (default name: the function's)."""
+
+    def decorator(func: _F) -> _F:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _active_recorder.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _recorded_span(recorder, span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_cache(name: str, *, hit: bool) -> None:
+    """Count a lookup in cache `name` (a no-op unless recording)."""
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        recorder.count_cache(name, hit=hit)
+
+
+def _deep_sizeof(obj: object) -> int:
+    """Approximate bytes held by `obj` and the containers/AST nodes in it.
+
+    Each object is counted once, however often it is referenced.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())  # pyright: ignore[reportUnknownArgumentType]
+            stack.extend(item.values())  # pyright: ignore[reportUnknownArgumentType]
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)  # pyright: ignore[reportUnknownArgumentType]
+        elif isinstance(item, ast.AST):
+            stack.extend(vars(item).values())
+    return total
+
+
+def record_size(name: str, obj: object) -> None:
+    """Record the deep size of `obj` as `name` (no-op unless accounting)."""
+    recorder = _active_recorder.get()
+    if recorder is None or not _memory_on.get():
+        return
+    recorder.add_size(SizeSample(name, _deep_sizeof(obj), _span_path.get()))
+
+
+# --------------------------------------------------------------------------- #
+# Reports
+# --------------------------------------------------------------------------- #
+
+
+# Categories summed into one row in tables and totals (one span per module
+# would drown the phases); traces still show every span
+_GROUPED_CATEGORIES = {"module": "[modules]"}
+
+
+def _grouped_path(s: Span) -> tuple[str, ...]:
+    if s.category in _GROUPED_CATEGORIES:
+        return (*s.path[:-1], _GROUPED_CATEGORIES[s.category])
+    return s.path
+
+
+def _aggregate_spans(
+    spans: list[Span],
+) -> list[tuple[tuple[str, ...], int, float]]:
+    """Sum spans by path; return (path, calls, seconds) in tree order."""
+    first_start: dict[tuple[str, ...], float] = {}
+    totals: dict[tuple[str, ...], tuple[int, float]] = {}
+    for s in spans:
+        path = _grouped_path(s)
+        first_start[path] = min(first_start.get(path, s.start), s.start)
+        calls, seconds = totals.get(path, (0, 0.0))
+        totals[path] = (calls + 1, seconds + s.duration)
+
+    # Parents start before their children; siblings in start order
+    def sort_key(path: tuple[str, ...]) -> tuple[float, ...]:
+        return tuple(first_start.get(path[: i + 1], 0.0) for i in range(len(path)))
+
+    return [(path, *totals[path]) for path in sorted(totals, key=sort_key)]
+
+
+def format_timings_table(recorder: SpanRecorder) -> str:
+    """Render spans, build critical paths and cache counters as a table."""
+    rows = _aggregate_spans(recorder.spans)
+    wall = max((s.start + s.duration for s in recorder.spans), default=recorder.origin)
+    total = wall - recorder.origin
+    lines = [
+        f"⏱️  Timings ({total * 1000:.1f} ms wall)",
+        f"{'ms':>10}  {'%':>5}  {'calls':>5}  span",
+    ]
+    for path, calls, seconds in rows:
+        share = seconds / total * 100 if total else 0.0
+        indent = "  " * (len(path) - 1)
+        lines.append(
+            f"{seconds * 1000:10.1f}  {share:5.1f}  {calls:5d}  {indent}{path[-1]}"
+        )
+    lines.extend(
+        f"critical path, {path.build} ({path.elapsed * 1000:.1f} ms): "
+        f"{path.format_steps() or '-'}"
+        for path in recorder.critical_paths
+    )
+    if recorder.caches:
+        caches = ", ".join(
+            f"{name} {stats.hits}/{stats.lookups} hits ({stats.hit_ratio:.0%})"
+            for name, stats in sorted(recorder.caches.items())
+        )
+        lines.append(f"caches: {caches}")
+    return "\n".join(lines)
+
+
+def _aggregate_memory(
+    spans: list[Span],
+) -> list[tuple[tuple[str, ...], int, int]]:
+    """Return (path, peak growth, retained bytes) per path, in tree order.
+
+    Peak growth is the largest of the path's spans; retained bytes are summed.
+    """
+    memory: dict[tuple[str, ...], tuple[int, int]] = {}
+    for s in spans:
+        growth, retained = s.mem_growth, s.mem_retained
+        if growth is None or retained is None:
+            continue
+        path = _grouped_path(s)
+        peak, kept = memory.get(path, (0, 0))
+        memory[path] = (max(peak, growth), kept + retained)
+    return [
+        (path, *memory[path])
+        for path, _calls, _seconds in _aggregate_spans(spans)
+        if path in memory
+    ]
+
+
+def _largest_sizes(sizes: list[SizeSample]) -> list[tuple[SizeSample, int]]:
+    """Return the largest sample and its sample count per name, largest first."""
+    largest: dict[str, tuple[SizeSample, int]] = {}
+    for sample in sizes:
+        best, count = largest.get(sample.name, (sample, 0))
+        largest[sample.name] = (max(best, sample, key=lambda x: x.size), count + 1)
+    return sorted(largest.values(), key=lambda item: -item[0].size)
+
+
+def _mb(size: int) -> float:
+    return size / (1024 * 1024)
+
+
+def format_memory_table(recorder: SpanRecorder) -> str:
+    """Render per-span peak/retained memory and the largest data structures."""
+    rows = _aggregate_memory(recorder.spans)
+    overall = max((peak for _path, peak, _kept in rows), default=0)
+    lines = [
+        f"🧠 Memory (peak {_mb(overall):.1f} MB traced)",
+        f"{'peak MB':>10}  {'kept MB':>10}  span",
+    ]
+    for path, peak, kept in rows:
+        indent = "  " * (len(path) - 1)
+        lines.append(f"{_mb(peak):10.2f}  {_mb(kept):10.2f}  {indent}{path[-1]}")
+    largest = _largest_sizes(recorder.sizes)
+    if largest:
+        lines.append(f"{'MB':>10}  {'samples':>10}  largest data structures")
+        for sample, count in largest:
+            where = sample.path[-1] if sample.path else "-"
+            lines.append(
+                f"{_mb(sample.size):10.2f}  {count:10d}  {sample.name} (in {where})"
+            )
+    return "\n".join(lines)
+
+
+def memory_to_dict(recorder: SpanRecorder) -> dict[str, Any]:
+    """Return per-path memory and the largest data structures as a dict."""
+    return {
+        "phases": [
+            {"path": "/".join(path), "peak_bytes": peak, "retained_bytes": kept}
+            for path, peak, kept in _aggregate_memory(recorder.spans)
+        ],
+        "largest": [
+            {
+                "name": sample.name,
+                "bytes": sample.size,
+                "samples": count,
+                "path": "/".join(sample.path),
+            }
+            for sample, count in _largest_sizes(recorder.sizes)
+        ],
+    }
+
+
+def timings_to_dict(recorder: SpanRecorder) -> dict[str, Any]:
+    """Return recorded spans, per-path totals and cache counters as a dict."""
+    origin = recorder.origin
+    return {
+        "spans": [
+            s.to_dict(origin) for s in sorted(recorder.spans, key=lambda s: s.start)
+        ],
+        "totals": [
+            {
+                "path": "/".join(path),
+                "calls": calls,
+                "total_ms": round(seconds * 1000, 3),
+            }
+            for path, calls, seconds in _aggregate_spans(recorder.spans)
+        ],
+        "caches": {
+            name: stats.to_dict() for name, stats in sorted(recorder.caches.items())
+        },
+        "critical_paths": [path.to_dict() for path in recorder.critical_paths],
+    }
+
+
+def timings_to_chrome_trace(recorder: SpanRecorder) -> dict[str, Any]:
+    """Return recorded spans as a Chrome trace-event document.
+
+    Every span becomes a complete ("X") event with its start and duration in
+    microseconds since the recorder's origin. Metadata events name one
+    process lane per pid (the recording process first, then build workers)
+    and one thread lane per thread, so Perfetto shows parallel work side by
+    side.
+    """
+    origin = recorder.origin
+    spans = sorted(recorder.spans, key=lambda s: (s.start, -s.duration))
+    events: list[dict[str, Any]] = []
+
+    pids = sorted(
+        {s.pid for s in spans} | {recorder.pid}, key=lambda p: (p != recorder.pid, p)
+    )
+    for index, pid in enumerate(pids):
+        label = "serger" if pid == recorder.pid else f"serger worker {index}"
+        events.append(
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}}
+        )
+        events.append(
+            {
+                "name": "process_sort_index",
+                "ph": "M",
+                "pid": pid,
+                "args": {"sort_index": index},
+            }
+        )
+    threads = {(s.pid, s.thread): s.thread_name for s in spans if s.thread_name}
+    for (pid, tid), thread_name in sorted(threads.items()):
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+        )
+
+    events.extend(
+        {
+            "name": s.name,
+            "cat": s.category,
+            "ph": "X",
+            "ts": round((s.start - origin) * 1_000_000, 3),
+            "dur": round(s.duration * 1_000_000, 3),
+            "pid": s.pid,
+            "tid": s.thread,
+            "args": {"path": "/".join(s.path), **s.args, **s.memory_dict()},
+        }
+        for s in spans
+    )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -0,0 +1,455 @@
+# src/serger/tree_shake.py
+"""Dead-code elimination (tree shaking) for stitched scripts.
+
+In raw stitch mode every module shares one namespace, so the stitched script
+is a single flat set of top-level names. Tree shaking walks that set starting
+from the code that always runs (the `__main__` block, module-level
+statements, shims) plus any names the user keeps, and drops top-level
+functions, classes, constants and imports that nothing reaches.
+
+Only definitions without import-time side effects are candidates: calls in a
+constant's value, decorators outside a small known-pure set, a metaclass, a
+base class that is not provably plain (it may register subclasses from
+`__init_subclass__`) or an import done for its side effects (`readline`)
+keep a statement in place. Names reached dynamically (string references such
+as `getattr(obj, "name")`) are kept and reported; lookups that cannot be
+resolved statically (`globals()`, `getattr` with a computed name, `eval`)
+are reported so the affected names can be listed in `tree_shake_keep`.
+"""
+
+import ast
+import builtins
+import re
+from dataclasses import dataclass, field
+
+from .constants import SIDE_EFFECT_IMPORT_MODULES
+
+
+# Decorators known not to have import-time side effects beyond wrapping
+_PURE_DECORATORS = frozenset(
+    {
+        "abstractmethod",
+        "cache",
+        "cached_property",
+        "classmethod",
+        "dataclass",
+        "final",
+        "lru_cache",
+        "overload",
+        "override",
+        "property",
+        "runtime_checkable",
+        "staticmethod",
+        "total_ordering",
+        "wraps",
+    }
+)
+
+# Base classes known not to run code when subclassed (besides builtin types)
+_PLAIN_BASES = frozenset(
+    {
+        "ABC",
+        "Enum",
+        "Flag",
+        "Generic",
+        "IntEnum",
+        "IntFlag",
+        "NamedTuple",
+        "Protocol",
+        "StrEnum",
+        "TypedDict",
+    }
+)
+
+# Builtins that look names up dynamically
+_DYNAMIC_LOOKUPS = frozenset(
+    {"__import__", "delattr", "eval", "exec", "getattr", "globals", "hasattr", "vars"}
+)
+_ATTR_LOOKUPS = frozenset({"delattr", "getattr", "hasattr", "setattr"})
+
+_MODULE_HEADER_RE = re.compile(r"^# === (.+) ===$")
+_SHIM_MARKER = "# --- import shims for stitched runtime ---"
+
+
+@dataclass
+class TreeShakeResult:
+    """Outcome of tree shaking a stitched script.
+
+    Attributes:
+        script_text: The script with unreachable definitions removed
+        removed: Removed definitions as "module.name" (or the bare name
+            outside module sections)
+        string_references: Names kept only because a string mentions them,
+            mapped to the modules containing those strings
+        dynamic_lookups: Unresolvable dynamic lookups, as
+            "module (line N): description"
+        dropped_exports: Removed names that an `__all__` listed
+    """
+
+    script_text: str
+    removed: list[str] = field(default_factory=list)
+    string_references: dict[str, list[str]] = field(default_factory=dict)
+    dynamic_lookups: list[str] = field(default_factory=list)
+    dropped_exports: list[str] = field(default_factory=list)
+
+
+def _is_dunder(name: str) -> bool:
+    return name.startswith("__") and name.endswith("__") and len(name) > 4  # noqa: PLR2004
+
+
+def _decorator_name(node: ast.expr) -> str | None:
+    while isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def _has_side_effects(node: ast.AST) -> bool:
+    return any(
+        isinstance(n, (ast.Call, ast.Await, ast.Yield, ast.YieldFrom, ast.NamedExpr))
+        for n in ast.walk(node)
+    )
+
+
+def _target_names(target: ast.expr) -> list[str] | None:
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        names: list[str] = []
+        for elt in target.elts:
+            sub = _target_names(elt)
+            if sub is None:
+                return None
+            names.extend(sub)
+        return names
+    return None
+
+
+def _import_bindings(stmt: ast.Import | ast.ImportFrom) -> list[str] | None:
+    if isinstance(stmt, ast.ImportFrom) and (
+        stmt.module == "__future__" or any(a.name == "*" for a in stmt.names)
+    ):
+        return None
+    if isinstance(stmt, ast.Import):
+        return [a.asname or a.name.split(".")[0] for a in stmt.names]
+    return [a.asname or a.name for a in stmt.names]
+
+
+def _imports_for_side_effects(stmt: ast.Import | ast.ImportFrom) -> bool:
+    if isinstance(stmt, ast.Import):
+        modules = [alias.name for alias in stmt.names]
+    else:
+        modules = [stmt.module or ""]
+    return any(m.split(".")[0] in SIDE_EFFECT_IMPORT_MODULES for m in modules)
+
+
+def _base_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Subscript):  # Generic[T], Protocol[T]
+        node = node.value
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def _classes_with_creation_hooks(stmts: list[ast.stmt]) -> set[int]:
+    """Return the top-level classes whose creation may run code.
+
+    Creating a subclass calls the bases' `__init_subclass__` (e.g. a plugin
+    registry), so a class is only removable if every base is provably plain:
+    a builtin type, a known stdlib base, or a class defined earlier in the
+    script that is itself plain, defines no `__init_subclass__` and takes no
+    class keywords (metaclass=...).
+    """
+    script_classes = {stmt.name for stmt in stmts if isinstance(stmt, ast.ClassDef)}
+    plain: set[str] = set()
+    hooked: set[int] = set()
+
+    def is_plain_base(node: ast.expr) -> bool:
+        name = _base_name(node)
+        if name is None:
+            return False
+        if name in script_classes:
+            return name in plain
+        return name in _PLAIN_BASES or isinstance(getattr(builtins, name, None), type)
+
+    for idx, stmt in enumerate(stmts):
+        if not isinstance(stmt, ast.ClassDef):
+            continue
+        if not all(is_plain_base(base) for base in stmt.bases):
+            hooked.add(idx)
+        defines_hook = any(
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == "__init_subclass__"
+            for node in stmt.body
+        )
+        if idx in hooked or stmt.keywords or defines_hook:
+            plain.discard(stmt.name)
+        else:
+            plain.add(stmt.name)
+    return hooked
+
+
+def _definitions(stmt: ast.stmt) -> list[str] | None:  # noqa: PLR0911
+    """Return the names a removable statement binds, or None to always keep it."""
+    names: list[str] | None = None
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        if any(_decorator_name(d) not in _PURE_DECORATORS for d in stmt.decorator_list):
+            return None
+        if isinstance(stmt, ast.ClassDef) and stmt.keywords:
+            # metaclass=... (or __init_subclass__ arguments) may register it
+            return None
+        names = [stmt.name]
+    elif isinstance(stmt, ast.Assign):
+        if _has_side_effects(stmt.value):
+            return None
+        names = []
+        for target in stmt.targets:
+            sub = _target_names(target)
+            if sub is None:
+                return None
+            names.extend(sub)
+    elif isinstance(stmt, ast.AnnAssign):
+        if not isinstance(stmt.target, ast.Name) or _has_side_effects(stmt):
+            return None
+        names = [stmt.target.id]
+    elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+        if _imports_for_side_effects(stmt):
+            return None
+        names = _import_bindings(stmt)
+    if not names or any(_is_dunder(n) and n != "__all__" for n in names):
+        return None
+    return names
+
+
+def _describe_dynamic_lookup(node: ast.Call) -> str | None:
+    func = node.func
+    name = func.id if isinstance(func, ast.Name) else None
+    if isinstance(func, ast.Attribute) and func.attr == "import_module":
+        return "importlib.import_module()"
+    if name not in _DYNAMIC_LOOKUPS:
+        return None
+    if name in _ATTR_LOOKUPS:
+        literal = (
+            len(node.args) > 1
+            and isinstance(node.args[1], ast.Constant)
+            and isinstance(node.args[1].value, str)
+        )
+        return None if literal else f"{name}() with a computed name"
+    return f"{name}()"
+
+
+class _StatementInfo:
+    """References and dynamic lookups found in one top-level statement."""
+
+    def __init__(self, stmt: ast.stmt) -> None:
+        self.names: set[str] = set()
+        self.strings: set[str] = set()
+        self.dynamic: list[tuple[int, str]] = []
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Name):
+                self.names.add(node.id)
+            elif isinstance(node, ast.Attribute):
+                # Conservative: `module.attr` may reach a stitched global
+                self.names.add(node.attr)
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                self.strings.add(node.value)
+            elif isinstance(node, ast.Call):
+                description = _describe_dynamic_lookup(node)
+                if description and (node.lineno, description) not in self.dynamic:
+                    self.dynamic.append((node.lineno, description))
+        self.dynamic.sort()
+
+
+def _module_labels(lines: list[str]) -> list[str | None]:
+    """Map each (1-based) line to its module section; None for generated code."""
+    labels: list[str | None] = [None]
+    current: str | None = None
+    for line in lines:
+        stripped = line.rstrip("\r\n")
+        header = _MODULE_HEADER_RE.match(stripped)
+        if header:
+            current = header.group(1)
+        elif stripped == _SHIM_MARKER:
+            current = None
+        labels.append(current)
+    return labels
+
+
+def _all_exports(stmt: ast.stmt) -> list[str]:
+    """Return the string entries of an `__all__ = [...]` assignment."""
+    if isinstance(stmt, ast.Assign):
+        targets = stmt.targets
+    elif isinstance(stmt, ast.AnnAssign):
+        targets = [stmt.target]
+    else:
+        return []
+    if not any(isinstance(t, ast.Name) and t.id == "__all__" for t in targets):
+        return []
+    if not isinstance(stmt.value, (ast.List, ast.Tuple)):
+        return []
+    return [
+        elt.value
+        for elt in stmt.value.elts
+        if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+    ]
+
+
+def _decorators(stmt: ast.stmt) -> list[ast.expr]:
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return stmt.decorator_list
+    return []
+
+
+def _prune_import_aliases(
+    stmt: ast.Import | ast.ImportFrom, reached: set[str]
+) -> str | None:
+    """Rewrite a partly used import without its unused names (None if all used)."""
+    aliases = stmt.names
+    if isinstance(stmt, ast.Import):
+        used = [a for a in aliases if (a.asname or a.name.split(".")[0]) in reached]
+    else:
+        used = [a for a in aliases if (a.asname or a.name) in reached]
+    if len(used) == len(aliases):
+        return None
+    if isinstance(stmt, ast.Import):
+        new_stmt: ast.stmt = ast.Import(names=used)
+    else:
+        new_stmt = ast.ImportFrom(module=stmt.module, names=used, level=stmt.level)
+    return ast.unparse(new_stmt) + "\n"
+
+
+def tree_shake_script(  # noqa: C901, PLR0912, PLR0915
+    script_text: str,
+    *,
+    keep: list[str] | None = None,
+) -> TreeShakeResult:
+    """Remove top-level definitions the stitched script never reaches.
+
+    Args:
+        script_text: The stitched script (raw stitch mode: one namespace)
+        keep: Top-level names to keep regardless (public API, entry points
+            called from outside)
+
+    Returns:
+        TreeShakeResult with the shaken script and what was found
+
+    Raises:
+        SyntaxError: If the script does not parse
+    """
+    tree = ast.parse(script_text)
+    lines = script_text.splitlines(keepends=True)
+    labels = _module_labels(lines)
+    stmts = tree.body
+
+    # Statements sharing a line (`a = 1; b = 2`) cannot be cut apart
+    line_owners: dict[int, int] = {}
+    shared_lines: set[int] = set()
+    for idx, stmt in enumerate(stmts):
+        start = min([stmt.lineno] + [d.lineno for d in _decorators(stmt)])
+        for lineno in range(start, (stmt.end_lineno or stmt.lineno) + 1):
+            if lineno in line_owners:
+                shared_lines.update((idx, line_owners[lineno]))
+            line_owners[lineno] = idx
+
+    infos = [_StatementInfo(stmt) for stmt in stmts]
+    always_kept = shared_lines | _classes_with_creation_hooks(stmts)
+    bindings: dict[int, list[str]] = {}
+    defined_by: dict[str, list[int]] = {}
+    for idx, stmt in enumerate(stmts):
+        names = None if idx in always_kept else _definitions(stmt)
+        if names is None:
+            continue
+        bindings[idx] = names
+        for name in names:
+            defined_by.setdefault(name, []).append(idx)
+
+    result = TreeShakeResult(script_text=script_text)
+    kept: set[int] = {idx for idx in range(len(stmts)) if idx not in bindings}
+    reached: set[str] = set()
+    pending: list[str] = list(keep or [])
+
+    def _visit(idx: int) -> None:
+        info = infos[idx]
+        pending.extend(info.names)
+        label = labels[stmts[idx].lineno]
+        for text in (info.strings & defined_by.keys()) - {"__all__"}:
+            pending.append(text)
+            if label is not None:
+                modules = result.string_references.setdefault(text, [])
+                if label not in modules:
+                    modules.append(label)
+
+    for idx in sorted(kept):
+        _visit(idx)
+    while pending:
+        name = pending.pop()
+        if name in reached:
+            continue
+        reached.add(name)
+        for idx in defined_by.get(name, []):
+            if idx not in kept:
+                kept.add(idx)
+                _visit(idx)
+
+    # Only report names that nothing but a string reference kept alive
+    direct = {
+        name
+        for idx in kept
+        for name in infos[idx].names
+        if idx not in defined_by.get(name, [])
+    }
+    result.string_references = {
+        name: modules
+        for name, modules in sorted(result.string_references.items())
+        if name not in direct and name not in (keep or [])
+    }
+
+    replacements: dict[int, str] = {}
+    removed_lines: set[int] = set()
+    removed_names: set[str] = set()
+    for idx, stmt in enumerate(stmts):
+        label = labels[stmt.lineno]
+        if idx in kept:
+            for lineno, description in infos[idx].dynamic:
+                if labels[lineno] is not None:
+                    result.dynamic_lookups.append(
+                        f"{labels[lineno]} (line {lineno}): {description}"
+                    )
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)) and idx in bindings:
+                pruned = _prune_import_aliases(stmt, reached)
+                if pruned is not None:
+                    replacements[stmt.lineno] = pruned
+                    removed_lines.update(
+                        range(stmt.lineno + 1, (stmt.end_lineno or stmt.lineno) + 1)
+                    )
+            continue
+        for name in bindings[idx]:
+            removed_names.add(name)
+            result.removed.append(f"{label}.{name}" if label else name)
+        start = min([stmt.lineno] + [d.lineno for d in _decorators(stmt)])
+        end = stmt.end_lineno or stmt.lineno
+        # Take the blank lines after the statement with it (they are always
+        # outside strings: the next top-level statement starts after them)
+        while end < len(lines) and not lines[end].strip():
+            end += 1
+        removed_lines.update(range(start, end + 1))
+
+    for stmt in stmts:
+        for name in _all_exports(stmt):
+            if name in removed_names and name not in result.dropped_exports:
+                result.dropped_exports.append(name)
+
+    if removed_lines or replacements:
+        out: list[str] = []
+        for lineno, line in enumerate(lines, start=1):
+            if lineno in replacements:
+                out.append(replacements[lineno])
+            elif lineno not in removed_lines:
+                out.append(line)
+        result.script_text = "".join(out)
+    return result
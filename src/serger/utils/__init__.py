@@ -1,23 +1,43 @@
 # src/serger/utils/__init__.py
 
-from .utils_installed_packages import discover_installed_packages_roots
+from .utils_installed_packages import (
+    INSTALLED_ROOTS_CACHE_VERSION,
+    discover_installed_packages_roots,
+    get_installed_packages_roots,
+)
 from .utils_matching import is_excluded
 from .utils_modules import derive_module_name
-from .utils_paths import shorten_path_for_display, shorten_paths_for_display
+from .utils_paths import (
+    get_user_cache_dir,
+    shorten_path_for_display,
+    shorten_paths_for_display,
+)
+from .utils_subprocess import (
+    SubprocessRunner,
+    run_subprocess,
+    using_subprocess_runner,
+)
 from .utils_types import make_includeresolved, make_pathresolved
 from .utils_validation import validate_required_keys
 
 
 __all__ = [  # noqa: RUF022
     # utils_installed_packages
+    "INSTALLED_ROOTS_CACHE_VERSION",
     "discover_installed_packages_roots",
+    "get_installed_packages_roots",
     # utils_matching
     "is_excluded",
     # utils_modules
     "derive_module_name",
     # utils_paths
+    "get_user_cache_dir",
     "shorten_path_for_display",
     "shorten_paths_for_display",
+    # utils_subprocess
+    "SubprocessRunner",
+    "run_subprocess",
+    "using_subprocess_runner",
     # utils_types
     "make_includeresolved",
     "make_pathresolved",
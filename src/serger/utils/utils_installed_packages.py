@@ -1,25 +1,46 @@
 # src/serger/utils/utils_installed_packages.py
 
 
+import base64
 import contextlib
-import shutil
+import hashlib
+import json
+import os
+import re
 import site
-import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from apathetic_utils import load_toml
+
+from serger.logs import getAppLogger
+from serger.timings import record_cache, timed
+
+from .utils_paths import get_user_cache_dir
 
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
-def discover_installed_packages_roots() -> list[str]:
+# Bump when discovery rules change so stale on-disk results are ignored
+INSTALLED_ROOTS_CACHE_VERSION = 1
+
+# Per-process results, keyed like the on-disk cache
+_roots_memo: dict[str, list[str]] = {}
+
+
+@timed(category="discovery")
+def discover_installed_packages_roots(
+    project_dir: Path | None = None,
+) -> list[str]:
     """Discover installed packages root directories.
 
     Searches for site-packages directories in priority order:
-    1. Poetry environment: `poetry env info --path` →
-       `{path}/lib/python*/site-packages`
+    1. Poetry environment: the project's Poetry virtualenv (located from
+       Poetry's config/cache directories) → `{venv}/lib/python*/site-packages`
     2. Virtualenv/pip: Check `sys.path` for `site-packages` or
        `dist-packages` in virtualenv paths
     3. User site-packages: `~/.local/lib/python*/site-packages`
@@ -29,18 +50,23 @@ def discover_installed_packages_roots() -> list[str]:
 
     Handles both `site-packages` and `dist-packages` (Debian/Ubuntu).
 
+    Args:
+        project_dir: Directory used to find the Poetry project
+            (defaults to the current working directory)
+
     Returns:
         List of absolute paths to site-packages directories in priority order.
         Returns empty list if nothing found (does not error).
 
     Note:
         Paths are deduplicated and returned in priority order.
+        See get_installed_packages_roots() for the cached variant.
     """
     discovered: list[str] = []
     seen: set[str] = set()
 
     # 1. Poetry environment (highest priority)
-    poetry_paths = _discover_poetry_site_packages()
+    poetry_paths = _discover_poetry_site_packages(project_dir)
     for path in poetry_paths:
         if path not in seen:
             discovered.append(path)
@@ -70,44 +96,240 @@ def discover_installed_packages_roots() -> list[str]:
     return discovered
 
 
-def _discover_poetry_site_packages() -> list[str]:
+def get_installed_packages_roots(project_dir: Path | None = None) -> list[str]:
+    """Return discover_installed_packages_roots(), cached in memory and on disk.
+
+    Results are stored under `$XDG_CACHE_HOME/serger/installed` and keyed by
+    the interpreter (path, prefix, sys.path), the mtime of its `pyvenv.cfg`,
+    and the project's `poetry.lock`/`pyproject.toml` mtimes, so creating or
+    re-locking an environment invalidates them. An entry whose directories no
+    longer all exist is ignored.
+
+    Args:
+        project_dir: Directory used to find the Poetry project
+            (defaults to the current working directory)
+
+    Returns:
+        Same as discover_installed_packages_roots().
+    """
+    logger = getAppLogger()
+    key = _installed_roots_cache_key(project_dir or Path.cwd())
+    if key in _roots_memo:
+        record_cache("installed_roots", hit=True)
+        return list(_roots_memo[key])
+
+    cache_file = get_user_cache_dir() / "installed" / f"{key}.json"
+    try:
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        entry = None
+    if (
+        isinstance(entry, dict)
+        and entry.get("version") == INSTALLED_ROOTS_CACHE_VERSION
+        and isinstance(entry.get("roots"), list)
+        and all(Path(p).is_dir() for p in entry["roots"])
+    ):
+        roots = [str(p) for p in entry["roots"]]
+        logger.trace("[installed_roots] cache hit (%d roots)", len(roots))
+        record_cache("installed_roots", hit=True)
+    else:
+        record_cache("installed_roots", hit=False)
+        roots = discover_installed_packages_roots(project_dir)
+        _store_installed_roots(cache_file, roots)
+
+    _roots_memo[key] = roots
+    return list(roots)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _installed_roots_cache_key(start: Path) -> str:
+    """Key discovery results by everything that changes what they would be."""
+    project_dir = _find_pyproject_dir(start)
+    parts: list[Any] = [
+        INSTALLED_ROOTS_CACHE_VERSION,
+        sys.executable,
+        sys.prefix,
+        sys.path,
+        _mtime_ns(Path(sys.prefix) / "pyvenv.cfg"),
+        str(project_dir),
+        sorted(
+            (k, v)
+            for k, v in os.environ.items()
+            if k.startswith("POETRY_") or k in {"XDG_CONFIG_HOME", "XDG_CACHE_HOME"}
+        ),
+    ]
+    if project_dir is not None:
+        parts.append(_mtime_ns(project_dir / "poetry.lock"))
+        parts.append(_mtime_ns(project_dir / "pyproject.toml"))
+        parts.append(_mtime_ns(project_dir / ".venv"))
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _store_installed_roots(cache_file: Path, roots: list[str]) -> None:
+    """Atomically write discovery results; failures only cost a re-scan."""
+    logger = getAppLogger()
+    payload = {"version": INSTALLED_ROOTS_CACHE_VERSION, "roots": roots}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        Path(tmp_name).replace(cache_file)
+    except OSError as e:
+        logger.trace("[installed_roots] could not store cache: %s", e)
+
+
+@timed(category="discovery")
+def _discover_poetry_site_packages(project_dir: Path | None = None) -> list[str]:
     """Discover Poetry environment site-packages directories.
 
+    Locates the project's Poetry virtualenv from Poetry's own config and
+    cache layout instead of running `poetry env info --path`.
+
+    Args:
+        project_dir: Directory to search upward from for pyproject.toml
+            (defaults to the current working directory)
+
     Returns:
         List of absolute paths to Poetry site-packages directories.
         Returns empty list if Poetry is not available or not in use.
     """
-    poetry_cmd = shutil.which("poetry")
-    if not poetry_cmd:
-        return []
-
     try:
-        result = subprocess.run(  # noqa: S603
-            [poetry_cmd, "env", "info", "--path"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=10,
-        )
-        venv_path = Path(result.stdout.strip())
-        if not venv_path.exists():
-            return []
-
-        # Look for lib/python*/site-packages or lib/python*/dist-packages
-        site_packages_paths: list[str] = []
-        lib_dir = venv_path / "lib"
-        if lib_dir.exists():
-            for python_dir in lib_dir.iterdir():
-                if python_dir.is_dir() and python_dir.name.startswith("python"):
-                    for pkg_dir_name in ("site-packages", "dist-packages"):
-                        pkg_dir = python_dir / pkg_dir_name
-                        if pkg_dir.exists() and pkg_dir.is_dir():
-                            site_packages_paths.append(str(pkg_dir.resolve()))
-
-        return sorted(site_packages_paths)
+        venv_path = _find_poetry_venv(project_dir or Path.cwd())
     except Exception:  # noqa: BLE001
-        # Poetry command failed or venv path invalid - return empty
+        # Unreadable config or unexpected layout - treat as "no poetry env"
         return []
+    if venv_path is None:
+        return []
+    return _venv_site_packages(venv_path)
+
+
+def _venv_site_packages(venv_path: Path) -> list[str]:
+    """Return lib/python*/{site,dist}-packages directories inside a venv."""
+    site_packages_paths: list[str] = []
+    lib_dir = venv_path / "lib"
+    if lib_dir.exists():
+        for python_dir in lib_dir.iterdir():
+            if python_dir.is_dir() and python_dir.name.startswith("python"):
+                for pkg_dir_name in ("site-packages", "dist-packages"):
+                    pkg_dir = python_dir / pkg_dir_name
+                    if pkg_dir.exists() and pkg_dir.is_dir():
+                        site_packages_paths.append(str(pkg_dir.resolve()))
+    return sorted(site_packages_paths)
+
+
+def _find_pyproject_dir(start: Path) -> Path | None:
+    """Return the nearest directory at or above `start` with a pyproject.toml."""
+    start = start.resolve()
+    for candidate in (start, *start.parents):
+        if (candidate / "pyproject.toml").is_file():
+            return candidate
+    return None
+
+
+def _poetry_platform_dirs() -> tuple[Path, Path]:
+    """Return Poetry's default (config_dir, cache_dir) for this platform."""
+    home = Path.home()
+    if sys.platform == "win32":
+        appdata = os.getenv("APPDATA") or str(home / "AppData" / "Roaming")
+        local = os.getenv("LOCALAPPDATA") or str(home / "AppData" / "Local")
+        return Path(appdata) / "pypoetry", Path(local) / "pypoetry" / "Cache"
+    if sys.platform == "darwin":
+        lib = home / "Library"
+        return lib / "Application Support" / "pypoetry", lib / "Caches" / "pypoetry"
+    config_home = os.getenv("XDG_CONFIG_HOME") or str(home / ".config")
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(home / ".cache")
+    return Path(config_home) / "pypoetry", Path(cache_home) / "pypoetry"
+
+
+def _load_toml_or_empty(path: Path) -> dict[str, Any]:
+    if not path.is_file():
+        return {}
+    data = load_toml(path, required=False)
+    return data if isinstance(data, dict) else {}
+
+
+def _poetry_env_name(project_dir: Path, project_name: str) -> str:
+    """Mirror Poetry's EnvManager.generate_env_name() (`{name}-{hash8}`)."""
+    name = re.sub(r"[-_.]+", "-", project_name).lower()
+    sanitized = re.sub(r'[ $`!*@"\\\r\n\t]', "_", name)[:42]
+    normalized_dir = os.path.normcase(os.path.realpath(project_dir))
+    digest = hashlib.sha256(normalized_dir.encode()).digest()
+    return f"{sanitized}-{base64.urlsafe_b64encode(digest).decode()[:8]}"
+
+
+def _find_poetry_venv(start: Path) -> Path | None:  # noqa: PLR0911
+    """Locate the Poetry virtualenv for the project containing `start`.
+
+    Resolution mirrors Poetry: an in-project `.venv` wins, otherwise the env
+    lives in `virtualenvs.path` (default `{cache-dir}/virtualenvs`) as
+    `{name}-{hash}-py{X.Y}`, with the active minor recorded in envs.toml.
+    """
+    project_dir = _find_pyproject_dir(start)
+    if project_dir is None:
+        return None
+    pyproject = _load_toml_or_empty(project_dir / "pyproject.toml")
+    poetry_section = pyproject.get("tool", {}).get("poetry")
+    if poetry_section is None and not (project_dir / "poetry.lock").exists():
+        # Not a Poetry project
+        return None
+
+    default_config_dir, default_cache_dir = _poetry_platform_dirs()
+    config_dir = Path(os.getenv("POETRY_CONFIG_DIR") or default_config_dir)
+    global_cfg = _load_toml_or_empty(config_dir / "config.toml")
+    local_cfg = _load_toml_or_empty(project_dir / "poetry.toml")
+
+    def _setting(section: str | None, key: str, env: str) -> Any:
+        if env in os.environ:
+            return os.environ[env]
+        for cfg in (local_cfg, global_cfg):
+            scope = cfg.get(section, {}) if section else cfg
+            if isinstance(scope, dict) and key in scope:
+                return scope[key]
+        return None
+
+    in_project = _setting("virtualenvs", "in-project", "POETRY_VIRTUALENVS_IN_PROJECT")
+    in_project_venv = project_dir / ".venv"
+    if str(in_project).lower() != "false" and in_project_venv.is_dir():
+        return in_project_venv
+
+    cache_dir = Path(
+        _setting(None, "cache-dir", "POETRY_CACHE_DIR") or default_cache_dir
+    )
+    venvs_setting = _setting("virtualenvs", "path", "POETRY_VIRTUALENVS_PATH")
+    venvs_dir = (
+        Path(str(venvs_setting).replace("{cache-dir}", str(cache_dir)))
+        if venvs_setting
+        else cache_dir / "virtualenvs"
+    ).expanduser()
+    if not venvs_dir.is_dir():
+        return None
+
+    project_name = (poetry_section or {}).get("name") or pyproject.get(
+        "project", {}
+    ).get("name")
+    if not isinstance(project_name, str) or not project_name:
+        return None
+    env_name = _poetry_env_name(project_dir, project_name)
+
+    # Prefer the env Poetry marked active, then one matching this interpreter
+    minors: list[str] = []
+    active = _load_toml_or_empty(venvs_dir / "envs.toml").get(env_name, {})
+    if isinstance(active, dict) and isinstance(active.get("minor"), str):
+        minors.append(active["minor"])
+    minors.append(f"{sys.version_info.major}.{sys.version_info.minor}")
+    for minor in minors:
+        candidate = venvs_dir / f"{env_name}-py{minor}"
+        if candidate.is_dir():
+            return candidate
+    others = sorted(venvs_dir.glob(f"{env_name}-py*"))
+    return others[-1] if others else None
 
 
 def _discover_venv_site_packages() -> list[str]:
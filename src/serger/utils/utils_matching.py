@@ -1,14 +1,21 @@
 # src/serger/utils/utils_matching.py
 
+from typing import TYPE_CHECKING
 
 from apathetic_utils import is_excluded_raw
 
-from serger.config.config_types import PathResolved
 from serger.logs import getAppLogger
 from serger.utils.utils_validation import validate_required_keys
 
 
-def is_excluded(path_entry: PathResolved, exclude_patterns: list[PathResolved]) -> bool:
+# Only for annotations: serger.config imports serger.utils at load time
+if TYPE_CHECKING:
+    from serger.config.config_types import PathResolved
+
+
+def is_excluded(
+    path_entry: "PathResolved", exclude_patterns: "list[PathResolved]"
+) -> bool:
     """High-level helper for internal use.
     Accepts PathResolved entries and delegates to the smart matcher.
     """
@@ -22,7 +29,10 @@ def is_excluded(path_entry: PathResolved, exclude_patterns: list[PathResolved])
     patterns = [str(e["path"]) for e in exclude_patterns]
     result = is_excluded_raw(path, patterns, root)
     logger.trace(
-        f"[is_excluded] path={path}, root={root},"
-        f" patterns={len(patterns)}, excluded={result}"
+        "[is_excluded] path=%s, root=%s, patterns=%s, excluded=%s",
+        path,
+        root,
+        len(patterns),
+        result,
     )
     return result
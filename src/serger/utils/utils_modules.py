@@ -2,14 +2,19 @@
 
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from apathetic_utils import get_glob_root, has_glob_chars
 
-from serger.config.config_types import IncludeResolved
 from serger.logs import getAppLogger
 from serger.utils.utils_validation import validate_required_keys
 
 
+# Only for annotations: serger.config imports serger.utils at load time
+if TYPE_CHECKING:
+    from serger.config.config_types import IncludeResolved
+
+
 def _interpret_dest_for_module_name(  # noqa: PLR0911
     file_path: Path,
     include_root: Path,
@@ -36,14 +41,17 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
     file_path_resolved = file_path.resolve()
 
     logger.trace(
-        f"[DEST_INTERPRET] file={file_path}, root={include_root}, "
-        f"pattern={include_pattern!r}, dest={dest}",
+        "[DEST_INTERPRET] file=%s, root=%s, pattern=%r, dest=%s",
+        file_path,
+        include_root,
+        include_pattern,
+        dest,
     )
 
     # If dest is absolute, use it directly
     if dest_path.is_absolute():
         result = dest_path.resolve()
-        logger.trace(f"[DEST_INTERPRET] absolute dest → {result}")
+        logger.trace("[DEST_INTERPRET] absolute dest → %s", result)
         return result
 
     # Treat trailing slashes as if they implied recursive includes
@@ -55,7 +63,9 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
             )
             result = dest_path / rel
             logger.trace(
-                f"[DEST_INTERPRET] trailing-slash include → rel={rel}, result={result}",
+                "[DEST_INTERPRET] trailing-slash include → rel=%s, result=%s",
+                rel,
+                result,
             )
             return result  # noqa: TRY300
         except ValueError:
@@ -84,9 +94,7 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
             and not include_pattern.endswith("/*")
         )
         if is_single_level_glob:
-            logger.trace(
-                f"[DEST_INTERPRET] explicit dest override → {dest_path}",
-            )
+            logger.trace("[DEST_INTERPRET] explicit dest override → %s", dest_path)
             return dest_path
 
         # For glob patterns, strip non-glob prefix
@@ -95,8 +103,10 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
             rel = file_path_resolved.relative_to(include_root_resolved / prefix)
             result = dest_path / rel
             logger.trace(
-                f"[DEST_INTERPRET] glob include → prefix={prefix}, "
-                f"rel={rel}, result={result}",
+                "[DEST_INTERPRET] glob include → prefix=%s, rel=%s, result=%s",
+                prefix,
+                rel,
+                result,
             )
             return result  # noqa: TRY300
         except ValueError:
@@ -109,7 +119,7 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
     if dest_str.endswith(".py"):
         # Dest is a full path - use it directly
         logger.trace(
-            f"[DEST_INTERPRET] literal include with full dest path → {dest_path}",
+            "[DEST_INTERPRET] literal include with full dest path → %s", dest_path
         )
         return dest_path
 
@@ -117,13 +127,15 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
     try:
         rel = file_path_resolved.relative_to(include_root_resolved)
         result = dest_path / rel
-        logger.trace(f"[DEST_INTERPRET] literal include → rel={rel}, result={result}")
+        logger.trace(
+            "[DEST_INTERPRET] literal include → rel=%s, result=%s", rel, result
+        )
         return result  # noqa: TRY300
     except ValueError:
         # Fallback when file_path isn't under include_root
         logger.trace(
-            f"[DEST_INTERPRET] fallback (file not under root) → "
-            f"using name={file_path.name}",
+            "[DEST_INTERPRET] fallback (file not under root) → using name=%s",
+            file_path.name,
         )
         return dest_path / file_path.name
 
@@ -131,7 +143,7 @@ def _interpret_dest_for_module_name(  # noqa: PLR0911
 def derive_module_name(  # noqa: PLR0912, PLR0915, C901
     file_path: Path,
     package_root: Path,
-    include: IncludeResolved | None = None,
+    include: "IncludeResolved | None" = None,
     source_bases: list[str] | None = None,
     user_provided_source_bases: list[str] | None = None,
     detected_packages: set[str] | None = None,
@@ -201,7 +213,7 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
 
         module_name = ".".join(parts)
         logger.trace(
-            f"[DERIVE] file={file_path}, dest={dest} → module={module_name}",
+            "[DERIVE] file=%s, dest=%s → module=%s", file_path, dest, module_name
         )
         return module_name
 
@@ -234,8 +246,11 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
             # (this would cause files in package dirs to lose their package name)
             if module_base == file_parent:
                 logger.trace(
-                    f"[DERIVE] file={file_path} parent={file_parent} equals "
-                    f"module_base={module_base}, skipping (would lose package name)",
+                    "[DERIVE] file=%s parent=%s equals module_base=%s, skipping "
+                    "(would lose package name)",
+                    file_path,
+                    file_parent,
+                    module_base,
                 )
                 continue
             try:
@@ -246,8 +261,11 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
                 if not is_under_package_root:
                     rel_path = module_base_rel
                     logger.trace(
-                        f"[DERIVE] file={file_path} not under root={package_root}, "
-                        f"but under module_base={module_base}, using relative path",
+                        "[DERIVE] file=%s not under root=%s, but under "
+                        "module_base=%s, using relative path",
+                        file_path,
+                        package_root,
+                        module_base,
                     )
                     break
                 # Check if module_base is more specific (deeper) than package_root
@@ -295,16 +313,22 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
                             # Prepend module_base.name to preserve package structure
                             rel_path = Path(module_base.name) / rel_path
                             logger.trace(
-                                f"[DERIVE] file={file_path} under both "
-                                f"root={package_root} and module_base={module_base}, "
-                                f"using module_base (file is under module_base, "
-                                f"prepending package {module_base.name})",
+                                "[DERIVE] file=%s under both root=%s and "
+                                "module_base=%s, using module_base (file is under "
+                                "module_base, prepending package %s)",
+                                file_path,
+                                package_root,
+                                module_base,
+                                module_base.name,
                             )
                         else:
                             logger.trace(
-                                f"[DERIVE] file={file_path} under both "
-                                f"root={package_root} and module_base={module_base}, "
-                                f"using module_base (file is under module_base)",
+                                "[DERIVE] file=%s under both root=%s and "
+                                "module_base=%s, using module_base (file is under "
+                                "module_base)",
+                                file_path,
+                                package_root,
+                                module_base,
                             )
                         break
                     except ValueError:
@@ -319,8 +343,11 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
                     if not is_under_package_root:
                         rel_path = module_base_rel
                         logger.trace(
-                            f"[DERIVE] file={file_path} not under root={package_root}, "
-                            f"but under module_base={module_base}, using module_base",
+                            "[DERIVE] file=%s not under root=%s, but under "
+                            "module_base=%s, using module_base",
+                            file_path,
+                            package_root,
+                            module_base,
                         )
                         break
                     # File is under package_root but module_base is not
@@ -334,14 +361,16 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
         if is_under_package_root and package_root_rel is not None:
             rel_path = package_root_rel
             logger.trace(
-                f"[DERIVE] file={file_path} under package_root={package_root}, "
-                f"using relative path",
+                "[DERIVE] file=%s under package_root=%s, using relative path",
+                file_path,
+                package_root,
             )
         else:
             # File not under package root or any module_base - use just filename
             logger.trace(
-                f"[DERIVE] file={file_path} not under root={package_root} "
-                f"or any module_base, using filename",
+                "[DERIVE] file=%s not under root=%s or any module_base, using filename",
+                file_path,
+                package_root,
             )
             rel_path = Path(file_path.name)
 
@@ -358,5 +387,5 @@ def derive_module_name(  # noqa: PLR0912, PLR0915, C901
         raise ValueError(xmsg)
 
     module_name = ".".join(parts)
-    logger.trace(f"[DERIVE] file={file_path} → module={module_name}")
+    logger.trace("[DERIVE] file=%s → module=%s", file_path, module_name)
     return module_name
@@ -1,15 +1,22 @@
 # src/serger/utils/utils_paths.py
 
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from apathetic_utils import shorten_path
 
-from serger.config.config_types import IncludeResolved, PathResolved
+from serger.meta import PROGRAM_PACKAGE
+
+
+# Only for annotations: serger.config imports serger.utils at load time
+if TYPE_CHECKING:
+    from serger.config.config_types import IncludeResolved, PathResolved
 
 
 def shorten_path_for_display(
-    path: Path | str | PathResolved | IncludeResolved,
+    path: "Path | str | PathResolved | IncludeResolved",
     *,
     cwd: Path | None = None,
     config_dir: Path | None = None,
@@ -68,11 +75,11 @@ def shorten_path_for_display(
 
 def shorten_paths_for_display(
     paths: (
-        list[Path]
-        | list[str]
-        | list[PathResolved]
-        | list[IncludeResolved]
-        | list[Path | str | PathResolved | IncludeResolved]
+        "list[Path]"
+        " | list[str]"
+        " | list[PathResolved]"
+        " | list[IncludeResolved]"
+        " | list[Path | str | PathResolved | IncludeResolved]"
     ),
     *,
     cwd: Path | None = None,
@@ -97,3 +104,14 @@ def shorten_paths_for_display(
     return [
         shorten_path_for_display(path, cwd=cwd, config_dir=config_dir) for path in paths
     ]
+
+
+def get_user_cache_dir() -> Path:
+    """Return serger's per-user cache directory.
+
+    Uses `$XDG_CACHE_HOME/serger`, falling back to `~/.cache/serger`.
+    The directory is not created.
+    """
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / PROGRAM_PACKAGE
@@ -0,0 +1,46 @@
+# src/serger/utils/utils_subprocess.py
+"""Indirection for the subprocesses a build runs (git, tools, checks).
+
+Build code calls run_subprocess() instead of subprocess.run(). By default it
+is subprocess.run(); inside using_subprocess_runner() the call goes to the
+given runner instead (the asyncio API runs them on the event loop).
+"""
+
+import subprocess
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+
+# Called like subprocess.run(args, **kwargs) and returning the same result
+SubprocessRunner = Callable[..., "subprocess.CompletedProcess[Any]"]
+
+_subprocess_runner: ContextVar[SubprocessRunner | None] = ContextVar(
+    "serger_subprocess_runner", default=None
+)
+
+
+def run_subprocess(
+    args: list[str], **kwargs: Any
+) -> "subprocess.CompletedProcess[Any]":
+    """Run a command like subprocess.run(), through the active runner.
+
+    Supported keyword arguments are those of subprocess.run() that build code
+    uses: cwd, input, capture_output, text, check and timeout.
+    """
+    runner = _subprocess_runner.get()
+    if runner is None:
+        # looked up per call so tests can patch subprocess.run
+        return subprocess.run(args, **kwargs)  # noqa: PLW1510, S603
+    return runner(args, **kwargs)
+
+
+@contextmanager
+def using_subprocess_runner(runner: SubprocessRunner) -> Iterator[None]:
+    """Route run_subprocess() calls in this context to `runner`."""
+    token = _subprocess_runner.set(runner)
+    try:
+        yield
+    finally:
+        _subprocess_runner.reset(token)
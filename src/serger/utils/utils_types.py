@@ -3,17 +3,21 @@
 
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     cast,
 )
 
-from serger.config.config_types import IncludeResolved, OriginType, PathResolved
+
+# Only for annotations: serger.config imports serger.utils at load time
+if TYPE_CHECKING:
+    from serger.config.config_types import IncludeResolved, OriginType, PathResolved
 
 
 def _root_resolved(
     path: Path | str,
     root: Path | str,
     pattern: str | None,
-    origin: OriginType,
+    origin: "OriginType",
 ) -> dict[str, object]:
     # Preserve raw string if available (to keep trailing slashes)
     raw_path = path if isinstance(path, str) else str(path)
@@ -30,10 +34,10 @@ def _root_resolved(
 def make_pathresolved(
     path: Path | str,
     root: Path | str = ".",
-    origin: OriginType = "code",
+    origin: "OriginType" = "code",
     *,
     pattern: str | None = None,
-) -> PathResolved:
+) -> "PathResolved":
     """Quick helper to build a PathResolved entry."""
     # mutate class type
     return cast("PathResolved", _root_resolved(path, root, pattern, origin))
@@ -42,11 +46,11 @@ def make_pathresolved(
 def make_includeresolved(
     path: Path | str,
     root: Path | str = ".",
-    origin: OriginType = "code",
+    origin: "OriginType" = "code",
     *,
     pattern: str | None = None,
     dest: Path | str | None = None,
-) -> IncludeResolved:
+) -> "IncludeResolved":
     """Create an IncludeResolved entry with optional dest override."""
     entry = _root_resolved(path, root, pattern, origin)
     if dest is not None:
@@ -5,18 +5,38 @@ This module provides functions for verifying stitched Python scripts,
 including compilation checks, ruff formatting, and execution validation.
 """
 
+import os
 import py_compile
 import shutil
-import subprocess
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .config import PostProcessingConfigResolved, ToolConfigResolved
 from .logs import getAppLogger
+from .timings import record_cache, span, timed
+from .utils.utils_subprocess import run_subprocess
 from .utils.utils_validation import validate_required_keys
 
 
+# (command, custom_path) → executable, pre-resolved for the current build
+ToolExecutables = dict[tuple[str, str | None], str | None]
+
+_tool_executables: ContextVar[ToolExecutables | None] = ContextVar(
+    "serger_tool_executables", default=None
+)
+
+# (command, PATH) → executable found on PATH, kept between builds
+ToolLookupCache = dict[tuple[str, str], str]
+
+_tool_lookup_cache: ContextVar[ToolLookupCache | None] = ContextVar(
+    "serger_tool_lookup_cache", default=None
+)
+
+
 def verify_compiles_string(source: str, filename: str = "<string>") -> None:
     """Verify that Python source code compiles without syntax errors.
 
@@ -67,6 +87,29 @@ def find_tool_executable(
     Returns:
         Path to executable if found, None otherwise
     """
+    prefetched = _tool_executables.get()
+    if prefetched is not None and (tool_name, custom_path) in prefetched:
+        return prefetched[(tool_name, custom_path)]
+
+    cache = _tool_lookup_cache.get()
+    if cache is None or custom_path:
+        # a custom path is a single stat; only PATH searches are cached
+        return _lookup_tool_executable(tool_name, custom_path)
+    key = (tool_name, os.environ.get("PATH", ""))
+    executable = cache.get(key)
+    # only found tools are remembered, and only while they still exist, so
+    # installing or removing a tool is noticed by the next build
+    if executable is not None and Path(executable).exists():
+        record_cache("tools", hit=True)
+        return executable
+    record_cache("tools", hit=False)
+    executable = _lookup_tool_executable(tool_name, custom_path)
+    if executable is not None:
+        cache[key] = executable
+    return executable
+
+
+def _lookup_tool_executable(tool_name: str, custom_path: str | None) -> str | None:
     if custom_path:
         path = Path(custom_path)
         if path.exists() and path.is_file():
@@ -76,6 +119,53 @@ def find_tool_executable(
     return shutil.which(tool_name)
 
 
+def discover_tool_executables(
+    config: PostProcessingConfigResolved,
+) -> ToolExecutables:
+    """Resolve the executable of every enabled post-processing tool up front.
+
+    Lets the PATH lookups run in the background while the build is still
+    analyzing modules; see using_tool_executables().
+
+    Args:
+        config: Resolved post-processing configuration
+
+    Returns:
+        Mapping of (command, custom_path) to executable (None if not found)
+    """
+    executables: ToolExecutables = {}
+    if not config.get("enabled"):
+        return executables
+    for category in config.get("categories", {}).values():
+        if not category.get("enabled"):
+            continue
+        for tool_config in category.get("tools", {}).values():
+            key = (tool_config["command"], tool_config.get("path"))
+            if key not in executables:
+                executables[key] = find_tool_executable(*key)
+    return executables
+
+
+@contextmanager
+def using_tool_executables(executables: ToolExecutables) -> Iterator[None]:
+    """Make find_tool_executable() answer from `executables` in this block."""
+    token = _tool_executables.set(executables)
+    try:
+        yield
+    finally:
+        _tool_executables.reset(token)
+
+
+@contextmanager
+def caching_tool_lookups(cache: ToolLookupCache) -> Iterator[None]:
+    """Remember find_tool_executable() results in `cache` for this block."""
+    token = _tool_lookup_cache.set(cache)
+    try:
+        yield
+    finally:
+        _tool_lookup_cache.reset(token)
+
+
 def build_tool_command(
     tool_label: str,
     category: str,  # noqa: ARG001
@@ -187,12 +277,17 @@ def execute_post_processing(
             # Execute command
             logger.debug("Running %s for category %s", tool_label, category_name)
             try:
-                result = subprocess.run(  # noqa: S603
-                    command,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
+                with span(
+                    tool_label,
+                    category="tool",
+                    args={"category": category_name, "command": " ".join(command)},
+                ):
+                    result = run_subprocess(
+                        command,
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                    )
                 if result.returncode == 0:
                     logger.debug(
                         "%s completed successfully for category %s",
@@ -219,6 +314,7 @@ def execute_post_processing(
             )
 
 
+@timed(category="subprocess")
 def verify_executes(file_path: Path) -> bool:
     """Verify that a Python script can be executed (basic sanity check).
 
@@ -242,7 +338,7 @@ def verify_executes(file_path: Path) -> bool:
     # First, try to actually execute the script with --help
     # This verifies the script can run, not just compile
     try:
-        result = subprocess.run(  # noqa: S603
+        result = run_subprocess(
             [sys.executable, str(file_path), "--help"],
             capture_output=True,
             text=True,
@@ -254,7 +350,7 @@ def verify_executes(file_path: Path) -> bool:
             logger.debug("Script executes successfully (--help): %s", file_path)
             return True
         # If --help fails, try --version as fallback
-        result = subprocess.run(  # noqa: S603
+        result = run_subprocess(
             [sys.executable, str(file_path), "--version"],
             capture_output=True,
             text=True,
@@ -269,7 +365,7 @@ def verify_executes(file_path: Path) -> bool:
 
     # Fallback: verify it compiles (lightweight check)
     try:
-        result = subprocess.run(  # noqa: S603
+        result = run_subprocess(
             [sys.executable, "-m", "py_compile", str(file_path)],
             capture_output=True,
             text=True,
@@ -410,6 +506,7 @@ def _write_error_file(  # pyright: ignore[reportUnusedFunction]
     return error_path
 
 
+@timed()
 def post_stitch_processing(
     out_path: Path,
     *,
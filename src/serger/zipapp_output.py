@@ -0,0 +1,121 @@
+# src/serger/zipapp_output.py
+"""Zipapp (.pyz) packaging for stitched scripts.
+
+With `out_format: "zipapp"`, the final stitched program is stored as the
+archive's `__main__.py` next to a precompiled `__main__.pyc`. Python runs a
+zipapp through zipimport, which loads the `.pyc` directly and only falls back
+to compiling `__main__.py` when the bytecode was built for a different
+interpreter.
+"""
+
+import io
+import marshal
+import zipfile
+from importlib.util import MAGIC_NUMBER, source_hash
+
+from .meta import PROGRAM_PACKAGE
+from .timings import span
+from .utils.utils_subprocess import run_subprocess
+
+
+ZIPAPP_SHEBANG = "#!/usr/bin/env python3"
+
+# Fixed timestamp for every archive member (the earliest a zip can store),
+# so identical inputs always produce byte-identical archives
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# Regular file, rw-r--r--
+_ZIP_FILE_MODE = 0o100644 << 16
+# PEP 552 flags: hash-based, but never checked against the source. The
+# source hash (not an mtime) keeps the output reproducible.
+_PYC_FLAGS = (0b01).to_bytes(4, "little")
+
+# Same as compile_pyc(), for a different interpreter: reads source from
+# stdin and writes the .pyc contents to stdout, so the bytecode matches the
+# requested version.
+_PYC_COMPILER = """\
+import importlib.util, marshal, sys
+source = sys.stdin.buffer.read()
+code = compile(source, sys.argv[1], "exec", dont_inherit=True)
+flags = (0b01).to_bytes(4, "little")
+sys.stdout.buffer.write(
+    importlib.util.MAGIC_NUMBER
+    + flags
+    + importlib.util.source_hash(source)
+    + marshal.dumps(code)
+)
+"""
+
+
+def compile_pyc(source: bytes, filename: str, python: str | None = None) -> bytes:
+    """Compile source into the contents of an unchecked hash-based `.pyc`.
+
+    Args:
+        source: Module source code
+        filename: Filename recorded in the code object (shown in tracebacks)
+        python: Interpreter command to compile with. None compiles in-process
+            with the running interpreter.
+
+    Returns:
+        The `.pyc` file contents
+
+    Raises:
+        ValueError: If the interpreter cannot be run or fails to compile
+    """
+    if python is None:
+        code = compile(source, filename, "exec", dont_inherit=True)
+        return MAGIC_NUMBER + _PYC_FLAGS + source_hash(source) + marshal.dumps(code)
+
+    try:
+        with span("zipapp_python", category="subprocess", args={"file": filename}):
+            result = run_subprocess(
+                [python, "-c", _PYC_COMPILER, filename],
+                input=source,
+                capture_output=True,
+                check=False,
+            )
+    except OSError as e:
+        msg = f"Cannot run zipapp_python {python!r}: {e}"
+        raise ValueError(msg) from e
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        msg = f"zipapp_python {python!r} failed to compile {filename}: {stderr}"
+        raise ValueError(msg)
+    return result.stdout
+
+
+def build_zipapp(
+    script_text: str,
+    *,
+    archive_name: str,
+    python: str | None = None,
+) -> bytes:
+    """Package a stitched script as an executable zipapp.
+
+    The archive holds `__main__.py` (the script, for readability and as a
+    fallback) and `__main__.pyc` (compiled for `python`). Members are written
+    in a fixed order with fixed timestamps and permissions, so the same
+    script always yields the same bytes.
+
+    Args:
+        script_text: The complete stitched script
+        archive_name: Name of the output file; recorded in code objects as
+            `<archive_name>/__main__.py` so tracebacks point into the archive
+        python: Interpreter command the bytecode targets (None = the running
+            interpreter)
+
+    Returns:
+        The archive contents, including the shebang line
+    """
+    source = script_text.encode("utf-8")
+    pyc = compile_pyc(source, f"{archive_name}/__main__.py", python)
+
+    buffer = io.BytesIO()
+    buffer.write(f"{ZIPAPP_SHEBANG}\n".encode())
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.comment = f"Build Tool: {PROGRAM_PACKAGE}".encode()
+        for member, data in (("__main__.py", source), ("__main__.pyc", pyc)):
+            info = zipfile.ZipInfo(member, date_time=_ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = _ZIP_FILE_MODE
+            archive.writestr(info, data, compresslevel=9)
+    return buffer.getvalue()
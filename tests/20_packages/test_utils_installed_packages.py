@@ -8,8 +8,10 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import apathetic_utils as mod_apathetic_utils
 import pytest
 
+import serger.meta as mod_meta
 import serger.utils as mod_utils
 import serger.utils.utils_installed_packages as mod_utils_installed_packages
 
@@ -205,46 +207,79 @@ def test_discover_installed_packages_roots_handles_empty_results(
         sys.prefix = original_prefix
 
 
+def _make_poetry_project(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> tuple[Path, Path]:
+    """Create a Poetry project and point Poetry's dirs into tmp_path.
+
+    Returns (project_dir, virtualenvs_dir).
+    """
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text('[tool.poetry]\nname = "My_Pkg"\n')
+    for var in ("POETRY_VIRTUALENVS_PATH", "POETRY_VIRTUALENVS_IN_PROJECT"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("POETRY_CONFIG_DIR", str(tmp_path / "poetry_config"))
+    monkeypatch.setenv("POETRY_CACHE_DIR", str(tmp_path / "poetry_cache"))
+    venvs = tmp_path / "poetry_cache" / "virtualenvs"
+    venvs.mkdir(parents=True)
+    return project, venvs
+
+
+def _poetry_venv_dir(project: Path, venvs: Path) -> Path:
+    env_name = mod_utils_installed_packages._poetry_env_name(project, "My_Pkg")  # noqa: SLF001
+    minor = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return venvs / f"{env_name}-py{minor}"
+
+
 def test_discover_poetry_site_packages_with_poetry(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test Poetry discovery when poetry is available."""
-    # Create a mock poetry venv structure
-    venv_path = tmp_path / "poetry_venv"
+    """Poetry's env is found in its virtualenvs dir without running poetry."""
+    # --- setup ---
+    project, venvs = _make_poetry_project(tmp_path, monkeypatch)
+    venv_path = _poetry_venv_dir(project, venvs)
     lib_path = venv_path / "lib" / "python3.10" / "site-packages"
     lib_path.mkdir(parents=True)
 
-    mock_result = MagicMock(
-        stdout=str(venv_path) + "\n",
-        returncode=0,
-    )
-    mock_result.check_returncode = MagicMock()
+    def _no_subprocess(*_args: object, **_kwargs: object) -> None:
+        xmsg = "poetry discovery must not spawn a process"
+        raise AssertionError(xmsg)
 
-    def mock_run(*_args: object, **_kwargs: object) -> MagicMock:
-        return mock_result
+    monkeypatch.setattr(subprocess, "run", _no_subprocess)
 
-    def mock_which_poetry_site(_: str) -> str | None:
-        return "/usr/bin/poetry"
+    # --- execute ---
+    result = mod_utils_installed_packages._discover_poetry_site_packages(project)  # noqa: SLF001
 
-    monkeypatch.setattr(shutil, "which", mock_which_poetry_site)
-    monkeypatch.setattr(subprocess, "run", mock_run)
+    # --- verify ---
+    assert result == [str(lib_path.resolve())]
 
-    result = mod_utils_installed_packages._discover_poetry_site_packages()  # noqa: SLF001
-    # Should find the site-packages directory
-    assert len(result) > 0
-    assert any("site-packages" in path for path in result)
 
-
-def test_discover_poetry_site_packages_without_poetry(
-    monkeypatch: pytest.MonkeyPatch,
+def test_discover_poetry_site_packages_prefers_in_project_venv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test Poetry discovery when poetry is not available."""
+    """An in-project .venv wins over the shared virtualenvs dir."""
+    # --- setup ---
+    project, venvs = _make_poetry_project(tmp_path, monkeypatch)
+    (_poetry_venv_dir(project, venvs) / "lib" / "python3.10" / "site-packages").mkdir(
+        parents=True
+    )
+    local_site = project / ".venv" / "lib" / "python3.10" / "site-packages"
+    local_site.mkdir(parents=True)
+
+    # --- execute ---
+    result = mod_utils_installed_packages._discover_poetry_site_packages(project)  # noqa: SLF001
 
-    def mock_which_none(_: str) -> str | None:
-        return None
+    # --- verify ---
+    assert result == [str(local_site.resolve())]
 
-    monkeypatch.setattr(shutil, "which", mock_which_none)
-    result = mod_utils_installed_packages._discover_poetry_site_packages()  # noqa: SLF001
+
+def test_discover_poetry_site_packages_without_poetry(
+    tmp_path: Path,
+) -> None:
+    """Test Poetry discovery when the project does not use Poetry."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "plain"\n')
+    result = mod_utils_installed_packages._discover_poetry_site_packages(tmp_path)  # noqa: SLF001
     assert result == []
 
 
@@ -252,30 +287,87 @@ def test_discover_poetry_site_packages_handles_dist_packages(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Test Poetry discovery handles dist-packages (Debian/Ubuntu)."""
-    # Create a mock poetry venv structure with dist-packages
-    venv_path = tmp_path / "poetry_venv"
-    lib_path = venv_path / "lib" / "python3.10" / "dist-packages"
+    # --- setup ---
+    project, venvs = _make_poetry_project(tmp_path, monkeypatch)
+    lib_path = _poetry_venv_dir(project, venvs) / "lib" / "python3.10" / "dist-packages"
     lib_path.mkdir(parents=True)
 
-    mock_result = MagicMock(
-        stdout=str(venv_path) + "\n",
-        returncode=0,
+    # --- execute ---
+    result = mod_utils_installed_packages._discover_poetry_site_packages(project)  # noqa: SLF001
+
+    # --- verify ---
+    assert len(result) > 0
+    assert any("dist-packages" in path for path in result)
+
+
+def _patch(monkeypatch: pytest.MonkeyPatch, name: str, value: object) -> None:
+    """Patch a utils_installed_packages global, also inside stitched builds."""
+    mod_apathetic_utils.patch_everywhere(
+        monkeypatch,
+        mod_utils_installed_packages,
+        name,
+        value,
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={
+            "/dist/",
+            "stitched",
+            f"{mod_meta.PROGRAM_SCRIPT}.py",
+            ".pyz",
+        },
     )
-    mock_result.check_returncode = MagicMock()
 
-    def mock_run(*_args: object, **_kwargs: object) -> MagicMock:
-        return mock_result
 
-    def mock_which_poetry3(_: str) -> str | None:
-        return "/usr/bin/poetry"
+def test_get_installed_packages_roots_reuses_disk_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second process-equivalent lookup is served from the on-disk cache."""
+    # --- setup ---
+    project, _venvs = _make_poetry_project(tmp_path, monkeypatch)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    _patch(monkeypatch, "_roots_memo", {})
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    calls: list[Path | None] = []
+
+    def _fake_discover(project_dir: Path | None = None) -> list[str]:
+        calls.append(project_dir)
+        return [str(site_dir)]
+
+    _patch(monkeypatch, "discover_installed_packages_roots", _fake_discover)
 
-    monkeypatch.setattr(shutil, "which", mock_which_poetry3)
-    monkeypatch.setattr(subprocess, "run", mock_run)
+    # --- execute ---
+    first = mod_utils_installed_packages.get_installed_packages_roots(project)
+    _patch(monkeypatch, "_roots_memo", {})
+    second = mod_utils_installed_packages.get_installed_packages_roots(project)
 
-    result = mod_utils_installed_packages._discover_poetry_site_packages()  # noqa: SLF001
-    # Should find the dist-packages directory
-    assert len(result) > 0
-    assert any("dist-packages" in path for path in result)
+    # --- verify ---
+    assert first == second == [str(site_dir)]
+    assert len(calls) == 1
+
+
+def test_get_installed_packages_roots_invalidates_on_lock_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Creating or re-locking poetry.lock forces a fresh discovery."""
+    # --- setup ---
+    project, _venvs = _make_poetry_project(tmp_path, monkeypatch)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    _patch(monkeypatch, "_roots_memo", {})
+    calls: list[Path | None] = []
+
+    def _fake_discover(project_dir: Path | None = None) -> list[str]:
+        calls.append(project_dir)
+        return []
+
+    _patch(monkeypatch, "discover_installed_packages_roots", _fake_discover)
+
+    # --- execute ---
+    mod_utils_installed_packages.get_installed_packages_roots(project)
+    (project / "poetry.lock").write_text("# lock\n")
+    mod_utils_installed_packages.get_installed_packages_roots(project)
+
+    # --- verify ---
+    assert calls == [project, project]
 
 
 def test_discover_venv_site_packages_in_venv(
@@ -0,0 +1,151 @@
+# tests/50_core/test_apply_lean_mode.py
+"""Tests for apply_lean_mode function."""
+
+import serger.lean_mode as mod_lean_mode
+
+
+def test_strips_function_and_variable_annotations() -> None:
+    """Argument, return and variable annotations should be removed."""
+    # --- setup ---
+    source = (
+        "def greet(name: str, *args: int, times: int = 2, **kw: str) -> str:\n"
+        "    result: str = name * times\n"
+        "    count: int\n"
+        "    return result\n"
+    )
+
+    # --- execute ---
+    result = mod_lean_mode.apply_lean_mode(source)
+
+    # --- verify ---
+    assert result == (
+        "def greet(name, *args, times=2, **kw):\n"
+        "    result = name * times\n"
+        "    return result\n"
+    )
+
+
+def test_strips_parenthesized_parameter_annotations() -> None:
+    """Parentheses around a parameter annotation should go with it."""
+    # --- setup ---
+    source = (
+        "def show(\n"
+        "    paths: (\n"
+        '        "list[str]"  # comment\n'
+        "    ),\n"
+        "    sep: ((str)) = ',',\n"
+        "    pair: (int, str) = (1, 'a'),\n"
+        "):\n"
+        "    return sep.join(paths), pair\n"
+    )
+
+    # --- execute ---
+    result = mod_lean_mode.apply_lean_mode(source)
+
+    # --- verify ---
+    assert result == (
+        "def show(\n"
+        "    paths,\n"
+        "    sep=',',\n"
+        "    pair=(1, 'a'),\n"
+        "):\n"
+        "    return sep.join(paths), pair\n"
+    )
+
+
+def test_strips_parenthesized_return_annotation() -> None:
+    """Parentheses around a return annotation should go with it."""
+    # --- setup ---
+    source = (
+        "def pairs(items) -> (\n"
+        '    "list[tuple[str, int]]"\n'
+        "):\n"
+        "    return list(items)\n"
+    )
+
+    # --- execute ---
+    result = mod_lean_mode.apply_lean_mode(source)
+
+    # --- verify ---
+    assert result == "def pairs(items):\n    return list(items)\n"
+
+
+def test_keeps_annotations_read_at_runtime() -> None:
+    """Dataclass, NamedTuple and TypedDict fields must keep their annotations."""
+    # --- setup ---
+    source = (
+        "from dataclasses import dataclass\n"
+        "from typing import NamedTuple, TypedDict\n"
+        "\n"
+        "\n"
+        "@dataclass\n"
+        "class Point:\n"
+        "    x: int\n"
+        "    y: int = 0\n"
+        "\n"
+        "\n"
+        "class Pair(NamedTuple):\n"
+        "    a: int\n"
+        "\n"
+        "\n"
+        "class Options(TypedDict):\n"
+        "    verbose: bool\n"
+    )
+
+    # --- execute ---
+    result = mod_lean_mode.apply_lean_mode(source)
+
+    # --- verify ---
+    assert result == source
+
+
+def test_drops_type_checking_blocks_and_unused_typing_imports() -> None:
+    """TYPE_CHECKING blocks go away, and so do typing names only they used."""
+    # --- setup ---
+    source = (
+        "from typing import TYPE_CHECKING, Any, cast\n"
+        "import typing\n"
+        "\n"
+        "if TYPE_CHECKING:\n"
+        "    from collections.abc import Iterator\n"
+        "\n"
+        "\n"
+        "def run(items: Iterator[Any]) -> list[Any]:\n"
+        "    if typing.TYPE_CHECKING:\n"
+        "        reveal_type(items)\n"
+        "    return cast(list, list(items))\n"
+    )
+
+    # --- execute ---
+    result = mod_lean_mode.apply_lean_mode(source)
+
+    # --- verify ---
+    assert result == (
+        "from typing import cast\n"
+        "\n"
+        "\n"
+        "\n"
+        "def run(items):\n"
+        "    return cast(list, list(items))\n"
+    )
+
+
+def test_introspecting_module_keeps_annotations() -> None:
+    """Modules that read annotations themselves should only lose TYPE_CHECKING."""
+    # --- setup ---
+    source = (
+        "from typing import get_type_hints\n"
+        "\n"
+        "\n"
+        "def handler(value: int) -> None:\n"
+        "    pass\n"
+        "\n"
+        "\n"
+        "HINTS = get_type_hints(handler)\n"
+    )
+
+    # --- execute ---
+    result = mod_lean_mode.apply_lean_mode(source)
+
+    # --- verify ---
+    assert result == source
@@ -0,0 +1,202 @@
+# tests/50_core/test_build_async.py
+"""Tests for the asyncio build API (serger.build_async)."""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import apathetic_utils as mod_utils
+import pytest
+
+import serger.build as mod_build
+import serger.build_async as mod_build_async
+import serger.meta as mod_meta
+import serger.utils.utils_subprocess as mod_utils_subprocess
+from tests.utils import make_build_cfg, make_include_resolved
+
+
+def _no_blocking_subprocess(*_args: Any, **_kwargs: Any) -> None:
+    xmsg = "subprocess.run() called from an async build"
+    raise AssertionError(xmsg)
+
+
+def _make_cfg(root: Path) -> Any:
+    src = root / "src"
+    src.mkdir(parents=True)
+    (src / "base.py").write_text("BASE = 1\n")
+    (src / "main.py").write_text("from src.base import BASE\n\nMAIN = BASE\n")
+    cfg = make_build_cfg(root, [make_include_resolved("src/*.py", root)])
+    cfg["package"] = "testpkg"
+    cfg["order"] = ["src/base.py", "src/main.py"]
+    return cfg
+
+
+def test_run_build_async_builds_while_loop_runs(tmp_path: Path) -> None:
+    """Builds should run off the loop; concurrent builds should all finish."""
+    # --- setup ---
+    cfgs = [_make_cfg(tmp_path / f"proj{i}") for i in range(3)]
+    ticks: list[float] = []
+
+    async def ticker(done: asyncio.Event) -> None:
+        while not done.is_set():
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0)
+
+    async def main() -> list[Any]:
+        done = asyncio.Event()
+        tick_task = asyncio.create_task(ticker(done))
+        try:
+            return await asyncio.gather(
+                *(mod_build_async.run_build_async(cfg) for cfg in cfgs)
+            )
+        finally:
+            done.set()
+            await tick_task
+
+    # --- execute ---
+    results = asyncio.run(main())
+
+    # --- verify ---
+    assert len(results) == len(cfgs)
+    for i, result in enumerate(results):
+        out_file = tmp_path / f"proj{i}" / "dist" / "script.py"
+        assert result.out_path == out_file.resolve()
+        assert "MAIN = BASE" in out_file.read_text()
+    assert len(ticks) > len(cfgs)  # the loop kept running during the builds
+
+
+def test_build_subprocesses_run_on_the_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """run_subprocess() in a build thread should not call subprocess.run()."""
+    # --- setup ---
+    monkeypatch.setattr(subprocess, "run", _no_blocking_subprocess)
+    code = "import sys; print(sys.stdin.read().upper()); sys.exit(3)"
+
+    def build_step() -> subprocess.CompletedProcess[Any]:
+        return mod_utils_subprocess.run_subprocess(
+            [sys.executable, "-c", code],
+            input="hi",
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    # --- execute ---
+    result = asyncio.run(
+        mod_build_async._run_in_build_thread(build_step, None)  # noqa: SLF001
+    )
+
+    # --- verify ---
+    assert result.returncode == 3  # noqa: PLR2004
+    assert result.stdout == "HI\n"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"check": True}, subprocess.CalledProcessError),
+        ({"timeout": 0.2}, subprocess.TimeoutExpired),
+    ],
+)
+def test_loop_subprocesses_keep_subprocess_run_errors(
+    kwargs: dict[str, Any], error: type[Exception]
+) -> None:
+    """check= and timeout= should raise what subprocess.run() raises."""
+    # --- setup ---
+    code = "import sys, time; time.sleep(0.5); sys.exit(1)"
+
+    def build_step() -> None:
+        mod_utils_subprocess.run_subprocess(
+            [sys.executable, "-c", code], capture_output=True, **kwargs
+        )
+
+    # --- execute and verify ---
+    with pytest.raises(error):
+        asyncio.run(
+            mod_build_async._run_in_build_thread(build_step, None)  # noqa: SLF001
+        )
+
+
+def test_cancel_kills_subprocess_and_stops_build() -> None:
+    """Cancelling should kill the running command and skip the rest."""
+    # --- setup ---
+    steps: list[str] = []
+
+    async def main() -> float:
+        started = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def build_step() -> None:
+            steps.append("start")
+            loop.call_soon_threadsafe(started.set)
+            mod_utils_subprocess.run_subprocess(
+                [sys.executable, "-c", "import time; time.sleep(30)"]
+            )
+            steps.append("after sleep")
+            mod_utils_subprocess.run_subprocess([sys.executable, "-c", "pass"])
+            steps.append("done")
+
+        task = asyncio.create_task(
+            mod_build_async._run_in_build_thread(build_step, None)  # noqa: SLF001
+        )
+        await started.wait()
+        await asyncio.sleep(0.2)  # let the command start
+        start = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - start
+
+    # --- execute ---
+    elapsed = asyncio.run(main())
+
+    # --- verify ---
+    assert steps == ["start"]
+    assert elapsed < 10  # noqa: PLR2004
+
+
+def test_cancel_stops_at_next_stage(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A build cancelled between subprocesses should stop at a stage boundary."""
+    # --- setup ---
+    cfg = _make_cfg(tmp_path)
+    collect = mod_build.collect_included_files
+
+    async def main() -> None:
+        started = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def slow_collect(*args: Any, **kwargs: Any) -> Any:
+            loop.call_soon_threadsafe(started.set)
+            time.sleep(0.3)  # let the cancellation arrive mid-stage
+            return collect(*args, **kwargs)
+
+        mod_utils.patch_everywhere(
+            monkeypatch,
+            mod_build,
+            "collect_included_files",
+            slow_collect,
+            package_prefix=mod_meta.PROGRAM_PACKAGE,
+            stitch_hints={
+                "/dist/",
+                "stitched",
+                f"{mod_meta.PROGRAM_SCRIPT}.py",
+                ".pyz",
+            },
+        )
+        task = asyncio.create_task(mod_build_async.run_build_async(cfg))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # --- execute ---
+    asyncio.run(main())
+
+    # --- verify ---
+    assert not (tmp_path / "dist" / "script.py").exists()
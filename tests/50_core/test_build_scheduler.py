@@ -0,0 +1,95 @@
+# tests/50_core/test_build_scheduler.py
+"""Tests for serger.scheduler.BuildScheduler."""
+
+import threading
+
+import pytest
+
+import serger.scheduler as mod_scheduler
+
+
+def test_tasks_overlap_with_main_thread_stages() -> None:
+    """Background tasks run while stages proceed; results join on demand."""
+    # --- setup ---
+    release = threading.Event()
+    scheduler = mod_scheduler.BuildScheduler()
+
+    def _io_task() -> str:
+        release.wait(timeout=5)
+        return "done"
+
+    # --- execute ---
+    try:
+        scheduler.submit("io", _io_task)
+        scheduler.begin_stage("analyze")
+        # The task is still blocked, so the main thread keeps working
+        release.set()
+        result = scheduler.result("io")
+    finally:
+        scheduler.close()
+
+    # --- verify ---
+    assert result == "done"
+    labels = [label for label, _ in scheduler.critical_path()]
+    assert labels[0] == "analyze"
+    assert set(labels) <= {"analyze", "wait:io"}
+
+
+def test_critical_path_records_blocking_waits_in_order() -> None:
+    """A task the build had to wait for appears between the stage halves."""
+    # --- setup ---
+    started = threading.Event()
+    release = threading.Event()
+    scheduler = mod_scheduler.BuildScheduler()
+
+    def _slow() -> int:
+        started.set()
+        release.wait(timeout=5)
+        return 42
+
+    # --- execute ---
+    try:
+        scheduler.submit("slow", _slow)
+        scheduler.begin_stage("collect")
+        started.wait(timeout=5)
+        threading.Timer(0.05, release.set).start()
+        value = scheduler.result("slow")
+        scheduler.begin_stage("stitch")
+    finally:
+        scheduler.close()
+
+    # --- verify ---
+    assert value == 42  # noqa: PLR2004
+    labels = [label for label, _ in scheduler.critical_path()]
+    assert labels == ["collect", "wait:slow", "collect", "stitch"]
+    (timing,) = scheduler.task_timings
+    assert timing.name == "slow"
+    assert timing.waited > 0
+    assert timing.duration > 0
+
+
+def test_task_exception_is_raised_on_result() -> None:
+    """Errors from background tasks surface where the result is needed."""
+    scheduler = mod_scheduler.BuildScheduler()
+
+    def _boom() -> None:
+        xmsg = "refusing"
+        raise RuntimeError(xmsg)
+
+    try:
+        scheduler.submit("check", _boom)
+        with pytest.raises(RuntimeError, match="refusing"):
+            scheduler.result("check")
+    finally:
+        scheduler.close()
+
+
+def test_submit_rejects_duplicate_names() -> None:
+    """Task names identify results, so they must be unique."""
+    scheduler = mod_scheduler.BuildScheduler()
+    try:
+        scheduler.submit("git", lambda: None)
+        with pytest.raises(ValueError, match="already submitted"):
+            scheduler.submit("git", lambda: None)
+    finally:
+        scheduler.close()
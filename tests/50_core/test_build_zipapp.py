@@ -0,0 +1,67 @@
+# tests/50_core/test_build_zipapp.py
+"""Tests for build_zipapp function."""
+
+import io
+import sys
+import zipfile
+from importlib.util import MAGIC_NUMBER
+
+import pytest
+
+import serger.zipapp_output as mod_zipapp_output
+
+
+def test_archive_holds_source_and_bytecode() -> None:
+    """The archive should carry __main__.py and a matching __main__.pyc."""
+    # --- setup ---
+    script = "#!/usr/bin/env python3\nprint('hi')\n"
+
+    # --- execute ---
+    data = mod_zipapp_output.build_zipapp(script, archive_name="app.pyz")
+
+    # --- verify ---
+    assert data.startswith(f"{mod_zipapp_output.ZIPAPP_SHEBANG}\n".encode())
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == ["__main__.py", "__main__.pyc"]
+        assert archive.read("__main__.py").decode() == script
+        pyc = archive.read("__main__.pyc")
+    assert pyc.startswith(MAGIC_NUMBER)
+    # Hash-based, unchecked (PEP 552)
+    assert int.from_bytes(pyc[4:8], "little") == 0b01
+
+
+def test_archive_is_reproducible() -> None:
+    """Identical scripts should produce byte-identical archives."""
+    # --- execute ---
+    first = mod_zipapp_output.build_zipapp("x = 1\n", archive_name="app.pyz")
+    second = mod_zipapp_output.build_zipapp("x = 1\n", archive_name="app.pyz")
+    other = mod_zipapp_output.build_zipapp("x = 2\n", archive_name="app.pyz")
+
+    # --- verify ---
+    assert first == second
+    assert first != other
+    with zipfile.ZipFile(io.BytesIO(first)) as archive:
+        assert {info.date_time for info in archive.infolist()} == {
+            (1980, 1, 1, 0, 0, 0)
+        }
+
+
+def test_external_interpreter_matches_in_process() -> None:
+    """Compiling with an explicit interpreter should give the same bytecode."""
+    # --- execute ---
+    in_process = mod_zipapp_output.compile_pyc(b"x = 1\n", "app.pyz/__main__.py")
+    external = mod_zipapp_output.compile_pyc(
+        b"x = 1\n", "app.pyz/__main__.py", python=sys.executable
+    )
+
+    # --- verify ---
+    assert external == in_process
+
+
+def test_missing_interpreter_raises() -> None:
+    """An interpreter that cannot be run should raise ValueError."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Cannot run zipapp_python"):
+        mod_zipapp_output.compile_pyc(
+            b"x = 1\n", "app.pyz/__main__.py", python="/nonexistent/python"
+        )
@@ -0,0 +1,137 @@
+"""Tests for serger.module_actions.compile_module_actions / ModuleActionPlan."""
+
+import pytest
+
+import serger.config.config_types as mod_types
+import serger.module_actions as mod_module_actions
+from tests.utils.buildconfig import make_module_action_full
+
+
+def _apply_in_sequence(
+    module_names: list[str], actions: list[mod_types.ModuleActionFull]
+) -> list[str]:
+    """Reference result: each action applied to the whole list in turn."""
+    result = list(module_names)
+    for action in actions:
+        result = mod_module_actions.apply_single_action(result, action, set())
+    return result
+
+
+@pytest.mark.parametrize(
+    "actions",
+    [
+        # chained moves: later actions see earlier results
+        [
+            make_module_action_full("pkg1", dest="pkg2"),
+            make_module_action_full("pkg2.sub", dest="pkg2.renamed"),
+        ],
+        # copy, then an action on the copy only
+        [
+            make_module_action_full("pkg1", dest="pkg3", action="copy"),
+            make_module_action_full("pkg3.sub", action="delete"),
+        ],
+        # delete matching a middle component
+        [make_module_action_full("sub", action="delete")],
+        # component matching (first and last component) and flatten
+        [make_module_action_full("pkg1.deep", dest="flat", mode="flatten")],
+        # rename of the last node, then none
+        [
+            make_module_action_full("pkg1.sub", dest="other", action="rename"),
+            make_module_action_full("pkg1", action="none"),
+        ],
+    ],
+)
+def test_plan_matches_sequential_application(
+    actions: list[mod_types.ModuleActionFull],
+) -> None:
+    """The compiled plan should give the same list as sequential actions."""
+    # --- setup ---
+    module_names = ["pkg1", "pkg1.sub", "pkg1.sub.deep", "pkg2", "pkg1x.sub"]
+
+    # --- execute ---
+    plan = mod_module_actions.compile_module_actions(actions)
+
+    # --- verify ---
+    assert plan.apply(module_names) == _apply_in_sequence(module_names, actions)
+
+
+def test_plan_resolve_returns_final_names() -> None:
+    """resolve() should map one module to all of its final names."""
+    # --- setup ---
+    actions = [
+        make_module_action_full("pkg1", dest="copy", action="copy"),
+        make_module_action_full("pkg1", dest="moved"),
+    ]
+
+    # --- execute ---
+    plan = mod_module_actions.compile_module_actions(actions)
+
+    # --- verify ---
+    assert plan.resolve("pkg1.sub") == ("moved.sub", "copy.sub")
+    assert plan.resolve("other") == ("other",)
+
+
+def test_compile_is_cached_for_equal_actions() -> None:
+    """Equal action lists should reuse one compiled plan."""
+    # --- execute ---
+    first = mod_module_actions.compile_module_actions(
+        [make_module_action_full("pkg1", dest="pkg2")]
+    )
+    second = mod_module_actions.compile_module_actions(
+        [make_module_action_full("pkg1", dest="pkg2")]
+    )
+
+    # --- verify ---
+    assert first is second
+
+
+@pytest.mark.parametrize(
+    ("action", "message"),
+    [
+        ({"source": "pkg1", "action": "bogus"}, "Invalid action type 'bogus'"),
+        ({"source": "pkg1", "action": "move"}, "Move action requires 'dest'"),
+        ({"source": "pkg1", "action": "rename"}, "Rename action requires 'dest'"),
+        (
+            {"source": "pkg1", "action": "copy", "dest": "x", "mode": "bad"},
+            "Invalid mode 'bad'",
+        ),
+    ],
+)
+def test_compile_rejects_invalid_actions(
+    action: mod_types.ModuleActionFull, message: str
+) -> None:
+    """Invalid actions should fail as they do in apply_single_action()."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=message):
+        mod_module_actions.compile_module_actions([action])
+    with pytest.raises(ValueError, match=message):
+        mod_module_actions.apply_single_action(["pkg1"], action, set())
+
+
+def test_plan_scales_with_many_actions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each module should only meet the actions that can match it."""
+    # --- setup ---
+    count = 2000
+    module_names = [f"pkg{i}.mod" for i in range(count)]
+    actions = [
+        make_module_action_full(f"pkg{i}", dest=f"target.pkg{i}") for i in range(count)
+    ]
+    plan = mod_module_actions.compile_module_actions(actions)
+    candidates: list[int] = []
+    original = mod_module_actions.ModuleActionPlan._candidates  # noqa: SLF001
+
+    def counting(
+        self: mod_module_actions.ModuleActionPlan, module_name: str, start: int
+    ) -> list[int]:
+        found = original(self, module_name, start)
+        candidates.append(len(found))
+        return found
+
+    monkeypatch.setattr(mod_module_actions.ModuleActionPlan, "_candidates", counting)
+
+    # --- execute ---
+    result = plan.apply(module_names)
+
+    # --- verify ---
+    assert result == [f"target.pkg{i}.mod" for i in range(count)]
+    assert max(candidates) <= 1
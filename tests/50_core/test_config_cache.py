@@ -0,0 +1,124 @@
+# tests/50_core/test_config_cache.py
+"""Tests for serger.config.config_cache (on-disk resolved-config cache)."""
+
+import argparse
+import os
+from pathlib import Path
+
+import pytest
+
+import serger.config.config_cache as mod_cache
+
+
+def _args(**kwargs: object) -> argparse.Namespace:
+    return argparse.Namespace(**kwargs)
+
+
+def test_store_then_load_returns_payload(tmp_path: Path) -> None:
+    """A fresh entry with unchanged dependencies is a hit."""
+    # --- setup ---
+    dep = tmp_path / "pyproject.toml"
+    dep.write_text("[project]\nname = 'x'\n")
+    cache_dir = tmp_path / "cache"
+
+    # --- execute ---
+    mod_cache.store_cached_config("k", {"value": 1}, {dep}, cache_dir=cache_dir)
+    result = mod_cache.load_cached_config("k", cache_dir=cache_dir)
+
+    # --- verify ---
+    assert result == {"value": 1}
+
+
+def test_load_misses_when_dependency_content_changes(tmp_path: Path) -> None:
+    """Changing a recorded file invalidates the entry."""
+    # --- setup ---
+    dep = tmp_path / "LICENSE"
+    dep.write_text("MIT")
+    cache_dir = tmp_path / "cache"
+    mod_cache.store_cached_config("k", "payload", {dep}, cache_dir=cache_dir)
+
+    # --- execute ---
+    dep.write_text("Apache-2.0")
+    result = mod_cache.load_cached_config("k", cache_dir=cache_dir)
+
+    # --- verify ---
+    assert result is None
+
+
+def test_load_hits_when_file_only_touched(tmp_path: Path) -> None:
+    """A new mtime with identical content is still valid (hash check)."""
+    # --- setup ---
+    dep = tmp_path / "LICENSE"
+    dep.write_text("MIT")
+    cache_dir = tmp_path / "cache"
+    mod_cache.store_cached_config("k", "payload", {dep}, cache_dir=cache_dir)
+
+    # --- execute ---
+    st = dep.stat()
+    os.utime(dep, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    result = mod_cache.load_cached_config("k", cache_dir=cache_dir)
+
+    # --- verify ---
+    assert result == "payload"
+
+
+def test_load_misses_when_missing_dependency_appears(tmp_path: Path) -> None:
+    """A path that was absent at store time invalidates once it exists."""
+    # --- setup ---
+    dep = tmp_path / "pyproject.toml"
+    cache_dir = tmp_path / "cache"
+    mod_cache.store_cached_config("k", "payload", {dep}, cache_dir=cache_dir)
+
+    # --- execute ---
+    dep.write_text("[project]\n")
+    result = mod_cache.load_cached_config("k", cache_dir=cache_dir)
+
+    # --- verify ---
+    assert result is None
+
+
+def test_recording_collects_only_inside_block(tmp_path: Path) -> None:
+    """record_config_dependency is a no-op outside the recording block."""
+    # --- execute ---
+    mod_cache.record_config_dependency(tmp_path / "outside")
+    with mod_cache.recording_config_dependencies() as deps:
+        mod_cache.record_config_dependency(tmp_path / "inside")
+
+    # --- verify ---
+    assert deps == {(tmp_path / "inside").resolve()}
+
+
+def test_cache_key_depends_on_args_and_env(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Different CLI args or SERGER_* env values give different keys."""
+    # --- setup ---
+    monkeypatch.delenv("SERGER_LOG_LEVEL", raising=False)
+    base = mod_cache.make_config_cache_key(_args(include=["src"]), tmp_path)
+
+    # --- execute ---
+    other_args = mod_cache.make_config_cache_key(_args(include=["lib"]), tmp_path)
+    runtime_only = mod_cache.make_config_cache_key(
+        _args(include=["src"], dry_run=True), tmp_path
+    )
+    monkeypatch.setenv("SERGER_LOG_LEVEL", "debug")
+    other_env = mod_cache.make_config_cache_key(_args(include=["src"]), tmp_path)
+
+    # --- verify ---
+    assert other_args != base
+    assert other_env != base
+    # dry-run is applied after resolution, so it shares the entry
+    assert runtime_only == base
+
+
+def test_is_config_cache_enabled_precedence(monkeypatch: pytest.MonkeyPatch) -> None:
+    """CLI flag wins over SERGER_CONFIG_CACHE, which wins over the default."""
+    # --- setup ---
+    monkeypatch.delenv("SERGER_CONFIG_CACHE", raising=False)
+
+    # --- execute & verify ---
+    assert mod_cache.is_config_cache_enabled(_args(config_cache=None)) is False
+    monkeypatch.setenv("SERGER_CONFIG_CACHE", "1")
+    assert mod_cache.is_config_cache_enabled(_args(config_cache=None)) is True
+    assert mod_cache.is_config_cache_enabled(_args(config_cache=False)) is False
@@ -0,0 +1,70 @@
+# tests/50_core/test_expand_build_configs.py
+"""Tests for serger.config.config_resolve.expand_build_configs."""
+
+from typing import Any, cast
+
+import serger.config.config_resolve as mod_resolve
+import serger.config.config_types as mod_types
+
+
+def _root(cfg: dict[str, Any]) -> mod_types.RootConfig:
+    return cast("mod_types.RootConfig", cfg)
+
+
+def test_expand_build_configs_without_builds_returns_root() -> None:
+    """A flat config is its own single build."""
+    # --- setup ---
+    cfg = _root({"include": ["src/**"], "out": "dist/app.py"})
+
+    # --- execute ---
+    result = mod_resolve.expand_build_configs(cfg)
+
+    # --- verify ---
+    assert result == [{"include": ["src/**"], "out": "dist/app.py"}]
+
+
+def test_expand_build_configs_entries_inherit_and_override_root() -> None:
+    """Each build inherits root keys; entry keys win (shallow merge)."""
+    # --- setup ---
+    cfg = _root(
+        {
+            "source_bases": ["src"],
+            "comments_mode": "strip",
+            "builds": [
+                {"package": "a", "out": "dist/a.py"},
+                {"package": "b", "out": "dist/b.py", "comments_mode": "keep"},
+            ],
+        }
+    )
+
+    # --- execute ---
+    result = mod_resolve.expand_build_configs(cfg)
+
+    # --- verify ---
+    expected_builds = 2
+    assert len(result) == expected_builds
+    assert result[0] == {
+        "source_bases": ["src"],
+        "comments_mode": "strip",
+        "package": "a",
+        "out": "dist/a.py",
+    }
+    assert result[1]["comments_mode"] == "keep"
+    assert all("builds" not in build for build in result)
+
+
+def test_expand_build_configs_drops_root_only_keys_from_entries() -> None:
+    """Root-only keys set inside a build entry are ignored."""
+    # --- setup ---
+    cfg = _root(
+        {
+            "watch_interval": 2.0,
+            "builds": [{"package": "a", "watch_interval": 9.0}],
+        }
+    )
+
+    # --- execute ---
+    result = mod_resolve.expand_build_configs(cfg)
+
+    # --- verify ---
+    assert result[0]["watch_interval"] == 2.0  # noqa: PLR2004
@@ -0,0 +1,74 @@
+# tests/50_core/test_find_eager_import_cycles.py
+"""Tests for find_eager_import_cycles function."""
+
+from pathlib import Path
+
+import apathetic_utils as mod_utils
+
+import serger.build as mod_build
+import serger.config.config_types as mod_config_types
+import serger.stitch as mod_stitch
+from tests.utils import make_include_resolved
+
+
+def _find_cycles(src_dir: Path, module_names: list[str]) -> list[list[str]]:
+    file_paths = [(src_dir / f"{name}.py").resolve() for name in module_names]
+    package_root = mod_build.find_package_root(file_paths)
+    include = make_include_resolved(str(src_dir.name), src_dir.parent)
+    file_to_include: dict[Path, mod_config_types.IncludeResolved] = dict.fromkeys(
+        file_paths, include
+    )
+    detected_packages, _parent_dirs = mod_utils.detect_packages_from_files(
+        file_paths, "pkg"
+    )
+    return mod_stitch.find_eager_import_cycles(
+        file_paths,
+        package_root,
+        file_to_include,
+        detected_packages=detected_packages,
+    )
+
+
+def test_reports_module_level_cycle(tmp_path: Path) -> None:
+    """Modules importing each other at module level form a cycle."""
+    # --- setup ---
+    (tmp_path / "a.py").write_text("from pkg.b import x\n")
+    (tmp_path / "b.py").write_text("from pkg.a import y\n")
+    (tmp_path / "c.py").write_text("from pkg.a import z\n")
+
+    # --- execute ---
+    cycles = _find_cycles(tmp_path, ["a", "b", "c"])
+
+    # --- verify ---
+    assert cycles == [["a", "b"]]
+
+
+def test_ignores_imports_inside_functions(tmp_path: Path) -> None:
+    """A deferred (function-level) import breaks the cycle."""
+    # --- setup ---
+    (tmp_path / "a.py").write_text("from pkg.b import x\n")
+    (tmp_path / "b.py").write_text("def f():\n    from pkg.a import y\n")
+
+    # --- execute ---
+    cycles = _find_cycles(tmp_path, ["a", "b"])
+
+    # --- verify ---
+    assert cycles == []
+
+
+def test_ignores_type_checking_imports(tmp_path: Path) -> None:
+    """Imports under `if TYPE_CHECKING:` never run, so they form no cycle."""
+    # --- setup ---
+    (tmp_path / "a.py").write_text("from pkg.b import x\n")
+    (tmp_path / "b.py").write_text(
+        "from typing import TYPE_CHECKING\n"
+        "\n"
+        "if TYPE_CHECKING:\n"
+        "    from pkg.a import y\n"
+    )
+
+    # --- execute ---
+    cycles = _find_cycles(tmp_path, ["a", "b"])
+
+    # --- verify ---
+    assert cycles == []
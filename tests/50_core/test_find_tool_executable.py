@@ -62,3 +62,69 @@ def test_find_tool_executable_with_invalid_custom_path() -> None:
         assert result is not None
     else:
         assert result is None
+
+
+def test_find_tool_executable_uses_prefetched_executables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Should answer from the prefetched mapping without a PATH lookup."""
+
+    # --- setup ---
+    def fail_which(_: str) -> None:
+        xmsg = "PATH lookup should not happen"
+        raise AssertionError(xmsg)
+
+    mod_utils.patch_everywhere(
+        monkeypatch,
+        shutil,
+        "which",
+        fail_which,
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={"/dist/", "stitched", f"{mod_meta.PROGRAM_SCRIPT}.py", ".pyz"},
+    )
+    executables = {("ruff", None): "/opt/bin/ruff", ("black", None): None}
+
+    # --- execute and verify ---
+    with mod_verify.using_tool_executables(executables):
+        assert mod_verify.find_tool_executable("ruff") == "/opt/bin/ruff"
+        assert mod_verify.find_tool_executable("black") is None
+
+
+def test_find_tool_executable_caches_found_tools(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """With a lookup cache, PATH is searched once per found tool."""
+    # --- setup ---
+    tool = tmp_path / "ruff"
+    tool.touch()
+    calls: list[str] = []
+
+    def counting_which(name: str) -> str | None:
+        calls.append(name)
+        return str(tool) if name == "ruff" else None
+
+    mod_utils.patch_everywhere(
+        monkeypatch,
+        shutil,
+        "which",
+        counting_which,
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={"/dist/", "stitched", f"{mod_meta.PROGRAM_SCRIPT}.py", ".pyz"},
+    )
+    cache: mod_verify.ToolLookupCache = {}
+
+    # --- execute ---
+    with mod_verify.caching_tool_lookups(cache):
+        first = mod_verify.find_tool_executable("ruff")
+        second = mod_verify.find_tool_executable("ruff")
+        mod_verify.find_tool_executable("black")
+        mod_verify.find_tool_executable("black")
+        tool.unlink()
+        after_removal = mod_verify.find_tool_executable("ruff")
+
+    # --- verify ---
+    assert first == second == str(tool)
+    # missing tools and removed executables are looked up again
+    assert calls == ["ruff", "black", "black", "ruff"]
+    assert after_removal == str(tool)
@@ -0,0 +1,118 @@
+# tests/50_core/test_logs_helpers.py
+"""Tests for the lazy/queued logging helpers in serger.logs."""
+
+import logging
+from typing import Any
+
+from apathetic_logging import DualStreamHandler
+
+import serger.logs as mod_logs
+
+
+class _CollectingHandler(DualStreamHandler):
+    """DualStreamHandler that keeps messages instead of writing them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        self.messages.append(record.getMessage())
+
+
+def test_lazy_only_calls_when_formatted(
+    direct_logger: mod_logs.AppLogger,
+) -> None:
+    """Lazy arguments should not be computed for disabled levels."""
+    # --- setup ---
+    calls: list[int] = []
+
+    def expensive(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    messages: list[str] = []
+    handler = logging.Handler()
+    handler.emit = lambda record: messages.append(record.getMessage())  # type: ignore[method-assign]
+    direct_logger.addHandler(handler)
+
+    # --- execute ---
+    direct_logger.setLevel("info")
+    direct_logger.trace("value=%s", mod_logs.Lazy(expensive, 1))
+    direct_logger.setLevel("trace")
+    direct_logger.trace("value=%s", mod_logs.Lazy(expensive, 2))
+
+    # --- verify ---
+    assert calls == [2]
+    assert messages == ["value=4"]
+
+
+def test_is_trace_enabled_follows_level(
+    direct_logger: mod_logs.AppLogger,
+) -> None:
+    """isTraceEnabled() should reflect the effective level."""
+    # --- execute and verify ---
+    direct_logger.setLevel("debug")
+    assert not direct_logger.isTraceEnabled()
+    direct_logger.setLevel("trace")
+    assert direct_logger.isTraceEnabled()
+
+
+def test_get_app_logger_is_app_logger() -> None:
+    """The shared app logger should be an AppLogger (has the helpers)."""
+    # --- execute and verify ---
+    assert isinstance(mod_logs.getAppLogger(), mod_logs.AppLogger)
+
+
+def test_queued_handler_writes_in_order_after_flush() -> None:
+    """Queued records should reach the target, frozen and in order."""
+    # --- setup ---
+    target = _CollectingHandler()
+    handler = mod_logs.QueuedDualStreamHandler(target)
+    items = ["a"]
+
+    # --- execute ---
+    try:
+        for i in range(50):
+            record = logging.LogRecord(
+                "serger", logging.INFO, __file__, 1, "%d %s", (i, items), None
+            )
+            handler.handle(record)
+        # mutating after logging must not change already-queued messages
+        items.append("b")
+        handler.flush()
+    finally:
+        handler.close()
+
+    # --- verify ---
+    assert target.messages == [f"{i} ['a']" for i in range(50)]
+
+
+def test_configure_log_queue_round_trip() -> None:
+    """Enabling swaps in the queued handler; disabling restores the original."""
+    # --- setup ---
+    root = logging.getLogger()
+    original = list(root.handlers)
+    target = _CollectingHandler()
+    root.handlers = [target]
+
+    # --- execute ---
+    try:
+        mod_logs.configureLogQueue(enabled=True)
+        queued = root.handlers[0]
+        mod_logs.configureLogQueue(enabled=True)  # idempotent
+        same = root.handlers[0]
+        queued.handle(
+            logging.LogRecord("serger", logging.INFO, __file__, 1, "hi", None, None)
+        )
+        mod_logs.flushLogs()
+        mod_logs.configureLogQueue(enabled=False)
+    finally:
+        restored = list(root.handlers)
+        root.handlers = original
+
+    # --- verify ---
+    assert isinstance(queued, mod_logs.QueuedDualStreamHandler)
+    assert same is queued
+    assert target.messages == ["hi"]
+    assert restored == [target]
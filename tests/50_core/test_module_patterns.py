@@ -0,0 +1,258 @@
+"""Tests for glob/capture patterns in serger.module_actions."""
+
+import pytest
+
+import serger.config.config_types as mod_types
+import serger.module_actions as mod_module_actions
+from tests.utils.buildconfig import make_module_action_full
+
+
+@pytest.mark.parametrize(
+    ("pattern", "module_name", "expected"),
+    [
+        ("vendor.*.impl", "vendor.a.impl", ("vendor.a.impl", {"1": "a"})),
+        # submodules match through their package
+        ("vendor.*.impl", "vendor.a.impl.core", ("vendor.a.impl", {"1": "a"})),
+        ("vendor.*.impl", "vendor.a.b.impl", None),
+        ("lib_*", "lib_foo.sub", ("lib_foo", {"1": "foo"})),
+        ("lib_*", "libfoo", None),
+        ("mod?", "mod1", ("mod1", {})),
+        ("mod?", "mod12", None),
+        ("**.tests", "tests", ("tests", {"1": ""})),
+        ("**.tests", "a.b.tests.unit", ("a.b.tests", {"1": "a.b"})),
+        ("pkg.**", "pkg", ("pkg", {"1": ""})),
+        (
+            "{org}.{name}",
+            "acme.tool.sub",
+            ("acme.tool", {"1": "acme", "2": "tool", "org": "acme", "name": "tool"}),
+        ),
+    ],
+)
+def test_module_pattern_match(
+    pattern: str,
+    module_name: str,
+    expected: tuple[str, dict[str, str]] | None,
+) -> None:
+    """Patterns should match whole components and return their captures."""
+    # --- execute ---
+    result = mod_module_actions.compile_module_pattern(pattern).match(module_name)
+
+    # --- verify ---
+    assert result == expected
+
+
+def test_module_pattern_literal_prefix() -> None:
+    """The literal prefix is the components before the first wildcard."""
+    # --- execute and verify ---
+    pattern = mod_module_actions.compile_module_pattern("vendor.lib.*.impl")
+    assert pattern.literal_prefix == ("vendor", "lib")
+    assert mod_module_actions.compile_module_pattern("**.x").literal_prefix == ()
+
+
+@pytest.mark.parametrize(
+    ("pattern", "message"),
+    [
+        ("vendor..impl", "empty component"),
+        ("a.**.**", r"repeated '\*\*'"),
+        ("a**", r"'\*\*' must be a whole component"),
+        ("a.{1x}", "identifier name"),
+        ("a.{name", "identifier name"),
+        ("{x}.{x}", "capture 'x' used twice"),
+        ("a}.*", "unbalanced"),
+    ],
+)
+def test_module_pattern_rejects_malformed(pattern: str, message: str) -> None:
+    """Malformed patterns should raise a ValueError naming the problem."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=message):
+        mod_module_actions.ModulePattern(pattern)
+
+
+@pytest.mark.parametrize(
+    ("action", "message"),
+    [
+        (
+            make_module_action_full("vendor.*", dest="{2}"),
+            r"uses '\{2\}', which source pattern 'vendor.\*' does not capture",
+        ),
+        (
+            make_module_action_full("vendor.*", dest="{1}}"),
+            "unbalanced brace",
+        ),
+        (
+            make_module_action_full("vendor", dest="{1}"),
+            "source 'vendor' is not a pattern",
+        ),
+        (
+            make_module_action_full("vendor.*", source_path="x.py", dest="x"),
+            "cannot be used with 'source_path'",
+        ),
+    ],
+)
+def test_validate_action_pattern_rejects_bad_templates(
+    action: mod_types.ModuleActionFull, message: str
+) -> None:
+    """Dest templates may only use the captures their source provides."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=message):
+        mod_module_actions.validate_action_pattern(action)
+
+
+def test_expand_module_action_patterns_one_action_per_match() -> None:
+    """Each matched module should become one concrete action."""
+    # --- setup ---
+    actions = [
+        make_module_action_full("vendor.*.impl", dest="{1}._impl"),
+        make_module_action_full("plain", dest="other"),
+    ]
+    module_names = ["vendor.a.impl", "vendor.a.impl.core", "vendor.b.impl", "plain"]
+
+    # --- execute ---
+    result = mod_module_actions.expand_module_action_patterns(actions, module_names)
+
+    # --- verify ---
+    assert [(a["source"], a.get("dest")) for a in result] == [
+        ("vendor.a.impl", "a._impl"),
+        ("vendor.b.impl", "b._impl"),
+        ("plain", "other"),
+    ]
+
+
+def test_expand_module_action_patterns_rejects_collisions() -> None:
+    """Two modules filled into the same dest should be an error."""
+    # --- setup ---
+    actions = [make_module_action_full("vendor.*.impl", dest="merged")]
+
+    # --- execute and verify ---
+    with pytest.raises(
+        ValueError,
+        match=r"maps both 'vendor\.a\.impl' and 'vendor\.b\.impl' to 'merged'",
+    ):
+        mod_module_actions.expand_module_action_patterns(
+            actions, ["vendor.a.impl", "vendor.b.impl"]
+        )
+
+
+def test_expand_module_action_patterns_requires_a_match() -> None:
+    """A pattern that matches nothing should be reported."""
+    # --- setup ---
+    actions = [make_module_action_full("vendor.*.impl", dest="{1}")]
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="does not match any available module"):
+        mod_module_actions.expand_module_action_patterns(
+            actions, ["other.a.impl"], scope="shim"
+        )
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        make_module_action_full("vendor.*.impl", dest="{1}._impl"),
+        make_module_action_full("vendor.*.impl", dest="{1}._impl", action="copy"),
+        make_module_action_full("vendor.*.impl", dest="_{1}", action="rename"),
+        make_module_action_full("vendor.*.impl", action="delete"),
+    ],
+)
+def test_expanded_pattern_actions_apply_like_the_pattern(
+    action: mod_types.ModuleActionFull,
+) -> None:
+    """Sibling matches should not reach each other through component matching."""
+    # --- setup ---
+    module_names = ["vendor", "vendor.a", "vendor.a.impl", "vendor.b", "vendor.b.impl"]
+
+    # --- execute ---
+    expanded = mod_module_actions.expand_module_action_patterns([action], module_names)
+    from_pattern = mod_module_actions.apply_module_actions(
+        module_names, [action], set()
+    )
+    from_expanded = mod_module_actions.apply_module_actions(
+        module_names, expanded, set()
+    )
+    one_by_one = list(module_names)
+    for concrete in expanded:
+        one_by_one = mod_module_actions.apply_single_action(one_by_one, concrete, set())
+
+    # --- verify ---
+    assert [a["source"] for a in expanded] == ["vendor.a.impl", "vendor.b.impl"]
+    assert from_expanded == from_pattern
+    assert one_by_one == from_pattern
+
+
+@pytest.mark.parametrize(
+    ("action", "expected"),
+    [
+        (
+            make_module_action_full("vendor.*.impl", dest="{1}._impl"),
+            ["a._impl", "a._impl.core", "b._impl", "vendor", "keep"],
+        ),
+        (
+            make_module_action_full("vendor.*.impl", dest="flat", mode="flatten"),
+            ["flat", "flat.core", "flat", "vendor", "keep"],
+        ),
+        (
+            make_module_action_full(
+                "vendor.{name}.impl", dest="{name}_impl", action="rename"
+            ),
+            [
+                "vendor.a.a_impl",
+                "vendor.a.a_impl.core",
+                "vendor.b.b_impl",
+                "vendor",
+                "keep",
+            ],
+        ),
+        (
+            make_module_action_full("**.impl", action="delete"),
+            ["vendor", "keep"],
+        ),
+        (
+            make_module_action_full("vendor.*.impl", dest="copies.{1}", action="copy"),
+            [
+                "vendor.a.impl",
+                "copies.a",
+                "vendor.a.impl.core",
+                "copies.a.core",
+                "vendor.b.impl",
+                "copies.b",
+                "vendor",
+                "keep",
+            ],
+        ),
+    ],
+)
+def test_pattern_actions_apply(
+    action: mod_types.ModuleActionFull, expected: list[str]
+) -> None:
+    """Pattern actions should rewrite every matching module."""
+    # --- setup ---
+    module_names = [
+        "vendor.a.impl",
+        "vendor.a.impl.core",
+        "vendor.b.impl",
+        "vendor",
+        "keep",
+    ]
+
+    # --- execute ---
+    plan = mod_module_actions.compile_module_actions([action])
+    single = mod_module_actions.apply_single_action(module_names, action, set())
+
+    # --- verify ---
+    assert plan.apply(module_names) == expected
+    assert single == expected
+
+
+def test_pattern_actions_are_validated_in_expanded_form() -> None:
+    """Conflicts created through a pattern should be caught by validation."""
+    # --- setup ---
+    actions = [
+        make_module_action_full("vendor.*", dest="x.{1}"),
+        make_module_action_full("x.a", dest="vendor.a"),
+    ]
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Circular move chain"):
+        mod_module_actions.validate_module_actions(
+            actions, {"vendor.a", "vendor.b", "x.a"}, {"vendor", "x"}
+        )
@@ -0,0 +1,90 @@
+# tests/50_core/test_optimize_hoisted_imports.py
+"""Tests for optimize_hoisted_imports function."""
+
+import serger.import_optimizer as mod_import_optimizer
+
+
+def test_merges_sorts_and_prunes_imports() -> None:
+    """Same-module imports merge, unused ones go, the rest is sorted."""
+    # --- setup ---
+    imports = [
+        "import sys\n",
+        "from os import sep\n",
+        "import json\n",
+        "from os import path\n",
+        "import re, types\n",
+        "from collections import OrderedDict as OD, deque\n",
+    ]
+    body = ["print(path, sep, re.escape('x'), OD())\n"]
+
+    # --- execute ---
+    result = mod_import_optimizer.optimize_hoisted_imports(imports, body)
+
+    # --- verify ---
+    assert result.imports == [
+        "import re\n",
+        "import sys\n",
+        "import types\n",
+        "from collections import OrderedDict as OD\n",
+        "from os import path, sep\n",
+    ]
+    assert result.removed == ["collections.deque", "json"]
+
+
+def test_keeps_unhandled_statements_verbatim() -> None:
+    """__future__ goes first, TYPE_CHECKING blocks last; names they use stay."""
+    # --- setup ---
+    type_checking = "if TYPE_CHECKING:\n    from pathlib import Path\n"
+    imports = [
+        "from typing import TYPE_CHECKING\n",
+        type_checking,
+        "from __future__ import annotations\n",
+        "from json import *\n",
+    ]
+
+    # --- execute ---
+    result = mod_import_optimizer.optimize_hoisted_imports(imports, ["x = 1\n"])
+
+    # --- verify ---
+    assert result.imports == [
+        "from __future__ import annotations\n",
+        "from typing import TYPE_CHECKING\n",
+        type_checking,
+        "from json import *\n",
+    ]
+    assert result.removed == []
+
+
+def test_string_references_and_unparsable_body_keep_imports() -> None:
+    """Names in strings count as uses; a body that fails to parse disables pruning."""
+    # --- setup ---
+    imports = ["from os import path\n", "import json\n"]
+
+    # --- execute ---
+    by_string = mod_import_optimizer.optimize_hoisted_imports(
+        imports, ["__all__ = ['path']\n"]
+    )
+    unparsable = mod_import_optimizer.optimize_hoisted_imports(
+        imports, ["def broken(:\n"]
+    )
+
+    # --- verify ---
+    assert by_string.imports == ["from os import path\n"]
+    assert unparsable.imports == ["import json\n", "from os import path\n"]
+    assert unparsable.removed == []
+
+
+def test_long_from_imports_are_wrapped() -> None:
+    """Merged imports longer than a line are written in parentheses."""
+    # --- setup ---
+    names = [f"very_long_name_number_{i}" for i in range(5)]
+    imports = [f"from somewhere import {name}\n" for name in names]
+
+    # --- execute ---
+    result = mod_import_optimizer.optimize_hoisted_imports(
+        imports, [f"print({', '.join(names)})\n"]
+    )
+
+    # --- verify ---
+    body = "".join(f"    {name},\n" for name in names)
+    assert result.imports == [f"from somewhere import (\n{body})\n"]
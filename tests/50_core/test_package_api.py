@@ -0,0 +1,86 @@
+# tests/50_core/test_package_api.py
+"""Tests for the lazily loaded package API (`serger.__getattr__`)."""
+
+import ast
+import importlib
+
+import pytest
+
+import serger as mod_serger
+from tests.utils import PROJ_ROOT
+
+
+def test_every_export_resolves() -> None:
+    """Every name in __all__ should be reachable as a package attribute."""
+    # --- execute ---
+    missing = [name for name in mod_serger.__all__ if not hasattr(mod_serger, name)]
+
+    # --- verify ---
+    assert missing == []
+
+
+def test_lazy_export_is_the_defining_object() -> None:
+    """A lazily loaded name should be the object its submodule defines."""
+    # --- setup ---
+    mod_stitch = importlib.import_module("serger.stitch")
+
+    # --- execute and verify ---
+    assert mod_serger.stitch_modules is mod_stitch.stitch_modules
+
+
+def test_dir_lists_exports() -> None:
+    """dir() should include names that have not been loaded yet."""
+    # --- execute ---
+    names = dir(mod_serger)
+
+    # --- verify ---
+    assert set(mod_serger.__all__) <= set(names)
+
+
+def test_unknown_attribute_raises() -> None:
+    """Names outside the public API should raise AttributeError."""
+    # --- execute and verify ---
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = mod_serger.no_such_name  # type: ignore[attr-defined]
+
+
+def _parse_export_lists() -> tuple[dict[str, set[str]], dict[str, set[str]], set[str]]:
+    """Read the three export lists from the package source.
+
+    Parsed rather than imported so the check also runs against stitched
+    builds, which have no TYPE_CHECKING block or lazy table of their own.
+    """
+    init_path = PROJ_ROOT / "src" / "serger" / "__init__.py"
+    tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    type_checking: dict[str, set[str]] = {}
+    lazy: dict[str, set[str]] = {}
+    exported: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING":
+            for stmt in node.body:
+                assert isinstance(stmt, ast.ImportFrom)
+                assert stmt.module is not None
+                type_checking.setdefault(stmt.module, set()).update(
+                    alias.name for alias in stmt.names
+                )
+        elif isinstance(node, ast.AnnAssign | ast.Assign):
+            target = node.target if isinstance(node, ast.AnnAssign) else node.targets[0]
+            name = ast.unparse(target)
+            if name == "_LAZY_SUBMODULE_EXPORTS":
+                assert node.value is not None
+                lazy = {k: set(v) for k, v in ast.literal_eval(node.value).items()}
+            elif name == "__all__":
+                assert node.value is not None
+                exported = set(ast.literal_eval(node.value))
+    return type_checking, lazy, exported
+
+
+def test_export_lists_stay_in_sync() -> None:
+    """TYPE_CHECKING imports, the lazy table and __all__ should agree."""
+    # --- execute ---
+    type_checking, lazy, exported = _parse_export_lists()
+
+    # --- verify ---
+    assert lazy  # parsed something
+    assert type_checking == lazy
+    assert set().union(*lazy.values()) == exported
@@ -5,6 +5,7 @@
 # ruff: noqa: SLF001
 # pyright: reportPrivateUsage=false
 
+from collections import OrderedDict
 from pathlib import Path
 
 import apathetic_utils as mod_utils
@@ -12,6 +13,7 @@ import apathetic_utils as mod_utils
 import serger.build as mod_build
 import serger.config.config_types as mod_config_types
 import serger.stitch as mod_stitch
+import serger.timings as mod_timings
 from tests.utils import make_include_resolved
 
 
@@ -539,3 +541,69 @@ class TestCollectModulesMultiPackage:
         assert any("external" in imp for imp in import_list)
         # Cross-package imports should be removed
         assert not any("pkg1.a" in imp for imp in import_list)
+
+
+class TestCollectModulesCache:
+    """Test reusing processed modules through a ModuleCache."""
+
+    def _collect(
+        self, src_dir: Path, docstring_mode: str = "keep"
+    ) -> tuple[list[str], OrderedDict[str, None]]:
+        file_paths, package_root, file_to_include = _setup_collect_test(
+            src_dir, ["a", "b"]
+        )
+        detected_packages, _parent_dirs = mod_utils.detect_packages_from_files(
+            file_paths, "testpkg"
+        )
+        _sources, all_imports, parts, _names = mod_stitch._collect_modules(
+            file_paths,
+            package_root,
+            "testpkg",
+            file_to_include,
+            detected_packages,
+            docstring_mode=docstring_mode,  # type: ignore[arg-type]
+        )
+        return parts, all_imports
+
+    def test_cache_reuses_unchanged_modules(self, tmp_path: Path) -> None:
+        """Unchanged modules should come from the cache with identical output."""
+        # --- setup ---
+        (tmp_path / "a.py").write_text('"""Doc."""\nimport json\n\nA = 1\n')
+        (tmp_path / "b.py").write_text("B = 2\n")
+        cache = mod_stitch.ModuleCache()
+        uncached = self._collect(tmp_path)
+
+        # --- execute ---
+        with mod_timings.recording() as recorder, mod_stitch.using_module_cache(cache):
+            first = self._collect(tmp_path)
+            cache.next_build()
+            (tmp_path / "b.py").write_text("B = 3\n")
+            second = self._collect(tmp_path)
+            stripped = self._collect(tmp_path, docstring_mode="strip")
+
+        # --- verify ---
+        assert first == uncached
+        assert second[0][0] == first[0][0]
+        assert "B = 3" in second[0][1]
+        assert '"""Doc."""' not in stripped[0][0]
+        # a.py: miss, hit, miss (other docstring mode); b.py: miss each time
+        stats = recorder.caches["modules"]
+        assert (stats.hits, stats.misses) == (1, 5)
+
+    def test_next_build_drops_unused_entries(self) -> None:
+        """Entries a build did not use are forgotten by the next one."""
+        # --- setup ---
+        cache = mod_stitch.ModuleCache()
+        cache.put(("a",), ((), "A"))
+        cache.put(("b",), ((), "B"))
+
+        # --- execute ---
+        cache.next_build()
+        kept = cache.get(("a",))
+        cache.next_build()
+
+        # --- verify ---
+        assert kept == ((), "A")
+        assert cache.get(("a",)) == ((), "A")
+        assert cache.get(("b",)) is None
+        assert len(cache) == 1
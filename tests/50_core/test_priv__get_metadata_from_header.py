@@ -5,9 +5,15 @@
 # ruff: noqa: SLF001
 # pyright: reportPrivateUsage=false
 
+import zipfile
+import zipimport
 from pathlib import Path
 
+import apathetic_utils as mod_apathetic_utils
+import pytest
+
 import serger.actions as mod_actions
+import serger.meta as mod_meta
 
 
 def test__get_metadata_from_header_prefers_constants(tmp_path: Path) -> None:
@@ -87,3 +93,33 @@ __version__ = "3.0.0"
     # --- verify ---
     assert version == "3.0.0"
     assert commit == "abc9999"
+
+
+def test__get_metadata_from_header_reads_inside_zipapp(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A zipapp's __main__.py is not a file; its loader should read it."""
+    # --- setup ---
+    archive = tmp_path / "app.pyz"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("__main__.py", '__version__ = "4.5.6"\n__commit__ = "abc4567"\n')
+    mod_apathetic_utils.patch_everywhere(
+        monkeypatch,
+        mod_actions,
+        "__loader__",
+        zipimport.zipimporter(str(archive)),
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={
+            "/dist/",
+            "stitched",
+            f"{mod_meta.PROGRAM_SCRIPT}.py",
+            ".pyz",
+        },
+    )
+
+    # --- execute ---
+    version, commit = mod_actions._get_metadata_from_header(archive / "__main__.py")
+
+    # --- verify ---
+    assert version == "4.5.6"
+    assert commit == "abc4567"
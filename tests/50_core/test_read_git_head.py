@@ -0,0 +1,135 @@
+# tests/50_core/test_read_git_head.py
+"""Tests for read_git_head (subprocess-free HEAD resolution)."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import serger.stitch as mod_stitch
+
+
+GIT_AVAILABLE = shutil.which("git") is not None
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+OTHER_SHA = "fedcba9876543210fedcba9876543210fedcba98"
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(  # noqa: S603
+        ["git", *args],  # noqa: S607
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def _make_git_dir(root: Path, head: str) -> Path:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head + "\n")
+    return git_dir
+
+
+def test_read_git_head_loose_ref(tmp_path: Path) -> None:
+    """HEAD → refs/heads/main (loose) resolves to the short hash."""
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main")
+    (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+
+    assert mod_stitch.read_git_head(tmp_path) == SHA[:7]
+
+
+def test_read_git_head_packed_ref(tmp_path: Path) -> None:
+    """Refs only present in packed-refs are found (peeled lines skipped)."""
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{OTHER_SHA} refs/tags/v1\n"
+        f"^{SHA}\n"
+        f"{SHA} refs/heads/main\n"
+    )
+
+    assert mod_stitch.read_git_head(tmp_path) == SHA[:7]
+
+
+def test_read_git_head_detached_and_subdirectory(tmp_path: Path) -> None:
+    """A detached HEAD is read from any subdirectory of the worktree."""
+    _make_git_dir(tmp_path, SHA)
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+
+    assert mod_stitch.read_git_head(nested) == SHA[:7]
+
+
+def test_read_git_head_worktree_gitdir_file(tmp_path: Path) -> None:
+    """A `.git` file pointing at a worktree gitdir uses the common dir refs."""
+    main_git = _make_git_dir(tmp_path / "main", "ref: refs/heads/main")
+    (main_git / "refs" / "heads" / "feature").write_text(OTHER_SHA + "\n")
+    wt_git = main_git / "worktrees" / "feature"
+    wt_git.mkdir(parents=True)
+    (wt_git / "HEAD").write_text("ref: refs/heads/feature\n")
+    (wt_git / "commondir").write_text("../..\n")
+    checkout = tmp_path / "feature"
+    checkout.mkdir()
+    (checkout / ".git").write_text(f"gitdir: {wt_git}\n")
+
+    assert mod_stitch.read_git_head(checkout) == OTHER_SHA[:7]
+
+
+def test_read_git_head_honors_core_abbrev(tmp_path: Path) -> None:
+    """core.abbrev sets the short-hash length."""
+    git_dir = _make_git_dir(tmp_path, SHA)
+    (git_dir / "config").write_text("[core]\n\tabbrev = 12\n")
+
+    assert mod_stitch.read_git_head(tmp_path) == SHA[:12]
+
+
+def test_read_git_head_unsupported_layouts_return_none(tmp_path: Path) -> None:
+    """Layouts it does not understand defer to git (None)."""
+    # unborn branch
+    _make_git_dir(tmp_path / "unborn", "ref: refs/heads/main")
+    assert mod_stitch.read_git_head(tmp_path / "unborn") is None
+    # reftable storage
+    reftable = _make_git_dir(tmp_path / "reftable", "ref: refs/heads/.invalid")
+    (reftable / "reftable").mkdir()
+    assert mod_stitch.read_git_head(tmp_path / "reftable") is None
+
+
+@pytest.mark.skipif(not GIT_AVAILABLE, reason="git not available")
+def test_read_git_head_matches_git_rev_parse(tmp_path: Path) -> None:
+    """Agrees with `git rev-parse --short HEAD` for loose and packed refs."""
+    # --- setup ---
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "dev")
+    (tmp_path / "a.txt").write_text("a")
+    _git(tmp_path, "add", "a.txt")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+
+    # --- execute & verify ---
+    assert mod_stitch.read_git_head(tmp_path) == _git(
+        tmp_path, "rev-parse", "--short", "HEAD"
+    )
+    _git(tmp_path, "pack-refs", "--all")
+    assert mod_stitch.read_git_head(tmp_path) == _git(
+        tmp_path, "rev-parse", "--short", "HEAD"
+    )
+
+
+def test_extract_commit_in_ci_does_not_spawn_git(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """In CI, a readable repository is resolved without a subprocess."""
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main")
+    (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+    monkeypatch.setenv("CI", "true")
+
+    def _no_subprocess(*_args: object, **_kwargs: object) -> None:
+        xmsg = "git should not be spawned"
+        raise AssertionError(xmsg)
+
+    monkeypatch.setattr(mod_stitch.subprocess, "run", _no_subprocess)
+
+    assert mod_stitch.extract_commit(tmp_path) == SHA[:7]
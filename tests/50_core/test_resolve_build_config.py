@@ -14,6 +14,7 @@ import serger.config.config_resolve as mod_resolve
 import serger.config.config_types as mod_types
 import serger.constants as mod_constants
 import serger.logs as mod_logs
+import serger.meta as mod_meta
 from tests.utils import make_build_input, make_test_package
 
 
@@ -1571,6 +1572,343 @@ def test_resolve_build_config_shim_invalid_root_value_raises_error(
         mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
 
 
+def test_resolve_build_config_shim_attrs_default_value(
+    tmp_path: Path,
+) -> None:
+    """shim_attrs should default to 'copy' if not specified."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["shim_attrs"] == "copy"
+
+
+def test_resolve_build_config_shim_attrs_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """shim_attrs from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], shim_attrs="lazy")
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["shim_attrs"] == "lazy"
+
+
+def test_resolve_build_config_shim_attrs_invalid_value_raises_error(
+    tmp_path: Path, module_logger: mod_logs.AppLogger
+) -> None:
+    """shim_attrs should raise error for invalid values."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], shim_attrs="eager")
+    args = _args()
+
+    # --- execute and validate ---
+    with (
+        module_logger.useLevel("info"),
+        pytest.raises(ValueError, match="Invalid shim_attrs value"),
+    ):
+        mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+
+def test_resolve_build_config_module_loading_default_value(
+    tmp_path: Path,
+) -> None:
+    """module_loading should default to 'eager' if not specified."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["module_loading"] == "eager"
+
+
+def test_resolve_build_config_module_loading_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """module_loading from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(
+        include=["src/**"], stitch_mode="exec", module_loading="lazy"
+    )
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["module_loading"] == "lazy"
+
+
+def test_resolve_build_config_module_loading_invalid_value_raises_error(
+    tmp_path: Path, module_logger: mod_logs.AppLogger
+) -> None:
+    """module_loading should raise error for invalid values."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], module_loading="deferred")
+    args = _args()
+
+    # --- execute and validate ---
+    with (
+        module_logger.useLevel("info"),
+        pytest.raises(ValueError, match="Invalid module_loading value"),
+    ):
+        mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+
+def test_resolve_build_config_bytecode_cache_default_value(
+    tmp_path: Path,
+) -> None:
+    """bytecode_cache should default to False if not specified."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["bytecode_cache"] is False
+
+
+def test_resolve_build_config_bytecode_cache_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """bytecode_cache from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], bytecode_cache=True)
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["bytecode_cache"] is True
+
+
+def test_resolve_build_config_tree_shake_default_value(
+    tmp_path: Path,
+) -> None:
+    """tree_shake should default to False with nothing kept."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["tree_shake"] is False
+    assert resolved["tree_shake_keep"] == []
+
+
+def test_resolve_build_config_tree_shake_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """tree_shake and tree_shake_keep from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(
+        include=["src/**"], tree_shake=True, tree_shake_keep=["public_api"]
+    )
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["tree_shake"] is True
+    assert resolved["tree_shake_keep"] == ["public_api"]
+
+
+def test_resolve_build_config_tree_shake_keep_invalid_type_raises_error(
+    tmp_path: Path, module_logger: mod_logs.AppLogger
+) -> None:
+    """tree_shake_keep must be a list of strings."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], tree_shake_keep="public_api")
+    args = _args()
+
+    # --- execute and validate ---
+    with (
+        module_logger.useLevel("info"),
+        pytest.raises(TypeError, match="tree_shake_keep must be a list of strings"),
+    ):
+        mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+
+def test_resolve_build_config_startup_profiling_default_value(
+    tmp_path: Path,
+) -> None:
+    """startup_profiling should default to False if not specified."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["startup_profiling"] is False
+
+
+def test_resolve_build_config_startup_profiling_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """startup_profiling from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], startup_profiling=True)
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["startup_profiling"] is True
+
+
+def test_resolve_build_config_lean_mode_default_value(
+    tmp_path: Path,
+) -> None:
+    """lean_mode should default to False if not specified."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["lean_mode"] is False
+
+
+def test_resolve_build_config_lean_mode_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """lean_mode from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], lean_mode=True)
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["lean_mode"] is True
+
+
+def test_resolve_build_config_memory_budget_mb(
+    tmp_path: Path,
+) -> None:
+    """memory_budget_mb should default to None and keep a configured value."""
+    # --- setup ---
+    args = _args()
+
+    # --- execute ---
+    default = mod_resolve.resolve_build_config(
+        make_build_input(include=["src/**"]), args, tmp_path, tmp_path
+    )
+    configured = mod_resolve.resolve_build_config(
+        make_build_input(include=["src/**"], memory_budget_mb=512),
+        args,
+        tmp_path,
+        tmp_path,
+    )
+
+    # --- validate ---
+    assert default["memory_budget_mb"] is None
+    assert configured["memory_budget_mb"] == 512  # noqa: PLR2004
+
+
+def test_resolve_build_config_optimize_imports_default_value(
+    tmp_path: Path,
+) -> None:
+    """optimize_imports should default to False if not specified."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["optimize_imports"] is False
+
+
+def test_resolve_build_config_optimize_imports_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """optimize_imports from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], optimize_imports=True)
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["optimize_imports"] is True
+
+
+def test_resolve_build_config_out_format_default_value(
+    tmp_path: Path,
+) -> None:
+    """out_format should default to 'script' and zipapp_python to None."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"])
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["out_format"] == "script"
+    assert resolved["zipapp_python"] is None
+
+
+def test_resolve_build_config_out_format_from_build_config(
+    tmp_path: Path,
+) -> None:
+    """out_format and zipapp_python from build config should be used."""
+    # --- setup ---
+    raw = make_build_input(
+        include=["src/**"], out_format="zipapp", zipapp_python="python3.12"
+    )
+    args = _args()
+
+    # --- execute ---
+    resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    assert resolved["out_format"] == "zipapp"
+    assert resolved["zipapp_python"] == "python3.12"
+
+
+def test_resolve_build_config_out_format_invalid_value_raises_error(
+    tmp_path: Path, module_logger: mod_logs.AppLogger
+) -> None:
+    """out_format should raise error for invalid values."""
+    # --- setup ---
+    raw = make_build_input(include=["src/**"], out_format="wheel")
+    args = _args()
+
+    # --- execute and validate ---
+    with (
+        module_logger.useLevel("info"),
+        pytest.raises(ValueError, match="Invalid out_format value"),
+    ):
+        mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+
 # ---------------------------------------------------------------------------
 # Module actions tests
 # ---------------------------------------------------------------------------
@@ -2099,6 +2437,64 @@ def test_resolve_build_config_module_actions_invalid_cleanup_raises_error(
         mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
 
 
+def test_resolve_build_config_module_actions_pattern_accepted(
+    tmp_path: Path, module_logger: mod_logs.AppLogger
+) -> None:
+    """Pattern sources with capture templates should pass config validation."""
+    # --- setup ---
+    raw = cast(
+        "mod_types.RootConfig",
+        {"include": ["src/**"], "module_actions": {"vendor.*.impl": "{1}._impl"}},
+    )
+    args = _args()
+
+    # --- execute ---
+    with module_logger.useLevel("info"):
+        resolved = mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+    # --- validate ---
+    actions = resolved["module_actions"]
+    assert actions[0]["source"] == "vendor.*.impl"
+    assert actions[0]["dest"] == "{1}._impl"
+
+
+@pytest.mark.parametrize(
+    ("module_actions", "message"),
+    [
+        ({"vendor.*.impl": "{2}._impl"}, r"module_actions\['vendor.\*.impl'\]"),
+        (
+            [{"source": "vendor.**.**", "action": "delete"}],
+            r"module_actions\[0\].*repeated '\*\*'",
+        ),
+        ([{"source": "vendor", "dest": "{1}"}], r"source 'vendor' is not a pattern"),
+        (
+            [{"source": "lib_*", "source_path": "x.py", "dest": "lib"}],
+            r"'source_path' requires a plain 'source'",
+        ),
+    ],
+)
+def test_resolve_build_config_module_actions_invalid_pattern_raises_error(
+    tmp_path: Path,
+    module_logger: mod_logs.AppLogger,
+    module_actions: object,
+    message: str,
+) -> None:
+    """Malformed patterns and capture templates should fail at config load."""
+    # --- setup ---
+    raw = cast(
+        "mod_types.RootConfig",
+        {"include": ["src/**"], "module_actions": module_actions},
+    )
+    args = _args()
+
+    # --- execute and validate ---
+    with (
+        module_logger.useLevel("info"),
+        pytest.raises(ValueError, match=message),
+    ):
+        mod_resolve.resolve_build_config(raw, args, tmp_path, tmp_path)
+
+
 def test_resolve_build_config_module_actions_source_path_validation(
     tmp_path: Path,
 ) -> None:
@@ -3890,3 +4286,61 @@ def test_resolve_build_config_include_priority_source_then_installed_multiple(
     inc = includes[0]
     assert inc["root"] == installed_dir2.resolve()
     assert str(inc["path"]) == "mypkg/**"
+
+
+def test_resolve_build_config_auto_discovery_is_lazy(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Installed bases are only discovered when an include falls back to them."""
+    # --- setup ---
+    src_pkg = tmp_path / "src" / "mypkg"
+    src_pkg.mkdir(parents=True)
+    (src_pkg / "__init__.py").write_text("")
+    installed_dir = tmp_path / "site-packages"
+    (installed_dir / "otherpkg").mkdir(parents=True)
+    calls: list[Path | None] = []
+
+    def _fake_roots(project_dir: Path | None = None) -> list[str]:
+        calls.append(project_dir)
+        return [str(installed_dir)]
+
+    mod_apathetic_utils.patch_everywhere(
+        monkeypatch,
+        mod_resolve,
+        "get_installed_packages_roots",
+        _fake_roots,
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={
+            "/dist/",
+            "stitched",
+            f"{mod_meta.PROGRAM_SCRIPT}.py",
+            ".pyz",
+        },
+    )
+
+    # --- execute ---
+    # Found in source_bases: no discovery
+    found_locally = mod_resolve.resolve_build_config(
+        make_build_input(include=["mypkg/**"], source_bases=["src"]),
+        _args(),
+        tmp_path,
+        tmp_path,
+    )
+    calls_after_local = len(calls)
+    # Needs the installed-bases fallback: discovery runs once
+    from_installed = mod_resolve.resolve_build_config(
+        make_build_input(
+            include=["otherpkg/**", "otherpkg/*.py"], source_bases=["src"]
+        ),
+        _args(),
+        tmp_path,
+        tmp_path,
+    )
+
+    # --- validate ---
+    assert calls_after_local == 0
+    assert found_locally["installed_bases"] == []
+    assert calls == [tmp_path]
+    assert from_installed["installed_bases"] == [str(installed_dir)]
+    assert from_installed["include"][0]["root"] == installed_dir.resolve()
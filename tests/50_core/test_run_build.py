@@ -8,12 +8,14 @@ a single executable script). File copying is handled by pocket-build.
 import logging
 import re
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
+import apathetic_utils as mod_apathetic_utils
 import pytest
 
 import serger.build as mod_build
 import serger.meta as mod_meta
+import serger.timings as mod_timings
 from tests.utils import make_build_cfg, make_include_resolved
 from tests.utils.buildconfig import make_resolved
 
@@ -64,6 +66,32 @@ def test_run_build_errors_without_package(
         mod_build.run_build(cfg)
 
 
+def test_run_build_refuses_overwrite_before_analysis(
+    tmp_path: Path,
+) -> None:
+    """A non-serger output file should be refused before the build is analyzed.
+
+    The invalid module action would fail during analysis; the refusal must
+    come first so it is not hidden by that error.
+    """
+    # --- setup ---
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "base.py").write_text("BASE = 1\n")
+    out_file = tmp_path / "dist" / "script.py"
+    out_file.parent.mkdir()
+    out_file.write_text("print('hand written')\n")
+
+    cfg = make_build_cfg(tmp_path, [make_include_resolved("src/*.py", tmp_path)])
+    cfg["package"] = "testpkg"
+    cfg["module_actions"] = [{"source": "testpkg", "action": "bogus"}]  # type: ignore[list-item]
+
+    # --- execute & verify ---
+    with pytest.raises(RuntimeError, match="Refusing to overwrite"):
+        mod_build.run_build(cfg)
+    assert out_file.read_text() == "print('hand written')\n"
+
+
 def test_run_build_respects_order_paths(
     tmp_path: Path,
 ) -> None:
@@ -515,3 +543,186 @@ def test_run_build_no_warning_for_files_inside_cwd(
     assert not any("outside project directory" in msg for msg in warning_messages), (
         f"Should not warn for files inside CWD, got: {warning_messages}"
     )
+
+
+def test_run_build_returns_build_result(
+    tmp_path: Path,
+) -> None:
+    """Should report file counts, sizes and phase spans of the build."""
+    # --- setup ---
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "base.py").write_text("BASE = 1\n")
+    (src / "main.py").write_text("from src.base import BASE\n\nMAIN = BASE\n")
+
+    cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("src/*.py", tmp_path)],
+        package="testpkg",
+    )
+
+    # --- execute ---
+    result = mod_build.run_build(cfg)
+
+    # --- verify ---
+    out_file = tmp_path / "dist" / "script.py"
+    assert result.out_path == out_file.resolve()
+    assert result.files == 2  # noqa: PLR2004
+    assert result.bytes_in == len("BASE = 1\n") + len(
+        "from src.base import BASE\n\nMAIN = BASE\n"
+    )
+    assert result.bytes_out == out_file.stat().st_size
+    names = {s.name for s in result.spans}
+    assert {"run_build", "stitch_modules", "_collect_modules"} <= names
+    assert result.to_dict()["files"] == 2  # noqa: PLR2004
+
+
+def test_run_build_dry_run_result_has_no_output(
+    tmp_path: Path,
+) -> None:
+    """A dry run should count files but report no output."""
+    # --- setup ---
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "base.py").write_text("BASE = 1\n")
+
+    cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("src/*.py", tmp_path)],
+        package="testpkg",
+        dry_run=True,
+    )
+
+    # --- execute ---
+    result = mod_build.run_build(cfg)
+
+    # --- verify ---
+    assert result.out_path is None
+    assert result.files == 1
+    assert result.bytes_out == 0
+
+
+def _fake_peak_rss(monkeypatch: pytest.MonkeyPatch, *peaks_mb: float) -> None:
+    """Make the process's peak RSS read as `peaks_mb`, one value per call."""
+    peaks = iter([int(mb * 1024 * 1024) for mb in peaks_mb])
+    mod_apathetic_utils.patch_everywhere(
+        monkeypatch,
+        mod_build,
+        "_max_rss_bytes",
+        lambda: next(peaks),
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={
+            "/dist/",
+            "stitched",
+            f"{mod_meta.PROGRAM_SCRIPT}.py",
+            ".pyz",
+        },
+    )
+
+
+def _memory_budget_cfg(tmp_path: Path, budget_mb: float) -> Any:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "base.py").write_text("BASE = [0] * 100_000\n")
+    return make_build_cfg(
+        tmp_path,
+        [make_include_resolved("src/*.py", tmp_path)],
+        package="testpkg",
+        memory_budget_mb=budget_mb,
+    )
+
+
+def test_run_build_fails_over_memory_budget(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A build whose peak memory exceeds memory_budget_mb should fail."""
+    # --- setup ---
+    cfg = _memory_budget_cfg(tmp_path, 15)
+    _fake_peak_rss(monkeypatch, 10, 20)  # the peak rose during the build
+
+    # --- execute and verify ---
+    with pytest.raises(
+        RuntimeError,
+        match=r"20\.0 MB \(peak RSS\), over its memory_budget_mb of 15 MB",
+    ) as excinfo:
+        mod_build.run_build(cfg)
+    out_file = (tmp_path / "dist" / "script.py").resolve()
+    assert f"The output was still written to {out_file}." in str(excinfo.value)
+    assert out_file.exists()
+
+
+def test_run_build_fails_over_traced_memory_budget(
+    tmp_path: Path,
+) -> None:
+    """With memory accounting on, the traced peak should be checked."""
+    # --- setup ---
+    cfg = _memory_budget_cfg(tmp_path, 0.01)
+
+    # --- execute and verify ---
+    with (
+        mod_timings.memory_accounting(),
+        pytest.raises(RuntimeError, match=r"\(traced\), over its memory_budget_mb"),
+    ):
+        mod_build.run_build(cfg)
+
+
+def test_run_build_memory_budget_ignores_earlier_peak(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A peak RSS reached before the build should not fail it (--watch, --serve)."""
+    # --- setup ---
+    cfg = _memory_budget_cfg(tmp_path, 15)
+    _fake_peak_rss(monkeypatch, 20, 20)  # an earlier build peaked higher
+
+    # --- execute ---
+    with caplog.at_level("WARNING"):
+        result = mod_build.run_build(cfg)
+
+    # --- verify ---
+    assert result.out_path is not None
+    assert any(
+        "already peaked at 20.0 MB before this build" in record.message
+        for record in caplog.records
+    )
+
+
+def test_running_builds_detects_overlap() -> None:
+    """Only a build no other build overlapped should count as alone."""
+    # --- setup ---
+    running = mod_build._RunningBuilds()  # noqa: SLF001
+
+    # --- execute ---
+    first = running.enter()
+    second = running.enter()
+    second_alone = running.leave(second)
+    first_alone = running.leave(first)
+    third = running.enter()
+    third_alone = running.leave(third)
+
+    # --- verify ---
+    assert (first_alone, second_alone, third_alone) == (False, False, True)
+
+
+@pytest.mark.parametrize(
+    ("budget", "error"), [("1GB", TypeError), (True, TypeError), (0, ValueError)]
+)
+def test_run_build_rejects_invalid_memory_budget(
+    tmp_path: Path,
+    budget: object,
+    error: type[Exception],
+) -> None:
+    """memory_budget_mb must be a positive number."""
+    # --- setup ---
+    cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("src/*.py", tmp_path)],
+        package="testpkg",
+        memory_budget_mb=cast("float", budget),
+    )
+
+    # --- execute and verify ---
+    with pytest.raises(error, match="memory_budget_mb"):
+        mod_build.run_build(cfg)
@@ -0,0 +1,135 @@
+# tests/50_core/test_run_builds.py
+"""Tests for run_builds() multi-build orchestration."""
+
+from pathlib import Path
+
+import apathetic_utils as mod_apathetic_utils
+import pytest
+
+import serger.build as mod_build
+import serger.config.config_types as mod_types
+import serger.meta as mod_meta
+from tests.utils import make_build_cfg, make_include_resolved
+from tests.utils.buildconfig import make_resolved
+
+
+def _make_pkg_build(tmp_path: Path, name: str) -> mod_types.RootConfigResolved:
+    pkg = tmp_path / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text(f"NAME = {name!r}\n")
+    return make_build_cfg(
+        tmp_path,
+        [make_include_resolved(f"{name}/**/*.py", tmp_path)],
+        package=name,
+        out=make_resolved(f"dist/{name}.py", tmp_path),
+        disable_build_timestamp=True,
+    )
+
+
+def test_run_builds_runs_every_build(tmp_path: Path) -> None:
+    """All builds should produce their own output file."""
+    # --- setup ---
+    builds = [_make_pkg_build(tmp_path, "alpha"), _make_pkg_build(tmp_path, "beta")]
+
+    # --- execute ---
+    mod_build.run_builds(builds)
+
+    # --- verify ---
+    assert "NAME = 'alpha'" in (tmp_path / "dist" / "alpha.py").read_text()
+    assert "NAME = 'beta'" in (tmp_path / "dist" / "beta.py").read_text()
+
+
+def test_run_builds_sequential_matches_pool(tmp_path: Path) -> None:
+    """max_workers=1 runs in-process and still builds everything."""
+    # --- setup ---
+    builds = [_make_pkg_build(tmp_path, "alpha"), _make_pkg_build(tmp_path, "beta")]
+
+    # --- execute ---
+    mod_build.run_builds(builds, max_workers=1)
+
+    # --- verify ---
+    assert (tmp_path / "dist" / "alpha.py").exists()
+    assert (tmp_path / "dist" / "beta.py").exists()
+
+
+def test_run_builds_rejects_shared_output(tmp_path: Path) -> None:
+    """Two builds writing the same file is a configuration error."""
+    # --- setup ---
+    first = _make_pkg_build(tmp_path, "alpha")
+    second = _make_pkg_build(tmp_path, "beta")
+    second["out"] = first["out"]
+
+    # --- execute & verify ---
+    with pytest.raises(ValueError, match="both write to"):
+        mod_build.run_builds([first, second])
+
+
+def test_run_builds_reports_failures_after_all_builds(tmp_path: Path) -> None:
+    """A failing build should not stop the others; the run fails at the end."""
+    # --- setup ---
+    good = _make_pkg_build(tmp_path, "alpha")
+    bad = _make_pkg_build(tmp_path, "beta")
+    del bad["package"]
+
+    # --- execute & verify ---
+    with pytest.raises(RuntimeError, match="1 of 2 builds failed"):
+        mod_build.run_builds([good, bad], max_workers=1)
+    assert (tmp_path / "dist" / "alpha.py").exists()
+
+
+def test_run_builds_survives_unexpected_errors(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Any exception should fail only its own build and still reach the summary."""
+    # --- setup ---
+    good = _make_pkg_build(tmp_path, "alpha")
+    bad = _make_pkg_build(tmp_path, "beta")
+    real_run_build = mod_build.run_build
+
+    def flaky_run_build(
+        build_cfg: mod_types.RootConfigResolved,
+    ) -> mod_build.BuildResult:
+        if build_cfg.get("package") == "beta":
+            msg = "boom"
+            raise KeyError(msg)
+        return real_run_build(build_cfg)
+
+    mod_apathetic_utils.patch_everywhere(
+        monkeypatch,
+        mod_build,
+        "run_build",
+        flaky_run_build,
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={
+            "/dist/",
+            "stitched",
+            f"{mod_meta.PROGRAM_SCRIPT}.py",
+            ".pyz",
+        },
+    )
+
+    # --- execute & verify ---
+    with (
+        caplog.at_level("INFO"),
+        pytest.raises(RuntimeError, match="1 of 2 builds failed"),
+    ):
+        mod_build.run_builds([good, bad], max_workers=1)
+    assert (tmp_path / "dist" / "alpha.py").exists()
+    assert "KeyError('boom')" in caplog.text
+
+
+def test_run_builds_rejects_shared_extensionless_output_file(tmp_path: Path) -> None:
+    """An existing file without .py is written as-is, like run_build does."""
+    # --- setup ---
+    first = _make_pkg_build(tmp_path, "alpha")
+    second = _make_pkg_build(tmp_path, "beta")
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "app").write_text("")
+    first["out"] = second["out"] = make_resolved("dist/app", tmp_path)
+
+    # --- execute & verify ---
+    with pytest.raises(ValueError, match=r"both write to \S*dist/app\. "):
+        mod_build.run_builds([first, second])
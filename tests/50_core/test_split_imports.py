@@ -1,6 +1,8 @@
 # tests/50_core/test_split_imports.py
 """Tests for split_imports function."""
 
+from pathlib import Path
+
 import serger.stitch as mod_stitch
 
 
@@ -2538,3 +2540,100 @@ def foo():
     # Non-no-op assignment (with alias) should be created
     assert "h = helper" in body
     assert "def foo():" in body
+
+
+def test_split_imports_lazy_mode_hoists_plain_imports() -> None:
+    """In 'lazy' mode, module-level `import x` should be hoisted like 'top'."""
+    code = """import json
+import subprocess as sp
+
+def foo():
+    return json.dumps(sp.PIPE)
+"""
+    imports, body = mod_stitch.split_imports(code, ["serger"], external_imports="lazy")
+    assert imports == ["import json\n", "import subprocess as sp\n"]
+    assert "import json" not in body
+    assert "def foo():" in body
+
+
+def test_split_imports_lazy_mode_moves_function_only_from_imports() -> None:
+    """In 'lazy' mode, `from x import y` used only in functions moves into them."""
+    code = '''from decimal import Decimal
+
+def foo(x):
+    """Doc."""
+    return Decimal(x)
+
+class C:
+    def bar(self):
+        return Decimal(1)
+'''
+    imports, body = mod_stitch.split_imports(code, ["serger"], external_imports="lazy")
+    assert imports == []
+    assert '"""Doc."""\n    from decimal import Decimal\n    return Decimal(x)' in body
+    assert "        from decimal import Decimal\n        return Decimal(1)" in body
+    assert body.count("from decimal import Decimal") == 2  # noqa: PLR2004
+
+
+def test_split_imports_lazy_mode_keeps_shared_names_hoisted() -> None:
+    """In 'lazy' mode, names other modules refer to keep their import hoisted."""
+    code = """from decimal import Decimal
+from fractions import Fraction
+
+def foo(x):
+    return Decimal(x), Fraction(x)
+"""
+    imports, body = mod_stitch.split_imports(
+        code,
+        ["serger"],
+        external_imports="lazy",
+        shared_names=frozenset({"Decimal"}),
+    )
+    assert imports == ["from decimal import Decimal\n"]
+    assert "    from fractions import Fraction\n" in body
+    assert "from decimal" not in body
+
+
+def test_split_imports_lazy_mode_keeps_module_level_uses_hoisted() -> None:
+    """In 'lazy' mode, names used at import time keep their import hoisted."""
+    code = """from fractions import Fraction
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+HALF = Fraction(1, 2)
+
+def foo(x: Any) -> None:
+    return None
+
+def one_liner(): return Path(".")
+
+__all__ = ["Decimal"]
+"""
+    imports, body = mod_stitch.split_imports(code, ["serger"], external_imports="lazy")
+    # Module-level use, annotation, one-line body, and re-export
+    assert imports == [
+        "from fractions import Fraction\n",
+        "from decimal import Decimal\n",
+        "from pathlib import Path\n",
+        "from typing import Any\n",
+    ]
+    assert "from " not in body
+
+
+def test_lazy_import_shared_names_finds_cross_module_references(
+    tmp_path: Path,
+) -> None:
+    """Imported names count as shared when another module refers to them."""
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    texts = {
+        a: (
+            "from json import dumps, loads\n"
+            "from os import sep as separator\n"
+            "from re import compile as rx\n"
+        ),
+        b: "from .a import dumps\nimport a\nSEP = a.separator\n__all__ = ['rx']\n",
+    }
+    shared = mod_stitch._lazy_import_shared_names(texts)  # noqa: SLF001
+    assert shared[a] == {"dumps", "separator", "rx"}
+    assert shared[b] == {"dumps"}  # b binds it too (a refers to it)
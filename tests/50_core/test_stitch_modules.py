@@ -226,8 +226,8 @@ class TestStitchModulesValidation:
                 is_serger_build=is_serger_build_for_test(out_path),
             )
 
-    def test_unimplemented_stitch_mode_exec(self, tmp_path: Path) -> None:
-        """Should raise NotImplementedError when stitch_mode is 'exec'."""
+    def test_exec_stitch_mode_requires_kept_imports(self, tmp_path: Path) -> None:
+        """Should raise ValueError when exec mode would move module imports."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
         (src_dir / "module_a.py").write_text("A = 1\n")
@@ -241,9 +241,10 @@ class TestStitchModulesValidation:
             "package": "testpkg",
             "order": file_paths,
             "stitch_mode": "exec",
+            "external_imports": "top",
         }
 
-        with pytest.raises(NotImplementedError, match="not yet implemented"):
+        with pytest.raises(ValueError, match="requires external_imports"):
             mod_stitch.stitch_modules(
                 config=config,
                 file_paths=file_paths,
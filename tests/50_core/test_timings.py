@@ -0,0 +1,190 @@
+# tests/50_core/test_timings.py
+"""Tests for the span API in serger.timings."""
+
+import contextvars
+import threading
+from dataclasses import replace
+
+import serger.timings as mod_timings
+
+
+def test_span_is_shared_noop_when_not_recording() -> None:
+    """Without an active recorder, span() should hand out one no-op object."""
+    # --- execute and verify ---
+    assert mod_timings.current_recorder() is None
+    assert mod_timings.span("a") is mod_timings.span("b")
+
+
+def test_recording_nests_spans_and_decorated_calls() -> None:
+    """Spans should record their enclosing path, including @timed() calls."""
+
+    # --- setup ---
+    @mod_timings.timed()
+    def helper() -> str:
+        return "done"
+
+    # --- execute ---
+    with mod_timings.recording() as recorder:
+        with mod_timings.span("outer"):
+            assert helper() == "done"
+        helper()
+
+    # --- verify ---
+    paths = [s.path for s in recorder.spans]
+    assert paths == [("outer", "helper"), ("outer",), ("helper",)]
+    assert all(s.duration >= 0 for s in recorder.spans)
+    assert mod_timings.current_recorder() is None
+
+
+def test_record_cache_counts_hits_and_misses() -> None:
+    """Cache lookups should be counted per cache while recording."""
+    # --- execute ---
+    mod_timings.record_cache("ignored", hit=True)  # not recording: no-op
+    with mod_timings.recording() as recorder:
+        snapshot = recorder.cache_snapshot()
+        mod_timings.record_cache("config", hit=True)
+        mod_timings.record_cache("config", hit=True)
+        mod_timings.record_cache("config", hit=False)
+
+    # --- verify ---
+    stats = recorder.caches_since(snapshot)["config"]
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.hit_ratio == stats.hits / stats.lookups
+    assert "ignored" not in recorder.caches
+
+
+def test_format_timings_table_lists_spans_in_tree_order() -> None:
+    """The table should show parents before (indented) children."""
+    # --- setup ---
+    with mod_timings.recording() as recorder:
+        with mod_timings.span("build"):
+            with mod_timings.span("collect"):
+                pass
+            with mod_timings.span("stitch"):
+                pass
+        mod_timings.record_cache("config", hit=False)
+
+    # --- execute ---
+    table = mod_timings.format_timings_table(recorder)
+    data = mod_timings.timings_to_dict(recorder)
+
+    # --- verify ---
+    names = [line.split()[-1] for line in table.splitlines()[2:5]]
+    assert names == ["build", "collect", "stitch"]
+    assert "    collect" in table
+    assert "caches: config 0/1 hits (0%)" in table
+    assert [t["path"] for t in data["totals"]] == [
+        "build",
+        "build/collect",
+        "build/stitch",
+    ]
+    assert data["caches"]["config"]["misses"] == 1
+
+
+def test_chrome_trace_has_lanes_and_complete_events() -> None:
+    """Spans should export as "X" events on named process/thread lanes."""
+    # --- setup ---
+    with mod_timings.recording() as recorder, mod_timings.span("build"):
+        for name in ("pkg.a", "pkg.b"):
+            with mod_timings.span(name, category="module", args={"file": name}):
+                pass
+    worker = replace(recorder.spans[-1], pid=recorder.pid + 1, path=("build",))
+    recorder.merge([worker], {})
+
+    # --- execute ---
+    trace = mod_timings.timings_to_chrome_trace(recorder)
+    totals = mod_timings.timings_to_dict(recorder)["totals"]
+
+    # --- verify ---
+    events = trace["traceEvents"]
+    complete = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in complete] == ["build", "build", "pkg.a", "pkg.b"]
+    module_a = next(e for e in complete if e["name"] == "pkg.a")
+    assert module_a["cat"] == "module"
+    assert module_a["args"] == {"path": "build/pkg.a", "file": "pkg.a"}
+    assert all(e["ts"] >= 0 and e["dur"] >= 0 for e in complete)
+    lanes = {e["pid"]: e["args"]["name"] for e in events if e["name"] == "process_name"}
+    assert lanes == {recorder.pid: "serger", recorder.pid + 1: "serger worker 1"}
+    assert any(e["name"] == "thread_name" for e in events)
+    # modules are summed into one row outside of traces
+    assert [(t["path"], t["calls"]) for t in totals] == [
+        ("build", 2),
+        ("build/[modules]", 2),
+    ]
+
+
+def test_memory_accounting_records_peaks_and_sizes() -> None:
+    """Spans should carry peak/retained memory and record_size() samples."""
+    # --- setup ---
+    kept: list[bytes] = []
+
+    # --- execute ---
+    mod_timings.record_size("ignored", kept)  # not accounting: no-op
+    with (
+        mod_timings.memory_accounting(),
+        mod_timings.recording() as recorder,
+        mod_timings.span("outer"),
+    ):
+        with mod_timings.span("inner"):
+            scratch = bytearray(4_000_000)
+            del scratch
+        kept.append(bytes(1_000_000))
+        mod_timings.record_size("kept", kept)
+
+    # --- verify ---
+    inner, outer = (s.memory_dict() for s in recorder.spans)
+    mb = 1_000_000
+    assert inner["mem_peak_bytes"] >= 4 * mb
+    assert inner["mem_retained_bytes"] < mb
+    # the parent's peak includes its child's
+    assert outer["mem_peak_bytes"] >= 4 * mb
+    assert outer["mem_retained_bytes"] >= mb
+    (sample,) = recorder.sizes
+    assert (sample.name, sample.path) == ("kept", ("outer",))
+    assert sample.size >= mb
+    table = mod_timings.format_memory_table(recorder)
+    assert "kept (in outer)" in table
+    phases = mod_timings.memory_to_dict(recorder)["phases"]
+    assert [p["path"] for p in phases] == ["outer", "outer/inner"]
+
+
+def test_memory_is_only_measured_on_the_tracing_thread() -> None:
+    """Other threads must not reset the shared peak under the owner's spans."""
+    # --- setup ---
+    mb = 1_000_000
+    nested_peaks: list[int | None] = []
+
+    def worker() -> None:
+        with mod_timings.span("worker"):
+            scratch = bytearray(4 * mb)
+            del scratch
+
+    def concurrent_build() -> None:
+        with (
+            mod_timings.memory_accounting(),
+            mod_timings.recording() as nested,
+            mod_timings.span("other build"),
+        ):
+            pass
+        nested_peaks.extend(s.mem_peak for s in nested.spans)
+
+    # --- execute ---
+    with (
+        mod_timings.memory_accounting(),
+        mod_timings.recording() as recorder,
+        mod_timings.span("build"),
+    ):
+        for target in (worker, concurrent_build):
+            # a copied context, as BuildScheduler and asyncio.to_thread use
+            thread = threading.Thread(
+                target=contextvars.copy_context().run, args=(target,)
+            )
+            thread.start()
+            thread.join()
+
+    # --- verify ---
+    spans = {s.name: s for s in recorder.spans}
+    assert spans["worker"].memory_dict() == {}
+    assert nested_peaks == [None]
+    # the worker's allocation still counts towards the owner's span
+    assert spans["build"].memory_dict()["mem_peak_bytes"] >= 4 * mb
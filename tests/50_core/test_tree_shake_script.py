@@ -0,0 +1,150 @@
+# tests/50_core/test_tree_shake_script.py
+"""Tests for tree_shake_script function."""
+
+import serger.tree_shake as mod_tree_shake
+
+
+SCRIPT = """\
+import json
+import os
+from pathlib import Path, PurePath
+
+# === pkg.util ===
+UNUSED_CONST = 42
+USED_CONST = "used"
+
+
+def unused_helper() -> None:
+    print(os.sep)
+
+
+def used_helper() -> str:
+    return USED_CONST
+
+
+class Unused:
+    pass
+
+
+# === pkg.main ===
+def main() -> None:
+    print(used_helper(), Path("."))
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def test_removes_unreachable_definitions_and_imports() -> None:
+    """Only definitions reachable from the __main__ block should remain."""
+    # --- execute ---
+    result = mod_tree_shake.tree_shake_script(SCRIPT)
+
+    # --- verify ---
+    assert sorted(result.removed) == [
+        "json",
+        "os",
+        "pkg.util.UNUSED_CONST",
+        "pkg.util.Unused",
+        "pkg.util.unused_helper",
+    ]
+    text = result.script_text
+    assert "def used_helper" in text
+    assert 'USED_CONST = "used"' in text
+    assert "from pathlib import Path\n" in text
+    assert "PurePath" not in text
+    assert "unused_helper" not in text
+    compile(text, "<shaken>", "exec")
+
+
+def test_keep_and_string_references_are_roots() -> None:
+    """Kept names and names mentioned in strings should survive."""
+    # --- setup ---
+    script = (
+        "# === pkg.api ===\n"
+        "def public() -> None:\n    pass\n\n\n"
+        "def by_name() -> None:\n    pass\n\n\n"
+        "def dropped() -> None:\n    pass\n\n\n"
+        "handler = globals()['by_name']\n"
+    )
+
+    # --- execute ---
+    result = mod_tree_shake.tree_shake_script(script, keep=["public"])
+
+    # --- verify ---
+    assert result.removed == ["pkg.api.dropped"]
+    assert result.string_references == {"by_name": ["pkg.api"]}
+    assert result.dynamic_lookups == ["pkg.api (line 14): globals()"]
+
+
+def test_side_effects_keep_definitions() -> None:
+    """Calls, registering decorators and metaclasses must not be dropped."""
+    # --- setup ---
+    script = (
+        "# === pkg.reg ===\n"
+        "REGISTRY = {}\n"
+        "LOOKUP = dict(a=1)\n\n\n"
+        "@register\n"
+        "def plugin() -> None:\n    pass\n\n\n"
+        "class Model(metaclass=Meta):\n    pass\n\n\n"
+        "@dataclass\n"
+        "class Plain:\n    x: int = 0\n"
+    )
+
+    # --- execute ---
+    result = mod_tree_shake.tree_shake_script(script)
+
+    # --- verify ---
+    assert result.removed == ["pkg.reg.REGISTRY", "pkg.reg.Plain"]
+    assert "LOOKUP = dict(a=1)" in result.script_text
+    assert "def plugin" in result.script_text
+    assert "class Model" in result.script_text
+
+
+def test_classes_with_non_plain_bases_are_kept() -> None:
+    """Subclasses of classes that may run code on subclassing must be kept."""
+    # --- setup ---
+    script = (
+        "# === pkg.plugins ===\n"
+        "import readline\n"
+        "from external import Registered\n\n\n"
+        "class Plugin:\n"
+        "    plugins = []\n\n"
+        "    def __init_subclass__(cls, **kwargs):\n"
+        "        Plugin.plugins.append(cls.__name__)\n\n\n"
+        "class Hello(Plugin):\n    pass\n\n\n"
+        "class External(Registered):\n    pass\n\n\n"
+        "class Error(ValueError):\n    pass\n\n\n"
+        "class Base:\n    pass\n\n\n"
+        "class Child(Base):\n    pass\n"
+    )
+
+    # --- execute ---
+    result = mod_tree_shake.tree_shake_script(script)
+
+    # --- verify ---
+    assert result.removed == [
+        "pkg.plugins.Error",
+        "pkg.plugins.Base",
+        "pkg.plugins.Child",
+    ]
+    assert "import readline" in result.script_text
+    assert "class Hello(Plugin)" in result.script_text
+    assert "class Plugin" in result.script_text
+    assert "class External(Registered)" in result.script_text
+
+
+def test_reports_dropped_all_exports() -> None:
+    """Names listed in an unreferenced __all__ should be reported when removed."""
+    # --- setup ---
+    script = (
+        "# === pkg ===\n__all__ = ['exported']\n\n\ndef exported() -> None:\n    pass\n"
+    )
+
+    # --- execute ---
+    result = mod_tree_shake.tree_shake_script(script)
+
+    # --- verify ---
+    assert result.dropped_exports == ["exported"]
+    assert result.script_text == "# === pkg ===\n"
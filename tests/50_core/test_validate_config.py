@@ -27,9 +27,7 @@ def test_valid_minimal_root_and_build() -> None:
 
 
 def test_valid_multiple_builds() -> None:
-    """Multi-build configs are no longer supported - this test is removed."""
-    # Multi-build support has been removed. This test is kept as a placeholder
-    # but will fail validation since "builds" key is not supported.
+    """A 'builds' list of partial configs should validate True."""
     # --- setup ---
     cfg: dict[str, Any] = {
         "builds": [
@@ -43,8 +41,7 @@ def test_valid_multiple_builds() -> None:
     summary = mod_validate.validate_config(cfg)
 
     # --- validate ---
-    # Should fail because "builds" key is not supported
-    assert summary.valid is False
+    assert summary.valid is True
 
 
 # ---------------------------------------------------------------------------
@@ -53,9 +50,8 @@ def test_valid_multiple_builds() -> None:
 
 
 def test_invalid_builds_not_a_list() -> None:
-    """The 'builds' key is not supported - should fail validation."""
+    """The 'builds' key must be a list - a dict should fail validation."""
     # --- setup ---
-    # not supported
     cfg: dict[str, Any] = {"builds": {"include": ["src"], "out": "dist"}}
 
     # --- execute ---
@@ -0,0 +1,43 @@
+# tests/50_core/test_wrap_with_bytecode_cache.py
+"""Tests for wrap_with_bytecode_cache function."""
+
+import pytest
+
+import serger.bytecode_cache as mod_bytecode_cache
+
+
+def test_program_is_kept_as_comments() -> None:
+    """Every program line should follow the marker, prefixed with '#'."""
+    # --- setup ---
+    script = "#!/usr/bin/env python3\nx = 1\n\nprint(x)\n"
+
+    # --- execute ---
+    wrapped = mod_bytecode_cache.wrap_with_bytecode_cache(script)
+
+    # --- verify ---
+    lines = wrapped.split("\n")
+    start = lines.index(mod_bytecode_cache.BYTECODE_CACHE_MARKER) + 1
+    program = lines[start:-1]
+    assert all(line.startswith("#") for line in program)
+    assert "\n".join(line[1:] for line in program) == script
+    compile(wrapped, "<wrapped>", "exec")
+
+
+def test_digest_changes_with_program() -> None:
+    """Different programs should never share a cache key."""
+    # --- execute ---
+    first = mod_bytecode_cache.wrap_with_bytecode_cache("x = 1\n")
+    second = mod_bytecode_cache.wrap_with_bytecode_cache("x = 2\n")
+    again = mod_bytecode_cache.wrap_with_bytecode_cache("x = 1\n")
+
+    # --- verify ---
+    marker = f"\n{mod_bytecode_cache.BYTECODE_CACHE_MARKER}\n"
+    assert first.split(marker)[0] != second.split(marker)[0]
+    assert first == again
+
+
+def test_rejects_carriage_returns() -> None:
+    """A carriage return would end the comment, so wrapping must refuse."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="carriage returns"):
+        mod_bytecode_cache.wrap_with_bytecode_cache("x = 1\rprint('oops')\n")
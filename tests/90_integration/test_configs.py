@@ -7,6 +7,8 @@ from pathlib import Path
 import pytest
 
 import serger.cli as mod_cli
+import serger.config as mod_config
+import serger.constants as mod_constants
 import serger.logs as mod_logs
 import serger.meta as mod_meta
 from tests.utils import make_test_package, write_config_file
@@ -711,7 +713,7 @@ def test_main_invalid_config(tmp_path: Path) -> None:
         ),
         # Empty builds with strict_config=false - should fail validation
         (
-            # Should fail - builds not supported
+            # Should fail - builds must be a non-empty list
             {"strict_config": False, "builds": []},
             [],
             1,
@@ -720,7 +722,7 @@ def test_main_invalid_config(tmp_path: Path) -> None:
         ),
         # Empty builds with strict_config=true - should fail validation
         (
-            # Should fail - builds not supported
+            # Should fail - builds must be a non-empty list
             {"strict_config": True, "builds": []},
             [],
             1,
@@ -799,17 +801,18 @@ def test_main_invalid_config(tmp_path: Path) -> None:
             "No include patterns found",
             "only_log_level",
         ),
-        # Multiple builds - should fail validation
+        # Multiple builds - every build is checked for includes
         (
             {
+                "package": "mypkg",
                 "builds": [
                     {"include": ["mypkg/**/*.py"], "out": "dist1/mypkg.py"},
                     {"out": "dist2/mypkg.py"},
-                ]
-            },  # Should fail - multi-build not supported
+                ],
+            },  # Should fail - second build has no includes (default strict)
             [],
             1,
-            "builds",
+            "No include patterns found",
             "mixed_builds_one_has_includes",
         ),
     ],
@@ -925,3 +928,83 @@ def test_config_discovery_finds_closest_parent_config(
     # Verify root output was NOT created (proves closest config wins)
     root_dist = root / "root_dist"
     assert not root_dist.exists()
+
+
+def test_main_multi_build_config_builds_each_entry(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A 'builds' list should produce one output per entry, inheriting root keys."""
+    # --- setup ---
+    make_test_package(tmp_path / "alpha")
+    make_test_package(tmp_path / "beta")
+    config = tmp_path / f".{mod_meta.PROGRAM_CONFIG}.json"
+    config.write_text(
+        json.dumps(
+            {
+                "disable_build_timestamp": True,
+                "builds": [
+                    {
+                        "package": "alpha",
+                        "include": ["alpha/**/*.py"],
+                        "out": "dist/alpha.py",
+                    },
+                    {
+                        "package": "beta",
+                        "include": ["beta/**/*.py"],
+                        "out": "dist/beta.py",
+                    },
+                ],
+            }
+        )
+    )
+
+    # --- execute ---
+    monkeypatch.chdir(tmp_path)
+    code = mod_cli.main([])
+
+    # --- verify ---
+    assert code == 0
+    alpha = (tmp_path / "dist" / "alpha.py").read_text()
+    beta = (tmp_path / "dist" / "beta.py").read_text()
+    assert '__package__ = "alpha"' in alpha
+    assert '__package__ = "beta"' in beta
+    # Root-level disable_build_timestamp is inherited by both builds
+    assert mod_constants.BUILD_TIMESTAMP_PLACEHOLDER in alpha
+    assert mod_constants.BUILD_TIMESTAMP_PLACEHOLDER in beta
+
+
+def test_main_config_cache_skips_resolution_on_repeat(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With --config-cache, an unchanged project reuses the resolved config."""
+    # --- setup ---
+    project = tmp_path / "project"
+    project.mkdir()
+    make_test_package(project / "mypkg")
+    write_config_file(
+        project / f".{mod_meta.PROGRAM_CONFIG}.json",
+        package="mypkg",
+        include=["mypkg/**/*.py"],
+        out="dist/mypkg.py",
+    )
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(project)
+    # The first build adds dist/ (and tool caches) to the project dir, which
+    # changes its listing and correctly invalidates the entry once.
+    assert mod_cli.main(["--config-cache"]) == 0
+    assert mod_cli.main(["--config-cache"]) == 0
+
+    # --- patch and execute ---
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        xmsg = "config should have come from the cache"
+        raise AssertionError(xmsg)
+
+    # cli imports resolve_config when it needs it, so patch it at the source
+    monkeypatch.setattr(mod_config, "resolve_config", _fail)
+    code = mod_cli.main(["--config-cache"])
+
+    # --- verify ---
+    assert code == 0
+    assert (project / "dist" / "mypkg.py").exists()
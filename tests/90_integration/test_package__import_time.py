@@ -0,0 +1,74 @@
+# tests/90_integration/test_package__import_time.py
+"""Import-time budget for the package runtime (`python -X importtime`).
+
+`import serger` and `serger --help` must not load the stitcher, the config
+loader or apathetic_utils (which imports pytest); those come in only when a
+build actually runs.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import serger.meta as mod_meta
+
+
+# --- only for package runs ---
+__runtime_mode__ = "package"
+
+# Modules that only a build needs
+HEAVY_MODULES = (
+    "serger.build",
+    "serger.config",
+    "serger.stitch",
+    "apathetic_utils",
+    "pytest",
+)
+
+# Generous: typically ~15ms, CI machines are slow and noisy
+IMPORT_BUDGET_US = 250_000
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Run python -X importtime and return {module: cumulative µs}."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def test_import_package_is_lazy() -> None:
+    """`import serger` should load only the package __init__."""
+    # --- execute ---
+    times = _import_times("-c", f"import {mod_meta.PROGRAM_PACKAGE}")
+
+    # --- verify ---
+    assert mod_meta.PROGRAM_PACKAGE in times
+    loaded = [m for m in HEAVY_MODULES if m in times]
+    assert loaded == []
+    assert times[mod_meta.PROGRAM_PACKAGE] < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("flag", ["--help", "--version"])
+def test_cli_info_flags_skip_the_builder(flag: str) -> None:
+    """`serger --help` / `--version` should not import the build machinery."""
+    # --- execute ---
+    times = _import_times("-m", mod_meta.PROGRAM_PACKAGE, flag)
+
+    # --- verify ---
+    # --version reads pyproject.toml through apathetic_utils in a checkout
+    heavy = HEAVY_MODULES[:3] if flag == "--version" else HEAVY_MODULES
+    loaded = [m for m in heavy if m in times]
+    assert loaded == []
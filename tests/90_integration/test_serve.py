@@ -0,0 +1,292 @@
+# tests/90_integration/test_serve.py
+"""Tests for the build server (serger --serve) and forwarding to it."""
+
+import io
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import suppress
+from pathlib import Path
+
+import apathetic_utils as mod_apathetic_utils
+import pytest
+
+import serger.cli as mod_cli
+import serger.daemon as mod_daemon
+import serger.meta as mod_meta
+from tests.utils import make_test_package, write_config_file
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A small package with a config that builds it into dist/."""
+    make_test_package(tmp_path / "mypkg")
+    config = tmp_path / f".{mod_meta.PROGRAM_CONFIG}.json"
+    write_config_file(
+        config, package="mypkg", include=["mypkg/**/*.py"], out="dist/mypkg.py"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[mod_daemon.BuildServer]:
+    """A BuildServer answering on a socket in tmp_path, in a thread."""
+    build_server = mod_daemon.BuildServer(tmp_path / "serve.sock", mod_cli.run_cli)
+    thread = threading.Thread(target=build_server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield build_server
+    finally:
+        build_server.shutdown()
+        build_server.server_close()
+        thread.join()
+
+
+def _client_env(tmp_path: Path) -> dict[str, str]:
+    # keep the served config cache out of the real user cache dir
+    return {**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_served_builds_stream_output_and_reuse_caches(
+    project: Path, server: mod_daemon.BuildServer
+) -> None:
+    """Builds run on the server; the second one reuses its warm caches."""
+    # --- setup ---
+    out = io.StringIO()
+    env = _client_env(project)
+
+    # --- execute ---
+    replies = [
+        mod_daemon.request_build(
+            ["--log-level", "info"],
+            socket_path=server.socket_path,
+            cwd=project,
+            env=env,
+            stdout=out,
+            stderr=out,
+        )
+        for _ in range(2)
+    ]
+
+    # --- verify ---
+    assert all(reply is not None and reply.exit_code == 0 for reply in replies)
+    assert (project / "dist" / "mypkg.py").exists()
+    assert "Stitch completed" in out.getvalue()
+    second = replies[1]
+    assert second is not None
+    caches = second.results[0]["caches"]
+    assert caches["modules"]["misses"] == 0
+    assert server.builds_served == len(replies)
+
+
+def test_cli_forwards_to_running_server(
+    project: Path,
+    server: mod_daemon.BuildServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """main() should hand the build to the server named by the env var."""
+    # --- setup ---
+    for name, value in _client_env(project).items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("SERGER_SERVE_SOCKET", str(server.socket_path))
+    monkeypatch.chdir(project)
+
+    # --- execute ---
+    served_code = mod_cli.main([])
+    local_code = mod_cli.main(["--no-server"])
+
+    # --- verify ---
+    assert served_code == 0
+    assert local_code == 0
+    assert server.builds_served == 1
+    assert (project / "dist" / "mypkg.py").exists()
+
+
+@pytest.mark.parametrize("key", ["version", "executable", "prefix"])
+def test_mismatched_client_is_refused_and_builds_locally(
+    project: Path,
+    server: mod_daemon.BuildServer,
+    monkeypatch: pytest.MonkeyPatch,
+    key: str,
+) -> None:
+    """A client on another serger or Python should build in its own process."""
+    # --- setup ---
+    server.identity = {**server.identity, key: "something else"}
+    for name, value in _client_env(project).items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("SERGER_SERVE_SOCKET", str(server.socket_path))
+    monkeypatch.chdir(project)
+
+    # --- execute ---
+    reply = mod_daemon.request_build([], socket_path=server.socket_path)
+    code = mod_cli.main([])
+
+    # --- verify ---
+    assert reply is None
+    assert code == 0
+    assert server.builds_served == 0
+    assert (project / "dist" / "mypkg.py").exists()
+
+
+def test_served_build_reports_failures(
+    tmp_path: Path, server: mod_daemon.BuildServer
+) -> None:
+    """A failing build should come back with its exit code and error output."""
+    # --- setup ---
+    err = io.StringIO()
+
+    # --- execute ---
+    reply = mod_daemon.request_build(
+        ["--config", "missing.json"],
+        socket_path=server.socket_path,
+        cwd=tmp_path,
+        env=_client_env(tmp_path),
+        stdout=io.StringIO(),
+        stderr=err,
+    )
+
+    # --- verify ---
+    assert reply is not None
+    assert reply.exit_code != 0
+    assert reply.results == []
+    assert "missing.json" in err.getvalue()
+
+
+def test_request_build_without_server_returns_none(tmp_path: Path) -> None:
+    """With nothing listening, the client should fall back (None)."""
+    # --- execute and verify ---
+    assert (
+        mod_daemon.request_build([], socket_path=tmp_path / "none.sock", cwd=tmp_path)
+        is None
+    )
+
+
+def test_second_server_on_same_socket_is_refused(
+    server: mod_daemon.BuildServer,
+) -> None:
+    """Starting a server on a socket that is already served should fail."""
+    # --- execute and verify ---
+    with pytest.raises(RuntimeError, match="already running"):
+        mod_daemon.BuildServer(server.socket_path, mod_cli.run_cli)
+    assert server.socket_path.exists()
+
+
+def test_stale_socket_file_is_replaced(tmp_path: Path) -> None:
+    """A socket file left by a dead server should not block a new one."""
+    # --- setup ---
+    socket_path = tmp_path / "serve.sock"
+    socket_path.write_text("")
+
+    # --- execute ---
+    build_server = mod_daemon.BuildServer(socket_path, mod_cli.run_cli)
+    build_server.server_close()
+
+    # --- verify ---
+    assert not socket_path.exists()
+
+
+def test_socket_is_owner_only(server: mod_daemon.BuildServer) -> None:
+    """Other users should not be able to connect to the socket."""
+    # --- execute and verify ---
+    assert server.socket_path.stat().st_mode & 0o077 == 0
+
+
+def test_shared_socket_directory_is_refused(tmp_path: Path) -> None:
+    """A directory others can write to could have its socket swapped."""
+    # --- setup ---
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    # --- execute and verify ---
+    with pytest.raises(RuntimeError, match="chmod 700"):
+        mod_daemon.BuildServer(shared / "serve.sock", mod_cli.run_cli)
+    assert not (shared / "serve.sock").exists()
+
+
+def test_missing_socket_directory_is_created_private(tmp_path: Path) -> None:
+    """The server should create its socket directory owner-only."""
+    # --- setup ---
+    socket_path = tmp_path / "cache" / "serger" / "serve.sock"
+
+    # --- execute ---
+    build_server = mod_daemon.BuildServer(socket_path, mod_cli.run_cli)
+    build_server.server_close()
+
+    # --- verify ---
+    assert socket_path.parent.stat().st_mode & 0o077 == 0
+
+
+def test_other_users_are_refused_on_both_sides(
+    project: Path,
+    server: mod_daemon.BuildServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A peer with another uid gets no build, and the client builds locally."""
+    # --- setup ---
+    mod_apathetic_utils.patch_everywhere(
+        monkeypatch,
+        mod_daemon,
+        "_peer_uid",
+        lambda _sock: os.getuid() + 1,
+        package_prefix=mod_meta.PROGRAM_PACKAGE,
+        stitch_hints={
+            "/dist/",
+            "stitched",
+            f"{mod_meta.PROGRAM_SCRIPT}.py",
+            ".pyz",
+        },
+    )
+
+    # --- execute ---
+    reply = mod_daemon.request_build(
+        [], socket_path=server.socket_path, cwd=project, env=_client_env(project)
+    )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(server.socket_path))
+        answer = b""
+        with suppress(ConnectionError):  # closed without reading the request
+            sock.sendall(b'{"argv": []}\n')
+            answer = sock.recv(1024)
+
+    # --- verify ---
+    assert reply is None
+    assert answer == b""
+    assert server.builds_served == 0
+
+
+def test_unresponsive_server_falls_back_to_local_build(tmp_path: Path) -> None:
+    """A server that accepts but never answers should not hang the client."""
+    # --- setup ---
+    socket_path = tmp_path / "wedged.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    # --- execute ---
+    with listener:
+        start = time.monotonic()
+        reply = mod_daemon.request_build(
+            [],
+            socket_path=socket_path,
+            cwd=tmp_path,
+            env=_client_env(tmp_path),
+            accept_timeout=0.2,
+        )
+        elapsed = time.monotonic() - start
+
+    # --- verify ---
+    assert reply is None
+    assert elapsed < 5  # noqa: PLR2004
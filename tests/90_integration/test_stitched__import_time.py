@@ -0,0 +1,48 @@
+# tests/90_integration/test_stitched__import_time.py
+"""Import-time check for the stitched script (`dist/serger.py`).
+
+The self-build uses `external_imports: "lazy"`, so the third-party imports
+that only a build needs (pytest, via apathetic_utils) are not paid by
+`serger --version` / `--help`.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import serger.meta as mod_meta
+from tests.utils import PROJ_ROOT
+
+
+# --- only for stitched runs ---
+__runtime_mode__ = "stitched"
+
+
+@pytest.mark.parametrize("flag", ["--help", "--version"])
+def test_stitched_info_flags_skip_pytest(flag: str) -> None:
+    """Info flags of the stitched script should not import pytest."""
+    # --- setup ---
+    script = PROJ_ROOT / "dist" / f"{mod_meta.PROGRAM_SCRIPT}.py"
+    assert script.exists(), (
+        "Stitched script not found — run `poetry run poe build:stitched` first."
+    )
+
+    # --- execute ---
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", str(script), flag],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "pytest" not in imported
+    assert "_pytest" not in imported
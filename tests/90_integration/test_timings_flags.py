@@ -0,0 +1,119 @@
+# tests/90_integration/test_timings_flags.py
+"""Tests for the --timings, --timings-json, --trace-out and --memory-report flags."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import serger.cli as mod_cli
+import serger.meta as mod_meta
+from tests.utils import make_test_package, write_config_file
+
+
+def _make_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    make_test_package(tmp_path / "mypkg")
+    write_config_file(
+        tmp_path / f".{mod_meta.PROGRAM_CONFIG}.json",
+        package="mypkg",
+        include=["mypkg/**/*.py"],
+        out="dist/mypkg.py",
+    )
+    monkeypatch.chdir(tmp_path)
+
+
+def test_timings_prints_phase_table(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """--timings should print config and build phases to stderr."""
+    # --- setup ---
+    _make_project(tmp_path, monkeypatch)
+
+    # --- execute ---
+    code = mod_cli.main(["--timings"])
+
+    # --- verify ---
+    assert code == 0
+    err = capsys.readouterr().err
+    assert "Timings (" in err
+    for name in ("config", "resolve_config", "run_build", "stitch_modules"):
+        assert f" {name}\n" in err
+    assert "critical path, mypkg → dist/mypkg.py (" in err
+    assert "collect " in err.split("critical path", 1)[1]
+
+
+def test_timings_json_writes_build_result(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """--timings-json should write spans, totals and per-build results."""
+    # --- setup ---
+    _make_project(tmp_path, monkeypatch)
+    report_path = tmp_path / "reports" / "timings.json"
+
+    # --- execute ---
+    code = mod_cli.main(["--timings-json", str(report_path)])
+
+    # --- verify ---
+    assert code == 0
+    report = json.loads(report_path.read_text())
+    paths = {total["path"] for total in report["totals"]}
+    assert "run_build/stitch_modules/_collect_modules" in paths
+    (build,) = report["builds"]
+    assert build["files"] > 0
+    assert build["bytes_out"] == (tmp_path / "dist" / "mypkg.py").stat().st_size
+    assert build["out_path"].endswith("mypkg.py")
+    (critical_path,) = report["critical_paths"]
+    assert [step["name"] for step in critical_path["steps"]][:2] == [
+        "collect",
+        "analyze",
+    ]
+    assert build["critical_path"] == critical_path
+
+
+def test_trace_out_writes_chrome_trace(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """--trace-out should write trace events, down to one span per module."""
+    # --- setup ---
+    _make_project(tmp_path, monkeypatch)
+    trace_path = tmp_path / "build.trace.json"
+
+    # --- execute ---
+    code = mod_cli.main(["--trace-out", str(trace_path)])
+
+    # --- verify ---
+    assert code == 0
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    complete = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert {"config", "run_build", "_collect_modules"} <= complete.keys()
+    modules = [e for e in complete.values() if e["cat"] == "module"]
+    assert modules
+    assert all(e["args"]["file"].endswith(".py") for e in modules)
+
+
+def test_memory_report_prints_memory_table(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """--memory-report should print memory per phase and add it to the JSON."""
+    # --- setup ---
+    _make_project(tmp_path, monkeypatch)
+    report_path = tmp_path / "timings.json"
+
+    # --- execute ---
+    code = mod_cli.main(["--memory-report", "--timings-json", str(report_path)])
+
+    # --- verify ---
+    assert code == 0
+    err = capsys.readouterr().err
+    assert "Memory (peak" in err
+    assert "module_sources (in stitch_modules)" in err
+    report = json.loads(report_path.read_text())
+    paths = {phase["path"] for phase in report["memory"]["phases"]}
+    assert "run_build/stitch_modules/_collect_modules" in paths
+    assert report["builds"][0]["memory_peak_bytes"] > 0
@@ -0,0 +1,105 @@
+# tests/95_integration_output/test_bytecode_cache.py
+"""Integration tests for bytecode_cache (self-caching loader output)."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_cached_pkg(tmp_path: Path, message: str = "hello") -> Path:
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir(exist_ok=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "main.py").write_text(
+        "import sys\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        f"    print({message!r}, argv, __name__)\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        bytecode_cache=True,
+    )
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def _run(
+    script: Path, cache_home: Path, *args: str
+) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ, XDG_CACHE_HOME=str(cache_home))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(  # noqa: S603
+        [sys.executable, str(script), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+
+def _cache_files(cache_home: Path) -> list[Path]:
+    return sorted((cache_home / "serger" / "bytecode").glob("*.bin"))
+
+
+def test_bytecode_cache_writes_and_reuses_code(tmp_path: Path) -> None:
+    """The first run should populate the cache and later runs reuse it."""
+    # --- setup ---
+    script = _build_cached_pkg(tmp_path)
+    cache_home = tmp_path / "cache"
+
+    # --- execute ---
+    cold = _run(script, cache_home, "a")
+    files_after_cold = _cache_files(cache_home)
+    warm = _run(script, cache_home, "a")
+
+    # --- verify ---
+    assert cold.returncode == 0, cold.stderr
+    assert warm.returncode == 0, warm.stderr
+    assert cold.stdout == warm.stdout == "hello ['a'] __main__\n"
+    assert len(files_after_cold) == 1
+    assert _cache_files(cache_home) == files_after_cold
+
+
+def test_bytecode_cache_recovers_from_corrupt_entry(tmp_path: Path) -> None:
+    """An unreadable cache entry should be recompiled, not crash the script."""
+    # --- setup ---
+    script = _build_cached_pkg(tmp_path)
+    cache_home = tmp_path / "cache"
+    _run(script, cache_home)
+    (cache_file,) = _cache_files(cache_home)
+    cache_file.write_bytes(b"not marshal data")
+
+    # --- execute ---
+    result = _run(script, cache_home)
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("hello")
+
+
+def test_bytecode_cache_rebuild_uses_new_entry(tmp_path: Path) -> None:
+    """A rebuilt script must not pick up the previous build's bytecode."""
+    # --- setup ---
+    cache_home = tmp_path / "cache"
+    script = _build_cached_pkg(tmp_path, "first")
+    _run(script, cache_home)
+
+    # --- execute ---
+    script = _build_cached_pkg(tmp_path, "second")
+    result = _run(script, cache_home)
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("second")
+    assert len(_cache_files(cache_home)) == 2  # noqa: PLR2004
@@ -0,0 +1,128 @@
+# tests/95_integration_output/test_external_imports_lazy.py
+"""Integration tests for external_imports="lazy"."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build(tmp_path: Path) -> Path:
+    """Stitch a package that imports a noisy external module."""
+    ext_dir = tmp_path / "ext"
+    ext_dir.mkdir()
+    (ext_dir / "noisy.py").write_text("print('noisy loaded')\nVALUE = 42\n")
+    (ext_dir / "noisy_from.py").write_text("print('noisy_from loaded')\nOTHER = 7\n")
+
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "main.py").write_text(
+        "import noisy\n"
+        "from noisy_from import OTHER\n"
+        "\n"
+        "\n"
+        "def report():\n"
+        "    print(noisy.VALUE, OTHER)\n"
+        "\n"
+        "\n"
+        "def main():\n"
+        "    print('started')\n"
+        "    report()\n"
+        "\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    main()\n"
+    )
+
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        order=["mypkg/__init__.py", "mypkg/main.py"],
+        external_imports="lazy",
+    )
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def test_external_imports_lazy_defers_loading(tmp_path: Path) -> None:
+    """External modules should only execute when first used."""
+    # --- setup ---
+    out_file = _build(tmp_path)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(tmp_path / "ext")
+
+    # --- execute ---
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(out_file)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+    # --- verify ---
+    content = out_file.read_text()
+    assert "noisy = _lazy_external_import('noisy')" in content.replace('"', "'")
+    assert "from noisy_from import OTHER" not in content.split("# === ")[0]
+    assert result.stdout.splitlines() == [
+        "started",
+        "noisy_from loaded",
+        "noisy loaded",
+        "42 7",
+    ]
+
+
+def test_external_imports_lazy_keeps_names_other_modules_use(
+    tmp_path: Path,
+) -> None:
+    """A name re-imported by another module should stay hoisted.
+
+    mypkg.a only uses `dumps` inside a function, but mypkg.b imports it from
+    mypkg.a and calls it at import time; that import is stripped, so b needs
+    the hoisted name in the shared namespace.
+    """
+    # --- setup ---
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "a.py").write_text(
+        "from json import dumps\n\n\ndef f(value):\n    return dumps(value)\n"
+    )
+    (pkg_dir / "b.py").write_text(
+        "from .a import dumps\n"
+        "\n"
+        "X = dumps([1])\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    print(X)\n"
+    )
+    out_file = tmp_path / "stitched.py"
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        order=["mypkg/__init__.py", "mypkg/a.py", "mypkg/b.py"],
+        external_imports="lazy",
+    )
+
+    # --- execute ---
+    mod_build.run_build(build_cfg)
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(out_file)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # --- verify ---
+    assert "from json import dumps" in out_file.read_text().split("# === ")[0]
+    assert result.stdout == "[1]\n"
@@ -0,0 +1,87 @@
+# tests/95_integration_output/test_lean_mode.py
+"""Integration tests for lean_mode (annotation and TYPE_CHECKING stripping)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_lean_pkg(tmp_path: Path, *, lean_mode: bool = True) -> Path:
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir(exist_ok=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "shapes.py").write_text(
+        "from dataclasses import dataclass, fields\n"
+        "from typing import TYPE_CHECKING, Final\n"
+        "\n"
+        "if TYPE_CHECKING:\n"
+        "    from collections.abc import Sequence\n"
+        "\n"
+        "SCALE: Final[int] = 2\n"
+        "\n"
+        "\n"
+        "@dataclass\n"
+        "class Point:\n"
+        "    x: int\n"
+        "    y: int = 0\n"
+        "\n"
+        "\n"
+        "def field_names() -> list[str]:\n"
+        "    return [f.name for f in fields(Point)]\n"
+        "\n"
+        "\n"
+        "def scaled(points: 'Sequence[Point]') -> list[Point]:\n"
+        "    return [Point(p.x * SCALE, p.y * SCALE) for p in points]\n"
+    )
+    (pkg_dir / "main.py").write_text(
+        "from mypkg.shapes import Point, field_names, scaled\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print(field_names(), scaled([Point(1, 2)]))\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        lean_mode=lean_mode,
+    )
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def test_lean_output_runs_and_keeps_dataclass_fields(tmp_path: Path) -> None:
+    """Stripped output should still run, with dataclass fields intact."""
+    # --- execute ---
+    script = _build_lean_pkg(tmp_path)
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # --- verify ---
+    content = script.read_text()
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "['x', 'y'] [Point(x=2, y=4)]\n"
+    assert "TYPE_CHECKING" not in content
+    assert "Final" not in content
+    assert "def scaled(points):" in content
+    assert "    x: int\n" in content
+
+
+def test_annotations_kept_without_lean_mode(tmp_path: Path) -> None:
+    """Default builds should leave annotations untouched."""
+    # --- execute ---
+    content = _build_lean_pkg(tmp_path, lean_mode=False).read_text()
+
+    # --- verify ---
+    assert "def field_names() -> list[str]:" in content
+    assert "if TYPE_CHECKING:" in content
@@ -1897,3 +1897,80 @@ def test_source_path_end_to_end_excluded_to_stitched(tmp_path: Path) -> None:
     assert hasattr(module.public.utils, "helper")
     result = module.public.utils.helper()
     assert result == "from_internal"
+
+
+def test_pattern_action_rewrites_every_match(tmp_path: Path) -> None:
+    """A glob action should rewrite each matching module via its captures."""
+    # --- setup ---
+    for name in ("a", "b"):
+        sub_dir = tmp_path / "vendor" / name
+        sub_dir.mkdir(parents=True)
+        (sub_dir / "__init__.py").write_text("")
+        (sub_dir / "impl.py").write_text(f"def f{name}():\n    return '{name}'\n")
+    (tmp_path / "vendor" / "__init__.py").write_text("")
+
+    out_file = tmp_path / "stitched.py"
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("vendor/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        order=[
+            "vendor/__init__.py",
+            "vendor/a/__init__.py",
+            "vendor/a/impl.py",
+            "vendor/b/__init__.py",
+            "vendor/b/impl.py",
+        ],
+    )
+    build_cfg["module_actions"] = [
+        {"source": "vendor.*.impl", "dest": "{1}._impl", "scope": "original"},
+    ]
+
+    # --- execute ---
+    mod_build.run_build(build_cfg)
+
+    # --- verify ---
+    content = out_file.read_text()
+    assert "# === a._impl ===" in content
+    assert "# === b._impl ===" in content
+
+    spec = importlib.util.spec_from_file_location("test_pattern_action", out_file)
+    assert spec is not None
+    assert spec.loader is not None
+
+    for name in list(sys.modules.keys()):
+        if name.startswith(("vendor", "mypkg", "test_pattern_action")):
+            del sys.modules[name]
+
+    stitched_mod = importlib.util.module_from_spec(spec)
+    sys.modules["test_pattern_action"] = stitched_mod
+    spec.loader.exec_module(stitched_mod)
+
+    assert sys.modules["mypkg.a._impl"].fa() == "a"
+    assert sys.modules["mypkg.b._impl"].fb() == "b"
+
+
+def test_pattern_action_without_matches_raises(tmp_path: Path) -> None:
+    """A glob action that matches nothing should fail the build."""
+    # --- setup ---
+    pkg_dir = tmp_path / "pkg1"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "module.py").write_text("def func():\n    return 'test'\n")
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("pkg1/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        order=["pkg1/__init__.py", "pkg1/module.py"],
+    )
+    build_cfg["module_actions"] = [
+        {"source": "vendor.*.impl", "dest": "{1}._impl", "scope": "original"},
+    ]
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="does not match any available module"):
+        mod_build.run_build(build_cfg)
@@ -0,0 +1,74 @@
+# tests/95_integration_output/test_optimize_imports.py
+"""Integration tests for optimize_imports (hoisted import optimization)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_pkg(tmp_path: Path, *, optimize_imports: bool = True) -> Path:
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir(exist_ok=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "paths.py").write_text(
+        "from os import sep\n"
+        "import json\n"
+        "\n"
+        "\n"
+        "def joined(*parts: str) -> str:\n"
+        "    return sep.join(parts)\n"
+    )
+    (pkg_dir / "main.py").write_text(
+        "from os import path\n"
+        "import csv\n"
+        "\n"
+        "from mypkg.paths import joined\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print(joined('a', 'b') == path.join('a', 'b'))\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        optimize_imports=optimize_imports,
+    )
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def test_optimized_imports_are_merged_and_pruned(tmp_path: Path) -> None:
+    """Unused imports should be dropped and `from os` imports merged."""
+    # --- execute ---
+    script = _build_pkg(tmp_path)
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # --- verify ---
+    content = script.read_text()
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "True\n"
+    assert "from os import path, sep\n" in content
+    assert "import json" not in content
+    assert "import csv" not in content
+
+
+def test_imports_untouched_without_optimize_imports(tmp_path: Path) -> None:
+    """Default builds should hoist imports exactly as written."""
+    # --- execute ---
+    content = _build_pkg(tmp_path, optimize_imports=False).read_text()
+
+    # --- verify ---
+    assert "from os import sep\n" in content
+    assert "import json\n" in content
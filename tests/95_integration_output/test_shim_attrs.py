@@ -0,0 +1,109 @@
+# tests/95_integration_output/test_shim_attrs.py
+"""Integration tests for the shim_attrs setting."""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_pkg(tmp_path: Path, shim_attrs: str) -> Path:
+    """Stitch a small package with a subpackage and return the output path."""
+    pkg_dir = tmp_path / "mypkg"
+    (pkg_dir / "sub").mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "core.py").write_text("def func():\n    return 'core'\n")
+    (pkg_dir / "sub" / "__init__.py").write_text("")
+    (pkg_dir / "sub" / "helpers.py").write_text("HELPER = 'helper'\n")
+
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        order=[
+            "mypkg/__init__.py",
+            "mypkg/core.py",
+            "mypkg/sub/__init__.py",
+            "mypkg/sub/helpers.py",
+        ],
+    )
+    build_cfg["shim_attrs"] = shim_attrs  # type: ignore[typeddict-item]
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def _load(out_file: Path, name: str) -> types.ModuleType:
+    for mod_name in list(sys.modules):
+        if mod_name.startswith(("mypkg", name)):
+            del sys.modules[mod_name]
+    spec = importlib.util.spec_from_file_location(name, out_file)
+    assert spec is not None
+    assert spec.loader is not None
+    stitched_mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = stitched_mod
+    spec.loader.exec_module(stitched_mod)
+    return stitched_mod
+
+
+def test_shim_attrs_lazy_uses_registration_table(tmp_path: Path) -> None:
+    """Lazy mode should emit one table instead of per-package global copies."""
+    # --- execute ---
+    content = _build_pkg(tmp_path, "lazy").read_text()
+
+    # --- verify ---
+    assert "_SHIM_PACKAGES = (" in content
+    assert "_setup_lazy_pkg_modules(_SHIM_PACKAGES" in content
+    assert "for _key, _value in _globals.items()" not in content
+    assert "_setup_pkg_modules(" not in content
+
+
+def test_shim_attrs_lazy_forwards_attributes(tmp_path: Path) -> None:
+    """Package modules should resolve stitched globals on first access."""
+    # --- setup ---
+    out_file = _build_pkg(tmp_path, "lazy")
+
+    # --- execute ---
+    _load(out_file, "test_shim_attrs_lazy")
+
+    # --- verify ---
+    import mypkg  # type: ignore[import-not-found]  # noqa: PLC0415
+    from mypkg.core import func  # type: ignore[import-not-found]  # noqa: PLC0415
+    from mypkg.sub.helpers import (  # type: ignore[import-not-found]  # noqa: PLC0415
+        HELPER,
+    )
+
+    assert func() == "core"
+    assert HELPER == "helper"
+    assert mypkg.func is func
+    assert isinstance(mypkg.sub, types.ModuleType)
+    assert "func" in dir(mypkg)
+    assert "func" not in vars(mypkg)  # not copied, only forwarded
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = mypkg.missing
+
+
+def test_shim_attrs_copy_and_lazy_expose_same_names(tmp_path: Path) -> None:
+    """Both modes should expose the same public attributes on packages."""
+    # --- setup ---
+    copy_dir = tmp_path / "copy"
+    lazy_dir = tmp_path / "lazy"
+    copy_dir.mkdir()
+    lazy_dir.mkdir()
+    copy_out = _build_pkg(copy_dir, "copy")
+    lazy_out = _build_pkg(lazy_dir, "lazy")
+
+    # --- execute ---
+    _load(copy_out, "test_shim_attrs_copy")
+    copy_names = {n for n in dir(sys.modules["mypkg"]) if not n.startswith("_")}
+    _load(lazy_out, "test_shim_attrs_lazy2")
+    lazy_names = {n for n in dir(sys.modules["mypkg"]) if not n.startswith("_")}
+
+    # --- verify ---
+    assert copy_names == lazy_names
@@ -0,0 +1,111 @@
+# tests/95_integration_output/test_startup_profiling.py
+"""Integration tests for startup_profiling (SERGER_PROFILE timing probes)."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_profiled_pkg(tmp_path: Path, *, startup_profiling: bool = True) -> Path:
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir(exist_ok=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "slow.py").write_text("import time\n\ntime.sleep(0.05)\nSLOW = True\n")
+    (pkg_dir / "main.py").write_text(
+        "from mypkg.slow import SLOW\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print('ran', SLOW, argv)\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        startup_profiling=startup_profiling,
+    )
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def _run(script: Path, profile: str | None) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env.pop("SERGER_PROFILE", None)
+    if profile is not None:
+        env["SERGER_PROFILE"] = profile
+    return subprocess.run(  # noqa: S603
+        [sys.executable, str(script), "x"],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+
+def test_profile_json_reports_modules_shims_and_imports(tmp_path: Path) -> None:
+    """SERGER_PROFILE=json should time every section, slowest first."""
+    # --- setup ---
+    script = _build_profiled_pkg(tmp_path)
+
+    # --- execute ---
+    result = _run(script, "json")
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "ran True ['x']\n"
+    report = json.loads(result.stderr.strip().splitlines()[-1])
+    entries = report["entries"]
+    labels = {(entry["kind"], entry["name"]) for entry in entries}
+    assert ("imports", "hoisted imports") in labels
+    assert ("module", "mypkg.slow") in labels
+    assert ("module", "mypkg.main") in labels
+    assert ("shims", "_create_pkg_module") in labels
+    assert ("shims", "_setup_pkg_modules") in labels
+    assert entries[0]["name"] == "mypkg.slow"
+    assert entries[0]["ms"] >= 50  # noqa: PLR2004
+    assert report["total_ms"] >= entries[0]["ms"]
+
+
+def test_profile_table_is_printed_to_stderr(tmp_path: Path) -> None:
+    """SERGER_PROFILE=1 should print a human-readable table."""
+    # --- setup ---
+    script = _build_profiled_pkg(tmp_path)
+
+    # --- execute ---
+    result = _run(script, "1")
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert "startup profile:" in result.stderr
+    assert "mypkg.slow" in result.stderr
+
+
+def test_probes_are_silent_when_disabled(tmp_path: Path) -> None:
+    """Without SERGER_PROFILE (or with 0) nothing should be reported."""
+    # --- setup ---
+    script = _build_profiled_pkg(tmp_path)
+
+    # --- execute ---
+    unset = _run(script, None)
+    zero = _run(script, "0")
+
+    # --- verify ---
+    assert unset.returncode == zero.returncode == 0
+    assert unset.stderr == zero.stderr == ""
+
+
+def test_no_probes_without_startup_profiling(tmp_path: Path) -> None:
+    """Builds without the flag should not contain any probes."""
+    # --- execute ---
+    content = _build_profiled_pkg(tmp_path, startup_profiling=False).read_text()
+
+    # --- verify ---
+    assert "_SERGER_PROFILE" not in content
@@ -0,0 +1,240 @@
+# tests/95_integration_output/test_stitch_mode_exec.py
+"""Integration tests for stitch_mode="exec" (precompiled module code)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import apathetic_utils as mod_apathetic_utils
+import pytest
+
+import serger.build as mod_build
+import serger.meta as mod_meta
+from tests.utils import PROJ_ROOT
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_exec_pkg(tmp_path: Path, module_loading: str = "eager") -> Path:
+    """Stitch a package whose modules rely on separate namespaces."""
+    pkg_dir = tmp_path / "mypkg"
+    (pkg_dir / "sub").mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text("from .core import describe\n")
+    (pkg_dir / "core.py").write_text(
+        "from __future__ import annotations\n"
+        "\n"
+        "import json\n"
+        "\n"
+        "from .sub.helpers import NAME as HELPER_NAME\n"
+        "\n"
+        "NAME = 'core'\n"
+        "\n"
+        "\n"
+        "def describe() -> str:\n"
+        "    return json.dumps([NAME, HELPER_NAME, __name__, __package__])\n"
+    )
+    (pkg_dir / "sub" / "__init__.py").write_text("")
+    # Same top-level name as core: fine, each module has its own namespace
+    (pkg_dir / "sub" / "helpers.py").write_text("NAME = 'helpers'\n")
+    # Never imported by the entry point
+    (pkg_dir / "unused.py").write_text("print('unused executed')\n")
+    (pkg_dir / "__main__.py").write_text(
+        "from mypkg import describe\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print(describe())\n"
+        "    print(argv)\n"
+        "    return 0\n"
+    )
+
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        stitch_mode="exec",
+        internal_imports="keep",
+        external_imports="keep",
+    )
+    build_cfg["module_loading"] = module_loading  # type: ignore[typeddict-item]
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def _run(script: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, str(script), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_exec_mode_embeds_compiled_code(tmp_path: Path) -> None:
+    """Module code should be embedded as a blob instead of concatenated source."""
+    # --- execute ---
+    content = _build_exec_pkg(tmp_path).read_text()
+
+    # --- verify ---
+    assert "_STITCHED_CODE = " in content
+    assert "_STITCHED_SOURCE = " in content
+    assert "mypkg/sub/__init__.py" in content
+    # Module bodies are not present as plain source
+    assert "def describe()" not in content
+    assert "# === mypkg.core ===" not in content
+
+
+def test_exec_mode_runs_modules_in_own_namespaces(tmp_path: Path) -> None:
+    """Relative imports and per-module __name__/__package__ should work."""
+    # --- setup ---
+    script = _build_exec_pkg(tmp_path)
+
+    # --- execute ---
+    result = _run(script, "a", "b")
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    *_, payload, argv = result.stdout.splitlines()
+    assert json.loads(payload) == ["core", "helpers", "mypkg.core", "mypkg"]
+    assert argv == "['a', 'b']"
+
+
+def test_exec_mode_falls_back_to_source(tmp_path: Path) -> None:
+    """A bytecode magic mismatch should compile the embedded sources instead."""
+    # --- setup ---
+    script = _build_exec_pkg(tmp_path)
+    lines = script.read_text().splitlines(keepends=True)
+    patched = [
+        '_STITCHED_MAGIC = b"\\x00\\x00\\r\\n"\n'
+        if line.startswith("_STITCHED_MAGIC = ")
+        else line
+        for line in lines
+    ]
+    script.write_text("".join(patched))
+
+    # --- execute ---
+    result = _run(script)
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.splitlines()[-2])[0] == "core"
+
+
+def test_exec_mode_eager_loading_imports_every_module(tmp_path: Path) -> None:
+    """Eager loading should execute every stitched module at startup."""
+    # --- setup ---
+    script = _build_exec_pkg(tmp_path, "eager")
+
+    # --- execute ---
+    result = _run(script)
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert "unused executed" in result.stdout
+
+
+def test_exec_mode_lazy_loading_runs_modules_on_first_import(tmp_path: Path) -> None:
+    """Lazy loading should only execute modules the program imports."""
+    # --- setup ---
+    script = _build_exec_pkg(tmp_path, "lazy")
+
+    # --- execute ---
+    result = _run(script, "x")
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert "unused executed" not in result.stdout
+    assert json.loads(result.stdout.splitlines()[0]) == [
+        "core",
+        "helpers",
+        "mypkg.core",
+        "mypkg",
+    ]
+
+
+@pytest.mark.parametrize("module_loading", ["eager", "lazy"])
+def test_exec_mode_modules_see_header_metadata(
+    tmp_path: Path, module_loading: str
+) -> None:
+    """Every module should get the header's __version__, __commit__, etc."""
+    # --- setup ---
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "__main__.py").write_text(
+        "import json\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    names = ('__version__', '__commit__', '__STITCH_SOURCE__')\n"
+        "    print(json.dumps([globals().get(name) for name in names]))\n"
+        "    print('__STITCHED__' in globals())\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        stitch_mode="exec",
+        internal_imports="keep",
+        external_imports="keep",
+    )
+    build_cfg["module_loading"] = module_loading  # type: ignore[typeddict-item]
+    mod_build.run_build(build_cfg)
+    script = tmp_path / "stitched.py"
+    header = {}
+    for line in script.read_text().splitlines():
+        name, sep, value = line.partition(" = ")
+        if sep and name in ("__version__", "__commit__", "__STITCH_SOURCE__"):
+            header[name] = json.loads(value)
+
+    # --- execute ---
+    result = _run(script)
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    metadata, has_stitched_flag = result.stdout.splitlines()
+    assert json.loads(metadata) == [
+        header["__version__"],
+        header["__commit__"],
+        header["__STITCH_SOURCE__"],
+    ]
+    # modules do not share one namespace, so they are not flagged as such
+    assert has_stitched_flag == "False"
+
+
+def test_exec_mode_self_build_reports_version(tmp_path: Path) -> None:
+    """An exec-mode build of serger itself should report its version."""
+    # --- setup ---
+    for name in ("src", "pyproject.toml"):
+        (tmp_path / name).symlink_to(PROJ_ROOT / name)
+    config = (PROJ_ROOT / f".{mod_meta.PROGRAM_CONFIG}.jsonc").read_text()
+    config = config.replace(
+        '"log_level": "warning"',
+        '"log_level": "warning", "out": "dist/exec.py", "stitch_mode": "exec",'
+        ' "internal_imports": "keep", "external_imports": "keep"',
+    ).replace('"external_imports": "lazy",', "")
+    (tmp_path / f".{mod_meta.PROGRAM_CONFIG}.jsonc").write_text(config)
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-m", mod_meta.PROGRAM_PACKAGE, "--no-server"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+    )
+
+    # --- execute ---
+    result = _run(tmp_path / "dist" / "exec.py", "--version")
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    version = mod_apathetic_utils.load_toml(PROJ_ROOT / "pyproject.toml")["project"][
+        "version"
+    ]
+    output = result.stdout + result.stderr
+    assert f"{mod_meta.PROGRAM_DISPLAY} {version} (" in output
+    assert "[stitched]" in output
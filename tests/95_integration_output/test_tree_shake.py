@@ -0,0 +1,137 @@
+# tests/95_integration_output/test_tree_shake.py
+"""Integration tests for tree_shake (dead-code elimination)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import serger.build as mod_build
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_shaken_pkg(tmp_path: Path, **overrides: object) -> Path:
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir(exist_ok=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "textutils.py").write_text(
+        "import textwrap\n"
+        "\n"
+        "\n"
+        "def shout(text: str) -> str:\n"
+        "    return text.upper()\n"
+        "\n"
+        "\n"
+        "def wrap(text: str) -> str:\n"
+        "    return textwrap.fill(text)\n"
+    )
+    (pkg_dir / "main.py").write_text(
+        "from mypkg.textutils import shout\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print(shout('hi'), argv)\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        tree_shake=True,
+    )
+    build_cfg.update(overrides)  # type: ignore[typeddict-item]
+    mod_build.run_build(build_cfg)
+    return tmp_path / "stitched.py"
+
+
+def test_tree_shake_drops_unused_helpers_and_imports(tmp_path: Path) -> None:
+    """Unused functions (and imports only they used) should be removed."""
+    # --- execute ---
+    script = _build_shaken_pkg(tmp_path)
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(script), "a"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # --- verify ---
+    content = script.read_text()
+    assert "def shout" in content
+    assert "def wrap" not in content
+    assert "import textwrap" not in content
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "HI ['a']\n"
+
+
+def test_tree_shake_keep_preserves_public_api(tmp_path: Path) -> None:
+    """Names in tree_shake_keep should survive even when unused."""
+    # --- execute ---
+    content = _build_shaken_pkg(tmp_path, tree_shake_keep=["wrap"]).read_text()
+
+    # --- verify ---
+    assert "def wrap" in content
+    assert "import textwrap" in content
+
+
+def test_tree_shake_requires_raw_stitch_mode(tmp_path: Path) -> None:
+    """Other stitch modes keep per-module namespaces, so shaking is rejected."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="tree_shake requires stitch_mode 'raw'"):
+        _build_shaken_pkg(
+            tmp_path,
+            stitch_mode="exec",
+            internal_imports="keep",
+            external_imports="keep",
+        )
+
+
+def test_tree_shake_keeps_subclass_registrations(tmp_path: Path) -> None:
+    """Subclasses registered by __init_subclass__ should survive shaking."""
+    # --- setup ---
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "plugins.py").write_text(
+        "class Plugin:\n"
+        "    plugins: list[str] = []\n"
+        "\n"
+        "    def __init_subclass__(cls) -> None:\n"
+        "        Plugin.plugins.append(cls.__name__)\n"
+        "\n"
+        "\n"
+        "class Hello(Plugin):\n"
+        "    pass\n"
+    )
+    (pkg_dir / "main.py").write_text(
+        "from mypkg.plugins import Plugin\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print('plugins:', Plugin.plugins)\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("stitched.py", tmp_path),
+        package="mypkg",
+        tree_shake=True,
+    )
+
+    # --- execute ---
+    mod_build.run_build(build_cfg)
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(tmp_path / "stitched.py")],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "plugins: ['Hello']\n"
@@ -0,0 +1,126 @@
+# tests/95_integration_output/test_zipapp_output.py
+"""Integration tests for out_format="zipapp" (.pyz with precompiled bytecode)."""
+
+import subprocess
+import sys
+import zipfile
+import zipimport
+from pathlib import Path
+
+import apathetic_utils as mod_apathetic_utils
+import pytest
+
+import serger.build as mod_build
+import serger.meta as mod_meta
+import serger.stitch as mod_stitch
+from tests.utils import PROJ_ROOT
+from tests.utils.buildconfig import make_build_cfg, make_include_resolved, make_resolved
+
+
+def _build_zipapp_pkg(tmp_path: Path, *, bytecode_cache: bool = False) -> Path:
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir(exist_ok=True)
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "util.py").write_text("def greet() -> str:\n    return 'hello'\n")
+    (pkg_dir / "main.py").write_text(
+        "from mypkg.util import greet\n"
+        "\n"
+        "\n"
+        "def main(argv: list[str]) -> int:\n"
+        "    print(greet(), argv, __name__)\n"
+        "    return 0\n"
+    )
+    build_cfg = make_build_cfg(
+        tmp_path,
+        [make_include_resolved("mypkg/**/*.py", tmp_path)],
+        respect_gitignore=False,
+        out=make_resolved("app.pyz", tmp_path),
+        package="mypkg",
+        out_format="zipapp",
+        bytecode_cache=bytecode_cache,
+        disable_build_timestamp=True,
+    )
+    mod_build.run_build(build_cfg)
+    return tmp_path / "app.pyz"
+
+
+def test_zipapp_runs_from_precompiled_bytecode(tmp_path: Path) -> None:
+    """The archive should run, loading __main__ from its .pyc."""
+    # --- setup ---
+    archive = _build_zipapp_pkg(tmp_path)
+
+    # --- execute ---
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(archive), "a"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    spec = zipimport.zipimporter(str(archive)).find_spec("__main__")
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "hello ['a'] __main__\n"
+    # zipimport picked the bytecode, not the source
+    assert spec is not None
+    assert spec.origin is not None
+    assert spec.origin.endswith("__main__.pyc")
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.namelist() == ["__main__.py", "__main__.pyc"]
+
+
+def test_zipapp_rebuild_is_reproducible(tmp_path: Path) -> None:
+    """Rebuilding unchanged sources should overwrite with identical bytes."""
+    # --- setup ---
+    first = _build_zipapp_pkg(tmp_path).read_bytes()
+
+    # --- execute ---
+    archive = _build_zipapp_pkg(tmp_path)
+
+    # --- verify ---
+    assert archive.read_bytes() == first
+    assert mod_stitch.is_serger_build(archive)
+
+
+def test_zipapp_rejects_bytecode_cache(tmp_path: Path) -> None:
+    """bytecode_cache is redundant for zipapps, so the combination errors."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="bytecode_cache cannot be combined"):
+        _build_zipapp_pkg(tmp_path, bytecode_cache=True)
+
+
+def test_zipapp_self_build_reports_version(tmp_path: Path) -> None:
+    """A zipapp build of serger itself should report its version."""
+    # --- setup ---
+    for name in ("src", "pyproject.toml"):
+        (tmp_path / name).symlink_to(PROJ_ROOT / name)
+    config = (PROJ_ROOT / f".{mod_meta.PROGRAM_CONFIG}.jsonc").read_text()
+    config = config.replace(
+        '"log_level": "warning"',
+        '"log_level": "warning", "out": "dist/app.pyz", "out_format": "zipapp"',
+    )
+    (tmp_path / f".{mod_meta.PROGRAM_CONFIG}.jsonc").write_text(config)
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-m", mod_meta.PROGRAM_PACKAGE, "--no-server"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+    )
+
+    # --- execute ---
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(tmp_path / "dist" / "app.pyz"), "--version"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # --- verify ---
+    assert result.returncode == 0, result.stderr
+    version = mod_apathetic_utils.load_toml(PROJ_ROOT / "pyproject.toml")["project"][
+        "version"
+    ]
+    output = result.stdout + result.stderr
+    assert f"{mod_meta.PROGRAM_DISPLAY} {version} (" in output
+    assert "unknown (unknown)" not in output
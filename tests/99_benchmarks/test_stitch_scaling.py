@@ -0,0 +1,172 @@
+# tests/99_benchmarks/test_stitch_scaling.py
+"""Scaling benchmarks for the stitch pipeline (opt-in: `pytest -k bench`).
+
+Each shape of synthetic project is built at several sizes; every phase of
+`run_build()` is timed from its spans (best of a few runs) and a log-log fit
+gives its scaling exponent: ~1.0 is linear, 2.0 quadratic. A phase fails
+when its exponent exceeds the recorded baseline plus slack, which catches
+an accidental O(n²) long before builds of thousands of modules get slow.
+
+Environment:
+    SERGER_BENCH_SIZES: Comma-separated module counts (default 25,50,100,200)
+    SERGER_BENCH_OUT: Where to write this run's results
+        (default .benchmarks/stitch_scaling.json)
+    SERGER_BENCH_UPDATE: Set to 1 to record this run as the new baseline
+"""
+
+import json
+import math
+import os
+import platform
+import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import serger.build as mod_build
+import serger.logs as mod_logs
+from tests.utils import (
+    BUILD_PHASES,
+    PROJ_ROOT,
+    SyntheticProjectSpec,
+    make_build_cfg,
+    make_include_resolved,
+    make_resolved,
+    make_synthetic_project,
+    phase_seconds,
+)
+
+
+# --- only for package runs (phases are timed through the package modules) ---
+__runtime_mode__ = "package"
+
+pytestmark = [pytest.mark.bench, pytest.mark.slow, pytest.mark.timeout(1800)]
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "stitch_scaling.json"
+DEFAULT_SIZES = (25, 50, 100, 200)
+RUNS_PER_SIZE = 3
+
+# Exponent allowed for a phase with no baseline entry
+DEFAULT_EXPONENT_BOUND = 1.35
+# Allowed growth of the exponent over its baseline (timing noise)
+EXPONENT_SLACK = 0.35
+# Phases faster than this at the largest size are noise, not scaling
+MIN_MEASURABLE_S = 0.01
+
+SHAPES: dict[str, SyntheticProjectSpec] = {
+    "flat": SyntheticProjectSpec(depth=0, fanout=1, functions=3),
+    "nested": SyntheticProjectSpec(depth=3, fanout=4, functions=5),
+    "heavy": SyntheticProjectSpec(
+        depth=2,
+        fanout=6,
+        functions=12,
+        comment_density=0.6,
+        docstring_density=1.0,
+        stdlib_imports=5,
+        installed_packages=3,
+    ),
+}
+
+
+def _sizes() -> list[int]:
+    raw = os.getenv("SERGER_BENCH_SIZES")
+    if not raw:
+        return list(DEFAULT_SIZES)
+    return sorted(int(size) for size in raw.split(","))
+
+
+def _scaling_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Least-squares slope of log(seconds) against log(size)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(sec, 1e-9)) for sec in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True))
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return num / den
+
+
+def _allowed_exponent(phase: str, baseline_exponents: dict[str, float]) -> float:
+    if phase not in baseline_exponents:
+        return DEFAULT_EXPONENT_BOUND
+    # A baseline below linear is noise on a fast phase; never demand better
+    return max(baseline_exponents[phase], 1.0) + EXPONENT_SLACK
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def _measure(
+    tmp_path: Path,
+    spec: SyntheticProjectSpec,
+) -> dict[str, dict[str, float]]:
+    """Return {size: {phase: best seconds}} for one project shape."""
+    results: dict[str, dict[str, float]] = {}
+    for size in _sizes():
+        root = tmp_path / f"n{size}"
+        project = make_synthetic_project(root, replace(spec, modules=size))
+        build_cfg = make_build_cfg(
+            root,
+            [make_include_resolved(pattern, root) for pattern in project.include],
+            respect_gitignore=False,
+            out=make_resolved("stitched.py", root),
+            package=project.package,
+            log_level="warning",
+        )
+        best = dict.fromkeys(BUILD_PHASES, math.inf)
+        for _ in range(RUNS_PER_SIZE):
+            seconds = phase_seconds(mod_build.run_build(build_cfg))
+            best = {phase: min(best[phase], seconds[phase]) for phase in best}
+        results[str(size)] = {phase: round(sec, 6) for phase, sec in best.items()}
+    return results
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_stitch_phase_scaling(tmp_path: Path, shape: str) -> None:
+    """Every build phase should scale no worse than its baseline exponent."""
+    # --- setup ---
+    mod_logs.getAppLogger().setLevel("warning")
+
+    # --- execute ---
+    by_size = _measure(tmp_path, SHAPES[shape])
+    sizes = sorted(int(size) for size in by_size)
+    exponents = {
+        phase: _scaling_exponent(sizes, [by_size[str(n)][phase] for n in sizes])
+        for phase in BUILD_PHASES
+    }
+
+    # --- record ---
+    run = {
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "seconds": by_size,
+        "exponents": {phase: round(exp, 3) for phase, exp in exponents.items()},
+    }
+    out_path = Path(
+        os.getenv("SERGER_BENCH_OUT", PROJ_ROOT / ".benchmarks/stitch_scaling.json")
+    )
+    _write_json(out_path, {**_load_json(out_path), shape: run})
+    baseline = _load_json(BASELINE_PATH)
+    if os.getenv("SERGER_BENCH_UPDATE") == "1":
+        _write_json(BASELINE_PATH, {**baseline, shape: run})
+
+    # --- verify ---
+    baseline_exponents: dict[str, float] = baseline.get(shape, {}).get("exponents", {})
+    largest = str(sizes[-1])
+    too_steep = {
+        phase: round(exponent, 2)
+        for phase, exponent in exponents.items()
+        if by_size[largest][phase] >= MIN_MEASURABLE_S
+        and exponent > _allowed_exponent(phase, baseline_exponents)
+    }
+    assert too_steep == {}, f"phases scale worse than baseline: {too_steep}"
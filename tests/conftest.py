@@ -78,21 +78,23 @@ def _mode() -> str:
     return os.getenv("RUNTIME_MODE", "package")
 
 
-def _filter_debug_tests(
+def _filter_opt_in_tests(
     config: pytest.Config,
     items: list[pytest.Item],
+    marker: str,
 ) -> None:
-    # detect if the user is filtering for debug tests
+    # detect if the user is filtering for this kind of test
     keywords = config.getoption("-k") or ""
-    running_debug = "debug" in keywords.lower()
-
-    if running_debug:
+    markexpr = config.getoption("-m") or ""
+    if marker in keywords.lower() or marker in markexpr.lower():
         return  # user explicitly requested them, don't skip
 
     for item in items:
-        if "debug" in item.keywords:
+        if marker in item.keywords:
             item.add_marker(
-                pytest.mark.skip(reason="Skipped debug test (use -k debug to run)"),
+                pytest.mark.skip(
+                    reason=f"Skipped {marker} test (use -k {marker} to run)"
+                ),
             )
 
 
@@ -152,9 +154,10 @@ def pytest_collection_modifyitems(
 ) -> None:
     """Filter and record runtime-specific tests for later reporting.
 
-    also automatically skips debug tests unless asked for
+    also automatically skips debug and bench tests unless asked for
     """
-    _filter_debug_tests(config, items)
+    _filter_opt_in_tests(config, items, "debug")
+    _filter_opt_in_tests(config, items, "bench")
     _filter_runtime_mode_tests(config, items)
 
 
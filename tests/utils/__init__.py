@@ -16,7 +16,13 @@ from .config_validate import make_summary
 from .constants import DEFAULT_TEST_LOG_LEVEL, PROJ_ROOT
 from .force_mtime_advance import force_mtime_advance
 from .package import make_test_package
+from .phase_timer import BUILD_PHASES, phase_seconds
 from .stitch_test import cleanup_sys_modules, is_serger_build_for_test
+from .synthetic_project import (
+    SyntheticProject,
+    SyntheticProjectSpec,
+    make_synthetic_project,
+)
 
 
 __all__ = [  # noqa: RUF022
@@ -37,10 +43,17 @@ __all__ = [  # noqa: RUF022
     "force_mtime_advance",
     # package
     "make_test_package",
+    # phase_timer
+    "BUILD_PHASES",
+    "phase_seconds",
     # constants
     "PROJ_ROOT",
     "DEFAULT_TEST_LOG_LEVEL",
     # stitch_test
     "cleanup_sys_modules",
     "is_serger_build_for_test",
+    # synthetic_project
+    "SyntheticProject",
+    "SyntheticProjectSpec",
+    "make_synthetic_project",
 ]
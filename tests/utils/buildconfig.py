@@ -63,6 +63,17 @@ def make_build_cfg(  # noqa: PLR0913
     stitch_mode: mod_types.StitchMode = "raw",
     module_mode: mod_types.ModuleMode = "multi",
     shim: mod_types.ShimSetting = "all",
+    shim_attrs: mod_types.ShimAttrsMode = "copy",
+    module_loading: mod_types.ModuleLoading = "eager",
+    bytecode_cache: bool = False,
+    tree_shake: bool = False,
+    tree_shake_keep: list[str] | None = None,
+    startup_profiling: bool = False,
+    out_format: mod_types.OutFormat = "script",
+    zipapp_python: str | None = None,
+    lean_mode: bool = False,
+    memory_budget_mb: float | None = None,
+    optimize_imports: bool = False,
     internal_imports: mod_types.InternalImportMode = "force_strip",
     external_imports: mod_types.ExternalImportMode = "top",
     comments_mode: mod_types.CommentsMode = "keep",
@@ -110,6 +121,17 @@ def make_build_cfg(  # noqa: PLR0913
         "stitch_mode": stitch_mode,
         "module_mode": module_mode,
         "shim": shim,
+        "shim_attrs": shim_attrs,
+        "module_loading": module_loading,
+        "bytecode_cache": bytecode_cache,
+        "tree_shake": tree_shake,
+        "tree_shake_keep": tree_shake_keep or [],
+        "startup_profiling": startup_profiling,
+        "out_format": out_format,
+        "zipapp_python": zipapp_python,
+        "lean_mode": lean_mode,
+        "memory_budget_mb": memory_budget_mb,
+        "optimize_imports": optimize_imports,
         "internal_imports": internal_imports,
         "external_imports": external_imports,
         "comments_mode": comments_mode,
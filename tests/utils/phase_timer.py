@@ -0,0 +1,23 @@
+# tests/utils/phase_timer.py
+"""Group the spans of a `run_build()` result into benchmark phases."""
+
+import serger.build as mod_build
+
+
+# phase → span names (see serger.timings) the phase is made of
+BUILD_PHASES: dict[str, tuple[str, ...]] = {
+    "collect": ("collect_included_files",),
+    "resolve_order": ("resolve_order_paths", "compute_module_order"),
+    "collect_modules": ("_collect_modules",),
+    "build_final_script": ("_build_final_script",),
+    "verify": ("verify_no_broken_imports", "verify_compiles_string"),
+    "post_processing": ("post_stitch_processing",),
+}
+
+
+def phase_seconds(result: mod_build.BuildResult) -> dict[str, float]:
+    """Return seconds per phase of BUILD_PHASES for one build."""
+    totals = dict.fromkeys(BUILD_PHASES, 0.0)
+    for phase, names in BUILD_PHASES.items():
+        totals[phase] = sum(s.duration for s in result.spans if s.name in names)
+    return totals
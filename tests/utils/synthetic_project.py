@@ -0,0 +1,156 @@
+# tests/utils/synthetic_project.py
+"""Generate synthetic packages of tunable size for stitch benchmarks."""
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# Stdlib modules the synthetic code imports (hoisted as external imports)
+_STDLIB_MODULES = ("collections", "functools", "itertools", "json", "os", "re")
+
+
+@dataclass(frozen=True)
+class SyntheticProjectSpec:
+    """Shape of a generated project.
+
+    Attributes:
+        modules: Number of modules in the main package (excluding __init__)
+        depth: Subpackage nesting depth; modules are spread across levels
+        fanout: Internal imports per module (each of an earlier module)
+        functions: Functions per module; drives file size
+        comment_density: Fraction of function lines preceded by a comment
+        docstring_density: Fraction of functions with a docstring
+        stdlib_imports: Stdlib modules imported per module
+        installed_packages: Extra packages generated under site-packages/
+            and imported from the main package
+        seed: Random seed; the same spec always produces the same files
+    """
+
+    modules: int = 50
+    depth: int = 2
+    fanout: int = 3
+    functions: int = 5
+    comment_density: float = 0.2
+    docstring_density: float = 0.5
+    stdlib_imports: int = 2
+    installed_packages: int = 1
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class SyntheticProject:
+    """A generated project on disk.
+
+    Attributes:
+        root: Directory containing the package (and site-packages/)
+        package: Name of the main package
+        include: Include patterns (relative to root) covering every module
+        file_count: Number of .py files written
+        total_bytes: Total size of the .py files written
+    """
+
+    root: Path
+    package: str
+    include: list[str]
+    file_count: int
+    total_bytes: int
+
+
+def _module_dir(index: int, depth: int) -> tuple[str, ...]:
+    # Round-robin across nesting levels: level 0 is the package itself
+    level = index % (depth + 1)
+    return tuple(f"sub{level}_{i}" for i in range(level))
+
+
+def _render_module(
+    index: int,
+    imports: list[str],
+    spec: SyntheticProjectSpec,
+    rng: random.Random,
+) -> str:
+    lines = [f'"""Synthetic module {index}."""', ""]
+    stdlib = sorted(
+        rng.sample(_STDLIB_MODULES, min(spec.stdlib_imports, len(_STDLIB_MODULES)))
+    )
+    lines.extend(f"import {name}" for name in stdlib)
+    lines.extend(imports)
+    lines.extend(["", ""])
+    for fn in range(spec.functions):
+        lines.append(f"def func_{index}_{fn}(value: int) -> int:")
+        if rng.random() < spec.docstring_density:
+            lines.append(f'    """Compute step {fn} of module {index}."""')
+        body = [
+            "result = value",
+            f"result += {fn}",
+            "result *= 2",
+            "return result",
+        ]
+        for stmt in body:
+            if rng.random() < spec.comment_density:
+                lines.append("    # adjust the running result")
+            lines.append(f"    {stmt}")
+        lines.extend(["", ""])
+    uses = ", ".join(f"{name}.__name__" for name in stdlib) or "None"
+    lines.append(f"MODULE_{index}_DEPS = ({uses},)")
+    return "\n".join(lines) + "\n"
+
+
+def make_synthetic_project(
+    root: Path,
+    spec: SyntheticProjectSpec,
+    package: str = "synthpkg",
+) -> SyntheticProject:
+    """Write a synthetic package described by `spec` under `root`.
+
+    Module `i` imports `fanout` randomly chosen modules `j < i`, so the import
+    graph is acyclic and every size is a prefix-stable superset of the
+    smaller ones (for the same seed).
+    """
+    rng = random.Random(spec.seed)  # noqa: S311
+    root.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+
+    vendors = [f"synthvendor{v}" for v in range(spec.installed_packages)]
+    for vendor in vendors:
+        vendor_dir = root / "site-packages" / vendor
+        vendor_dir.mkdir(parents=True, exist_ok=True)
+        (vendor_dir / "__init__.py").write_text("")
+        (vendor_dir / "helpers.py").write_text(
+            f"def {vendor}_helper(value: int) -> int:\n    return value + 1\n"
+        )
+        written.extend([vendor_dir / "__init__.py", vendor_dir / "helpers.py"])
+
+    dotted: list[str] = []
+    pkg_dir = root / package
+    for index in range(spec.modules):
+        parts = _module_dir(index, spec.depth)
+        module_dir = pkg_dir.joinpath(*parts)
+        module_dir.mkdir(parents=True, exist_ok=True)
+        for level in range(len(parts) + 1):
+            init = pkg_dir.joinpath(*parts[:level]) / "__init__.py"
+            if not init.exists():
+                init.write_text("")
+                written.append(init)
+
+        earlier = rng.sample(range(index), min(spec.fanout, index))
+        imports = [f"from {dotted[j]} import func_{j}_0" for j in sorted(earlier)] + [
+            f"from {vendor}.helpers import {vendor}_helper" for vendor in vendors
+        ]
+
+        name = f"mod{index}"
+        path = module_dir / f"{name}.py"
+        path.write_text(_render_module(index, imports, spec, rng))
+        written.append(path)
+        dotted.append(".".join([package, *parts, name]))
+
+    include = [f"{package}/**/*.py"] + [
+        f"site-packages/{vendor}/**/*.py" for vendor in vendors
+    ]
+    return SyntheticProject(
+        root=root,
+        package=package,
+        include=include,
+        file_count=len(written),
+        total_bytes=sum(path.stat().st_size for path in written),
+    )